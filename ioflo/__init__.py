@@ -3,12 +3,22 @@
 """
 from __future__ import division
 
+import sys
 import importlib
 
-_modules = ['base', 'trim']  # register behaviors
-
-for m in _modules:
-    importlib.import_module(".{0}".format(m), package='ioflo')
+# subpackages are imported on first use not eagerly. Registered behaviors are
+# imported lazily via base.indexing when first looked up in their registry
+_packages = ['aid', 'aio', 'app', 'base', 'trim']
 
 from .__metadata__ import *
 
+if sys.version_info < (3, 7):  # no module __getattr__ so import eagerly
+    for m in ['base', 'trim']:
+        importlib.import_module(".{0}".format(m), package=__name__)
+
+def __getattr__(name):
+    """ Import subpackage name on first attribute access (python3.7+) """
+    if name in _packages:
+        return importlib.import_module(".{0}".format(name), package=__name__)
+    raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
+
@@ -29,6 +29,18 @@ class Console(object):
        If the write verbosity is less than or equal the allowed verbosity level
        THEN write
 
+       The verbosity level methods .terse .concise .verbose and .profuse
+       accept optional format args so that the message is only formatted
+       when it is actually written. This makes disabled messages cheap.
+          console.profuse("Running {0} at {1}\n", name, stamp)
+       is equivalent to but faster when not written than
+          console.profuse("Running {0} at {1}\n".format(name, stamp))
+       When there are no format args the message is written unformatted.
+
+       For messages whose args are themselves expensive to compute guard
+       with the verbosity level such as
+          if console._verbosity >= console.Wordage.profuse:
+
     """
     # Class attribute instance of verbosity levels
     Wordage = Verbiage(mute=0, terse=1, concise=2, verbose=3, profuse=4)
@@ -123,25 +135,33 @@ class Console(object):
             if self._flushy:
                 self.flush()
 
-    def terse(self, msg):
+    def terse(self, msg, *args, **kwa):
         """Write at terse verbosity level
+           Format msg with args and kwa only when written
         """
-        self.write(msg, verbosity=self.Wordage.terse)
+        if self.Wordage.terse <= self._verbosity:
+            self.write(msg.format(*args, **kwa) if (args or kwa) else msg)
 
-    def concise(self, msg):
+    def concise(self, msg, *args, **kwa):
         """Write at concise verbosity level
+           Format msg with args and kwa only when written
         """
-        self.write(msg, verbosity=self.Wordage.concise)
+        if self.Wordage.concise <= self._verbosity:
+            self.write(msg.format(*args, **kwa) if (args or kwa) else msg)
 
-    def verbose(self, msg):
+    def verbose(self, msg, *args, **kwa):
         """Write at verbose verbosity level
+           Format msg with args and kwa only when written
         """
-        self.write(msg, verbosity=self.Wordage.verbose)
+        if self.Wordage.verbose <= self._verbosity:
+            self.write(msg.format(*args, **kwa) if (args or kwa) else msg)
 
-    def profuse(self, msg):
+    def profuse(self, msg, *args, **kwa):
         """Write at profuse verbosity level
+           Format msg with args and kwa only when written
         """
-        self.write(msg, verbosity=self.Wordage.profuse)
+        if self.Wordage.profuse <= self._verbosity:
+            self.write(msg.format(*args, **kwa) if (args or kwa) else msg)
 
     @staticmethod
     def ocfn(filename, openMode = 'r+'):
@@ -193,6 +213,8 @@ def Test():
     console.concise('Ok bluejay\n')
     console.verbose('See ya later alligator.\n')
     console.profuse('Not to soon baboon.\n')
+    console.concise('{0} {1}\n', 'Ok', 'crocodile')
+    console.profuse('{0} {1}\n', 'Never', 'written')
     console.close()
 
     console = Console( verbosity=Console.Wordage.verbose,  path="/tmp/consoletesterfile")
@@ -13,6 +13,11 @@ from .sixing import *
 from .odicting import odict
 from ..base import excepting
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from .consoling import getConsole
 console = getConsole()
 
@@ -156,6 +161,44 @@ def RotateNEToFS(heading = 0.0, north = 0.0, east = 0.0):
 
     return (forward,starboard)
 
+def rotateFSToNEArray(heading = 0.0, forward = 0.0, starboard = 0.0):
+    """
+       Vectorized form of RotateFSToNE for arrays of headings and vectors
+       Returns duple of numpy arrays (north, east)
+
+       Requires numpy
+    """
+    if numpy is None:
+        raise ImportError("Array navigation requires numpy")
+    heading = DEGTORAD * numpy.asarray(heading, dtype=float)
+    ch = numpy.cos(heading)
+    sh = numpy.sin(heading)
+    north = ch * forward - sh * starboard
+    east = sh * forward + ch * starboard
+
+    return (north,east)
+
+RotateFSToNEArray = rotateFSToNEArray
+
+def rotateNEToFSArray(heading = 0.0, north = 0.0, east = 0.0):
+    """
+       Vectorized form of RotateNEToFS for arrays of headings and vectors
+       Returns duple of numpy arrays (forward, starboard)
+
+       Requires numpy
+    """
+    if numpy is None:
+        raise ImportError("Array navigation requires numpy")
+    heading = DEGTORAD * numpy.asarray(heading, dtype=float)
+    ch = numpy.cos(heading)
+    sh = numpy.sin(heading)
+    forward = ch * north + sh * east
+    starboard = - sh * north + ch * east
+
+    return (forward,starboard)
+
+RotateNEToFSArray = rotateNEToFSArray
+
 
 def AlongCrossTrack(track = 0.0, north = 0.0, east = 0.0,
                     mag = None, heading = None):
@@ -358,6 +401,39 @@ def sphereLLByDNDEToLL(lat0, lon0, dn, de):
 
 SphereLLByDNDEToLL = sphereLLByDNDEToLL
 
+def sphereLLByDNDEToLLArray(lat0, lon0, dn, de):
+    """
+    Returns new lat lon locations on sphere as duple of numpy arrays
+    (lat1, lon1) in total fractional degrees north east positive
+    Vectorized form of sphereLLByDNDEToLL for arrays of locations
+    lat0 lon0 and relative positions dn (north) meters and de (east) meters
+    Array like or scalar parameters are broadcast against each other
+
+    Requires numpy
+    """
+    if numpy is None:
+        raise ImportError("Array navigation requires numpy")
+    r = 6366710.0 #radius of earth in meters = 1852 * 60 * 180/pi
+
+    lat0 = numpy.asarray(lat0, dtype=float)
+    lon0 = numpy.asarray(lon0, dtype=float)
+    dn = numpy.asarray(dn, dtype=float)
+    de = numpy.asarray(de, dtype=float)
+
+    dlat = dn/(r * DEGTORAD)
+    lat1 = lat0 + dlat
+    avlat = (lat1 + lat0)/2.0
+
+    scale = r * DEGTORAD * numpy.cos(DEGTORAD * avlat)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        dlon = numpy.where(scale == 0.0, 0.0, de / scale)
+
+    lon1 = lon0 + dlon
+
+    return (lat1, lon1)
+
+SphereLLByDNDEToLLArray = sphereLLByDNDEToLLArray
+
 def SphereLLbyRBtoLL(lat0,lon0,range,bearing):
     """Computes new lat lon location on sphere
         from the flat earth approx of  change in range meters at bearing degrees from
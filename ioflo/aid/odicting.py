@@ -11,9 +11,19 @@ Based on various ordered dict implementations found in the wild
 """
 from __future__ import absolute_import, division, print_function
 
+import sys
+import platform
+
 from .sixing import *
 
 
+# True when builtin dict preserves insertion order so odict can rely on it.
+# CPython 3.6 dicts are ordered as an implementation detail, Python 3.7+ by spec
+DICT_ORDERED = (sys.version_info >= (3, 7) or
+                (sys.version_info >= (3, 6) and
+                 platform.python_implementation() == 'CPython'))
+
+
 class odict(dict):
     """
     Dictionary whose keys maintain the order they are added to the dict. Not
@@ -25,14 +35,32 @@ class odict(dict):
     The first key added to the dictionary is the first key in .keys()
     Changing the value of a key does not affect the order of the key
 
+    When the builtin dict preserves insertion order (DICT_ORDERED) the key
+    order is the dict order so setting, getting and deleting items are O(1)
+    at native dict speed. Otherwise the key order is kept in a circular
+    doubly linked list of [prev, next, key] links indexed by key in ._map
+    with sentinel link ._root so setting and deleting items are still O(1).
+
     """
-    __slots__ = ['_keys']
+    if DICT_ORDERED:
+        __slots__ = []
+    else:
+        __slots__ = ['_map', '_root']
 
     def __new__(cls, *args, **kwargs):
         self = dict.__new__(cls,*args, **kwargs)
-        self._keys = []
+        if not DICT_ORDERED:
+            self._initLinks()
         return self
 
+    def _initLinks(self):
+        """
+        Create empty key order links. Not used when DICT_ORDERED
+        """
+        self._map = {}  # links keyed by key
+        self._root = root = []  # sentinel link
+        root[:] = [root, root, None]
+
     def __init__(self, *pa, **kwa):
         """
         Create new empty odict
@@ -77,16 +105,6 @@ class odict(dict):
         for k in kwa:
             self[k] = kwa[k]
 
-    def __delitem__(self, key):
-        """ del x[y] """
-        dict.__delitem__(self, key)
-        self._keys.remove(key)
-
-    def __iter__(self):
-        """ iter(x)"""
-        for key in self._keys:
-            yield key
-
     def __repr__(self):
         """
         odict representation
@@ -94,17 +112,9 @@ class odict(dict):
         return ("{0}({1})".format(self.__class__.__name__,
                                   repr(self.items())))
 
-    def __setitem__(self, key, val):
-        """ x[key]=val"""
-        dict.__setitem__(self, key, val)
-        if not hasattr(self, '_keys'):
-            self._keys = [key]
-        if key not in self._keys:
-            self._keys.append(key)
-
     def __getnewargs__(self):
         """
-        Needed to force __new__ which creates _keys.
+        Needed to force __new__ which creates the key order links.
         if empty odict then __getstate__ returns empty list which is logically false so
         __setstate__ is not called.
         """
@@ -120,8 +130,225 @@ class odict(dict):
         """
         restore from state items list
         """
+        if not DICT_ORDERED and not hasattr(self, '_map'):
+            self._initLinks()  # pickle protocols before 2 do not call __new__
         self.__init__(state)
 
+    if DICT_ORDERED:  # dict order is key order
+
+        def insert(self, index, key, val):
+            """
+            Insert val at index if key not in odict
+            """
+            if key in self:
+                raise KeyError('Key %r already exists.' % key)
+            keys = list(dict.keys(self))
+            keys.insert(index, key)
+            dict.__setitem__(self, key, val)
+            for k in keys[keys.index(key) + 1:]:  # move following keys to end
+                dict.__setitem__(self, k, dict.pop(self, k))
+
+        def items(self):
+            return list(dict.items(self))
+
+        def iterkeys(self):
+            """
+            Return an iterator over the keys of odict
+            """
+            return iter(self)
+
+        def iteritems(self):
+            """
+            Return an iterator over the items (key, value)  of odict.
+            """
+            return iter(dict.items(self))
+
+        def itervalues(self):
+            """
+            Return an iterator over the values of odict.
+            """
+            return iter(dict.values(self))
+
+        def keys(self):
+            """
+            Return the list of keys of odict.
+            """
+            return list(dict.keys(self))
+
+        def popitem(self, last=True):
+            """
+            Remove and return last item (key, value) duple
+            If last is False remove and return first item instead
+            If odict is empty raise KeyError
+            """
+            if not dict.__len__(self):
+                raise KeyError('Empty odict.')
+            if last:
+                return dict.popitem(self)
+            key = next(iter(dict.keys(self)))
+            return (key, dict.pop(self, key))
+
+        def reorder(self, other):
+            """
+            Update values in this odict based on the `other` odict.
+            Keys of other are moved to the end in the order of other.
+            Raises ValueError if other is not an odict
+            """
+            if not isinstance(other, odict):
+                raise ValueError('other must be an odict')
+
+            if other is self:
+                return  # updating with self makes no changes
+
+            for key in other:
+                value = dict.__getitem__(other, key)
+                dict.pop(self, key, None)
+                dict.__setitem__(self, key, value)
+
+        def values(self):
+            return list(dict.values(self))
+
+    else:  # linked list of keys in ._map and ._root is key order
+
+        def __setitem__(self, key, val):
+            """ x[key]=val"""
+            if key not in self._map:
+                self._link(key)
+            dict.__setitem__(self, key, val)
+
+        def __delitem__(self, key):
+            """ del x[y] """
+            dict.__delitem__(self, key)
+            self._unlink(key)
+
+        def __iter__(self):
+            """ iter(x)"""
+            root = self._root
+            link = root[1]
+            while link is not root:
+                yield link[2]
+                link = link[1]
+
+        def _link(self, key, succ=None):
+            """
+            Link new key before link succ. Default is after last key
+            """
+            if succ is None:
+                succ = self._root
+            prev = succ[0]
+            prev[1] = succ[0] = self._map[key] = [prev, succ, key]
+
+        def _unlink(self, key):
+            """
+            Unlink key from key order
+            """
+            prev, succ, _ = self._map.pop(key)
+            prev[1] = succ
+            succ[0] = prev
+
+        def clear(self):
+            """ Remove all items from odict"""
+            dict.clear(self)
+            self._map.clear()
+            root = self._root
+            root[:] = [root, root, None]
+
+        def insert(self, index, key, val):
+            """
+            Insert val at index if key not in odict
+            """
+            if key in self:
+                raise KeyError('Key %r already exists.' % key)
+            size = len(self._map)
+            if index < 0:  # same semantics as list.insert
+                index = max(0, size + index)
+            succ = self._root[1]
+            for i in range(min(index, size)):
+                succ = succ[1]
+            dict.__setitem__(self, key, val)
+            self._link(key, succ)
+
+        def items(self):
+            return [(key, dict.__getitem__(self, key)) for key in self]
+
+        def iterkeys(self):
+            """
+            Return an iterator over the keys of odict
+            """
+            return iter(self)
+
+        def iteritems(self):
+            """
+            Return an iterator over the items (key, value)  of odict.
+            """
+            return ((key, dict.__getitem__(self, key)) for key in self)
+
+        def itervalues(self):
+            """
+            Return an iterator over the values of odict.
+            """
+            return (dict.__getitem__(self, key) for key in self)
+
+        def keys(self):
+            """
+            Return the list of keys of odict.
+            """
+            return list(self)
+
+        def pop(self, key, *default):
+            """
+            Remove key and the associated item and return the associated value
+            If key not found return default if given otherwise raise KeyError
+            """
+            value = dict.pop(self, key, *default)
+            if key in self._map:
+                self._unlink(key)
+            return value
+
+        def popitem(self, last=True):
+            """
+            Remove and return last item (key, value) duple
+            If last is False remove and return first item instead
+            If odict is empty raise KeyError
+            """
+            if not self._map:
+                raise KeyError('Empty odict.')
+            key = self._root[0][2] if last else self._root[1][2]
+            value = dict.pop(self, key)
+            self._unlink(key)
+            return (key, value)
+
+        def reorder(self, other):
+            """
+            Update values in this odict based on the `other` odict.
+            Keys of other are moved to the end in the order of other.
+            Raises ValueError if other is not an odict
+            """
+            if not isinstance(other, odict):
+                raise ValueError('other must be an odict')
+
+            if other is self:
+                return  # updating with self makes no changes
+
+            for key in other:
+                dict.__setitem__(self, key, dict.__getitem__(other, key))
+                if key in self._map:
+                    self._unlink(key)
+                self._link(key)
+
+        def setdefault(self, key, default=None):
+            """
+            If key in odict, return value at key
+            Otherwise set value at key to default and return default
+            """
+            value = dict.setdefault(self, key, default)
+            if key not in self._map:
+                self._link(key)
+            return value
+
+        def values(self):
+            return [dict.__getitem__(self, key) for key in self]
+
     def append(self, key, item):
         """
         D[key] = item.
@@ -130,16 +357,11 @@ class odict(dict):
             raise KeyError('append(): key %r already in dictionary' % key)
         self[key] = item
 
-    def clear(self):
-        """ Remove all items from odict"""
-        dict.clear(self)
-        self._keys = []
-
     def copy(self):
         """
         Make a shallow copy of odict
         """
-        items = [(key, dict.__getitem__(self, key)) for key in self._keys]
+        items = [(key, dict.__getitem__(self, key)) for key in self.iterkeys()]
         return self.__class__(items) #creates new odict and populates with items
 
     def create(self, *pa, **kwa):
@@ -151,15 +373,15 @@ class odict(dict):
         for a in pa:
             if hasattr(a,'get'): #positional arg is dictionary
                 for k in a:
-                    if k not in self._keys:
+                    if k not in self:
                         self[k] = a[k]
             else: #positional arg is sequence of duples (k,v)
                 for k, v in a:
-                    if k not in self._keys:
+                    if k not in self:
                         self[k] = v
 
         for k in kwa:
-            if k not in self._keys:
+            if k not in self:
                 self[k] = kwa[k]
 
     def sift(self, fields=None):
@@ -178,95 +400,6 @@ class odict(dict):
         items = [(key, dict.__getitem__(self, key)) for key in fields]
         return self.__class__(items) #creates new odict and populates with items
 
-    def insert(self, index, key, val):
-        """
-        Insert val at index if key not in odict
-        """
-        if key in self:
-            raise KeyError('Key %r already exists.' % key)
-        dict.__setitem__(self, key, val)
-        self._keys.insert(index, key)
-
-    def items(self):
-        return [(key, dict.__getitem__(self, key)) for key in self._keys]
-
-    def iterkeys(self):
-        """
-        Return an iterator over the keys of odict
-        """
-        return iter(self)
-
-    def iteritems(self):
-        """
-        Return an iterator over the items (key, value)  of odict.
-        """
-        return ((key, dict.__getitem__(self, key)) for key in self._keys)
-
-    def itervalues(self):
-        """
-        Return an iterator over the values of odict.
-        """
-        return (dict.__getitem__(self, key) for key in self._keys)
-
-    def keys(self):
-        """
-        Return the list of keys of odict.
-        """
-        return self._keys[:]
-
-    def pop(self, key, *default):
-        """
-        Remove key and the associated item and return the associated value
-        If key not found return default if given otherwise raise KeyError
-        """
-        value = dict.pop(self, key, *default)
-        if key in self._keys:
-            self._keys.remove(key)
-        return value
-
-    def popitem(self):
-        """
-        Remove and return last item (key, value) duple
-        If odict is empty raise KeyError
-        """
-        try:
-            key = self._keys[-1]
-        except IndexError:
-            raise KeyError('Empty odict.')
-        value = dict.__getitem__(self, key)
-        del self[key]
-        return (key, value)
-
-    def reorder(self, other):
-        """
-        Update values in this odict based on the `other` odict.
-        Raises ValueError if other is not an odict
-        """
-        if not isinstance(other, odict):
-            raise ValueError('other must be an odict')
-
-        if other is self:
-            #raise ValueError('other cannot be the same odict')
-            pass #updating with self makes no changes
-
-        dict.update(self, other)
-        keys = self._keys
-
-        for key in other:
-            if key in keys:
-                keys.remove(key)
-            keys.append(key)
-
-    def setdefault(self, key, default=None):
-        """
-        If key in odict, return value at key
-        Otherwise set value at key to default and return default
-        """
-        value = dict.setdefault(self, key, default)
-        if key not in self._keys:
-            self._keys.append(key)
-        return value
-
     def update(self, *pa, **kwa):
         """
         Update values in this odict
@@ -284,8 +417,6 @@ class odict(dict):
         for k in kwa:
             self[k] = kwa[k]
 
-    def values(self):
-        return [dict.__getitem__(self, key) for key in self._keys]
 
 ODict = odict  # alias
 
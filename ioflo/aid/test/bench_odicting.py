@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks scaling of odict insert, update, delete and reorder with the
+number of keys up to 100k versus the previous list backed key order.
+
+The list backed reference is only run up to --legacy keys since its inserts
+and deletes are O(n) so a full run is quadratic.
+
+example:
+
+python -m ioflo.aid.test.bench_odicting -s 1000 10000 100000 -l 10000
+
+"""
+import sys
+import time
+import argparse
+
+from ioflo.aid.odicting import odict, DICT_ORDERED
+
+
+class listodict(dict):
+    """
+    Reference odict with key order in list ._keys as before
+    """
+    __slots__ = ['_keys']
+
+    def __new__(cls, *args, **kwargs):
+        self = dict.__new__(cls, *args, **kwargs)
+        self._keys = []
+        return self
+
+    def __setitem__(self, key, val):
+        dict.__setitem__(self, key, val)
+        if key not in self._keys:
+            self._keys.append(key)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._keys.remove(key)
+
+    def keys(self):
+        return self._keys[:]
+
+    def reorder(self, other):
+        dict.update(self, other)
+        keys = self._keys
+        for key in other:
+            if key in keys:
+                keys.remove(key)
+            keys.append(key)
+
+
+def bench(kind, size):
+    """
+    Returns odict of elapsed seconds per operation for odict class kind
+    with size keys
+    """
+    keys = ["key{0}".format(i) for i in range(size)]
+    moves = odict([(key, 0) for key in keys[:size // 10]])  # first tenth
+    results = odict()
+    d = kind()
+
+    start = time.time()
+    for key in keys:
+        d[key] = 1
+    results["insert"] = time.time() - start
+
+    start = time.time()
+    for key in keys:
+        d[key] = 2
+    results["update"] = time.time() - start
+
+    start = time.time()
+    d.reorder(moves)
+    results["reorder"] = time.time() - start
+
+    start = time.time()
+    d.keys()
+    results["keys"] = time.time() - start
+
+    start = time.time()
+    for key in keys:
+        del d[key]
+    results["delete"] = time.time() - start
+
+    return results
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark odict scaling.")
+    p.add_argument('-s', '--sizes', type=int, nargs='+',
+                   default=[1000, 10000, 100000],
+                   help="Numbers of keys.")
+    p.add_argument('-l', '--legacy', type=int, default=10000,
+                   help="Max number of keys for list backed reference.")
+    args = p.parse_args()
+
+    print("odict uses {0}".format("dict order" if DICT_ORDERED else "linked keys"))
+    for size in args.sizes:
+        kinds = [("odict", odict)]
+        if size <= args.legacy:
+            kinds.insert(0, ("list", listodict))
+        for name, kind in kinds:
+            results = bench(kind, size)
+            print("{0:5s} keys={1:<7d} {2}".format(name, size,
+                    " ".join("{0}={1:0.3f}ms".format(op, 1000.0 * elapsed)
+                             for op, elapsed in results.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Test Template
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import os
+import io
+
+from ioflo.aid.sixing import *
+from ioflo.aid.consoling import getConsole, Console
+console = getConsole()
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+
+class Formattable(object):
+    """
+    Counts how often it is formatted
+    """
+    def __init__(self):
+        self.count = 0
+
+    def __format__(self, spec):
+        self.count += 1
+        return "formatted"
+
+
+class BasicTestCase(unittest.TestCase):
+    """
+    Example TestCase
+    """
+
+    def setUp(self):
+        super(BasicTestCase, self).setUp()
+        self.console = Console(name="tester", verbosity=Console.Wordage.terse)
+        self.console._file = io.StringIO()
+
+    def tearDown(self):
+        super(BasicTestCase, self).tearDown()
+
+    def testLazyFormat(self):
+        """
+        Test verbosity level methods only format args when written
+        """
+        console.terse("{0}\n".format(self.testLazyFormat.__doc__))
+
+        item = Formattable()
+        self.console.profuse(u"{0} {1}\n", item, 1)
+        self.console.verbose(u"{0}\n", item)
+        self.console.concise(u"{value}\n", value=item)
+        self.assertEqual(item.count, 0)
+        self.assertEqual(self.console._file.getvalue(), u"")
+
+        self.console.terse(u"{0} {1}\n", item, 1)
+        self.assertEqual(item.count, 1)
+        self.assertEqual(self.console._file.getvalue(), u"formatted 1\n")
+
+        self.console.reinit(verbosity=Console.Wordage.profuse)
+        self.console.profuse(u"{value} {{0}}\n", value=item)
+        self.assertEqual(item.count, 2)
+        self.assertEqual(self.console._file.getvalue(),
+                         u"formatted 1\nformatted {0}\n")
+
+        # no args so not formatted
+        self.console.concise(u"{0} {{0}}\n")
+        self.assertEqual(self.console._file.getvalue(),
+                         u"formatted 1\nformatted {0}\n{0} {{0}}\n")
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = [
+             'testLazyFormat',
+            ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testLazyFormat')
@@ -73,6 +73,80 @@ class BasicTestCase(unittest.TestCase):
         stuff = od.sift()
         self.assertEqual(stuff.items(), od.items())
 
+    def testODictOrder(self):
+        """
+        Test odict key order is kept by insert, reorder, append, create,
+        delete, pop and popitem and survives copy and pickle
+        """
+        console.terse("{0}\n".format(self.testODictOrder.__doc__))
+        import pickle
+
+        od = odicting.odict([("a", 1), ("b", 2), ("c", 3)])
+        od.append("d", 4)
+        self.assertEqual(od.keys(), ["a", "b", "c", "d"])
+        with self.assertRaises(KeyError):
+            od.append("a", 5)
+
+        od.insert(1, "e", 5)
+        self.assertEqual(od.keys(), ["a", "e", "b", "c", "d"])
+        od.insert(0, "f", 6)
+        od.insert(-1, "g", 7)
+        od.insert(100, "h", 8)
+        self.assertEqual(od.keys(), ["f", "a", "e", "b", "c", "g", "d", "h"])
+        self.assertEqual(list(od), od.keys())
+        with self.assertRaises(KeyError):
+            od.insert(0, "a", 0)
+
+        del od["e"]
+        self.assertEqual(od.pop("g"), 7)
+        self.assertEqual(od.pop("g", None), None)
+        with self.assertRaises(KeyError):
+            od.pop("g")
+        self.assertEqual(od.popitem(), ("h", 8))
+        self.assertEqual(od.popitem(last=False), ("f", 6))
+        self.assertEqual(od.items(), [("a", 1), ("b", 2), ("c", 3), ("d", 4)])
+
+        od["b"] = 20  # update does not change order
+        od["e"] = 5
+        self.assertEqual(od.keys(), ["a", "b", "c", "d", "e"])
+        self.assertEqual(od.values(), [1, 20, 3, 4, 5])
+        self.assertEqual(list(od.iteritems()), od.items())
+        self.assertEqual(list(od.itervalues()), od.values())
+
+        od.reorder(odicting.odict([("c", 30), ("a", 10), ("x", 0)]))
+        self.assertEqual(od.items(), [("b", 20), ("d", 4), ("e", 5),
+                                      ("c", 30), ("a", 10), ("x", 0)])
+        od.reorder(od)
+        self.assertEqual(od.keys(), ["b", "d", "e", "c", "a", "x"])
+        with self.assertRaises(ValueError):
+            od.reorder(dict(a=1))
+
+        od.create([("a", 0), ("y", 1)], z=2)
+        self.assertEqual(od.keys(), ["b", "d", "e", "c", "a", "x", "y", "z"])
+        self.assertEqual(od["a"], 10)
+        self.assertEqual(od.setdefault("a", 0), 10)
+        self.assertEqual(od.setdefault("w", 0), 0)
+        self.assertEqual(od.keys()[-1], "w")
+
+        self.assertEqual(od.sift(["x", "b"]).items(), [("x", 0), ("b", 20)])
+        dup = od.copy()
+        self.assertIsInstance(dup, odicting.odict)
+        self.assertEqual(dup.items(), od.items())
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            dup = pickle.loads(pickle.dumps(od, protocol))
+            self.assertEqual(dup.items(), od.items())
+            dup = pickle.loads(pickle.dumps(odicting.odict(), protocol))
+            self.assertEqual(dup.items(), [])
+
+        od.clear()
+        self.assertEqual(od.items(), [])
+        with self.assertRaises(KeyError):
+            od.popitem()
+        od["b"] = 1
+        od["a"] = 2
+        self.assertEqual(od.keys(), ["b", "a"])
+        self.assertEqual(repr(od), "odict([('b', 1), ('a', 2)])")
+
     def testLoDict(self):
         """
         Test the lodict
@@ -130,6 +204,7 @@ def runSome():
     tests =  []
     names = [
                 'testODict',
+                'testODictOrder',
                 'testLoDict',
                 'testMoDict',
             ]
@@ -3,3 +3,4 @@ aio  asynchronous (nonblocking) input output package
 """
 from .wiring import WireLog
 
+from .wheeling import Wheel
@@ -62,12 +62,12 @@ def arpCreate(ether, host, interface="en0", temp=True):
 
     """
     temp = "temp" if temp else ""
-    console.terse("{0}: Creating {1} arp entry for {2} at {3} on {4}\n".format(
+    console.terse("{0}: Creating {1} arp entry for {2} at {3} on {4}\n",
                                         datetime.datetime.utcnow().isoformat(),
                                         temp,
                                         ether,
                                         host,
-                                        interface))
+                                        interface)
     console.flush()
 
     # sudo arp -s 10.0.2.49 70:b3:d5:0:e0:30 ifscope en3 temp
@@ -82,12 +82,12 @@ def arpCreate(ether, host, interface="en0", temp=True):
                                   temp],
                                  check=True)
     except subprocess.SubprocessError as ex:
-        console.terse("{0}: Failed Creation of {1} arp entry for {2} at {3} on {4}\n".format(
+        console.terse("{0}: Failed Creation of {1} arp entry for {2} at {3} on {4}\n",
                                                 datetime.datetime.utcnow().isoformat(),
                                                 temp,
                                                 ether,
                                                 host,
-                                                interface))
+                                                interface)
     console.flush()
 
 
@@ -104,10 +104,10 @@ def arpDelete(host, interface="en0"):
 
     """
 
-    console.terse("{0}: Deleting arp entry at {1} on {2}\n".format(
+    console.terse("{0}: Deleting arp entry at {1} on {2}\n",
                                         datetime.datetime.utcnow().isoformat(),
                                         host,
-                                        interface))
+                                        interface)
     console.flush()
 
     # sudo arp -d 10.0.2.49 ifscope en3
@@ -120,10 +120,10 @@ def arpDelete(host, interface="en0"):
                                   interface],
                                  check=True)
     except subprocess.SubprocessError as ex:
-        console.terse("{0}: Failed Deletion of arp entry at {1} on {2}\n".format(
+        console.terse("{0}: Failed Deletion of arp entry at {1} on {2}\n",
                                                 datetime.datetime.utcnow().isoformat(),
                                                 host,
-                                                interface))
+                                                interface)
     console.flush()
 
 
@@ -537,7 +537,10 @@ class Respondent(httping.Parsent):
         if self.length and self.length < 0:
             raise ValueError("Invalid content length of {0}".format(self.length))
 
-        del self.body[:]  # self.body.clear() clear body python2 bytearrays don't clear
+        if self.evented:  # .eventSource parses .body in place
+            del self.body[:]  # self.body.clear() clear body python2 bytearrays don't clear
+        else:  # earlier response may still reference .body
+            self.body = bytearray()
 
         if self.chunked:  # content-length is ignored if chunked
             self.parms = odict()
@@ -648,6 +651,7 @@ class Patron(object):
                  redirectable=True,
                  redirects=None,
                  responses=None,
+                 pipeline=1,
                  **kwa):
         """
         Initialization method for instance.
@@ -689,6 +693,9 @@ class Patron(object):
                 each redirect is dict
             responses is deque of responses if any processed by respondent
                  each response is dict
+            pipeline is max number of requests from .requests transmitted on
+                the connection before their responses are received.
+                pipeline <= 1 means no pipelining
 
 
         """
@@ -702,6 +709,9 @@ class Patron(object):
         self.events = events if events is not None else deque()
         self.waited = False  # Boolean True If sent request but waiting for response
         self.latest = None  # latest request odict from .requests in process if any
+        self.pipeline = max(1, pipeline)  # max requests in flight when pipelining
+        # .pendings is deque of request odicts in flight when pipelining
+        self.pendings = deque()
         self.store = store or storing.Store(stamp=0.0)
 
         # see if path also includes scheme, netloc, host, port, query, fragment
@@ -904,6 +914,37 @@ class Patron(object):
                 request[k] = v
         self.requests.append(request)
 
+    def rebuild(self,
+                method=None,
+                path=None,
+                qargs=None,
+                fragment=None,
+                headers=None,
+                body=None,
+                data=None,
+                fargs=None,
+                **kwa):
+        """
+        Returns request msg built by .requester
+        If the parameters are all None then use existing .requester attributes
+        otherwise reinit .requester with those not None.
+        Does not touch .respondent so may be used while a response is in process
+        """
+        reinit = any(True for parm in (method, path, qargs, fragment, headers,
+                                       body, data, fargs)
+                     if parm is not None)
+        if reinit:
+            # rebuild calls reinit to enable repeated requests same destination
+            return self.requester.rebuild(method=method,
+                                          path=path,
+                                          qargs=qargs,
+                                          fragment=fragment,
+                                          headers=headers,
+                                          body=body,
+                                          data=data,
+                                          fargs=fargs)
+        return self.requester.build()
+
     def transmit(self,
                  method=None,
                  path=None,
@@ -929,21 +970,14 @@ class Patron(object):
         """
         self.waited = True
 
-        reinit = any(True for parm in (method, path, qargs, fragment, headers,
-                                       body, data, fargs)
-                     if parm is not None)
-        if reinit:
-            # rebuild calls reinit to enable repeated requests same destination
-            request = self.requester.rebuild(method=method,
-                                             path=path,
-                                             qargs=qargs,
-                                             fragment=fragment,
-                                             headers=headers,
-                                             body=body,
-                                             data=data,
-                                             fargs=fargs)
-        else:
-            request = self.requester.build()
+        request = self.rebuild(method=method,
+                               path=path,
+                               qargs=qargs,
+                               fragment=fragment,
+                               headers=headers,
+                               body=body,
+                               data=data,
+                               fargs=fargs)
 
         self.connector.tx(request)
 
@@ -1025,11 +1059,75 @@ class Patron(object):
             self.respondent.redirected = True
             self.respondent.ended = False  # since redirecting not done
 
+    def requestify(self, latest=None):
+        """
+        Returns request odict for response from current .requester attributes
+        updating a copy of latest request odict from .requests if provided
+        """
+        request = copy.copy(latest) if latest else odict()
+        request.update([
+                        ('host', self.requester.hostname),
+                        ('port', self.requester.port),
+                        ('scheme', self.requester.scheme),
+                        ('method', self.requester.method),
+                        ('path', self.requester.path),
+                        ('fragment', self.requester.fragment),
+                        ('qargs', copy.copy(self.requester.qargs)),
+                        ('headers', copy.copy(self.requester.headers)),
+                        ('body', self.requester.body),
+                        ('data', self.requester.data),
+                        ('fargs', copy.copy(self.requester.fargs)),
+                       ])
+        return request
+
+    def servicePipeline(self):
+        """
+        Service requests deque by transmitting up to .pipeline requests on the
+        connection before their responses are received.
+        Each transmitted request is snapshotted onto .pendings so responses,
+        which HTTP/1.1 returns in request order, are matched to them in order.
+        Per RFC 7230 6.3.2 nothing is pipelined behind a non-idempotent request.
+        """
+        if self.waited and not self.pendings:
+            return  # redirect or bare transmit in process
+
+        while self.requests and len(self.pendings) < self.pipeline:
+            if (self.pendings and
+                    self.pendings[-1]['method'] not in httping.IDEMPOTENT_METHODS):
+                break
+            request = self.requests.popleft()
+            if self.pendings:  # respondent busy with earlier response
+                self.waited = True
+                self.connector.tx(self.rebuild(**request))
+            else:
+                self.transmit(**request)  # expand items in request
+            self.pendings.append(self.requestify(request))
+
+    def flushPendings(self, error):
+        """
+        Append errored response with error for each request in .pendings
+        that will never be answered and clear .pendings
+        """
+        while self.pendings:
+            request = self.pendings.popleft()
+            self.responses.append(odict([('version', None),
+                                         ('status', None),
+                                         ('reason', None),
+                                         ('headers', lodict()),
+                                         ('body', bytearray()),
+                                         ('data', None),
+                                         ('request', request),
+                                         ('errored', True),
+                                         ('error', error),
+                                        ]))
+
     def serviceRequests(self):
         """
         Service requests deque
         """
-        if not self.waited:
+        if self.pipeline > 1:
+            self.servicePipeline()
+        elif not self.waited:
             if self.requests:
                 self.latest = request = self.requests.popleft()
                 # future check host port scheme if need to reconnect on new ha
@@ -1061,36 +1159,11 @@ class Patron(object):
                 self.respondent.dictify()
 
                 if not self.respondent.evented:
-                    if self.latest:  # use saved request attribute
-                        request = copy.copy(self.latest)
-                        request.update([
-                                        ('host', self.requester.hostname),
-                                        ('port', self.requester.port),
-                                        ('scheme', self.requester.scheme),
-                                        ('method', self.requester.method),
-                                        ('path', self.requester.path),
-                                        ('fragment', self.requester.fragment),
-                                        ('qargs', copy.copy(self.requester.qargs)),
-                                        ('headers', copy.copy(self.requester.headers)),
-                                        ('body', self.requester.body),
-                                        ('data', self.requester.data),
-                                        ('fargs', copy.copy(self.requester.fargs)),
-                                       ])
+                    if self.pendings:  # pipelined so use in order snapshot
+                        request = self.pendings.popleft()
+                    else:  # use saved request attribute if any
+                        request = self.requestify(self.latest)
                         self.latest = None
-                    else:
-                        request = odict([
-                                         ('host', self.requester.hostname),
-                                         ('port', self.requester.port),
-                                         ('scheme', self.requester.scheme),
-                                         ('method', self.requester.method),
-                                         ('path', self.requester.path),
-                                         ('fragment', self.requester.fragment),
-                                         ('qargs', copy.copy(self.requester.qargs)),
-                                         ('headers', copy.copy(self.requester.headers)),
-                                         ('body', self.requester.body),
-                                         ('data', self.requester.data),
-                                         ('fargs', copy.copy(self.requester.fargs)),
-                                        ])
                     response = odict([('version', self.respondent.version),
                                       ('status', self.respondent.status),
                                       ('reason', self.respondent.reason),
@@ -1101,7 +1174,9 @@ class Patron(object):
                                       ('errored', self.respondent.errored),
                                       ('error', self.respondent.error),
                                      ])
-                    if self.respondent.redirectable and self.respondent.redirectant:
+                    # redirect would be answered out of order behind pendings
+                    if (self.respondent.redirectable and
+                            self.respondent.redirectant and not self.pendings):
                         self.redirects.append(copy.copy(response))
                         self.redirect()
                     else:
@@ -1109,7 +1184,13 @@ class Patron(object):
                             response['redirects'] = copy.copy(self.redirects)
                         self.redirects = []
                         self.responses.append(response)
-                        self.waited = False
+                        if self.pendings:
+                            if self.connector.cutoff and not self.connector.rxbs:
+                                self.flushPendings(error="Connection closed "
+                                            "before pipelined response")
+                            else:  # set up for next pipelined response
+                                self.respondent.reinit(method=self.pendings[0]['method'])
+                        self.waited = True if self.pendings else False
                 self.respondent.makeParser()  #set up for next time
 
     def serviceAll(self):
@@ -1155,7 +1236,7 @@ class Patron(object):
                 self.serviceAll()
             except Exception as ex:
                 console.terse("Error: Servicing Patron '{0}'."
-                              " '{1}'\n".format(self.connector.name, ex))
+                              " '{1}'\n", self.connector.name, ex)
                 raise ex
             time.sleep(0.125)
             self.store.advanceStamp(0.125)
@@ -1185,7 +1266,228 @@ class Patron(object):
                     self.serviceAll()
                 except Exception as ex:
                     console.terse("Error: Servicing Patron '{0}'."
-                                  " '{1}'\n".format(self.connector.name, ex))
+                                  " '{1}'\n", self.connector.name, ex)
                     raise ex
                 yield b''  # this is eventually yielded by wsgi app while waiting
             return self.respond()
+
+
+class PatronPool(object):
+    """
+    PatronPool class nonblocking HTTP client connection pool
+    Keeps up to .size persistent Patron connections per (scheme, host, port)
+    origin and dispatches requests from the shared .requests deque to the
+    least busy patron for the request's origin. The patrons append their
+    responses onto the shared .responses deque. Each response's request
+    includes the reply tag if any of its originating request.
+    """
+    def __init__(self,
+                 store=None,
+                 name='',
+                 size=2,
+                 pipeline=1,
+                 bufsize=8096,
+                 wlog=None,
+                 hostname='127.0.0.1',
+                 port=None,
+                 scheme=u'http',
+                 headers=None,
+                 requests=None,
+                 responses=None,
+                 dictable=None,
+                 redirectable=True,
+                 **kwa):
+        """
+        Initialization method for instance.
+        Parameters:
+            store is reference to data store instance
+            name is user friendly name prefix for patron connections
+            size is max number of patron connections per origin
+            pipeline is max number of requests in flight per patron connection
+                pipeline <= 1 means no pipelining
+            bufsize is buffer size for patron connections
+            wlog is opened WireLog instance if any for patron connections
+            hostname is default remote server host for requests without one
+            port is default remote server port for requests without one
+            scheme is default http scheme for requests without one
+            headers is dict of default http headers for .request
+            requests is deque of requests if any to be dispatched to patrons
+                each request is dict as made by .request
+                request path may include scheme and netloc which takes priority
+                over any scheme, hostname, port items in request
+            responses is deque of responses if any from patrons
+                each response is dict
+            dictable is Boolean flag for patron respondents
+            redirectable is Boolean to allow redirects to be processed by patrons
+            kwa are passed as other init parameters to patron connectors
+        """
+        self.store = store or storing.Store(stamp=0.0)
+        self.name = name
+        self.size = max(1, size)
+        self.pipeline = max(1, pipeline)
+        self.bufsize = bufsize
+        self.wlog = wlog
+        self.scheme = u'https' if scheme.lower() == u'https' else u'http'
+        defaultPort = 443 if self.scheme == u'https' else 80
+        self.hostname, self.port = httping.normalizeHostPort(host=hostname,
+                                                             port=port,
+                                                             defaultPort=defaultPort)
+        self.headers = lodict(headers) if headers else lodict()
+        # .requests is deque of dicts of request data to dispatch
+        self.requests = requests if requests is not None else deque()
+        # .responses is deque of dicts of response data from all patrons
+        self.responses = responses if responses is not None else deque()
+        self.dictable = dictable
+        self.redirectable = redirectable
+        self.kwa = kwa
+        # .patrons is odict of lists of Patrons keyed by (scheme, hostname, port)
+        self.patrons = odict()
+        self.uid = 0  # uid of most recently created patron
+
+    def close(self):
+        """
+        Close all patron connections
+        """
+        for patrons in self.patrons.values():
+            for patron in patrons:
+                patron.close()
+        self.patrons = odict()
+
+    def respond(self):
+        """
+        Pops and returns next response from .responses if any
+        Otherwise returns None
+        """
+        if self.responses:
+            return Patron.attrify(self.responses.popleft())
+        return None
+
+    def request(self,
+                method=u'GET',
+                path=u'/',
+                qargs=None,
+                fragment=u'',
+                headers=None,
+                body=None,
+                data=None,
+                fargs=None,
+                reply=None,
+                scheme=None,
+                hostname=None,
+                port=None,
+                **kwa):
+        """
+        Create and append complete request odict onto .requests
+        Unlike Patron.request this is not differential since the request may
+        be dispatched to any patron connection for its origin.
+        Missing scheme hostname port default to pool values unless in path
+        """
+        request = odict()
+        request['method'] = method.upper() if method else u'GET'
+        request['path'] = path or u'/'
+        request['qargs'] = qargs if qargs is not None else odict()
+        request['fragment'] = fragment or u''
+        request['headers'] = lodict(headers) if headers is not None else self.headers.copy()
+        if body is not None:  # body should be bytes
+            if isinstance(body, unicode):
+                # RFC 2616 Section 3.7.1 default charset of iso-8859-1.
+                body = body.encode('iso-8859-1')
+        else:
+            body = b''
+        request['body'] = body
+        request['data'] = data
+        request['fargs'] = fargs
+        # not sent but supports associating requests with responses
+        if reply is not None:
+            request['reply'] = reply
+        if scheme is not None:
+            request['scheme'] = scheme
+        if hostname is not None:
+            request['hostname'] = hostname
+        if port is not None:
+            request['port'] = port
+        for k, v in kwa.items():  # extra stuff not sent
+            if v is not None:
+                request[k] = v
+        self.requests.append(request)
+
+    def originate(self, request):
+        """
+        Returns origin tuple (scheme, hostname, port) of request dict
+        Strips any scheme and netloc from request path
+        """
+        splits = urlsplit(request.get('path') or u'/')
+        scheme = (splits.scheme or request.get('scheme') or self.scheme).lower()
+        scheme = u'https' if scheme == u'https' else u'http'
+        if splits.netloc:
+            hostname, port = splits.hostname, splits.port
+            request['path'] = splits._replace(scheme='', netloc='').geturl() or u'/'
+        else:
+            hostname = request.get('hostname')
+            port = request.get('port')
+            if hostname is None:
+                hostname, port = self.hostname, port or self.port
+        defaultPort = 443 if scheme == u'https' else 80
+        hostname, port = httping.normalizeHostPort(host=hostname,
+                                                   port=port,
+                                                   defaultPort=defaultPort)
+        return (scheme, hostname, port)
+
+    def dispatch(self, request):
+        """
+        Returns patron for request after appending request onto its .requests
+        Picks least busy patron for request origin adding a new patron
+        connection when all are busy and fewer than .size
+        """
+        origin = self.originate(request)
+        patrons = self.patrons.setdefault(origin, [])
+        patron = None
+        if patrons:
+            patron = min(patrons, key=lambda p: len(p.requests) + len(p.pendings) + p.waited)
+        if (patron is None or
+                (len(patrons) < self.size and
+                 (patron.requests or patron.waited))):
+            scheme, hostname, port = origin
+            self.uid += 1
+            patron = Patron(store=self.store,
+                            name="{0}{1}".format(self.name, self.uid),
+                            uid=self.uid,
+                            bufsize=self.bufsize,
+                            wlog=self.wlog,
+                            hostname=hostname,
+                            port=port,
+                            scheme=scheme,
+                            dictable=self.dictable,
+                            redirectable=self.redirectable,
+                            responses=self.responses,
+                            pipeline=self.pipeline,
+                            **self.kwa)
+            patron.open()
+            patrons.append(patron)
+        patron.requests.append(request)
+        return patron
+
+    def serviceRequests(self):
+        """
+        Dispatch all requests in .requests to patrons
+        """
+        while self.requests:
+            self.dispatch(self.requests.popleft())
+
+    def serviceAll(self):
+        """
+        Service dispatch then all patron request responses
+        Drops idle patrons whose connection was closed
+        """
+        self.serviceRequests()
+        for origin, patrons in self.patrons.items():
+            for patron in patrons:
+                patron.serviceAll()
+            idles = [patron for patron in patrons
+                     if (patron.connector.cutoff and not patron.requests and
+                         not patron.waited)]
+            for patron in idles:
+                patron.close()
+                patrons.remove(patron)
+            if not patrons:
+                del self.patrons[origin]
@@ -8,6 +8,7 @@ from __future__ import absolute_import, division, print_function
 
 import sys
 import os
+import re
 from collections import deque
 import codecs
 import json
@@ -34,6 +35,7 @@ console = getConsole()
 CRLF = b"\r\n"
 LF = b"\n"
 CR = b"\r"
+EolRegex = re.compile(b"[\r\n]")  # first CR or LF in one pass
 MAX_LINE_SIZE = 65536
 MAX_HEADERS = 100
 
@@ -167,6 +169,9 @@ STATUS_DESCRIPTIONS = {
 METHODS = (u'GET', u'HEAD', u'PUT', u'PATCH', u'POST', u'DELETE',
            u'OPTIONS', u'TRACE', u'CONNECT' )
 
+# methods safe to pipeline other requests behind (RFC 7230 6.3.2)
+IDEMPOTENT_METHODS = (u'GET', u'HEAD', u'PUT', u'DELETE', u'OPTIONS', u'TRACE')
+
 # maximal amount of data to read at one time in _safe_read
 MAXAMOUNT = 1048576
 
@@ -443,6 +448,50 @@ def packChunk(msg):
     lines.append(b'\r\n')
     return (b''.join(lines))
 
+def findEol(raw, start=0, eols=(CRLF, LF, CR)):
+    """
+    Returns duple (index, size) of the first end of line in raw bytearray at
+    or after start where index is the index of the eol and size is its length.
+    Returns (-1, 0) if no eol found yet.
+
+    Scans raw once from start. Each eol must be one of CRLF, LF, or CR.
+    CRLF takes precedence over CR or LF at the same index. So when both CRLF
+    and CR are eols a CR at the end of raw is not yet an eol since it may be
+    followed by LF. On resume after (-1, 0) scan from max(start, len(raw) - 1)
+    so that the scan is linear in the total length of raw.
+    """
+    if CR in eols:  # lone CR before any LF may be eol
+        crlf = CRLF in eols
+        lf = LF in eols
+        end = len(raw)
+        while True:
+            match = EolRegex.search(raw, start)  # never scans past first CR or LF
+            if match is None:
+                return (-1, 0)
+            found = match.start()
+            if raw[found:found + 1] == CR:
+                if found + 1 < end:
+                    if crlf and raw[found + 1:found + 2] == LF:
+                        return (found, 2)
+                    return (found, 1)
+                if crlf:  # CR at end so wait to see if followed by LF
+                    return (-1, 0)
+                return (found, 1)
+            if lf:
+                return (found, 1)
+            start = found + 1  # lone LF not an eol so keep looking
+
+    if LF in eols:
+        index = raw.find(LF, start)
+        if index < 0:
+            return (-1, 0)
+        if index > start and raw[index - 1:index] == CR and CRLF in eols:
+            return (index - 1, 2)
+        return (index, 1)
+
+    index = raw.find(CRLF, start)  # only CRLF
+    return (index, 2) if index >= 0 else (-1, 0)
+
 def parseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
     """
     Generator to parse  line from raw bytearray
@@ -453,19 +502,19 @@ def parseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
     Yields line Otherwise
 
     Consumes parsed portions of raw bytearray
+    Resumes scanning for eol where it left off so total scan is linear
 
     Raise error if eol not found before MAX_LINE_SIZE
     """
+    scan = 0  # where to resume scan for eol
     while True:
-        for eol in eols:  # loop over eols unless found
-            index = raw.find(eol)  # not found index == -1
-            if index >= 0:
-                break
+        index, size = findEol(raw, scan, eols)
 
         if index < 0:  # not found
             if len(raw) > MAX_LINE_SIZE:
                 raise LineTooLong(kind)
             else:
+                scan = max(0, len(raw) - 1)
                 (yield None)  # more data needed not done parsing header
                 continue
 
@@ -473,8 +522,8 @@ def parseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
             raise LineTooLong(kind)
 
         line = raw[:index]
-        index += len(eol)  # strip eol
-        del raw[:index] # remove used bytes
+        del raw[:index + size] # remove used bytes and eol
+        scan = 0
         (yield line)
     return
 
@@ -485,28 +534,31 @@ def parseLeader(raw, eols=(CRLF, LF), kind="leader header line", headers=None):
     Yields None If more to parse
     Yields lodict of headers Otherwise as indicated by empty headers
 
+    Tracks the start of the current line and where to resume scanning for
+    eol so total scan is linear. Consumes the parsed leader from raw once
+    the leader is done.
+
     Raise error if eol not found before  MAX_LINE_SIZE
     """
     headers = headers if headers is not None else lodict()
+    start = 0  # start of current line
+    scan = 0  # where to resume scan for eol
     while True:  # loop until entire heading indicated by empty line
-        for eol in eols:  # loop over eols unless found
-            index = raw.find(eol)  # not found index == -1
-            if index >= 0:
-                break
+        index, size = findEol(raw, scan, eols)
 
         if index < 0:  # not found
-            if len(raw) > MAX_LINE_SIZE:
+            if len(raw) - start > MAX_LINE_SIZE:
                 raise LineTooLong(kind)
             else:
+                scan = max(start, len(raw) - 1)
                 (yield None)  # more data needed not done parsing header
                 continue
 
-        if index > MAX_LINE_SIZE:  # found but line too long
+        if index - start > MAX_LINE_SIZE:  # found but line too long
             raise LineTooLong(kind)
 
-        line = raw[:index]
-        index += len(eol)  # strip eol
-        del raw[:index] # remove used bytes
+        line = raw[start:index]
+        start = scan = index + size  # skip eol
         if line:
             line = line.decode('iso-8859-1')  # convert to unicode string
             key, value = line.split(': ', 1)
@@ -516,6 +568,8 @@ def parseLeader(raw, eols=(CRLF, LF), kind="leader header line", headers=None):
             raise HTTPException("Too many headers, more than {0}".format(MAX_HEADERS))
 
         if not line:  # empty line so entire leader done
+            del raw[:start]  # remove used bytes
+            start = scan = 0
             (yield headers) # leader done
     return
 
@@ -531,6 +585,9 @@ def parseChunk(raw):  # reading transfer encoded raw
         trails is dict of chunk trailer headers (only on last chunk if any)
         chunk is chunk if any or empty if not
 
+    Resumes scanning for CRLF where it left off and consumes the whole
+    chunk from raw at once when done.
+
     Chunked-Body   = *chunk
                 last-chunk
                 trailer
@@ -550,14 +607,22 @@ def parseChunk(raw):  # reading transfer encoded raw
     trails = lodict()
     chunk = bytearray()
 
-    lineParser = parseLine(raw=raw, eols=(CRLF, ), kind="chunk size line")
+    scan = 0  # where to resume scan for eol
     while True:
-        line = next(lineParser)
-        if line is not None:
-            lineParser.close()  # close generator
+        index, eol = findEol(raw, scan, (CRLF, ))
+        if index >= 0:
             break
+        if len(raw) > MAX_LINE_SIZE:
+            raise LineTooLong("chunk size line")
+        scan = max(0, len(raw) - 1)
         (yield None)
 
+    if index > MAX_LINE_SIZE:
+        raise LineTooLong("chunk size line")
+
+    line = raw[:index]
+    start = index + eol  # start of chunk data
+
     size, sep, exts = line.partition(b';')
     try:
         size = int(size.strip().decode('ascii'), 16)
@@ -569,9 +634,10 @@ def parseChunk(raw):  # reading transfer encoded raw
         for ext in exts:
             ext = ext.strip()
             name, sep, value = ext.partition(b'=')
-            parms[name.strip()] = value.strip() or None
+            parms[bytes(name.strip())] = bytes(value.strip()) or None
 
     if size == 0:  # last chunk so parse trailing headers if any
+        del raw[:start]  # remove used bytes
         leaderParser = parseLeader(raw=raw,
                                    eols=(CRLF, LF),
                                    kind="trailer header line")
@@ -584,23 +650,26 @@ def parseChunk(raw):  # reading transfer encoded raw
         trails.update(headers)
 
     else:
-        while len(raw) < size:  # need more for chunk
+        end = start + size  # end of chunk data
+        while len(raw) < end:  # need more for chunk
             (yield None)
 
-        chunk = raw[:size]
-        del raw[:size]  # remove used bytes
-
-        lineParser = parseLine(raw=raw, eols=(CRLF, ), kind="chunk end line")
-        while True:
-            line = next(lineParser)
-            if line is not None:
-                lineParser.close()  # close generator
+        scan = end
+        while True:  # chunk end line
+            index, eol = findEol(raw, scan, (CRLF, ))
+            if index >= 0:
                 break
+            if len(raw) - end > MAX_LINE_SIZE:
+                raise LineTooLong("chunk end line")
+            scan = max(end, len(raw) - 1)
             (yield None)
 
-        if line:  # not empty so raise error
+        if index != end:  # not empty so raise error
             raise ValueError("Chunk end error. Expected empty got "
-                     "'{0}' instead".format(line.decode('iso-8859-1')))
+                     "'{0}' instead".format(raw[end:index].decode('iso-8859-1')))
+
+        chunk = raw[start:end]
+        del raw[:index + eol]  # remove used bytes
 
     (yield (size, parms, trails, chunk))
     return
@@ -736,13 +805,26 @@ class EventSource(object):
         edata = u''
         parts = []
         ejson = None
-        lineParser = parseLine(raw=self.raw, eols=(CRLF, LF, CR ), kind="event line")
+        raw = self.raw
+        start = 0  # start of current line
+        scan = 0  # where to resume scan for eol
         while True:
-            line = next(lineParser)
-            if line is None:
+            index, size = findEol(raw, scan, (CRLF, LF, CR))
+            if index < 0:  # not found
+                if len(raw) - start > MAX_LINE_SIZE:
+                    raise LineTooLong("event line")
+                del raw[:start]  # remove used bytes of parsed lines
+                start = 0
+                scan = max(0, len(raw) - 1)
                 (yield None)
                 continue
 
+            if index - start > MAX_LINE_SIZE:  # found but line too long
+                raise LineTooLong("event line")
+
+            line = raw[start:index]
+            start = scan = index + size  # skip eol
+
             if not line or self.closed:  # empty line or closed so attempt dispatch
                 if parts:
                     edata = u'\n'.join(parts)
@@ -760,7 +842,7 @@ class EventSource(object):
                                               ('data', edata),
                                              ]))
                 if self.closed:  # all done
-                    lineParser.close()  # close generator
+                    del raw[:start]  # remove used bytes of parsed lines
                     break
                 ename = u''
                 edata = u''
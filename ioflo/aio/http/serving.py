@@ -498,10 +498,10 @@ class Responder(object):
                     self.ended = True
                 else:
                     console.terse("HTTPError streaming body after headers sent.\n"
-                                    "{}\n".format(ex))
+                                    "{}\n", ex)
             except Exception as ex:  # handle http exceptions not caught by app
                 console.terse("Unexcepted Server Error.\n"
-                                    "{}\n".format(ex))
+                                    "{}\n", ex)
             else:
                 if msg:  # only write if not empty allows async processing
                     self.write(msg)
@@ -530,6 +530,7 @@ class Valet(object):
                  eha=None,
                  scheme=u'',
                  timeout=None,
+                 selective=False,
                  **kwa):
         """
         Initialization method for instance.
@@ -555,6 +556,8 @@ class Valet(object):
             kwa needed to pass additional parameters to servant
 
             timeout is timeout in seconds for dropping idle connections
+            selective is Boolean True means created servant only services
+                sockets its selector reports ready
 
         Attributes:
             .store is Datastore for timers
@@ -623,6 +626,7 @@ class Valet(object):
                                     bufsize=bufsize,
                                     wlog=wlog,
                                     timeout=self.timeout,
+                                    selective=selective,
                                     **kwa)
             else:
                 servant = Server(store=self.store,
@@ -632,6 +636,7 @@ class Valet(object):
                                  bufsize=bufsize,
                                  wlog=wlog,
                                  timeout=self.timeout,
+                                 selective=selective,
                                  **kwa)
 
 
@@ -734,8 +739,9 @@ class Valet(object):
             if ca not in self.reqs:  # point requestant.msg to incomer.rxbs
                 self.reqs[ca] = Requestant(msg=ix.rxbs, incomer=ix)
 
-            if ix.timeout > 0.0 and ix.timer.expired:
-                self.closeConnection(ca)
+        for ix in self.servant.wheel.expireds():  # only timed out incomers
+            if self.servant.ixes.get(ix.ca) is ix:
+                self.closeConnection(ix.ca)
 
     def serviceReqs(self):
         """
@@ -760,11 +766,11 @@ class Valet(object):
                         continue
 
                     console.concise("Parsed Request:\n{0} {1} {2}\n"
-                                    "{3}\n{4}\n".format(requestant.method,
+                                    "{3}\n{4}\n", requestant.method,
                                                         requestant.path,
                                                         requestant.version,
                                                         requestant.headers,
-                                                        requestant.body))
+                                                        requestant.body)
                     # create or restart wsgi app responder here
                     environ = self.buildEnviron(requestant)
                     if ca not in self.reps:
@@ -959,7 +965,7 @@ class Steward(object):
         """
         Restart incomer timer
         """
-        incomer.timer.restart()
+        self.incomer.refresh()
 
     def respond(self):
         """
@@ -967,11 +973,11 @@ class Steward(object):
         Echo request
         """
         console.concise("Responding to Request:\n{0} {1} {2}\n"
-                                "{3}\n{4}\n".format(self.requestant.method,
+                                "{3}\n{4}\n", self.requestant.method,
                                                     self.requestant.path,
                                                     self.requestant.version,
                                                     self.requestant.headers,
-                                                    self.requestant.body))
+                                                    self.requestant.body)
         data = odict()
         data['version'] = "HTTP/{0}.{1}".format(*self.requestant.version)
         data['method'] = self.requestant.method
@@ -1030,6 +1036,7 @@ class Porter(object):
                  scheme=u'',
                  dictable=False,
                  timeout=None,
+                 selective=False,
                  **kwa):
         """
         Initialization method for instance.
@@ -1050,6 +1057,9 @@ class Porter(object):
         eha = external destination address for incoming connections used in TLS
         scheme = http scheme u'http' or u'https' or empty
         dictable = Boolean flag If True attempt to convert body from json for requestants
+        timeout = timeout in seconds for dropping idle connections
+        selective = Boolean True means created servant only services sockets
+                    its selector reports ready
 
         """
         self.store = store or storing.Store(stamp=0.0)
@@ -1100,6 +1110,7 @@ class Porter(object):
                                     bufsize=bufsize,
                                     wlog=wlog,
                                     timeout=self.timeout,
+                                    selective=selective,
                                     **kwa)
             else:
                 servant = Server(store=self.store,
@@ -1109,6 +1120,7 @@ class Porter(object):
                                  bufsize=bufsize,
                                  wlog=wlog,
                                  timeout=self.timeout,
+                                 selective=selective,
                                  **kwa)
 
 
@@ -1147,8 +1159,9 @@ class Porter(object):
             if ca not in self.stewards:
                 self.stewards[ca] = Steward(incomer=ix, dictable=self.dictable)
 
-            if ix.timeout > 0.0 and ix.timer.expired:
-                self.closeConnection(ca)
+        for ix in self.servant.wheel.expireds():  # only timed out incomers
+            if self.servant.ixes.get(ix.ca) is ix:
+                self.closeConnection(ix.ca)
 
     def serviceStewards(self):
         """
@@ -1161,11 +1174,11 @@ class Porter(object):
                 if steward.requestant.ended:
                     steward.requestant.dictify()
                     console.concise("Parsed Request:\n{0} {1} {2}\n"
-                                    "{3}\n{4}\n".format(steward.requestant.method,
+                                    "{3}\n{4}\n", steward.requestant.method,
                                                         steward.requestant.path,
                                                         steward.requestant.version,
                                                         steward.requestant.headers,
-                                                        steward.requestant.body))
+                                                        steward.requestant.body)
                     steward.respond()
 
             if steward.waited:
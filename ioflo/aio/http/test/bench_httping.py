@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks the resumable linear scan http line, leader, chunk and event
+parsers versus the previous generators that rescan the buffer for each
+candidate eol every time they resume.
+
+Cases:
+    head     request line and many headers arriving in small segments
+    longline one long header line arriving in small segments
+    chunks   many small chunks arriving at once
+    events   many LF terminated server sent events arriving at once
+             (previous is only the line split of the event stream)
+
+example:
+
+python -m ioflo.aio.http.test.bench_httping -n 5
+
+"""
+import sys
+import time
+import argparse
+
+from ioflo.aid.odicting import odict, lodict
+from ioflo.aio.http import httping
+from ioflo.aio.http.httping import CRLF, LF, CR, MAX_LINE_SIZE
+
+
+def legacyParseLine(raw, eols=(CRLF, LF, CR ), kind="event line"):
+    """
+    Previous parseLine generator
+    """
+    while True:
+        for eol in eols:  # loop over eols unless found
+            index = raw.find(eol)  # not found index == -1
+            if index >= 0:
+                break
+
+        if index < 0:  # not found
+            if len(raw) > MAX_LINE_SIZE:
+                raise httping.LineTooLong(kind)
+            else:
+                (yield None)  # more data needed not done parsing header
+                continue
+
+        if index > MAX_LINE_SIZE:  # found but line too long
+            raise httping.LineTooLong(kind)
+
+        line = raw[:index]
+        index += len(eol)  # strip eol
+        del raw[:index] # remove used bytes
+        (yield line)
+
+
+def legacyParseLeader(raw, eols=(CRLF, LF), kind="leader header line", headers=None):
+    """
+    Previous parseLeader generator
+    """
+    headers = headers if headers is not None else lodict()
+    while True:  # loop until entire heading indicated by empty line
+        for eol in eols:  # loop over eols unless found
+            index = raw.find(eol)  # not found index == -1
+            if index >= 0:
+                break
+
+        if index < 0:  # not found
+            if len(raw) > MAX_LINE_SIZE:
+                raise httping.LineTooLong(kind)
+            else:
+                (yield None)  # more data needed not done parsing header
+                continue
+
+        if index > MAX_LINE_SIZE:  # found but line too long
+            raise httping.LineTooLong(kind)
+
+        line = raw[:index]
+        index += len(eol)  # strip eol
+        del raw[:index] # remove used bytes
+        if line:
+            line = line.decode('iso-8859-1')  # convert to unicode string
+            key, value = line.split(': ', 1)
+            headers[key] = value
+
+        if not line:  # empty line so entire leader done
+            (yield headers) # leader done
+
+
+def legacyParseChunk(raw):
+    """
+    Previous parseChunk generator without extensions or trailers
+    """
+    lineParser = legacyParseLine(raw=raw, eols=(CRLF, ), kind="chunk size line")
+    while True:
+        line = next(lineParser)
+        if line is not None:
+            lineParser.close()  # close generator
+            break
+        (yield None)
+
+    size = int(line.strip().decode('ascii'), 16)
+    parms = odict()
+    trails = lodict()
+    chunk = bytearray()
+    if size:
+        while len(raw) < size:  # need more for chunk
+            (yield None)
+        chunk = raw[:size]
+        del raw[:size]  # remove used bytes
+
+    lineParser = legacyParseLine(raw=raw, eols=(CRLF, ), kind="chunk end line")
+    while True:
+        line = next(lineParser)
+        if line is not None:
+            lineParser.close()  # close generator
+            break
+        (yield None)
+
+    (yield (size, parms, trails, chunk))
+
+
+def parseHead(raw, data, segment, lineParse, leaderParse):
+    """
+    Feed data into raw segment bytes at a time and parse start line and leader
+    """
+    lineParser = lineParse(raw=raw, eols=(CRLF, LF), kind="status line")
+    leaderParser = None
+    for i in range(0, len(data), segment):
+        raw.extend(data[i:i + segment])
+        if leaderParser is None:
+            line = next(lineParser)
+            if line is None:
+                continue
+            lineParser.close()
+            leaderParser = leaderParse(raw=raw)
+        headers = next(leaderParser)
+        if headers is not None:
+            leaderParser.close()
+            return headers
+    raise ValueError("Incomplete head")
+
+
+def makeCases(legacy):
+    """
+    Returns list of (name, callable) cases
+    """
+    lineParse = legacyParseLine if legacy else httping.parseLine
+    leaderParse = legacyParseLeader if legacy else httping.parseLeader
+    chunkParse = legacyParseChunk if legacy else httping.parseChunk
+
+    head = (b"GET /echo HTTP/1.1\r\n" +
+            b"".join(httping.packHeader("X-Header-{0}".format(i), "value" * 4) + CRLF
+                     for i in range(99)) +
+            b"\r\n")
+
+    def headCase():
+        parseHead(bytearray(), head, 16, lineParse, leaderParse)
+
+    longhead = (b"GET /echo HTTP/1.1\r\n" +
+                httping.packHeader("X-Long", "v" * 60000) + CRLF +
+                b"\r\n")
+
+    def longlineCase():
+        parseHead(bytearray(), longhead, 100, lineParse, leaderParse)
+
+    body = b"".join(httping.packChunk(b"chunk" * 4) for i in range(2000)) + b"0\r\n\r\n"
+
+    def chunksCase():
+        raw = bytearray(body)
+        while True:
+            parser = chunkParse(raw=raw)
+            size, parms, trails, chunk = next(parser)
+            parser.close()
+            if not size:
+                break
+
+    stream = b"".join(b"id: {0}\nevent: tick\ndata: {0}\n\n".replace(b"{0}",
+                      str(i).encode("ascii")) for i in range(2000))
+
+    def eventsCase():
+        raw = bytearray(stream)
+        if legacy:
+            parser = legacyParseLine(raw=raw, eols=(CRLF, LF, CR))
+            while raw:
+                next(parser)
+        else:
+            source = httping.EventSource(raw=raw)
+            source.parse()
+
+    return [("head", headCase),
+            ("longline", longlineCase),
+            ("chunks", chunksCase),
+            ("events", eventsCase)]
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark http parsers.")
+    p.add_argument('-n', '--number', type=int, default=5,
+                   help="Number of runs per case.")
+    args = p.parse_args()
+
+    results = odict()
+    for legacy in (True, False):
+        for name, case in makeCases(legacy):
+            best = None
+            for i in range(args.number):
+                start = time.time()
+                case()
+                elapsed = time.time() - start
+                best = elapsed if best is None else min(best, elapsed)
+            results[(name, legacy)] = best
+
+    for name, case in makeCases(False):
+        legacy = results[(name, True)]
+        fast = results[(name, False)]
+        print("{0:9s} previous={1:0.3f}ms linear={2:0.3f}ms speedup={3:0.1f}x"
+              "".format(name, 1000.0 * legacy, 1000.0 * fast, legacy / fast))
+
+
+if __name__ == "__main__":
+    main()
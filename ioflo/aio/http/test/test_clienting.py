@@ -3867,6 +3867,147 @@ class BasicTestCase(unittest.TestCase):
         self.assertEqual(newQuery, u'oauth_consumer_key=meWtb1jEOCQciCgqheqiQoU&oauth_nonce=eb616fe02004000&oauth_signature_method=HMAC-SHA1&oauth_timestamp=1437580412&oauth_token=1048104-WpGhCC4Fbj9Bp5PaTTuN0laSqD4vxCb2B7xh62YD&oauth_version=1.0&oauth_signature=KBD3DdNVZBjyOd0fqQ9X17ack%3D')
 
 
+    def testPatronPipelined(self):
+        """
+        Test Patron pipelining requests on one connection to Valet
+        """
+        console.terse("{0}\n".format(self.testPatronPipelined.__doc__))
+
+        store = storing.Store(stamp=0.0)
+
+        def wsgiApp(environ, start_response):
+            body = u"{0} {1}?{2}".format(environ['REQUEST_METHOD'],
+                                          environ['PATH_INFO'],
+                                          environ['QUERY_STRING']).encode('ascii')
+            start_response('200 OK', [('Content-type','text/plain'),
+                                      ('Content-length', str(len(body)))])
+            return [body]
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              app=wsgiApp)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        beta = clienting.Patron(bufsize=131072,
+                                store=store,
+                                hostname=alpha.servant.eha[0],
+                                port=alpha.servant.eha[1],
+                                pipeline=3,
+                                reconnectable=True,
+                                )
+        self.assertEqual(beta.pipeline, 3)
+        self.assertIs(beta.connector.reopen(), True)
+
+        methods = [u'GET', u'GET', u'POST', u'GET', u'DELETE']
+        for i, method in enumerate(methods):
+            beta.request(method=method,
+                         path=u'/echo',
+                         qargs=odict([(u'index', i)]),
+                         headers=odict([(u'Accept', u'text/plain')]),
+                         body=b'hello' if method == u'POST' else None,
+                         reply=odict([(u'rid', i)]))
+
+        while not beta.connector.connected:
+            beta.serviceAll()
+            alpha.serviceAll()
+            time.sleep(0.05)
+
+        # GETs and POST in flight but nothing pipelined behind the POST
+        self.assertEqual([request['method'] for request in beta.pendings],
+                         [u'GET', u'GET', u'POST'])
+        self.assertEqual(len(beta.requests), 2)
+        self.assertIs(beta.waited, True)
+
+        while (beta.requests or beta.pendings or beta.connector.txes or
+               len(beta.responses) < len(methods)):
+            alpha.serviceAll()
+            time.sleep(0.05)
+            beta.serviceAll()
+            time.sleep(0.05)
+
+        self.assertEqual(len(alpha.servant.ixes), 1)  # one connection
+        self.assertIs(beta.waited, False)
+        self.assertEqual(len(beta.responses), len(methods))
+        for i, method in enumerate(methods):
+            response = beta.respond()
+            self.assertEqual(response.status, 200)
+            self.assertIs(response.errored, False)
+            self.assertEqual(response.request['reply'], odict([(u'rid', i)]))
+            self.assertEqual(response.request['method'], method)
+            self.assertEqual(response.request['qargs'], odict([(u'index', i)]))
+            self.assertEqual(response.body,
+                             u"{0} /echo?index={1}".format(method, i).encode('ascii'))
+
+        alpha.servant.closeAll()
+        beta.connector.close()
+
+    def testPatronPool(self):
+        """
+        Test PatronPool dispatching requests over pooled connections
+        """
+        console.terse("{0}\n".format(self.testPatronPool.__doc__))
+
+        store = storing.Store(stamp=0.0)
+
+        def wsgiApp(environ, start_response):
+            body = u"{0}?{1}".format(environ['PATH_INFO'],
+                                     environ['QUERY_STRING']).encode('ascii')
+            start_response('200 OK', [('Content-type','text/plain'),
+                                      ('Content-length', str(len(body)))])
+            return [body]
+
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              app=wsgiApp)
+        self.assertIs(alpha.servant.reopen(), True)
+
+        pool = clienting.PatronPool(store=store,
+                                    name=u'pool',
+                                    size=2,
+                                    pipeline=2,
+                                    bufsize=131072,
+                                    hostname=alpha.servant.eha[0],
+                                    port=alpha.servant.eha[1],
+                                    headers=odict([(u'Accept', u'text/plain')]),
+                                    reconnectable=True)
+
+        for i in range(6):
+            pool.request(path=u'/echo?index={0}'.format(i), reply=i)
+        pool.request(path=u'http://localhost:{0}/echo?index=6'.format(alpha.servant.eha[1]),
+                     reply=6)
+
+        pool.serviceRequests()
+        self.assertEqual(len(pool.requests), 0)
+        origin = (u'http', alpha.servant.eha[0], alpha.servant.eha[1])
+        self.assertEqual(pool.patrons.keys(),
+                         [origin, (u'http', u'localhost', alpha.servant.eha[1])])
+        self.assertEqual(len(pool.patrons[origin]), 2)
+        self.assertEqual([len(patron.requests) for patron in pool.patrons[origin]],
+                         [3, 3])
+
+        while len(pool.responses) < 7:
+            alpha.serviceAll()
+            time.sleep(0.05)
+            pool.serviceAll()
+            time.sleep(0.05)
+
+        self.assertEqual(len(alpha.servant.ixes), 3)
+        responses = odict()
+        while pool.responses:
+            response = pool.respond()
+            responses[response.request['reply']] = response
+        self.assertEqual(sorted(responses.keys()), list(range(7)))
+        for reply, response in responses.items():
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.body,
+                             u"/echo?index={0}".format(reply).encode('ascii'))
+
+        pool.close()
+        self.assertEqual(len(pool.patrons), 0)
+        alpha.servant.closeAll()
+
 
 
 def runOne(test):
@@ -3905,6 +4046,8 @@ def runSome():
              'testPatronRedirectComplexSecure',
              'testMultiPartForm',
              'testQueryQuoting',
+             'testPatronPipelined',
+             'testPatronPool',
             ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for httping module
+"""
+import sys
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from ioflo.aid.sixing import *
+from ioflo.aid.odicting import odict
+from ioflo.aid.consoling import getConsole
+from ioflo.aio.http import httping
+
+console = getConsole()
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+
+def feed(parser, raw, data):
+    """
+    Feed data one byte at a time into raw and service parser until result
+    Returns result
+    """
+    for i in range(len(data)):
+        raw.extend(data[i:i+1])
+        result = next(parser)
+        if result is not None:
+            return result
+    return None
+
+
+class BasicTestCase(unittest.TestCase):
+    """
+    Test Case
+    """
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def testFindEol(self):
+        """
+        Test findEol single pass earliest eol search
+        """
+        console.terse("{0}\n".format(self.testFindEol.__doc__))
+
+        findEol = httping.findEol
+        CRLF, LF, CR = httping.CRLF, httping.LF, httping.CR
+
+        self.assertEqual(findEol(bytearray(b"abc")), (-1, 0))
+        self.assertEqual(findEol(bytearray(b"abc\r\ndef")), (3, 2))
+        self.assertEqual(findEol(bytearray(b"abc\ndef\r\n")), (3, 1))
+        self.assertEqual(findEol(bytearray(b"abc\rdef\n")), (3, 1))
+        self.assertEqual(findEol(bytearray(b"abc\r")), (-1, 0))  # may be CRLF
+        self.assertEqual(findEol(bytearray(b"abc\r"), eols=(CR, LF)), (3, 1))
+        self.assertEqual(findEol(bytearray(b"a\nb\r\n"), eols=(CRLF, LF)), (1, 1))
+        self.assertEqual(findEol(bytearray(b"a\rb\r\n"), eols=(CRLF, LF)), (3, 2))
+        self.assertEqual(findEol(bytearray(b"a\nb\r\n"), eols=(CRLF, )), (3, 2))
+        self.assertEqual(findEol(bytearray(b"a\nb\n"), eols=(CRLF, )), (-1, 0))
+        self.assertEqual(findEol(bytearray(b"abc\r\ndef\r\n"), start=5), (8, 2))
+        self.assertEqual(findEol(bytearray(b"abc\r\n"), start=3), (3, 2))
+        self.assertEqual(findEol(bytearray(b"a\nb\r"), eols=(CR, )), (3, 1))
+
+        raw = bytearray(b"line\r" * 4 + b"tail")  # CR lines without any LF
+        scan = 0
+        lines = []
+        while True:
+            index, size = findEol(raw, scan, eols=(CR, LF))
+            if index < 0:
+                break
+            lines.append(bytes(raw[scan:index]))
+            scan = index + size
+        self.assertEqual(lines, [b"line"] * 4)
+        self.assertEqual(scan, len(raw) - 4)
+
+    def testParseLineLeader(self):
+        """
+        Test parseLine and parseLeader fed one byte at a time
+        """
+        console.terse("{0}\n".format(self.testParseLineLeader.__doc__))
+
+        msg = (b"GET /echo HTTP/1.1\r\n"
+               b"Host: localhost:6101\r\n"
+               b"Accept: application/json\n"
+               b"Content-Length: 0\r\n"
+               b"\r\n"
+               b"GET /next HTTP/1.1\r\n")
+        raw = bytearray()
+        lineParser = httping.parseLine(raw=raw, eols=(httping.CRLF, httping.LF))
+        line = feed(lineParser, raw, msg)
+        lineParser.close()
+        self.assertEqual(line, b"GET /echo HTTP/1.1")
+        self.assertEqual(raw, bytearray())
+
+        leaderParser = httping.parseLeader(raw=raw)
+        headers = feed(leaderParser, raw, msg[len(line) + 2:])
+        leaderParser.close()
+        self.assertEqual(headers.items(), [('host', 'localhost:6101'),
+                                           ('accept', 'application/json'),
+                                           ('content-length', '0')])
+        self.assertEqual(raw, bytearray())
+
+        raw.extend(msg)  # all at once leaves pipelined request in raw
+        lineParser = httping.parseLine(raw=raw, eols=(httping.CRLF, httping.LF))
+        self.assertEqual(next(lineParser), b"GET /echo HTTP/1.1")
+        leaderParser = httping.parseLeader(raw=raw)
+        self.assertEqual(len(next(leaderParser)), 3)
+        self.assertEqual(raw, bytearray(b"GET /next HTTP/1.1\r\n"))
+
+        raw = bytearray(b"x" * (httping.MAX_LINE_SIZE + 1))
+        leaderParser = httping.parseLeader(raw=raw)
+        with self.assertRaises(httping.LineTooLong):
+            next(leaderParser)
+
+    def testParseChunk(self):
+        """
+        Test parseChunk with pipelined chunks and fed one byte at a time
+        """
+        console.terse("{0}\n".format(self.testParseChunk.__doc__))
+
+        chunks = [b"Hello", b" ", b"World" * 10]
+        body = b"".join(httping.packChunk(chunk) for chunk in chunks)
+        body += b"0;name=value\r\nTrailer: yes\r\n\r\n"
+
+        raw = bytearray(body)  # all at once
+        results = []
+        while True:
+            parser = httping.parseChunk(raw=raw)
+            result = next(parser)
+            parser.close()
+            results.append(result)
+            if not result[0]:
+                break
+        self.assertEqual([bytes(chunk) for size, parms, trails, chunk in results[:-1]],
+                         chunks)
+        size, parms, trails, chunk = results[-1]
+        self.assertEqual(size, 0)
+        self.assertEqual(parms, odict([(b'name', b'value')]))
+        self.assertEqual(trails.items(), [('trailer', 'yes')])
+        self.assertEqual(raw, bytearray())
+
+        raw = bytearray()  # one byte at a time
+        data = body
+        results = []
+        while True:
+            parser = httping.parseChunk(raw=raw)
+            result = next(parser)
+            while result is None:
+                raw.extend(data[:1])
+                data = data[1:]
+                result = next(parser)
+            parser.close()
+            results.append(result)
+            if not result[0]:
+                break
+        self.assertEqual([bytes(chunk) for size, parms, trails, chunk in results[:-1]],
+                         chunks)
+        self.assertEqual(raw, bytearray())
+
+        raw = bytearray(b"5\r\nHelloX\r\n")
+        parser = httping.parseChunk(raw=raw)
+        with self.assertRaises(ValueError):
+            next(parser)
+
+    def testEventSource(self):
+        """
+        Test EventSource parseEvents with mixed eols fed one byte at a time
+        """
+        console.terse("{0}\n".format(self.testEventSource.__doc__))
+
+        stream = (b"id: 0\nevent: Hello\ndata: first\n\n"
+                  b": comment\r\nid: 1\r\ndata: second\r\ndata: more\r\n\r\n"
+                  b"data: third\r\r")
+        raw = bytearray()
+        source = httping.EventSource(raw=raw)
+        for i in range(len(stream)):
+            raw.extend(stream[i:i+1])
+            source.parse()
+        source.close()
+        raw.extend(b"\n")
+        source.parse()
+        self.assertEqual(list(source.events),
+                         [odict([('id', u'0'), ('name', u'Hello'), ('data', u'first')]),
+                          odict([('id', u'1'), ('name', u''), ('data', u'second\nmore')]),
+                          odict([('id', u'1'), ('name', u''), ('data', u'third')])])
+        self.assertIs(source.parser, None)
+        self.assertEqual(raw, bytearray())
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = [
+             'testFindEol',
+             'testParseLineLeader',
+             'testParseChunk',
+             'testEventSource',
+            ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testFindEol')
@@ -211,6 +211,60 @@ class BasicTestCase(unittest.TestCase):
         wireLogAlpha.close()
         wireLogBeta.close()
 
+    def testPorterServiceEchoSelective(self):
+        """
+        Test Porter service request response of echo with selective servant
+        """
+        console.terse("{0}\n".format(self.testPorterServiceEchoSelective.__doc__))
+
+        store = storing.Store(stamp=0.0)
+
+        alpha = serving.Porter(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              selective=True)
+        self.assertIs(alpha.servant.selective, True)
+        self.assertIs(alpha.servant.reopen(), True)
+        self.assertEqual(alpha.servant.eha, ('127.0.0.1', 6101))
+
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+
+        beta = clienting.Patron(bufsize=131072,
+                                     store=store,
+                                     path=path,
+                                     reconnectable=True,
+                                     )
+        self.assertIs(beta.connector.reopen(), True)
+
+        request = odict([('method', u'GET'),
+                         ('path', u'/echo?name=fame'),
+                         ('qargs', odict()),
+                         ('fragment', u''),
+                         ('headers', odict([('Accept', 'application/json'),
+                                            ('Content-Length', 0)])),
+                        ])
+
+        for i in range(2):  # second request on persistent connection
+            beta.requests.append(dict(request))
+            while (beta.requests or beta.connector.txes or not beta.responses or
+                   not alpha.servant.ixes or not alpha.idle()):
+                alpha.serviceAll()
+                time.sleep(0.05)
+                beta.serviceAll()
+                time.sleep(0.05)
+
+            self.assertEqual(len(alpha.servant.ixes), 1)
+            self.assertEqual(len(alpha.stewards), 1)
+            self.assertEqual(len(beta.responses), 1)
+            response = beta.responses.popleft()
+            self.assertEqual(response['status'], 200)
+            self.assertEqual(response['data']['path'], '/echo')
+            self.assertEqual(response['data']['qargs'], {'name': 'fame'})
+
+        alpha.servant.closeAll()
+        self.assertIsNone(alpha.servant.selector)
+        beta.connector.close()
+
     def testValetServiceBasic(self):
         """
         Test Valet WSGI service request response
@@ -303,6 +357,77 @@ class BasicTestCase(unittest.TestCase):
         wireLogAlpha.close()
         wireLogBeta.close()
 
+    def testValetServiceTimeout(self):
+        """
+        Test Valet reaps only timed out connections from servant wheel
+        """
+        console.terse("{0}\n".format(self.testValetServiceTimeout.__doc__))
+
+        store = storing.Store(stamp=0.0)
+
+        def wsgiApp(environ, start_response):
+            start_response('200 OK', [('Content-type','text/plain'),
+                                      ('Content-length', '12')])
+            return [b"Hello World!"]
+
+        console.terse("{0}\n".format("Building Valet ...\n"))
+        alpha = serving.Valet(port = 6101,
+                              bufsize=131072,
+                              store=store,
+                              timeout=2.0,
+                              app=wsgiApp)
+        self.assertIs(alpha.servant.reopen(), True)
+        self.assertIs(alpha.servant.wheel.store, store)
+
+        console.terse("{0}\n".format("Building Patron ...\n"))
+        path = "http://{0}:{1}/".format('localhost', alpha.servant.eha[1])
+        beta = clienting.Patron(bufsize=131072,
+                                store=store,
+                                path=path,
+                                reconnectable=False,
+                                )
+        self.assertIs(beta.connector.reopen(), True)
+
+        request = odict([('method', u'GET'),
+                         ('path', u'/echo?name=fame'),
+                         ('qargs', odict()),
+                         ('fragment', u''),
+                         ('headers', odict([('Accept', 'application/json'),
+                                            ('Content-Length', 0)])),
+                        ])
+        beta.requests.append(request)
+
+        while (beta.requests or beta.connector.txes or not beta.responses or
+               not alpha.idle()):
+            alpha.serviceAll()
+            time.sleep(0.05)
+            beta.serviceAll()
+            time.sleep(0.05)
+
+        self.assertEqual(len(beta.responses), 1)
+        self.assertEqual(len(alpha.servant.ixes), 1)
+        ix = alpha.servant.ixes.values()[0]
+        self.assertTrue(ix in alpha.servant.wheel)
+        self.assertEqual(alpha.servant.wheel.deadline(ix), ix.timer.stop)
+
+        store.advanceStamp(1.0)
+        ix.refresh()  # activity reschedules
+        self.assertEqual(alpha.servant.wheel.deadline(ix), 3.0)
+        store.advanceStamp(1.5)
+        alpha.serviceConnects()
+        self.assertEqual(len(alpha.servant.ixes), 1)
+        self.assertEqual(len(alpha.reqs), 1)
+
+        store.advanceStamp(0.5)
+        alpha.serviceConnects()
+        self.assertEqual(len(alpha.servant.ixes), 0)
+        self.assertEqual(len(alpha.reqs), 0)
+        self.assertEqual(len(alpha.reps), 0)
+        self.assertEqual(len(alpha.servant.wheel), 0)
+
+        alpha.servant.closeAll()
+        beta.connector.close()
+
     def testValetServiceBottle(self):
         """
         Test Valet WSGI service request response
@@ -1285,7 +1410,9 @@ def runSome():
     names = [
              'testHttpError',
              'testPorterServiceEcho',
+             'testPorterServiceEchoSelective',
              'testValetServiceBasic',
+             'testValetServiceTimeout',
              'testValetServiceBottle',
              'testValetServiceBottleNoContentLength',
              'testValetServiceBottleNonPersistent',
@@ -33,9 +33,10 @@ class Exchange(MixIn):
                  name=None,
                  device=None,
                  timeout=None,
-                 redoTimout=None,
+                 redoTimeout=None,
                  tx=None,
-                 rx=None):
+                 rx=None,
+                 wheel=None):
         """
         Setup Exchange instance
 
@@ -51,6 +52,7 @@ class Exchange(MixIn):
             redoTimeout is redo appropriate packet/message in exchange
             rx is latest received  msg/pkt/data
             tx is latest/next transmitted msg/pkt/data
+            wheel is shared Wheel instance if any that .refresh reschedules into
 
         Class Attributes:
             .Timeout is overall exchange timeout
@@ -70,6 +72,7 @@ class Exchange(MixIn):
             .redoTimer is StoreTimer instance for .redoTimeout
             .rx is latest received  msg/pkt/data
             .tx is latest/next transmitted msg/pkt/data
+            .wheel is shared Wheel instance or None
             .done is True If done  False otherwise
             .failed is True If failed False otherwise
             .acked is True if ack has been sent
@@ -85,10 +88,11 @@ class Exchange(MixIn):
         self.device = device
         self.timeout = timeout if timeout is not None else self.Timeout
         self.timer = StoreTimer(stack.stamper, duration=self.timeout)
-        self.redoTimeout = redoTimeout if redoTimout is not None else self.RedoTimeout
+        self.redoTimeout = redoTimeout if redoTimeout is not None else self.RedoTimeout
         self.redoTimer = StoreTimer(stack.stamper, duration=self.redoTimeout)
         self.rx = rx  # latest received
         self.tx = tx  # initial to transmit
+        self.wheel = wheel
         self.done = False
         self.failed = False
         self.acked = False
@@ -101,6 +105,15 @@ class Exchange(MixIn):
         self.failed = False
         self.acked = False
 
+    def refresh(self):
+        """
+        Restart .timer and reschedule into .wheel if any so the wheel owner
+        need only .process the exchanges its .wheel.expireds() returns
+        """
+        self.timer.restart()
+        if self.wheel is not None and self.timeout > 0.0:
+            self.wheel.schedule(self, self.timeout, start=self.timer.start)
+
     def start(self):
         """
         Startup first run when context is ready
@@ -119,18 +132,18 @@ class Exchange(MixIn):
         Process time based handling of exchange like timeout or retries
         """
         if self.timeout > 0.0 and self.timer.expired:
-            console.verbose("{0}. Timed out with {1} at {2}\n".format(
-                    self.stack.name, self.device.name, round(self.stack.stamper.stamp, 3)))
+            console.verbose("{0}. Timed out with {1} at {2}\n",
+                    self.stack.name, self.device.name, round(self.stack.stamper.stamp, 3))
             self.fail()
             return
 
         if self.redoTimeout > 0.0 and self.redoTimer.expired:
             self.redoTimer.restart()
-            console.verbose("{0}: Redoing {1} with {2} at {3}\n".format(
+            console.verbose("{0}: Redoing {1} with {2} at {3}\n",
                                             self.stack.name,
                                             self.name,
                                             self.device.name,
-                                            round(self.stack.stamper.stamp, 3)))
+                                            round(self.stack.stamper.stamp, 3))
             if self.tx is not None:
                 self.send(self.tx)
 
@@ -203,9 +216,11 @@ class Exchange(MixIn):
 
     def prepFinish(self):
         """
-        Mark flags
+        Mark flags and unschedule from .wheel if any
         """
         self.done = True
+        if self.wheel is not None:
+            self.wheel.remove(self)
 
     def finish(self):
         """
@@ -215,11 +230,11 @@ class Exchange(MixIn):
         """
         self.prepFinish()
         console.verbose("{0}: Finished {1} with {2} as {3}"
-                        " at {4}\n".format(self.stack.name,
+                        " at {4}\n", self.stack.name,
                                             self.name,
                                             self.device.name,
                                             'FAILURE' if self.failed else 'SUCCESS',
-                                            round(self.stack.stamper.stamp, 3)))
+                                            round(self.stack.stamper.stamp, 3))
 
     def fail(self):
         """
@@ -287,12 +302,12 @@ class Exchanger(Exchange):
         """
         self.prepStart()  # reset flags
 
-        self.timer.restart()
+        self.refresh()
         self.redoTimer.restart()
-        console.verbose("{0}: Initiating {1} with {2} at {3}.\n".format(self.stack.name,
+        console.verbose("{0}: Initiating {1} with {2} at {3}.\n", self.stack.name,
                                             self.name,
                                             self.device.name,
-                                            round(self.stack.stamper.stamp, 3)))
+                                            round(self.stack.stamper.stamp, 3))
         self.send(tx)
 
 class Exchangent(Exchange):
@@ -355,12 +370,12 @@ class Exchangent(Exchange):
         """
         self.prepStart()  # reset flags
 
-        self.timer.restart()
+        self.refresh()
         self.redoTimer.restart()
-        console.verbose("{0}: Corresponding {1} with {2} at {3}.\n".format(self.stack.name,
+        console.verbose("{0}: Corresponding {1} with {2} at {3}.\n", self.stack.name,
                                             self.name,
                                             self.device.name,
-                                            round(self.stack.stamper.stamp, 3)))
+                                            round(self.stack.stamper.stamp, 3))
         self.respond(rx)
 
     def respond(self, rx=None):
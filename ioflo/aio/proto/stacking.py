@@ -142,8 +142,8 @@ class Stack(MixIn):
 
             self.aha = self.handler.ha  # update accepting host address after open
 
-            console.verbose("Stack '{0}': Opened handler at '{1}'\n".format(self.name,
-                                                                           self.aha))
+            console.verbose("Stack '{0}': Opened handler at '{1}'\n", self.name,
+                                                                           self.aha)
 
         self.stats = stats if stats is not None else odict() # communication statistics
         self.statTimer = StoreTimer(self.stamper)
@@ -285,8 +285,9 @@ class Stack(MixIn):
         except Exception as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n", self.name,
+                                    hexlify(self.txbs[:count]).decode('ascii'))
 
         if count < len(self.txbs):  # delete sent portion
             del self.txbs[:count]
@@ -347,7 +348,7 @@ class Stack(MixIn):
         Appends (packed, ha) duple to txPkts deque
         """
         msg = self.txMsgs.popleft()
-        console.verbose("{0} sending\n{1}\n".format(self.name, msg))
+        console.verbose("{0} sending\n{1}\n", self.name, msg)
         packet = self.packetize(msg)
         if packet is not None:  # queue packet
             self.txPkts.append(packet)
@@ -398,13 +399,17 @@ class Stack(MixIn):
     def parserize(self, raw):
         """
         Returns packet parsed from raw data
+        raw is copy of .rxbs or when handler is zerocopy a memoryview of the
+        handler's .rxbs that it received into
+        so parsing does not copy the buffer. A memoryview is only valid during
+        the call so copy whatever the packet keeps.
         Override in subclass
         """
         packet = packeting.Packet(stack=self)
         try:
             packet.parse(raw=raw)
         except ValueError as ex:
-            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name, raw, ex)
+            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name, bytes(raw), ex)
             console.terse(emsg)
             self.incState("pkt_parse_error")
             return None
@@ -416,6 +421,8 @@ class Stack(MixIn):
         assumes that there is a .handler
         Override in subclass
         """
+        zerocopy = getattr(self.handler, "zerocopy", False)
+        rxbs = self.handler.rxbs if zerocopy else self.rxbs  # parse where received
         while True:  # keep receiving until empty
             try:
                 raw = self.handler.receive()
@@ -424,14 +431,16 @@ class Stack(MixIn):
 
             if not raw:
                 return False  # no received data
-            self.rxbs.extend(raw)
+            if not zerocopy:  # zerocopy handler already received into its .rxbs
+                self.rxbs.extend(raw)
 
-        packet = self.parserize(self.rxbs[:])
+        packet = self.parserize(memoryview(rxbs) if zerocopy else rxbs[:])
 
         if packet is not None:  # queue packet
-            console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                                        hexlify(self.rxbs[:packet.size]).decode('ascii')))
-            del self.rxbs[:packet.size]
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received\n    0x{1}\n", self.name,
+                                            hexlify(rxbs[:packet.size]).decode('ascii'))
+            del rxbs[:packet.size]
             self.rxPkts.append(packet)
         return True  # received data
 
@@ -463,7 +472,8 @@ class Stack(MixIn):
         Assumes that there is a message on the .rxes deque
         """
         pkt = self.rxPkts.popleft()
-        console.verbose("{0} received packet\n{1}\n".format(self.name, pkt.show()))
+        if console._verbosity >= console.Wordage.verbose:
+            console.verbose("{0} received packet\n{1}\n", self.name, pkt.show())
         self.incStat("pkt_received")
         message = self.messagize(pkt)
         if message is not None:
@@ -489,9 +499,9 @@ class Stack(MixIn):
         """
         msg = self.rxMsgs.popleft()
         console.verbose("{0}: Servicing RxMsg at {1:.3f}:"
-                        "\n     {2}\n".format(self.name,
+                        "\n     {2}\n", self.name,
                                               self.stamper.stamp,
-                                              msg))
+                                              msg)
 
     def serviceRxMsgs(self):
         """
@@ -646,8 +656,9 @@ class RemoteStack(Stack):
         except Exception as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n", self.name,
+                                    hexlify(self.txbs[:count]).decode('ascii'))
 
         if count < len(self.txbs):  # delete sent portion
             del self.txbs[:count]
@@ -693,9 +704,9 @@ class RemoteStack(Stack):
         Appends (packet, ha) duple to txPkts deque
         """
         msg, remote = self.txMsgs.popleft()  # duple (msg, destination uid
-        console.verbose("{0} sending to {1}\n{2}\n".format(self.name,
+        console.verbose("{0} sending to {1}\n{2}\n", self.name,
                                                            remote.name,
-                                                           msg))
+                                                           msg)
         packet = self.packetize(msg, remote)
         if packet is not None:
             self.txPkts.append((packet, remote.ha))
@@ -726,7 +737,7 @@ class RemoteStack(Stack):
             remote = self.haRemotes[ha]
         except KeyError as ex:
             console.verbose(("{0}: Dropping packet received from unknown remote "
-                             "ha '{1}'.\n{2}\n".format(self.name, ha, pkt.packed)))
+                             "ha '{1}'.\n{2}\n", self.name, ha, pkt.packed))
             return (None, None)
         return (msg, remote)
 
@@ -736,9 +747,10 @@ class RemoteStack(Stack):
         Assumes that there is a message on the .rxes deque
         """
         pkt, ha = self.rxPkts.popleft()
-        console.verbose("{0} received packet from {1}\n{2}\n".format(self.name,
-                                                                     ha or '',
-                                                                     pkt.show()))
+        if console._verbosity >= console.Wordage.verbose:
+            console.verbose("{0} received packet from {1}\n{2}\n", self.name,
+                                                                         ha or '',
+                                                                         pkt.show())
         self.incStat("pkt_received")
         message, remote = self.messagize(pkt, ha)
         if remote:
@@ -750,9 +762,9 @@ class RemoteStack(Stack):
         """
         msg = self.rxMsgs.popleft()
         console.verbose("{0}: Servicing RxMsg at {1:.3f}:"
-                        "\n     {2}\n".format(self.name,
+                        "\n     {2}\n", self.name,
                                               self.stamper.stamp,
-                                              msg))
+                                              msg)
 
     def serviceTimers(self):
         """
@@ -982,8 +994,8 @@ class KeepStack(RemoteStack):
         '''
         Clear out and remove the keep dir and contents
         '''
-        console.verbose("Stack {0}: Clearing keep dir '{1}'\n".format(
-                                  self.name, self.keep.dirpath))
+        console.verbose("Stack {0}: Clearing keep dir '{1}'\n",
+                                  self.name, self.keep.dirpath)
         self.keep.clearAllDir()
 
     def dumpLocal(self):
@@ -1197,6 +1209,7 @@ class TcpServerStack(RemoteStack, IpStack):
                  host=u'',
                  eha=None,
                  bufsize=1048576,
+                 zerocopy=False,
                  **kwa):
         """
         Setup Stack instance
@@ -1224,6 +1237,7 @@ class TcpServerStack(RemoteStack, IpStack):
         Parameters:
             eha is external host address used by server acceptor TLS if any
             bufsize is tcp socket buffer size
+            zerocopy is True means handler incomers receive with recv_into
 
         Inherited Class Attributes:
             .Port is default port
@@ -1247,6 +1261,7 @@ class TcpServerStack(RemoteStack, IpStack):
         Attributes:
             .eha is external host address used by server acceptor TLS if any
             .bufsize is tcp socket buffer size
+            .zerocopy is True means handler incomers receive with recv_into
 
         Inherited Properties:
             .uid is local device unique id as stack uid
@@ -1260,6 +1275,7 @@ class TcpServerStack(RemoteStack, IpStack):
         """
         self.eha = eha
         self.bufsize = bufsize  # create server needs to setup before super call
+        self.zerocopy = zerocopy
         super(TcpServerStack, self).__init__(host=host, **kwa)
 
     def createHandler(self, ha):
@@ -1268,7 +1284,8 @@ class TcpServerStack(RemoteStack, IpStack):
         """
         handler = serving.Server(ha=ha,
                                 eha=self.eha,
-                                bufsize=self.bufsize)
+                                bufsize=self.bufsize,
+                                zerocopy=self.zerocopy)
         self.eha = handler.eha  # update local copy after init
         return handler
 
@@ -1282,14 +1299,15 @@ class TcpServerStack(RemoteStack, IpStack):
         try:
             self.handler.transmitIx(self, pkt.packed, ca)
         except ValueError as ex:
-            console.profuse("{0}: Error sending to {1}\n{2}\n".format(self.name,
+            console.profuse("{0}: Error sending to {1}\n{2}\n", self.name,
                                                                       ca,
-                                                                      ex))
+                                                                      ex)
             raise
 
-        console.profuse("{0}: sent to {1}\n    0x{2}\n".format(self.name,
-                                                               ca,
-                                hexlify(pkt.packed).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent to {1}\n    0x{2}\n", self.name,
+                                                                   ca,
+                                    hexlify(pkt.packed).decode('ascii'))
         return True  # never blocks
 
     def _serviceOneReceived(self, ix, ca):
@@ -1300,12 +1318,13 @@ class TcpServerStack(RemoteStack, IpStack):
         if not ix.rxbs:
             return False  # no data
 
-        packet = self.parserize(ix.rxbs[:])
+        packet = self.parserize(memoryview(ix.rxbs) if ix.zerocopy else ix.rxbs[:])
         if packet is None:  # not enough for packet
             return False
 
-        console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                            hexlify(ix.rxbs[:packet.size]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: received\n    0x{1}\n", self.name,
+                                hexlify(ix.rxbs[:packet.size]).decode('ascii'))
 
         del ix.rxbs[:packet.size]
         self.rxPkts.append((packet, ca))  # queue packet
@@ -1353,8 +1372,9 @@ class TcpServerStack(RemoteStack, IpStack):
                 remote = IpRemoteDevice(stack=self, ha=ca)
                 self.addRemote(remote)
 
-            if ix.timeout > 0.0 and ix.timer.expired:
-                self.closeConnection(ca)
+        for ix in self.handler.wheel.expireds():  # only timed out incomers
+            if self.handler.ixes.get(ix.ca) is ix:
+                self.closeConnection(ix.ca)
 
     def serviceAll(self):
         """
@@ -1372,6 +1392,7 @@ class ClientStreamStack(Stack):
     Client Stream based stack object.
     Should be subclassed for specific transport type
     """
+    TxBudget = 65536  # max bytes of queued packets coalesced into one send
 
     def __init__(self,
                  **kwa):
@@ -1432,20 +1453,22 @@ class ClientStreamStack(Stack):
         """
         Service one (packet, ha) duple on .txPkts deque
         Packet is assumed to be packed already in .packed
+        Queued packets up to .TxBudget bytes are coalesced into one send
         Override in subclass
         """
-        pkt = None
-        if not self.txbs:  # everything sent last time
-            pkt = self.txPkts.popleft()  # duple = (packet, destination address)
-            self.txbs.extend(pkt.packed)
+        if not self.txbs:  # everything sent last time so coalesce queued packets
+            while self.txPkts and len(self.txbs) < self.TxBudget:
+                pkt = self.txPkts.popleft()
+                self.txbs.extend(pkt.packed)
 
         try:
             count = self.handler.send(self.txbs)
         except Exception as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                    hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n", self.name,
+                                        hexlify(self.txbs[:count]).decode('ascii'))
 
         if count < len(self.txbs):  # delete sent portion
             del self.txbs[:count]
@@ -1457,13 +1480,17 @@ class ClientStreamStack(Stack):
     def parserize(self, raw):
         """
         Returns packet parsed from raw data
+        raw is copy of .rxbs or when handler is zerocopy a memoryview of the
+        handler's .rxbs that it received into
+        so parsing does not copy the buffer. A memoryview is only valid during
+        the call so copy whatever the packet keeps.
         Override in subclass
         """
         packet = packeting.Packet(stack=self)
         try:
             packet.parse(raw=raw)
         except ValueError as ex:
-            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name, raw, ex)
+            emsg = "{}: Error parsing raw.\n{}\n{}\n".format(self.name, bytes(raw), ex)
             console.terse(emsg)
             self.incState("pkt_parse_error")
             return None
@@ -1475,6 +1502,8 @@ class ClientStreamStack(Stack):
         assumes that there is a server
         Override in subclass
         """
+        zerocopy = getattr(self.handler, "zerocopy", False)
+        rxbs = self.handler.rxbs if zerocopy else self.rxbs  # parse where received
         received = False
         while True:  # keep receiving until empty
             try:
@@ -1485,17 +1514,19 @@ class ClientStreamStack(Stack):
             if not raw:
                 break  # no received data
             received = True
-            self.rxbs.extend(raw)
+            if not zerocopy:  # zerocopy handler already received into its .rxbs
+                self.rxbs.extend(raw)
 
         if not received:  # nothing changed
             return False
 
-        packet = self.parserize(self.rxbs[:])
+        packet = self.parserize(memoryview(rxbs) if zerocopy else rxbs[:])
 
         if packet is not None:  # queue packet
-            console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                            hexlify(self.rxbs[:packet.size]).decode('ascii')))
-            del self.rxbs[:packet.size]
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received\n    0x{1}\n", self.name,
+                                hexlify(rxbs[:packet.size]).decode('ascii'))
+            del rxbs[:packet.size]
             self.rxPkts.append(packet)
         return True  # received data
 
@@ -1519,6 +1550,7 @@ class TcpClientStack(ClientStreamStack, IpStack):
                  bufsize=16192,
                  timeout=None,
                  remote=None,
+                 zerocopy=False,
                  **kwa):
         """
         Setup Stack instance
@@ -1547,6 +1579,7 @@ class TcpClientStack(ClientStreamStack, IpStack):
             bufsize is tcp socket buffer size
             timeout is tcp handler reconnection timeout in seconds or None
             remote is Remote device instance if any
+            zerocopy is True means handler receives with recv_into
 
         Inherited Class Attributes:
             .Port is default port
@@ -1571,6 +1604,7 @@ class TcpClientStack(ClientStreamStack, IpStack):
             .bufsize is tcp socket buffer size
             .timeout is tcp handler reconnection timeout in seconds or None
             .remote is remote device instance if any
+            .zerocopy is True means handler receives with recv_into
 
         Inherited Properties:
             .uid is local device unique id as stack uid
@@ -1587,6 +1621,7 @@ class TcpClientStack(ClientStreamStack, IpStack):
         """
         self.bufsize = bufsize  # create server needs to setup before super call
         self.timeout = timeout
+        self.zerocopy = zerocopy
 
         if ha is None:  # ha for remote not local
             if (host is not None or port is not None):
@@ -1640,7 +1675,8 @@ class TcpClientStack(ClientStreamStack, IpStack):
                                    store=self.stamper,
                                    bufsize=self.bufsize,
                                    rxbs=self.rxbs,
-                                   timeout=self.timeout)
+                                   timeout=self.timeout,
+                                   zerocopy=self.zerocopy)
         return handler
 
     def _serviceOneTxPkt(self):
@@ -1648,20 +1684,22 @@ class TcpClientStack(ClientStreamStack, IpStack):
         Service one (packet, ha) duple on .txPkts deque
         Packet is assumed to be packed already in .packed
         Assumes there is a duple on the deque
+        Queued packets up to .TxBudget bytes are coalesced into one send
         Override in subclass
         """
-        pkt = None
-        if not self.txbs:  # everything sent last time
-            pkt = self.txPkts.popleft()  # duple = (packet, destination address)
-            self.txbs.extend(pkt.packed)
+        if not self.txbs:  # everything sent last time so coalesce queued packets
+            while self.txPkts and len(self.txbs) < self.TxBudget:
+                pkt = self.txPkts.popleft()
+                self.txbs.extend(pkt.packed)
 
         try:
             count = self.handler.send(self.txbs)
         except socket.error as ex:
             raise
 
-        console.profuse("{0}: sent\n    0x{1}\n".format(self.name,
-                                    hexlify(self.txbs[:count]).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent\n    0x{1}\n", self.name,
+                                        hexlify(self.txbs[:count]).decode('ascii'))
 
         if count < len(self.txbs):  # partially blocked try again later
             del self.txbs[:count]  # delete sent portion
@@ -1692,6 +1730,8 @@ class TcpClientStack(ClientStreamStack, IpStack):
         assumes that there is a server
         Override in subclass
         """
+        zerocopy = getattr(self.handler, "zerocopy", False)
+        rxbs = self.handler.rxbs if zerocopy else self.rxbs  # parse where received
         received = False
         while True:  # keep receiving until empty
             try:
@@ -1702,18 +1742,20 @@ class TcpClientStack(ClientStreamStack, IpStack):
             if not raw:
                 break  # no received data
             received = True
-            self.rxbs.extend(raw)
+            if not zerocopy:  # zerocopy handler already received into its .rxbs
+                self.rxbs.extend(raw)
 
         if not received:  # nothing changed
             return False
 
-        packet = self.parserize(self.rxbs[:])
+        packet = self.parserize(memoryview(rxbs) if zerocopy else rxbs[:])
 
         if packet is not None:  # queue packet
-            console.profuse("{0}: received from {1}\n    0x{2}\n".format(self.name,
-                                                                     self.remote.ha,
-                            hexlify(self.rxbs[:packet.size]).decode('ascii')))
-            del self.rxbs[:packet.size]
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received from {1}\n    0x{2}\n", self.name,
+                                                                         self.remote.ha,
+                                hexlify(rxbs[:packet.size]).decode('ascii'))
+            del rxbs[:packet.size]
             self.rxPkts.append(packet)
         return True  # received data
 
@@ -1859,9 +1901,10 @@ class GramStack(Stack):
             else:
                 raise
 
-        console.profuse("{0}: sent to {1}\n    0x{2}\n".format(self.name,
-                                                          ha,
-                                                          hexlify(pkt.packed).decode('ascii')))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("{0}: sent to {1}\n    0x{2}\n", self.name,
+                                                              ha,
+                                                              hexlify(pkt.packed).decode('ascii'))
         return True  # not blocked
 
     def serviceTxPkts(self):
@@ -1912,9 +1955,9 @@ class GramStack(Stack):
         Appends (packed, ha) duple to txPkts deque
         """
         msg, remote = self.txMsgs.popleft()  # duple (msg, destination uid
-        console.verbose("{0} sending to {1}\n{2}\n".format(self.name,
+        console.verbose("{0} sending to {1}\n{2}\n", self.name,
                                                            remote.name,
-                                                           msg))
+                                                           msg)
         packet = self.packetize(msg, remote)
         if packet is not None:
             self.txPkts.append((packet, remote.ha))
@@ -1962,8 +2005,9 @@ class GramStack(Stack):
 
         packet = self.parserize(raw, ha)
         if packet is not None:
-            console.profuse("{0}: received\n    0x{1}\n".format(self.name,
-                                        hexlify(raw).decode('ascii')))
+            if console._verbosity >= console.Wordage.profuse:
+                console.profuse("{0}: received\n    0x{1}\n", self.name,
+                                            hexlify(raw).decode('ascii'))
             self.rxPkts.append((packet, ha))     # duple = ( packed, source address)
         return True  # received data
 
@@ -1981,9 +2025,10 @@ class GramStack(Stack):
         Assumes that there is a message on the .rxes deque
         """
         pkt, ha = self.rxPkts.popleft()
-        console.verbose("{0} received packet from {1}\n{2}\n".format(self.name,
-                                                                     ha or '',
-                                                                     pkt.show()))
+        if console._verbosity >= console.Wordage.verbose:
+            console.verbose("{0} received packet from {1}\n{2}\n", self.name,
+                                                                         ha or '',
+                                                                         pkt.show())
         self.incStat("pkt_received")
         message = self.messagize(pkt, ha)
         self.rxMsgs.append(message)
@@ -2105,7 +2150,7 @@ class UdpStack(GramStack, RemoteStack, IpStack):
             remote = self.haRemotes[ha]
         except KeyError as ex:
             console.verbose(("{0}: Dropping packet received from unknown remote "
-                             "ha '{1}'.\n{2}\n".format(self.name, ha, pkt.packed)))
+                             "ha '{1}'.\n{2}\n", self.name, ha, pkt.packed))
             return (None, None)
         return (msg, remote)
 
@@ -2115,9 +2160,10 @@ class UdpStack(GramStack, RemoteStack, IpStack):
         Assumes that there is a message on the .rxes deque
         """
         pkt, ha = self.rxPkts.popleft()
-        console.verbose("{0} received packet from {1}\n{2}\n".format(self.name,
-                                                                     ha or '',
-                                                                     pkt.show()))
+        if console._verbosity >= console.Wordage.verbose:
+            console.verbose("{0} received packet from {1}\n{2}\n", self.name,
+                                                                         ha or '',
+                                                                         pkt.show())
         self.incStat("pkt_received")
         message, remote = self.messagize(pkt, ha)
         if remote:
@@ -2129,8 +2175,8 @@ class UdpStack(GramStack, RemoteStack, IpStack):
         """
         msg = self.rxMsgs.popleft()
         console.verbose("{0}: Servicing RxMsg at {1:.3f}:"
-                        "\n     {2}\n".format(self.name,
+                        "\n     {2}\n", self.name,
                                               self.stamper.stamp,
-                                              msg))
+                                              msg)
         self.incStat("msg_received")
 
@@ -306,6 +306,113 @@ class BasicTestCase(unittest.TestCase):
         self.assertEqual(stack.aha, ha)
         stack.close()
 
+    def testTcpStacksZeroCopy(self):
+        """
+        Test TcpServerStack and TcpClientStack receiving in zerocopy mode
+        """
+        console.terse("{0}\n".format(self.testTcpStacksZeroCopy.__doc__))
+
+        alpha = stacking.TcpServerStack(bufsize=4096, zerocopy=True)
+        self.assertIs(alpha.handler.zerocopy, True)
+        beta = stacking.TcpClientStack(bufsize=4096, zerocopy=True)
+        self.assertIs(beta.handler.rxbs, beta.rxbs)
+        self.assertEqual(len(beta.handler.rxpad), 4096)
+
+        while True:
+            beta.serviceConnect()
+            alpha.handler.serviceConnects()
+            if beta.handler.connected and beta.handler.ca in alpha.handler.ixes:
+                break
+            time.sleep(0.01)
+
+        ix = alpha.handler.ixes[beta.handler.ca]
+        self.assertEqual(len(ix.rxpad), 4096)
+
+        packed = bytearray(b"Beta to Alpha " * 1000)  # bigger than bufsize
+        beta.transmit(packeting.Packet(stack=beta, packed=packed))
+        while len(ix.rxbs) < len(packed):
+            beta.serviceAllTx()
+            time.sleep(0.01)
+            alpha.handler.serviceReceivesAllIx()
+        alpha.serviceReceives()
+        self.assertEqual(len(alpha.rxPkts), 1)
+        packet, ca = alpha.rxPkts.popleft()
+        self.assertEqual(packet.packed, packed)
+        self.assertEqual(ca, beta.handler.ca)
+        self.assertEqual(len(ix.rxbs), 0)  # view released so rxbs resizable
+
+        packed = bytearray(b"Alpha to Beta " * 1000)
+        ix.tx(bytes(packed))
+        while len(beta.rxPkts) < 1:
+            alpha.handler.serviceTxesAllIx()
+            time.sleep(0.01)
+            beta.serviceReceives()
+        packet = beta.rxPkts.popleft()
+        received = packet.packed
+        while len(received) < len(packed):  # base packet takes what is there
+            alpha.handler.serviceTxesAllIx()
+            time.sleep(0.01)
+            beta.serviceReceives()
+            received.extend(beta.rxPkts.popleft().packed if beta.rxPkts else b"")
+        self.assertEqual(received, packed)
+        self.assertEqual(len(beta.rxbs), 0)
+
+        beta.close()
+        alpha.close()
+
+
+    def testTcpStacksParserizeCopy(self):
+        """
+        Test TcpServerStack and TcpClientStack parserize gets bytearray copy
+        of rxbs when not zerocopy so overrides may keep and search raw
+        """
+        console.terse("{0}\n".format(self.testTcpStacksParserizeCopy.__doc__))
+
+        raws = []
+
+        def parserize(stack, raw):
+            raws.append((raw, raw.find(b" to ")))  # keeps raw, bytearray method
+            return packeting.Packet(stack=stack, packed=raw[:])
+
+        alpha = stacking.TcpServerStack(bufsize=4096)
+        alpha.parserize = lambda raw: parserize(alpha, raw)
+        beta = stacking.TcpClientStack(bufsize=4096)
+        beta.parserize = lambda raw: parserize(beta, raw)
+        self.assertIs(alpha.handler.zerocopy, False)
+        self.assertIs(beta.handler.zerocopy, False)
+
+        while True:
+            beta.serviceConnect()
+            alpha.handler.serviceConnects()
+            if beta.handler.connected and beta.handler.ca in alpha.handler.ixes:
+                break
+            time.sleep(0.01)
+
+        ix = alpha.handler.ixes[beta.handler.ca]
+        beta.transmit(packeting.Packet(stack=beta, packed=bytearray(b"Beta to Alpha")))
+        while not ix.rxbs:
+            beta.serviceAllTx()
+            time.sleep(0.01)
+            alpha.handler.serviceReceivesAllIx()
+        alpha.serviceReceives()
+        packet, ca = alpha.rxPkts.popleft()
+        self.assertEqual(packet.packed, b"Beta to Alpha")
+        self.assertEqual(len(ix.rxbs), 0)
+
+        ix.tx(b"Alpha to Beta")
+        while not beta.rxPkts:
+            alpha.handler.serviceTxesAllIx()
+            time.sleep(0.01)
+            beta.serviceReceives()
+        self.assertEqual(beta.rxPkts.popleft().packed, b"Alpha to Beta")
+        self.assertEqual(len(beta.rxbs), 0)
+        self.assertEqual([index for raw, index in raws], [4, 5])
+        for raw, index in raws:
+            self.assertIsInstance(raw, bytearray)
+
+        beta.close()
+        alpha.close()
+
 
 
 def runOne(test):
@@ -326,6 +433,8 @@ def runSome():
              'testUdpStacks',
              'testTcpServerStack',
              'testTcpClientStack',
+             'testTcpStacksZeroCopy',
+             'testTcpStacksParserizeCopy',
             ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
@@ -62,7 +62,7 @@ class ConsoleNb(object):
         try:
             self.fd = os.open(port, os.O_NONBLOCK | os.O_RDWR | os.O_NOCTTY)
         except OSError as ex:
-            console.terse("os.error = {0}\n".format(ex))
+            console.terse("os.error = {0}\n", ex)
             return False
         return True
 
@@ -410,7 +410,7 @@ class Driver(object):
                                        bs=bs)
 
             except ImportError as  ex:
-                console.terse("Error: importing pyserial\n{0}\n".format(ex))
+                console.terse("Error: importing pyserial\n{0}\n", ex)
                 self.server = DeviceNb(port=port,
                                        speed=speed,
                                        bs=bs)
@@ -471,7 +471,7 @@ class Driver(object):
         if count < len(data):  # put back unsent portion
             self.txes.appendleft(data[count:])
             return False  # blocked
-        console.profuse("{0}: Sent: {1}\n".format(self.name, data))
+        console.profuse("{0}: Sent: {1}\n", self.name, data)
         return True  # send more
 
     def serviceTxes(self):
@@ -34,6 +34,8 @@ class Client(object):
     """
     Timeout = 1.0  # timeout in seconds
     Reconnectable = False  # auto reconnect flag
+    TxBudget = 65536  # max bytes of txes gathered into one vectored send
+    TxVectors = 256  # max txes gathered into one vectored send
 
     def __init__(self,
                  name=u'',
@@ -47,7 +49,9 @@ class Client(object):
                  timeout=None,
                  reconnectable=None,
                  txes=None,
-                 rxbs=None):
+                 rxbs=None,
+                 zerocopy=False,
+                 vectored=False):
         """
         Initialization method for instance.
         name = user friendly name for connection
@@ -62,6 +66,8 @@ class Client(object):
         reconnectable = Boolean auto reconnect if timed out
         txes = deque of data to send
         rxbs = bytearray of data received
+        zerocopy = True means receive with recv_into straight into .rxbs
+        vectored = True means serviceTxes gathers txes into sendmsg calls
         """
         self.name = name
         self.uid = uid
@@ -79,7 +85,14 @@ class Client(object):
         self._accepted = False  # attribute to support accepted property
         self.cutoff = False  # True when detect connection closed on far side
         self.txes = txes if txes is not None else deque()  # deque of data to send
+        self.txQueued = 0  # count of bytes queued by tx
+        self.txSent = 0  # count of bytes sent
+        self.txCalls = 0  # count of send system calls
+        # sendmsg not available on all platforms
+        self.vectored = True if (vectored and hasattr(socket.socket, "sendmsg")) else False
         self.rxbs = rxbs if rxbs is not None else bytearray()  # byte array of data recieved
+        self.zerocopy = True if zerocopy else False  # receive with recv_into
+        self.rxpad = bytearray(self.bs) if zerocopy else None  # zeros to grow .rxbs
         self.store = store or storing.Store(stamp=0.0)
         self.timeout = timeout if timeout is not None else self.Timeout
         self.timer = StoreTimer(self.store, duration=self.timeout)
@@ -271,7 +284,7 @@ class Client(object):
         try:
             result = self.cs.connect_ex(self.ha)  # async connect
         except socket.error as ex:
-            console.terse("socket.error = {0}\n".format(ex))
+            console.terse("socket.error = {0}\n", ex)
             raise
 
         if result not in [0, errno.EISCONN]:  # not connected
@@ -321,9 +334,14 @@ class Client(object):
         If connection closed then returns empty
         Otherwise returns data
         data is string in python2 and bytes in python3
+        when .zerocopy then data is received straight into .rxbs and
+        the count of bytes received is returned instead
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.zerocopy:  # no copy between socket and .rxbs
+                data = self._recvInto() or bytes()
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:
             # ex.args[0] is always ex.errno for better compat
             if  ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
@@ -349,21 +367,41 @@ class Client(object):
 
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
+                rx = self.rxbs[-data:] if self.zerocopy else data
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(rx).decode("UTF-8")
                 except UnicodeDecodeError as ex:
-                    load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    load = "0x{0}".format(hexlify(rx).decode("ASCII"))
                 cmsg = ("Outgoer at {0}, received from {1}:\n------------\n"
                         "{2}\n\n".format(self.ca, self.ha, load))
                 console.profuse(cmsg)
 
             if self.wlog:  # log over the wire rx
-                self.wlog.writeRx(self.ha, data)
+                self.wlog.writeRx(self.ha, self.rxbs[-data:] if self.zerocopy else data)
         else:  # data empty so connection closed on other end, whereas see above for blocked
             self.cutoff = True
 
         return data
 
+    def _recvInto(self):
+        """
+        Receive up to .bs bytes straight into the tail of .rxbs
+        Grows .rxbs by .bs, reads into a memoryview of the new tail and then
+        trims the unused tail even when the read raises
+        Returns count of bytes received
+        """
+        rxbs = self.rxbs
+        size = len(rxbs)
+        rxbs.extend(self.rxpad)  # grow tail by .bs
+        count = 0
+        view = memoryview(rxbs)
+        try:
+            count = self.cs.recv_into(view[size:], self.bs)
+        finally:
+            del view  # release export so .rxbs may be resized
+            del rxbs[size + count:]  # trim unused tail
+        return count
+
     def serviceReceives(self):
         """
         Service receives until no more
@@ -372,7 +410,8 @@ class Client(object):
             data = self.receive()
             if not data:
                 break
-            self.rxbs.extend(data)
+            if not self.zerocopy:  # zerocopy already received into .rxbs
+                self.rxbs.extend(data)
 
     def serviceReceiveOnce(self):
         '''
@@ -380,7 +419,7 @@ class Client(object):
         '''
         if self.connected and not self.cutoff:
             data = self.receive()
-            if data:
+            if data and not self.zerocopy:  # zerocopy already received into .rxbs
                 self.rxbs.extend(data)
 
     def clearRxbs(self):
@@ -392,7 +431,12 @@ class Client(object):
     def catRxbs(self):
         """
         Return copy and clear .rxbs
+        when .zerocopy returns memoryview of the old .rxbs which is replaced
+        with a new empty bytearray so nothing is copied
         """
+        if self.zerocopy:
+            rx, self.rxbs = memoryview(self.rxbs), bytearray()
+            return rx
         rx = self.rxbs[:]
         self.clearRxbs()
         return rx
@@ -401,9 +445,13 @@ class Client(object):
         """
         Returns duple of (bytes(self.rxbs[index:]), len(self.rxbs))
         slices the tail from index to end and converts to bytes
+        slicing a memoryview of .rxbs so the tail is only copied once
         also the length of .rxbs to be used to update index
+        when .zerocopy the tail is returned as the memoryview itself which
+        pins .rxbs so drop it before the next receive or clear
         """
-        return (bytes(self.rxbs[index:]), len(self.rxbs))
+        tail = memoryview(self.rxbs)[index:]
+        return ((tail if self.zerocopy else bytes(tail)), len(self.rxbs))
 
     def send(self, data):
         """
@@ -411,6 +459,7 @@ class Client(object):
         Return number of bytes sent
         data is string in python2 and bytes in python3
         """
+        self.txCalls += 1
         try:
             result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:
@@ -437,9 +486,10 @@ class Client(object):
                 raise
 
         if result:
+            self.txSent += result
             if console._verbosity >= console.Wordage.profuse:
                 try:
-                    load = data[:result].decode("UTF-8")
+                    load = bytes(data[:result]).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data[:result]).decode("ASCII"))
                 cmsg = ("Outgoer at {0}, sent {1} bytes to {2}:\n------------\n"
@@ -451,24 +501,92 @@ class Client(object):
 
         return result
 
+    def sendVector(self, buffers):
+        """
+        Perform non blocking gathering send of sequence of buffers on connected
+        socket .cs with one sendmsg system call.
+        Return number of bytes sent
+        """
+        self.txCalls += 1
+        try:
+            result = self.cs.sendmsg(buffers) #result is number of bytes sent
+        except socket.error as ex:
+            # ex.args[0] is always ex.errno for better compat
+            if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                result = 0  # blocked try again
+            elif ex.args[0] in (errno.ECONNRESET,
+                                errno.ENETRESET,
+                                errno.ENETUNREACH,
+                                errno.EHOSTUNREACH,
+                                errno.ENETDOWN,
+                                errno.EHOSTDOWN,
+                                errno.ETIMEDOUT,
+                                errno.ECONNREFUSED):
+                emsg = ("socket.error = {0}: Outgoer at {1} while sending "
+                        "to {2} \n".format(ex, self.ca, self.ha))
+                console.profuse(emsg)
+                self.cutoff = True  # this signals need to close/reopen connection
+                result = 0
+            else:
+                emsg = ("socket.error = {0}: Outgoer at {1} while "
+                        "sending to {2}\n".format(ex, self.ca, self.ha))
+                console.profuse(emsg)
+                raise
+
+        if result:
+            self.txSent += result
+            if console._verbosity >= console.Wordage.profuse or self.wlog:
+                data = b"".join(buffers)[:result]
+                if console._verbosity >= console.Wordage.profuse:
+                    try:
+                        load = data.decode("UTF-8")
+                    except UnicodeDecodeError as ex:
+                        load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    cmsg = ("Outgoer at {0}, sent {1} bytes to {2}:\n------------\n"
+                            "{3}\n\n".format(self.ca, result, self.ha, load))
+                    console.profuse(cmsg)
+
+                if self.wlog:
+                    self.wlog.writeTx(self.ha, data)
+        return result
+
     def tx(self, data):
         '''
         Queue data onto .txes
         '''
         self.txes.append(data)
+        self.txQueued += len(data)
 
     def serviceTxes(self):
         """
         Service transmits
         For each tx if all bytes sent then keep sending until partial send
         or no more to send
-        If partial send reattach and return
-        """
-        while self.txes and self.connected and not self.cutoff:
-            data = self.txes.popleft()
-            count = self.send(data)
-            if count < len(data):  # put back unsent portion
-                self.txes.appendleft(data[count:])
+        When .vectored gather up to .TxBudget bytes of txes into each send
+        If partial send replace tx with memoryview of unsent portion and return
+        so the unsent portion is not copied
+        """
+        txes = self.txes
+        while txes and self.connected and not self.cutoff:
+            if self.vectored and len(txes) > 1:
+                buffers = []
+                size = 0
+                for data in txes:
+                    buffers.append(data)
+                    size += len(data)
+                    if size >= self.TxBudget or len(buffers) >= self.TxVectors:
+                        break
+                count = self.sendVector(buffers)
+            else:
+                size = len(txes[0])
+                count = self.send(txes[0])
+
+            sent = count
+            while txes and count >= len(txes[0]):  # remove sent txes
+                count -= len(txes.popleft())
+            if count:  # partially sent tx
+                txes[0] = memoryview(txes[0])[count:]
+            if sent < size:
                 break  # try again later
 
 Outgoer = Client  # aliases
@@ -517,6 +635,7 @@ class ClientTls(Client):
         """
         super(OutgoerTls, self).__init__(**kwa)
 
+        self.vectored = False  # ssl sockets do not support sendmsg
         self._connected = False  # attributed supporting connected property
 
         if context is None:  # create context
@@ -649,9 +768,14 @@ class ClientTls(Client):
         If connection closed then returns ''
         Otherwise returns data
         data is string in python2 and bytes in python3
+        when .zerocopy then data is received straight into .rxbs and
+        the count of bytes received is returned instead
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.zerocopy:  # no copy between socket and .rxbs
+                data = self._recvInto() or bytes()
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
             # ex.args[0] is always ex.errno for better compat
             if ex.args[0] in (ssl.SSL_ERROR_WANT_READ, ssl.SSL_ERROR_WANT_WRITE):
@@ -678,16 +802,17 @@ class ClientTls(Client):
 
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
+                rx = self.rxbs[-data:] if self.zerocopy else data
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(rx).decode("UTF-8")
                 except UnicodeDecodeError as ex:
-                    load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    load = "0x{0}".format(hexlify(rx).decode("ASCII"))
                 cmsg = ("Outgoer at {0}, received from {1}:\n------------\n"
                         "{2}\n\n".format(self.ca, self.ha, load))
                 console.profuse(cmsg)
 
             if self.wlog:  # log over the wire rx
-                self.wlog.writeRx(self.ha, data)
+                self.wlog.writeRx(self.ha, self.rxbs[-data:] if self.zerocopy else data)
         else:  # data empty so connection closed on other end
             self.cutoff = True
 
@@ -699,6 +824,7 @@ class ClientTls(Client):
         Return number of bytes sent
         data is string in python2 and bytes in python3
         """
+        self.txCalls += 1
         try:
             result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
@@ -726,9 +852,10 @@ class ClientTls(Client):
                 raise
 
         if result:
+            self.txSent += result
             if console._verbosity >=  console.Wordage.profuse:
                 try:
-                    load = data[:result].decode("UTF-8")
+                    load = bytes(data[:result]).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data[:result]).decode("ASCII"))
                 cmsg = ("Outgoer at {0}, sent {1} bytes to {2}:\n------------\n"
@@ -17,12 +17,18 @@ try:
 except ImportError:
     pass
 
+try:
+    import selectors
+except ImportError:  # python2
+    selectors = None
+
 # Import ioflo libs
 from ...aid.sixing import *
 from ...aid.odicting import odict
 from ...aid.timing import StoreTimer
 from ...aid.consoling import getConsole
 from .. import aioing
+from ..wheeling import Wheel
 from ...base import storing
 
 console = getConsole()
@@ -94,6 +100,8 @@ class Incomer(object):
     Manager class for incoming nonblocking TCP connections.
     """
     Timeout = 0.0  # timeout in seconds
+    TxBudget = 65536  # max bytes of txes gathered into one vectored send
+    TxVectors = 256  # max txes gathered into one vectored send
 
     def __init__(self,
                  name=u'',
@@ -105,7 +113,10 @@ class Incomer(object):
                  wlog=None,
                  store=None,
                  timeout=None,
-                 refreshable=True):
+                 refreshable=True,
+                 zerocopy=False,
+                 vectored=False,
+                 wheel=None):
 
         """
         Initialization method for instance.
@@ -118,6 +129,9 @@ class Incomer(object):
         store = data store reference
         timeout = timeout for .timer
         refreshable = True if tx/rx activity refreshes timer False otherwise
+        zerocopy = True means receive with recv_into straight into .rxbs
+        vectored = True means serviceTxes gathers txes into sendmsg calls
+        wheel = shared Wheel instance if any that refresh reschedules into
         """
         self.name = name
         self.uid = uid
@@ -128,13 +142,23 @@ class Incomer(object):
         self.wlog = wlog
         self.cutoff = False # True when detect connection closed on far side
         self.txes = deque()  # deque of data to send
+        self.txQueued = 0  # count of bytes queued by tx
+        self.txSent = 0  # count of bytes sent
+        self.txCalls = 0  # count of send system calls
+        # sendmsg not available on all platforms
+        self.vectored = True if (vectored and hasattr(socket.socket, "sendmsg")) else False
         self.rxbs = bytearray()  # bytearray of data received
+        self.zerocopy = True if zerocopy else False  # receive with recv_into
+        self.rxpad = bytearray(self.bs) if zerocopy else None  # zeros to grow .rxbs
         if self.cs:
             self.cs.setblocking(0)  # linux does not preserve blocking from accept
         self.store = store or storing.Store(stamp=0.0)
         self.timeout = timeout if timeout is not None else self.Timeout
         self.timer = StoreTimer(self.store, duration=self.timeout)
         self.refreshable = refreshable
+        self.wheel = wheel
+        if self.wheel is not None and self.timeout > 0.0:
+            self.wheel.schedule(self, self.timeout, start=self.timer.start)
 
     def shutdown(self, how=socket.SHUT_RDWR):
         """
@@ -179,9 +203,11 @@ class Incomer(object):
 
     def refresh(self):
         """
-        Restart timer
+        Restart timer and reschedule into .wheel if any
         """
         self.timer.restart()
+        if self.wheel is not None and self.timeout > 0.0:
+            self.wheel.schedule(self, self.timeout, start=self.timer.start)
 
     def receive(self):
         """
@@ -192,9 +218,14 @@ class Incomer(object):
         Otherwise returns data
 
         data is string in python2 and bytes in python3
+        when .zerocopy then data is received straight into .rxbs and
+        the count of bytes received is returned instead
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.zerocopy:  # no copy between socket and .rxbs
+                data = self._recvInto() or bytes()
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:
             # ex.args[0] is always ex.errno for better compat
             if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
@@ -220,16 +251,17 @@ class Incomer(object):
 
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
+                rx = self.rxbs[-data:] if self.zerocopy else data
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(rx).decode("UTF-8")
                 except UnicodeDecodeError as ex:
-                    load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    load = "0x{0}".format(hexlify(rx).decode("ASCII"))
                 cmsg = ("Incomer at {0}, received from {1}:\n------------\n"
                         "{2}\n\n".format(self.ha, self.ca, load))
                 console.profuse(cmsg)
 
             if self.wlog:  # log over the wire rx
-                self.wlog.writeRx(self.ca, data)
+                self.wlog.writeRx(self.ca, self.rxbs[-data:] if self.zerocopy else data)
 
             if self.refreshable:
                 self.refresh()
@@ -239,6 +271,25 @@ class Incomer(object):
 
         return data
 
+    def _recvInto(self):
+        """
+        Receive up to .bs bytes straight into the tail of .rxbs
+        Grows .rxbs by .bs, reads into a memoryview of the new tail and then
+        trims the unused tail even when the read raises
+        Returns count of bytes received
+        """
+        rxbs = self.rxbs
+        size = len(rxbs)
+        rxbs.extend(self.rxpad)  # grow tail by .bs
+        count = 0
+        view = memoryview(rxbs)
+        try:
+            count = self.cs.recv_into(view[size:], self.bs)
+        finally:
+            del view  # release export so .rxbs may be resized
+            del rxbs[size + count:]  # trim unused tail
+        return count
+
     def serviceReceives(self):
         """
         Service receives until no more
@@ -247,7 +298,8 @@ class Incomer(object):
             data = self.receive()
             if not data:
                 break
-            self.rxbs.extend(data)
+            if not self.zerocopy:  # zerocopy already received into .rxbs
+                self.rxbs.extend(data)
 
     def serviceReceiveOnce(self):
         '''
@@ -255,7 +307,7 @@ class Incomer(object):
         '''
         if not self.cutoff:
             data = self.receive()
-            if data:
+            if data and not self.zerocopy:  # zerocopy already received into .rxbs
                 self.rxbs.extend(data)
 
     def clearRxbs(self):
@@ -267,7 +319,12 @@ class Incomer(object):
     def catRxbs(self):
         """
         Return copy and clear .rxbs
+        when .zerocopy returns memoryview of the old .rxbs which is replaced
+        with a new empty bytearray so nothing is copied
         """
+        if self.zerocopy:
+            rx, self.rxbs = memoryview(self.rxbs), bytearray()
+            return rx
         rx = self.rxbs[:]
         self.clearRxbs()
         return rx
@@ -276,9 +333,13 @@ class Incomer(object):
         """
         Returns duple of (bytes(self.rxbs[index:]), len(self.rxbs))
         slices the tail from index to end and converts to bytes
+        slicing a memoryview of .rxbs so the tail is only copied once
         also the length of .rxbs to be used to update index
+        when .zerocopy the tail is returned as the memoryview itself which
+        pins .rxbs so drop it before the next receive or clear
         """
-        return (bytes(self.rxbs[index:]), len(self.rxbs))
+        tail = memoryview(self.rxbs)[index:]
+        return ((tail if self.zerocopy else bytes(tail)), len(self.rxbs))
 
     def send(self, data):
         """
@@ -287,6 +348,7 @@ class Incomer(object):
 
         data is string in python2 and bytes in python3
         """
+        self.txCalls += 1
         try:
             result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:
@@ -313,9 +375,10 @@ class Incomer(object):
                 raise
 
         if result:
+            self.txSent += result
             if console._verbosity >=  console.Wordage.profuse:
                 try:
-                    load = data[:result].decode("UTF-8")
+                    load = bytes(data[:result]).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data[:result]).decode("ASCII"))
                 cmsg = ("Incomer at {0}, sent {1} bytes to {2}:\n------------\n"
@@ -330,24 +393,95 @@ class Incomer(object):
 
         return result
 
+    def sendVector(self, buffers):
+        """
+        Perform non blocking gathering send of sequence of buffers on connected
+        socket .cs with one sendmsg system call.
+        Return number of bytes sent
+        """
+        self.txCalls += 1
+        try:
+            result = self.cs.sendmsg(buffers) #result is number of bytes sent
+        except socket.error as ex:
+            # ex.args[0] is always ex.errno for better compat
+            if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                result = 0  # blocked try again
+            elif ex.args[0] in (errno.ECONNRESET,
+                                errno.ENETRESET,
+                                errno.ENETUNREACH,
+                                errno.EHOSTUNREACH,
+                                errno.ENETDOWN,
+                                errno.EHOSTDOWN,
+                                errno.ETIMEDOUT,
+                                errno.ECONNREFUSED):
+                emsg = ("socket.error = {0}: Incomer at {1} while sending "
+                        "to {2} \n".format(ex, self.ha, self.ca))
+                console.profuse(emsg)
+                self.cutoff = True  # this signals need to close/reopen connection
+                result = 0
+            else:
+                emsg = ("socket.error = {0}: Incomer at {1} while "
+                        "sending to {2}\n".format(ex, self.ha, self.ca))
+                console.profuse(emsg)
+                raise
+
+        if result:
+            self.txSent += result
+            if console._verbosity >= console.Wordage.profuse or self.wlog:
+                data = b"".join(buffers)[:result]
+                if console._verbosity >= console.Wordage.profuse:
+                    try:
+                        load = data.decode("UTF-8")
+                    except UnicodeDecodeError as ex:
+                        load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    cmsg = ("Incomer at {0}, sent {1} bytes to {2}:\n------------\n"
+                            "{3}\n\n".format(self.ha, result, self.ca, load))
+                    console.profuse(cmsg)
+
+                if self.wlog:
+                    self.wlog.writeTx(self.ca, data)
+
+            if self.refreshable:
+                self.refresh()
+        return result
+
     def tx(self, data):
         '''
         Queue data onto .txes
         '''
         self.txes.append(data)
+        self.txQueued += len(data)
 
     def serviceTxes(self):
         """
         Service transmits
         For each tx if all bytes sent then keep sending until partial send
         or no more to send
-        If partial send reattach and return
-        """
-        while self.txes and not self.cutoff:
-            data = self.txes.popleft()
-            count = self.send(data)
-            if count < len(data):  # put back unsent portion
-                self.txes.appendleft(data[count:])
+        When .vectored gather up to .TxBudget bytes of txes into each send
+        If partial send replace tx with memoryview of unsent portion and return
+        so the unsent portion is not copied
+        """
+        txes = self.txes
+        while txes and not self.cutoff:
+            if self.vectored and len(txes) > 1:
+                buffers = []
+                size = 0
+                for data in txes:
+                    buffers.append(data)
+                    size += len(data)
+                    if size >= self.TxBudget or len(buffers) >= self.TxVectors:
+                        break
+                count = self.sendVector(buffers)
+            else:
+                size = len(txes[0])
+                count = self.send(txes[0])
+
+            sent = count
+            while txes and count >= len(txes[0]):  # remove sent txes
+                count -= len(txes.popleft())
+            if count:  # partially sent tx
+                txes[0] = memoryview(txes[0])[count:]
+            if sent < size:
                 break  # try again later
 
 
@@ -382,6 +516,7 @@ class IncomerTls(Incomer):
         """
         super(IncomerTls, self).__init__(**kwa)
 
+        self.vectored = False  # ssl sockets do not support sendmsg
         self.connected = False  # True once ssl handshake completed
 
         self.context = initServerContext(context=context,
@@ -463,9 +598,14 @@ class IncomerTls(Incomer):
         Otherwise returns data
 
         data is string in python2 and bytes in python3
+        when .zerocopy then data is received straight into .rxbs and
+        the count of bytes received is returned instead
         """
         try:
-            data = self.cs.recv(self.bs)
+            if self.zerocopy:  # no copy between socket and .rxbs
+                data = self._recvInto() or bytes()
+            else:
+                data = self.cs.recv(self.bs)
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
             # ex.args[0] is always ex.errno for better compat
             if  ex.args[0] in (ssl.SSL_ERROR_WANT_READ, ssl.SSL_ERROR_WANT_WRITE):
@@ -492,16 +632,17 @@ class IncomerTls(Incomer):
 
         if data:  # connection open
             if console._verbosity >= console.Wordage.profuse:  # faster to check
+                rx = self.rxbs[-data:] if self.zerocopy else data
                 try:
-                    load = data.decode("UTF-8")
+                    load = bytes(rx).decode("UTF-8")
                 except UnicodeDecodeError as ex:
-                    load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                    load = "0x{0}".format(hexlify(rx).decode("ASCII"))
                 cmsg = ("Incomer at {0}, received from {1}:\n------------\n"
                         "{2}\n\n".format(self.ha, self.ca, load))
                 console.profuse(cmsg)
 
             if self.wlog:  # log over the wire rx
-                self.wlog.writeRx(self.ca, data)
+                self.wlog.writeRx(self.ca, self.rxbs[-data:] if self.zerocopy else data)
 
         else:  # data empty so connection closed on other end
             self.cutoff = True
@@ -515,6 +656,7 @@ class IncomerTls(Incomer):
 
         data is string in python2 and bytes in python3
         """
+        self.txCalls += 1
         try:
             result = self.cs.send(data) #result is number of bytes sent
         except socket.error as ex:  # ssl.SSLError is a subtype of socket.error
@@ -542,9 +684,10 @@ class IncomerTls(Incomer):
                 raise
 
         if result:
+            self.txSent += result
             if console._verbosity >=  console.Wordage.profuse:
                 try:
-                    load = data[:result].decode("UTF-8")
+                    load = bytes(data[:result]).decode("UTF-8")
                 except UnicodeDecodeError as ex:
                     load = "0x{0}".format(hexlify(data[:result]).decode("ASCII"))
                 cmsg = ("Incomer at {0}, sent {1} bytes to {2}:\n------------\n"
@@ -561,6 +704,11 @@ class Acceptor(object):
     """
     Nonblocking TCP Socket Acceptor Class.
     Listen socket for incoming TCP connections
+
+    In selective mode the listen socket is registered with .selector and
+    accepts are only attempted once the selector reports it readable
+    instead of on every service call. Selective mode needs the selectors
+    module so is off when not available (python2).
     """
 
     def __init__(self,
@@ -570,7 +718,8 @@ class Acceptor(object):
                  port=56000,
                  eha=None,
                  bufsize=8096,
-                 wlog=None):
+                 wlog=None,
+                 selective=False):
         """
         Initialization method for instance.
         name = user friendly name string for Acceptor
@@ -580,6 +729,7 @@ class Acceptor(object):
         eha = external destination address for incoming connections used in tls
         bufsize = buffer size
         wlog = WireLog object if any
+        selective = True means service only sockets the selector reports ready
         """
         self.name = name
         self.ha = ha or (host, port)  # ha = host address
@@ -600,6 +750,12 @@ class Acceptor(object):
         self.axes = deque()  # deque of duple (ca, cs) accepted connections
         self.opened = False
 
+        self.selective = True if (selective and selectors) else False
+        self.selector = None  # selector when selective
+        self.acceptable = False  # True when selector reports listen socket ready
+        self.readables = set()  # keys data of other sockets reported readable
+        self.writables = set()  # keys data of other sockets reported writable
+
     def actualBufSizes(self):
         """
         Returns duple of the the actual socket send and receive buffer size
@@ -643,10 +799,14 @@ class Acceptor(object):
             self.ss.bind(self.ha)
             self.ss.listen(5)
         except socket.error as ex:
-            console.terse("socket.error = {0}\n".format(ex))
+            console.terse("socket.error = {0}\n", ex)
             return False
 
         self.ha = self.ss.getsockname()  # get resolved ha after bind
+        if self.selective:
+            if self.selector is None:
+                self.selector = selectors.DefaultSelector()
+            self.selector.register(self.ss, selectors.EVENT_READ)  # data None
         self.opened = True
         return True
 
@@ -662,6 +822,12 @@ class Acceptor(object):
         Closes listen socket.
         """
         if self.ss:
+            if self.selector:
+                try:
+                    self.selector.unregister(self.ss)
+                except KeyError:  # not registered
+                    pass
+            self.acceptable = False
             try:
                 self.ss.shutdown(socket.SHUT_RDWR)  # shutdown socket
             except socket.error as ex:
@@ -671,6 +837,17 @@ class Acceptor(object):
             self.ss = None
             self.opened = False
 
+    def closeSelector(self):
+        """
+        Closes .selector if any. Reopen creates a new one when selective
+        """
+        if self.selector:
+            self.selector.close()
+            self.selector = None
+        self.acceptable = False
+        self.readables.clear()
+        self.writables.clear()
+
     def accept(self):
         """
         Accept new connection nonblocking
@@ -690,11 +867,34 @@ class Acceptor(object):
 
         return (cs, ca)
 
+    def serviceSelects(self, timeout=0.0):
+        """
+        Poll .selector once without blocking by default.
+        Set .acceptable if listen socket is ready to accept.
+        Add key data of other ready sockets to .readables and .writables
+        """
+        if not self.selector:
+            return
+        for key, events in self.selector.select(timeout):
+            if key.data is None:  # listen socket
+                self.acceptable = True
+                continue
+            if events & selectors.EVENT_READ:
+                self.readables.add(key.data)
+            if events & selectors.EVENT_WRITE:
+                self.writables.add(key.data)
+
     def serviceAccepts(self):
         """
         Service any accept requests
         Adds to .cxes odict key by ca
+        When selective only accepts once listen socket reported ready
         """
+        if self.selective:
+            self.serviceSelects()
+            if not self.acceptable:
+                return
+            self.acceptable = False
         while True:
             cs, ca = self.accept()
             if not cs:
@@ -707,24 +907,44 @@ class Server(Acceptor):
     Nonblocking TCP Socket Server Class.
     Listen socket for incoming TCP connections
     Incomer sockets for accepted connections
+
+    In selective mode incomers in .ixes are registered with .selector keyed
+    by ca. Receives are only serviced for incomers reported readable. Txes are
+    sent without polling but an incomer whose send blocked is registered for
+    writable and not sent to again until the selector reports it writable.
+    Incomers with nothing to rx or tx cost no socket calls.
+
+    Incomers with a timeout are scheduled into the shared timing wheel .wheel
+    so owners may reap only the connections whose timeout actually expired
+    with .wheel.expireds() instead of checking every incomer timer.
     """
     Timeout = 1.0  # timeout in seconds
 
     def __init__(self,
                  store=None,
                  timeout=None,
+                 zerocopy=False,
+                 vectored=False,
+                 wheel=None,
                  **kwa):
         """
         Initialization method for instance.
 
         store = data store reference if any
         timeout = default timeout for incoming connections
+        zerocopy = True means incomers receive with recv_into straight into .rxbs
+        vectored = True means incomers gather txes into sendmsg calls
+        wheel = Wheel instance for incomer timeouts If None create one
         """
         super(Server, self).__init__(**kwa)
         self.store = store or storing.Store(stamp=0.0)
         self.timeout = timeout if timeout is not None else self.Timeout
+        self.wheel = wheel if wheel is not None else Wheel(store=self.store)
+        self.zerocopy = zerocopy
+        self.vectored = vectored
 
         self.ixes = odict()  # ready to rx tx incoming connections, Incomer instances
+        self.blockeds = set()  # cas of incomers waiting for writable when selective
 
     def serviceAxes(self):
         """
@@ -746,10 +966,14 @@ class Server(Acceptor):
                               cs=cs,
                               wlog=self.wlog,
                               store=self.store,
-                              timeout=self.timeout)
+                              timeout=self.timeout,
+                              zerocopy=self.zerocopy,
+                              vectored=self.vectored,
+                              wheel=self.wheel)
             if ca in self.ixes and self.ixes[ca] is not incomer:
-                self.shutdownIx[ca]
+                self.removeIx(ca)
             self.ixes[ca] = incomer
+            self.registerIx(ca)
 
     def serviceConnects(self):
         """
@@ -757,6 +981,46 @@ class Server(Acceptor):
         """
         self.serviceAxes()
 
+    def registerIx(self, ca, writable=False):
+        """
+        When selective register or reregister incomer given by connection
+        address ca with .selector for readable and optionally writable
+        """
+        if not self.selector:
+            return
+        ix = self.ixes[ca]
+        events = selectors.EVENT_READ
+        if writable:
+            events |= selectors.EVENT_WRITE
+        try:
+            key = self.selector.get_key(ix.cs)
+        except KeyError:  # not yet registered
+            key = None
+        if key is not None and key.fileobj is not ix.cs:  # stale closed socket same fd
+            self.selector.unregister(ix.cs)
+            key = None
+        if key is None:
+            self.selector.register(ix.cs, events, ca)
+        else:
+            self.selector.modify(ix.cs, events, ca)
+
+    def unregisterIx(self, ca):
+        """
+        When selective unregister incomer given by connection address ca
+        from .selector
+        """
+        self.readables.discard(ca)
+        self.writables.discard(ca)
+        self.blockeds.discard(ca)
+        if not self.selector or ca not in self.ixes:
+            return
+        ix = self.ixes[ca]
+        if ix.cs:
+            try:
+                self.selector.unregister(ix.cs)
+            except (KeyError, ValueError):  # not registered
+                pass
+
     def shutdownIx(self, ca, how=socket.SHUT_RDWR):
         """
         Shutdown incomer given by connection address ca
@@ -791,13 +1055,15 @@ class Server(Acceptor):
         if ca not in self.ixes:
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
+        self.unregisterIx(ca)
         self.ixes[ca].close()
 
     def closeAllIx(self):
         """
         Shutdown and close all incomer connections
         """
-        for ix in self.ixes.values():
+        for ca, ix in self.ixes.items():
+            self.unregisterIx(ca)
             ix.close()
 
     def closeAll(self):
@@ -806,6 +1072,7 @@ class Server(Acceptor):
         """
         self.close()
         self.closeAllIx()
+        self.closeSelector()
 
     def removeIx(self, ca, shutclose=True):
         """
@@ -814,6 +1081,8 @@ class Server(Acceptor):
         if ca not in self.ixes:
             emsg = "Invalid connection address '{0}'".format(ca)
             raise ValueError(emsg)
+        self.unregisterIx(ca)
+        self.wheel.remove(self.ixes[ca])
         if shutclose:
             self.ixes[ca].shutclose()
         del self.ixes[ca]
@@ -839,7 +1108,17 @@ class Server(Acceptor):
     def serviceReceivesAllIx(self):
         """
         Service receives for all incomers in .ixes
+        When selective only for those reported readable
         """
+        if self.selective:
+            self.serviceSelects()
+            readables, self.readables = self.readables, set()
+            for ca in readables:
+                ix = self.ixes.get(ca)
+                if ix is not None and ix.cs:
+                    ix.serviceReceives()
+            return
+
         for ix in self.ixes.values():
             ix.serviceReceives()
 
@@ -855,7 +1134,30 @@ class Server(Acceptor):
     def serviceTxesAllIx(self):
         """
         Service transmits for all incomers in .ixes
-        """
+        When selective skip those whose last send blocked until reported
+        writable and register for writable those whose send blocks
+        """
+        if self.selective:
+            writables, self.writables = self.writables, set()
+            blockeds = self.blockeds
+            for ca, ix in self.ixes.items():
+                if ca in blockeds:
+                    if ca not in writables:
+                        continue  # still blocked
+                elif not ix.txes:
+                    continue
+                if ix.cs:
+                    ix.serviceTxes()
+                if ix.txes and not ix.cutoff:
+                    if ca not in blockeds:
+                        blockeds.add(ca)
+                        self.registerIx(ca, writable=True)
+                elif ca in blockeds:
+                    blockeds.discard(ca)
+                    if ix.cs:
+                        self.registerIx(ca)
+            return
+
         for ix in self.ixes.values():
             ix.serviceTxes()
 
@@ -926,6 +1228,8 @@ class ServerTls(Server):
                                  wlog=self.wlog,
                                  store=self.store,
                                  timeout=self.timeout,
+                                 zerocopy=self.zerocopy,
+                                 wheel=self.wheel,
                                  context=self.context,
                                  version=self.version,
                                  certify=self.certify,
@@ -945,6 +1249,9 @@ class ServerTls(Server):
             if cx.serviceHandshake():
                 self.ixes[ca] = cx
                 del self.cxes[ca]
+                self.registerIx(ca)
+                if cx.timeout > 0.0:  # may have expired from wheel while handshaking
+                    self.wheel.schedule(cx, cx.timeout, start=cx.timer.start)
 
     def serviceConnects(self):
         """
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks tcp Client bulk receive throughput with recv into fresh bytes
+versus zerocopy recv_into straight into the tail of .rxbs.
+
+example:
+
+python -m ioflo.aio.tcp.test.bench_receiving -m 64 -b 262144
+
+"""
+import sys
+import time
+import argparse
+
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.aio.tcp import serving, clienting
+
+
+def bench(zerocopy, total, bufsize, port):
+    """
+    Returns seconds spent in Client.serviceReceives to receive total bytes
+    """
+    server = serving.Server(port=port, bufsize=bufsize)
+    if not server.reopen():
+        raise ValueError("Failed opening server on port {0}".format(port))
+    client = clienting.Client(ha=server.eha, bufsize=bufsize, zerocopy=zerocopy)
+    client.reopen()
+
+    try:
+        while not (client.connected and client.ca in server.ixes):
+            client.serviceConnect()
+            server.serviceConnects()
+        ix = server.ixes[client.ca]
+
+        chunk = b"x" * (4 * bufsize)
+        received = 0
+        elapsed = 0.0
+        while received < total:
+            if not ix.txes:
+                ix.tx(chunk)
+            ix.serviceTxes()
+            start = time.time()
+            client.serviceReceives()
+            elapsed += time.time() - start
+            received += len(client.rxbs)
+            client.clearRxbs()
+    finally:
+        client.close()
+        server.closeAll()
+
+    return elapsed
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark tcp client receives.")
+    p.add_argument('-m', '--megabytes', type=int, default=64,
+                   help="Megabytes to receive.")
+    p.add_argument('-b', '--bufsize', type=int, default=262144,
+                   help="Socket and receive buffer size.")
+    p.add_argument('-p', '--port', type=int, default=6101,
+                   help="Server port.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.terse)
+
+    total = args.megabytes * 1024 * 1024
+    for zerocopy in (False, True):
+        elapsed = bench(zerocopy, total, args.bufsize, args.port)
+        print("{0:8s} bufsize={1} receive={2:0.1f}MB/s"
+              "".format("zerocopy" if zerocopy else "recv", args.bufsize,
+                        args.megabytes / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks tcp Server.serviceAll tick cost with many mostly idle connections
+in polling mode versus selective mode.
+
+Each connection uses two file descriptors so the process open file limit
+must exceed twice the number of connections.
+
+example:
+
+python -m ioflo.aio.tcp.test.bench_serving -c 1000 -a 10 -n 200
+
+"""
+import sys
+import time
+import socket
+import argparse
+
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.aio.tcp import serving
+
+
+def bench(selective, conns, actives, ticks, port):
+    """
+    Returns seconds per Server.serviceAll tick with conns connections of
+    which actives send a message each tick
+    """
+    server = serving.Server(port=port, selective=selective)
+    if not server.reopen():
+        raise ValueError("Failed opening server on port {0}".format(port))
+
+    clients = []
+    try:
+        for i in range(conns):
+            client = socket.create_connection(server.eha)
+            clients.append(client)
+            server.serviceConnects()  # listen backlog is small
+        while len(server.ixes) < conns:
+            server.serviceConnects()
+
+        msg = b"ping"
+        elapsed = 0.0
+        for i in range(ticks):
+            for client in clients[:actives]:
+                client.send(msg)
+            for ix in list(server.ixes.values())[:actives]:
+                ix.tx(msg)
+            start = time.time()
+            server.serviceAll()
+            elapsed += time.time() - start
+            for client in clients[:actives]:
+                client.recv(4096)
+    finally:
+        for client in clients:
+            client.close()
+        server.closeAll()
+
+    return elapsed / ticks
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark tcp server servicing.")
+    p.add_argument('-c', '--conns', type=int, default=1000,
+                   help="Number of connections.")
+    p.add_argument('-a', '--actives', type=int, default=10,
+                   help="Number of connections active each tick.")
+    p.add_argument('-n', '--ticks', type=int, default=200,
+                   help="Number of ticks.")
+    p.add_argument('-p', '--port', type=int, default=6101,
+                   help="Server port.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.terse)
+
+    for selective in (False, True):
+        period = bench(selective, args.conns, args.actives, args.ticks, args.port)
+        print("{0:9s} conns={1} actives={2} per tick={3:0.3f}ms"
+              "".format("selective" if selective else "polling",
+                        args.conns, args.actives, 1000.0 * period))
+
+
+if __name__ == "__main__":
+    main()
@@ -742,6 +742,277 @@ class BasicTestCase(unittest.TestCase):
         shutil.rmtree(tempDirpath)
         console.reinit(verbosity=console.Wordage.concise)
 
+    def testTcpClientServerSelective(self):
+        """
+        Test Classes Client and Server service methods in selective mode
+        """
+        console.terse("{0}\n".format(self.testTcpClientServerSelective.__doc__))
+
+        alpha = serving.Server(port = 6101, bufsize=131072, selective=True)
+        self.assertIs(alpha.selective, True)
+        self.assertIs(alpha.reopen(), True)
+        self.assertIsNotNone(alpha.selector)
+        self.assertEqual(alpha.eha, ('127.0.0.1', 6101))
+
+        alpha.serviceConnects()  # nothing to accept so not acceptable
+        self.assertIs(alpha.acceptable, False)
+        self.assertEqual(len(alpha.ixes), 0)
+
+        beta = clienting.Client(ha=alpha.eha, bufsize=131072)
+        self.assertIs(beta.reopen(), True)
+        gamma = clienting.Client(ha=alpha.eha, bufsize=131072)
+        self.assertIs(gamma.reopen(), True)
+
+        console.terse("Connecting beta and gamma to alpha\n")
+        while True:
+            beta.serviceConnect()
+            gamma.serviceConnect()
+            alpha.serviceConnects()
+            if (beta.connected and beta.ca in alpha.ixes and
+                    gamma.connected and gamma.ca in alpha.ixes):
+                break
+            time.sleep(0.01)
+
+        ixBeta = alpha.ixes[beta.ca]
+        ixGamma = alpha.ixes[gamma.ca]
+        self.assertEqual(alpha.selector.get_key(ixBeta.cs).data, beta.ca)
+        self.assertEqual(alpha.selector.get_key(ixGamma.cs).data, gamma.ca)
+
+        # only readable incomers are serviced
+        def receive(self):
+            raise AssertionError("Idle incomer serviced")
+        ixGamma.receive = receive.__get__(ixGamma)
+
+        msgOut = b"Beta sends to Alpha"
+        beta.tx(msgOut)
+        while len(ixBeta.rxbs) < len(msgOut):
+            beta.serviceTxes()
+            alpha.serviceReceivesAllIx()
+            time.sleep(0.01)
+        self.assertEqual(bytes(ixBeta.rxbs), msgOut)
+        ixBeta.clearRxbs()
+        del ixGamma.receive
+
+        # build message too big to fit in buffer so alpha sends block
+        sizes = beta.actualBufSizes()
+        size = sizes[0]
+        msgOutBig = b"".join(ns2b("{0:0>7d} ".format(count))
+                             for count in range(size // 2 + 1))  # 8 bytes each
+
+        ixBeta.tx(msgOutBig)
+        alpha.serviceTxesAllIx()
+        self.assertIn(beta.ca, alpha.blockeds)  # waiting for writable
+        while len(beta.rxbs) < len(msgOutBig):
+            alpha.serviceReceivesAllIx()
+            alpha.serviceTxesAllIx()
+            time.sleep(0.01)
+            beta.serviceReceives()
+            time.sleep(0.01)
+        self.assertEqual(bytes(beta.rxbs), msgOutBig)
+        beta.clearRxbs()
+        alpha.serviceTxesAllIx()
+        self.assertNotIn(beta.ca, alpha.blockeds)
+
+        beta.tx(msgOutBig)
+        while len(ixBeta.rxbs) < len(msgOutBig):
+            beta.serviceTxes()
+            time.sleep(0.01)
+            alpha.serviceReceivesAllIx()
+            time.sleep(0.01)
+        self.assertEqual(bytes(ixBeta.rxbs), msgOutBig)
+        ixBeta.clearRxbs()
+
+        # closed far side detected when readable
+        gamma.close()
+        while not ixGamma.cutoff:
+            alpha.serviceReceivesAllIx()
+            time.sleep(0.01)
+        ca = ixGamma.ca
+        alpha.removeIx(ca)
+        self.assertNotIn(ca, alpha.ixes)
+        self.assertEqual(len(alpha.selector.get_map()), 2)  # listen and beta
+
+        alpha.closeAll()
+        self.assertIsNone(alpha.selector)
+        beta.close()
+
+    def testTcpClientServerZeroCopy(self):
+        """
+        Test Classes Client and Server receiving in zerocopy mode
+        """
+        console.terse("{0}\n".format(self.testTcpClientServerZeroCopy.__doc__))
+
+        wireLogAlpha = wiring.WireLog(buffify=True, same=True)
+        result = wireLogAlpha.reopen()
+
+        alpha = serving.Server(port = 6101, bufsize=4096, wlog=wireLogAlpha,
+                               zerocopy=True)
+        self.assertIs(alpha.zerocopy, True)
+        self.assertIs(alpha.reopen(), True)
+
+        beta = clienting.Client(ha=alpha.eha, bufsize=4096, zerocopy=True)
+        self.assertIsInstance(beta.rxpad, bytearray)
+        self.assertEqual(len(beta.rxpad), 4096)
+        self.assertIs(beta.reopen(), True)
+
+        while True:
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            if beta.connected and beta.ca in alpha.ixes:
+                break
+            time.sleep(0.01)
+
+        ixBeta = alpha.ixes[beta.ca]
+        self.assertEqual(len(ixBeta.rxpad), 4096)
+        rxbs = ixBeta.rxbs
+        self.assertIs(ixBeta.receive(), None)  # blocked
+        self.assertEqual(len(rxbs), 0)  # unused tail trimmed
+
+        msgOut = b"Beta sends to Alpha"
+        beta.tx(msgOut)
+        while len(ixBeta.rxbs) < len(msgOut):
+            beta.serviceTxes()
+            time.sleep(0.01)
+            data = ixBeta.receive()
+            if data:
+                self.assertEqual(data, len(msgOut))  # count received into .rxbs
+        self.assertIs(ixBeta.rxbs, rxbs)
+        self.assertEqual(bytes(ixBeta.rxbs), msgOut)
+        self.assertEqual(wireLogAlpha.getRx(),
+                         ns2b("RX {0}\n".format(beta.ca)) + msgOut + b"\n")
+        msgIn, index = ixBeta.tailRxbs(5)
+        self.assertIsInstance(msgIn, memoryview)
+        self.assertEqual(bytes(msgIn), msgOut[5:])
+        self.assertEqual(index, len(msgOut))
+        del msgIn  # release view of .rxbs
+        msgIn = ixBeta.catRxbs()
+        self.assertIsInstance(msgIn, memoryview)
+        self.assertIs(msgIn.obj, rxbs)  # handed over not copied
+        self.assertEqual(bytes(msgIn), msgOut)
+        self.assertIsNot(ixBeta.rxbs, rxbs)
+        self.assertEqual(len(ixBeta.rxbs), 0)
+        rxbs = ixBeta.rxbs
+
+        # bigger than receive buffer so takes many reads into same buffer
+        msgOutBig = b"".join(ns2b("{0:0>7d} ".format(count)) for count in range(4096))
+        ixBeta.tx(msgOutBig)
+        while len(beta.rxbs) < len(msgOutBig):
+            ixBeta.serviceTxes()
+            time.sleep(0.01)
+            beta.serviceReceives()
+        self.assertEqual(bytes(beta.rxbs), msgOutBig)
+        beta.clearRxbs()
+
+        beta.tx(msgOutBig)
+        while len(ixBeta.rxbs) < len(msgOutBig):
+            beta.serviceTxes()
+            time.sleep(0.01)
+            alpha.serviceReceivesAllIx()
+        self.assertEqual(bytes(ixBeta.rxbs), msgOutBig)
+        self.assertIs(ixBeta.rxbs, rxbs)  # received into in place
+        ixBeta.clearRxbs()
+
+        beta.close()
+        while not ixBeta.cutoff:
+            ixBeta.serviceReceives()
+            time.sleep(0.01)
+        self.assertEqual(len(ixBeta.rxbs), 0)
+
+        alpha.closeAll()
+        wireLogAlpha.close()
+
+    def testTcpClientServerVectored(self):
+        """
+        Test Classes Client and Server transmitting in vectored mode
+        """
+        console.terse("{0}\n".format(self.testTcpClientServerVectored.__doc__))
+
+        wireLogBeta = wiring.WireLog(buffify=True, same=True)
+        wireLogBeta.reopen()
+
+        alpha = serving.Server(port = 6101, bufsize=131072, vectored=True)
+        self.assertIs(alpha.reopen(), True)
+        beta = clienting.Client(ha=alpha.eha, bufsize=131072, wlog=wireLogBeta,
+                                vectored=True)
+        self.assertIs(beta.vectored, True)
+        self.assertIs(beta.reopen(), True)
+
+        while True:
+            beta.serviceConnect()
+            alpha.serviceConnects()
+            if beta.connected and beta.ca in alpha.ixes:
+                break
+            time.sleep(0.01)
+        ixBeta = alpha.ixes[beta.ca]
+        self.assertIs(ixBeta.vectored, True)
+
+        # many small txes gathered into one send
+        msgs = [ns2b("chunk {0}\n".format(i)) for i in range(50)]
+        for msg in msgs:
+            beta.tx(msg)
+        self.assertEqual(beta.txQueued, len(b"".join(msgs)))
+        beta.serviceTxes()
+        self.assertEqual(len(beta.txes), 0)
+        self.assertEqual(beta.txCalls, 1)
+        self.assertEqual(beta.txSent, beta.txQueued)
+        self.assertEqual(wireLogBeta.getTx(),
+                         ns2b("TX {0}\n".format(beta.ha)) + b"".join(msgs) + b"\n")
+        while len(ixBeta.rxbs) < beta.txSent:
+            alpha.serviceReceivesAllIx()
+            time.sleep(0.01)
+        self.assertEqual(bytes(ixBeta.rxbs), b"".join(msgs))
+        ixBeta.clearRxbs()
+
+        # budget limits bytes per send
+        beta.TxBudget = 40
+        for msg in msgs[:10]:  # 8 bytes each
+            beta.tx(msg)
+        beta.serviceTxes()
+        self.assertEqual(len(beta.txes), 0)
+        self.assertEqual(beta.txCalls, 1 + 2)  # 5 txes per send
+        del beta.TxBudget
+
+        # partial sends keep memoryview of unsent portion
+        sizes = beta.actualBufSizes()
+        size = sizes[0]
+        msgOutBig = b"".join(ns2b("{0:0>7d} ".format(count))
+                             for count in range(size // 2 + 1))  # 8 bytes each
+        ixBeta.tx(b"head\n")
+        ixBeta.tx(msgOutBig)
+        ixBeta.tx(b"tail\n")
+        ixBeta.serviceTxes()
+        self.assertTrue(ixBeta.txes)
+        self.assertIsInstance(ixBeta.txes[0], memoryview)
+        expected = b"head\n" + msgOutBig + b"tail\n"
+        while len(beta.rxbs) < len(expected):
+            ixBeta.serviceTxes()
+            time.sleep(0.01)
+            beta.serviceReceives()
+        self.assertEqual(bytes(beta.rxbs), expected)
+        self.assertEqual(len(ixBeta.txes), 0)
+        self.assertEqual(ixBeta.txQueued, len(expected))
+        self.assertEqual(ixBeta.txSent, len(expected))
+        self.assertTrue(ixBeta.txCalls > 1)
+        beta.clearRxbs()
+
+        # not vectored also keeps memoryview of unsent portion
+        ixBeta.vectored = False
+        calls = ixBeta.txCalls
+        ixBeta.tx(msgOutBig)
+        ixBeta.serviceTxes()
+        self.assertIsInstance(ixBeta.txes[0], memoryview)
+        while len(beta.rxbs) < len(msgOutBig):
+            ixBeta.serviceTxes()
+            time.sleep(0.01)
+            beta.serviceReceives()
+        self.assertEqual(bytes(beta.rxbs), msgOutBig)
+        self.assertEqual(ixBeta.txSent, len(expected) + len(msgOutBig))
+        self.assertTrue(ixBeta.txCalls > calls)
+
+        beta.close()
+        alpha.closeAll()
+        wireLogBeta.close()
+
     def testClientAutoReconnect(self):
         """
         Test Classes Client/Outgoer reconnectable
@@ -1770,6 +2041,9 @@ def runSome():
              'testTcpClientServer',
              'testTcpClientServerServiceCat',
              'testTcpClientServerService',
+             'testTcpClientServerSelective',
+             'testTcpClientServerZeroCopy',
+             'testTcpClientServerVectored',
              'testClientAutoReconnect',
              'testTLSConnectionDefault',
              'testTLSConnectionVerifyNeither',
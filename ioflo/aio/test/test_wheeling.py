@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for wheeling (shared timing wheel) module
+"""
+
+import sys
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from ioflo.aid.sixing import *
+from ioflo.aid.consoling import getConsole
+from ioflo.aid.timing import Stamper
+from ioflo.aio import wheeling
+
+console = getConsole()
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+class BasicTestCase(unittest.TestCase):
+    """
+    Test Case
+    """
+
+    def setUp(self):
+        """
+
+        """
+        pass
+
+
+    def tearDown(self):
+        """
+
+        """
+        pass
+
+    def testWheel(self):
+        """
+        Test Class Wheel schedule reschedule remove and expireds
+        """
+        console.terse("{0}\n".format(self.testWheel.__doc__))
+
+        stamper = Stamper(stamp=0.0)
+        wheel = wheeling.Wheel(store=stamper, tick=0.25, size=8)
+        self.assertEqual(wheel.tick, 0.25)
+        self.assertEqual(wheel.size, 8)
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(wheel.expireds(), [])
+
+        self.assertEqual(wheel.schedule('a', 1.0), 1.0)
+        self.assertEqual(wheel.schedule('b', 0.5), 0.5)
+        self.assertEqual(wheel.schedule('c', 5.0), 5.0)  # beyond one revolution
+        self.assertEqual(len(wheel), 3)
+        self.assertTrue('a' in wheel)
+        self.assertEqual(wheel.deadline('c'), 5.0)
+
+        stamper.advance(0.4)
+        self.assertEqual(wheel.expireds(), [])
+        stamper.advance(0.1)
+        self.assertEqual(wheel.expireds(), ['b'])
+        self.assertFalse('b' in wheel)
+
+        wheel.schedule('a', 1.0)  # refresh reschedules at 1.5
+        self.assertEqual(wheel.deadline('a'), 1.5)
+        stamper.change(1.25)
+        self.assertEqual(wheel.expireds(), [])
+        stamper.change(1.5)
+        self.assertEqual(wheel.expireds(), ['a'])
+
+        # 'c' hashes into same slot as stamp 3.0 but is not due yet
+        stamper.change(3.0)
+        self.assertEqual(wheel.expireds(), [])
+        self.assertTrue('c' in wheel)
+
+        self.assertTrue(wheel.remove('c'))
+        self.assertFalse(wheel.remove('c'))
+        self.assertEqual(len(wheel), 0)
+
+        # schedule in the past expires on next service
+        wheel.schedule('d', 0.5, start=1.0)
+        wheel.schedule('e', 0.25, start=1.0)
+        self.assertEqual(wheel.expireds(), ['e', 'd'])
+
+        # jump of many revolutions expires everything due in order
+        for i in range(20):
+            wheel.schedule(i, 0.125 * (20 - i))
+        stamper.advance(100.0)
+        self.assertEqual(wheel.expireds(), list(reversed(range(20))))
+        self.assertEqual(len(wheel), 0)
+        self.assertEqual(sum(len(slot) for slot in wheel.slots), 0)
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = [
+             'testWheel',
+            ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testWheel')
@@ -191,6 +191,60 @@ class BasicTestCase(unittest.TestCase):
         self.assertIs(beta.opened, False)
         console.reinit(verbosity=console.Wordage.concise)
 
+    def testSocketUdpNbMany(self):
+        """
+        Test SocketUdpNb sendMany and receiveMany into receive ring
+        """
+        console.terse("{0}\n".format(self.testSocketUdpNbMany.__doc__))
+
+        wireLog = wiring.WireLog(buffify=True, same=True)
+        wireLog.reopen()
+
+        alpha = udping.SocketUdpNb(port = 6101, bufsize=131072, ringsize=8)
+        self.assertIs(alpha.reopen(), True)
+        beta = udping.SocketUdpNb(port = 6102, bufsize=131072, ringsize=8, wlog=wireLog)
+        self.assertIs(beta.reopen(), True)
+        self.assertIs(beta.ring, None)
+
+        self.assertEqual(beta.receiveMany(), [])
+        self.assertEqual(len(beta.ring), 8)
+
+        msgs = [ns2b("alpha sends to beta {0}".format(i)) for i in range(12)]
+        self.assertEqual(alpha.sendMany((msg, beta.ha) for msg in msgs), 12)
+        time.sleep(0.05)
+
+        rxes = beta.receiveMany(count=3)
+        self.assertEqual(len(rxes), 3)
+        for (data, sa), msg in zip(rxes, msgs[:3]):
+            self.assertIsInstance(data, memoryview)
+            self.assertEqual(bytes(data), msg)
+            self.assertEqual(sa[1], alpha.ha[1])
+        self.assertEqual(beta.ringdex, 3)
+
+        rxes = beta.receiveMany(size=2 * len(msgs[3]))  # stops once size reached
+        self.assertEqual([bytes(data) for data, sa in rxes], msgs[3:5])
+
+        rxes = beta.receiveMany(count=100)  # no more than ringsize at once
+        self.assertEqual([bytes(data) for data, sa in rxes], msgs[5:12][:8])
+        self.assertEqual(beta.ringdex, 12 % 8)
+        self.assertEqual(beta.receiveMany(), [])
+
+        rx = wireLog.getRx()
+        for msg in msgs:
+            self.assertIn(msg, rx)
+
+        # interleaved with single receive
+        alpha.send(b"single", beta.ha)
+        alpha.sendMany([(b"one", beta.ha), (b"two", beta.ha)])
+        time.sleep(0.05)
+        self.assertEqual(beta.receive()[0], b"single")
+        rxes = beta.receiveMany()
+        self.assertEqual([bytes(data) for data, sa in rxes], [b"one", b"two"])
+
+        alpha.close()
+        beta.close()
+        wireLog.close()
+
 
 def runOne(test):
     '''
@@ -206,6 +260,7 @@ def runSome():
     names = [
              'testSocketUdpNb',
              'testBroadcast',
+             'testSocketUdpNbMany',
             ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
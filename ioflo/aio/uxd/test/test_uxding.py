@@ -183,6 +183,38 @@ class BasicTestCase(unittest.TestCase):
         shutil.rmtree(tempDirpath)
         console.reinit(verbosity=console.Wordage.concise)
 
+    def testSocketUxdNbMany(self):
+        """
+        Test SocketUxdNb sendMany and receiveMany into receive ring
+        """
+        console.terse("{0}\n".format(self.testSocketUxdNbMany.__doc__))
+
+        tempDirpath = tempfile.mkdtemp(prefix="test", suffix="uxd")
+
+        alpha = uxding.SocketUxdNb(ha=os.path.join(tempDirpath, 'alpha.uxd'),
+                                   umask=0x077)
+        self.assertIs(alpha.reopen(), True)
+        beta = uxding.SocketUxdNb(ha=os.path.join(tempDirpath, 'beta.uxd'),
+                                  umask=0x077, ringsize=4)
+        self.assertIs(beta.reopen(), True)
+
+        msgs = [ns2b("Alpha sends to Beta {0}".format(i)) for i in range(6)]
+        self.assertEqual(alpha.sendMany((msg, beta.ha) for msg in msgs), 6)
+
+        rxes = beta.receiveMany()
+        self.assertEqual(len(rxes), 4)
+        for (data, sa), msg in zip(rxes, msgs):
+            self.assertEqual(bytes(data), msg)
+            self.assertEqual(sa, alpha.ha)
+
+        rxes = beta.receiveMany()
+        self.assertEqual([bytes(data) for data, sa in rxes], msgs[4:])
+        self.assertEqual(beta.receiveMany(), [])
+
+        alpha.close()
+        beta.close()
+        shutil.rmtree(tempDirpath)
+
 
 def runOne(test):
     '''
@@ -197,6 +229,7 @@ def runSome():
     tests =  []
     names = [
              'testSocketUxdNb',
+             'testSocketUxdNbMany',
             ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
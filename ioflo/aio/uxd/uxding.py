@@ -22,18 +22,22 @@ class SocketUxdNb(object):
     Use instance method .close() to close socket
     """
 
-    def __init__(self, ha=None, umask=None, bufsize = 1024, wlog=None):
+    def __init__(self, ha=None, umask=None, bufsize = 1024, wlog=None, ringsize=64):
         """
         Initialization method for instance.
 
         ha = uxd file name
         umask = umask for uxd file
         bufsize = buffer size
+        ringsize = number of bufsize buffers in receiveMany receive ring
         """
         self.ha = ha  # uxd host address string name
         self.umask = umask
         self.bs = bufsize
         self.wlog = wlog
+        self.ringsize = ringsize
+        self.ring = None  # memoryviews of ring buffers allocated on first use
+        self.ringdex = 0  # index of next ring buffer to receive into
 
         self.ss = None  # server's socket needs to be opened
         self.opened = False
@@ -78,17 +82,17 @@ class SocketUxdNb(object):
             self.ss.bind(self.ha)
         except socket.error as ex:
             if not ex.errno == errno.ENOENT: # No such file or directory
-                console.terse("socket.error = {0}\n".format(ex))
+                console.terse("socket.error = {0}\n", ex)
                 return False
             try:
                 os.makedirs(os.path.dirname(self.ha))
             except OSError as ex:
-                console.terse("OSError = {0}\n".format(ex))
+                console.terse("OSError = {0}\n", ex)
                 return False
             try:
                 self.ss.bind(self.ha)
             except socket.error as ex:
-                console.terse("socket.error = {0}\n".format(ex))
+                console.terse("socket.error = {0}\n", ex)
                 return False
 
         if oldumask is not None: # restore old umask
@@ -152,6 +156,61 @@ class SocketUxdNb(object):
 
         return (data, sa)
 
+    def receiveMany(self, count=None, size=None):
+        """
+        Perform non blocking reads on socket until no more data or count
+        datagrams or at least size bytes received.
+        Each datagram is received with recvfrom_into the next buffer of the
+        preallocated ring of .ringsize buffers so no bytes are allocated.
+
+        Returns list of duples of form (data, sa) oldest first
+        if no data then returns empty list
+        data is memoryview slice of its ring buffer that is only valid until
+        the ring wraps around to that buffer again so copy data to keep it
+
+        count = max number of datagrams, None or more than .ringsize means .ringsize
+        size = max total bytes, None means no limit
+        """
+        if self.ring is None:
+            self.ring = [memoryview(bytearray(self.bs)) for i in range(self.ringsize)]
+        count = self.ringsize if count is None else min(count, self.ringsize)
+        ring = self.ring
+        recvfromInto = self.ss.recvfrom_into
+        rxes = []
+        total = 0
+        while len(rxes) < count and (size is None or total < size):
+            view = ring[self.ringdex]
+            try:
+                result, sa = recvfromInto(view, self.bs)  # sa is source address
+            except socket.error as ex:
+                # ex.args[0] is always ex.errno for better compat
+                if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break  # nothing more to receive
+                else:
+                    emsg = "socket.error = {0}: receiving at {1}\n".format(ex, self.ha)
+                    console.profuse(emsg)
+                    raise #re raise exception ex1
+
+            self.ringdex = (self.ringdex + 1) % self.ringsize
+            data = view[:result]
+            total += result
+
+            if console._verbosity >= console.Wordage.profuse:  # faster to check
+                try:
+                    load = bytes(data).decode("UTF-8")
+                except UnicodeDecodeError as ex:
+                    load = "0x{0}".format(hexlify(data).decode("ASCII"))
+                cmsg = ("Server at {0}, received from {1}:\n------------\n"
+                        "{2}\n\n".format(self.ha, sa, load))
+                console.profuse(cmsg)
+
+            if self.wlog:  # log over the wire rx
+                self.wlog.writeRx(sa, data)
+
+            rxes.append((data, sa))
+
+        return rxes
+
     def send(self, data, da):
         """Perform non blocking send on  socket.
 
@@ -180,5 +239,45 @@ class SocketUxdNb(object):
 
         return result
 
+    def sendMany(self, txes):
+        """
+        Perform non blocking sends on socket of (data, da) duples from
+        iterable txes in order until all sent or the socket blocks.
+
+        Returns number of datagrams sent so the caller may drop that many
+        from the front of txes and send the rest later.
+
+        data is string in python2 and bytes in python3
+        da is destination address
+        """
+        sendto = self.ss.sendto
+        sent = 0
+        for data, da in txes:
+            try:
+                result = sendto(data, da) #result is number of bytes sent
+            except socket.error as ex:
+                # ex.args[0] is always ex.errno for better compat
+                if ex.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS):
+                    break  # blocked try rest again later
+                emsg = "socket.error = {0}: sending from {1} to {2}\n".format(ex, self.ha, da)
+                console.profuse(emsg)
+                raise
+
+            if console._verbosity >=  console.Wordage.profuse:
+                try:
+                    load = data[:result].decode("UTF-8")
+                except UnicodeDecodeError as ex:
+                    load = "0x{0}".format(hexlify(data[:result]).decode("ASCII"))
+                cmsg = ("Server at {0}, sent {1} bytes to {2}:\n------------\n"
+                        "{3}\n\n".format(self.ha, result, da, load))
+                console.profuse(cmsg)
+
+            if self.wlog:
+                self.wlog.writeTx(da, data[:result])
+
+            sent += 1
+
+        return sent
+
 
 PeerUxd = SocketUxdNb  # alias
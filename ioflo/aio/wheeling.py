@@ -0,0 +1,135 @@
+"""
+wheeling.py  shared timing wheel module for connection and exchange timeouts
+
+"""
+from __future__ import absolute_import, division, print_function
+
+# Import ioflo libs
+from ..aid.sixing import *
+from ..aid.consoling import getConsole
+from ..base import storing
+
+console = getConsole()
+
+
+class Wheel(object):
+    """
+    Hashed timing wheel of deadlines on Store based time.
+    Uses Store instance .stamp attribute as current time just like StoreTimer
+
+    Each scheduled key is hashed by the tick of its deadline into one of .size
+    slots. Scheduling, rescheduling and removing a key are O(1). Servicing
+    .expireds only visits the slots for the ticks elapsed since the last
+    service so cost scales with the number of expirations not the number of
+    scheduled keys. Deadlines beyond one revolution (.tick * .size seconds)
+    share slots with nearer ones and are simply skipped until due.
+
+    Keys may be any hashable such as Incomer or Exchange instances.
+    Whoever services .expireds owns the wheel's keys so share a wheel only
+    among keys with the same owner.
+
+    Class Attributes:
+        .Tick is default slot width in seconds
+        .Size is default number of slots
+
+    Attributes:
+        .store is Store instance (or any object with .stamp) providing time
+        .tick is slot width in seconds
+        .size is number of slots
+        .slots is list of dicts each mapping key to deadline
+        .deadlines is dict mapping key to deadline of scheduled keys
+        .cursor is absolute tick last serviced or None if nothing scheduled yet
+    """
+    Tick = 0.125  # slot width in seconds
+    Size = 512  # number of slots
+
+    def __init__(self, store=None, tick=None, size=None):
+        """
+        Initialization method for instance.
+        store = data store reference for time stamp
+        tick = slot width in seconds
+        size = number of slots
+        """
+        self.store = store or storing.Store(stamp=0.0)
+        self.tick = abs(float(tick)) if tick else self.Tick
+        self.size = abs(int(size)) if size else self.Size
+        self.slots = [dict() for i in range(self.size)]
+        self.deadlines = dict()
+        self.cursor = None
+
+    def __len__(self):
+        return len(self.deadlines)
+
+    def __contains__(self, key):
+        return key in self.deadlines
+
+    def schedule(self, key, duration=0.0, start=None):
+        """
+        Schedule or reschedule key to expire duration seconds after start
+        If start is missing then schedules from current time
+        Returns deadline
+        """
+        if start is None:
+            start = self.store.stamp if self.store.stamp is not None else 0.0
+        deadline = start + abs(duration)
+
+        old = self.deadlines.get(key)
+        if old is not None:
+            del self.slots[int(old // self.tick) % self.size][key]
+        self.deadlines[key] = deadline
+        tick = int(deadline // self.tick)
+        self.slots[tick % self.size][key] = deadline
+        if self.cursor is None or tick < self.cursor:
+            self.cursor = tick
+        return deadline
+
+    def remove(self, key):
+        """
+        Remove key if scheduled
+        Returns True if key was scheduled False otherwise
+        """
+        deadline = self.deadlines.pop(key, None)
+        if deadline is None:
+            return False
+        del self.slots[int(deadline // self.tick) % self.size][key]
+        return True
+
+    def deadline(self, key):
+        """
+        Returns deadline of key or None if not scheduled
+        """
+        return self.deadlines.get(key)
+
+    def expireds(self):
+        """
+        Remove and return list of keys whose deadline is at or before the
+        current time in deadline order
+        """
+        now = self.store.stamp
+        if now is None or self.cursor is None or not self.deadlines:
+            return []
+
+        current = int(now // self.tick)
+        if current < self.cursor:  # time went backwards
+            self.cursor = current
+            return []
+
+        if current - self.cursor >= self.size:  # more than one revolution
+            indices = range(self.size)
+        else:
+            indices = (tick % self.size for tick in range(self.cursor, current + 1))
+
+        expireds = []
+        for index in indices:
+            slot = self.slots[index]
+            if not slot:
+                continue
+            dues = [(deadline, key) for key, deadline in slot.items() if deadline <= now]
+            for deadline, key in dues:
+                del slot[key]
+                del self.deadlines[key]
+            expireds.extend(dues)
+
+        self.cursor = current  # current slot may still hold later deadlines
+        expireds.sort(key=lambda due: due[0])
+        return [key for deadline, key in expireds]
@@ -55,7 +55,7 @@ class WinMailslotNb(object):
             # 0 = ReadTimeout, 0 to not block
             # None = SecurityAttributes, none for nothing special
         except win32file.error as ex:
-            console.terse('mailslot.error = {0}'.format(ex))
+            console.terse('mailslot.error = {0}', ex)
             return False
 
         self.opened = True
@@ -48,6 +48,39 @@ def parseArgs(version=__version__):
             const=True,
             default=True,
             help="Shift skedder timers when retrograde clock detected.")
+    p.add_argument('-H', '--heaped',
+            action='store_const',
+            const=True,
+            default=False,
+            help="Schedule taskers with min heap keyed on next run time.")
+    p.add_argument('-L', '--lazyclock',
+            action='store_const',
+            const=True,
+            default=False,
+            help="Refresh .realtime and .datetime shares only when read.")
+    p.add_argument('-K', '--clockperiod',
+            action='store',
+            default='0.0',
+            help="Minimum skedder time in seconds between refreshes of "
+                 ".realtime and .datetime shares.")
+    p.add_argument('-C', '--cache',
+            action='store',
+            nargs='?',
+            const=True,
+            default=False,
+            help=("Load parsed FloScript from build cache when unchanged "
+            "otherwise parse and save to cache. "
+            "Cache directory is given by optional argument. "
+            "Default cache directory is ~/.ioflo/build. "))
+    p.add_argument('-X', '--parallel',
+            action='store',
+            nargs='?',
+            const='lockstep',
+            default='',
+            choices=['lockstep', 'freerun'],
+            help=("Run each house in its own worker process. "
+            "Workers iterate in lockstep or free run as given by optional "
+            "argument. Default is lockstep. "))
     p.add_argument('-n', '--name',
             action='store',
             default='skedder',
@@ -110,7 +143,13 @@ def run(name="skedder",
         statistics="",
         houses=None,
         metas=None,
-        preloads=None,        ):
+        preloads=None,
+        heaped=False,
+        clockLazy=False,
+        clockPeriod=0.0,
+        cache=None,
+        parallel=False,
+        lockstep=True,     ):
     """ Run Skedder"""
     console = consoling.getConsole(verbosity=consoling.Console.Wordage[verbose],
                                    path=consolepath)
@@ -129,7 +168,13 @@ def run(name="skedder",
                                password=password,
                                houses=houses,
                                metas=metas,
-                               preloads=preloads)
+                               preloads=preloads,
+                               heaped=heaped,
+                               clockLazy=clockLazy,
+                               clockPeriod=clockPeriod,
+                               cache=cache,
+                               parallel=parallel,
+                               lockstep=lockstep)
     if skedder.build():
         console.terse("\n----------------------\n")
         console.terse("Starting mission plan '{0}' from file:\n    {1}\n".format(
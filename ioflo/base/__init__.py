@@ -3,6 +3,7 @@
 
 """
 #print("Package at {0}".format(__path__[0]))
+import sys
 import importlib
 
 _modules = ['globaling', 'excepting', 'interfacing',
@@ -10,11 +11,20 @@ _modules = ['globaling', 'excepting', 'interfacing',
            'tasking', 'framing', 'logging', 'serving', 'monitoring',
            'acting', 'poking', 'goaling', 'needing', 'traiting',
            'fiating', 'wanting','completing','doing', 'deeding', 'arbiting',
-           'housing', 'building']
+           'housing', 'building', 'indexing', 'bridging']
 
-
-for m in _modules:
-    importlib.import_module(".{0}".format(m), package='ioflo.base')
+# other modules are imported on first use. Behaviors registered by deeding,
+# arbiting and trim are imported on first registry lookup via indexing.Index
 
 from .storing import Store, Node, Share, Data, Deck
-from .doing import doify, Doer, DoerParam, DoerSince, DoerLapse
+from .doing import doify, Doer, DoerParam, DoerSince, DoerLapse, DoerOffload
+
+if sys.version_info < (3, 7):  # no module __getattr__ so import eagerly
+    for m in _modules:
+        importlib.import_module(".{0}".format(m), package=__name__)
+
+def __getattr__(name):
+    """ Import module name on first attribute access (python3.7+) """
+    if name in _modules:
+        return importlib.import_module(".{0}".format(name), package=__name__)
+    raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
@@ -6,7 +6,7 @@
 import time
 import struct
 from collections import deque, Mapping
-from functools import wraps
+from functools import partial
 import inspect
 import copy
 try:
@@ -32,10 +32,16 @@ console = getConsole()
 #Class definitions
 
 class Act(object):
-    """ Container class for actor resolve time initialization and runtime operation """
+    """ Container class for actor resolve time initialization and runtime operation
+
+        Class Attributes:
+            .Flatten = True means resolve caches .dispatch so call skips the
+                kwargs packing and unpacking of Actor.__call__
+    """
+    Flatten = True  # fast dispatch mode
     __slots__ = ('frame', 'context', 'act', 'actor',
                  'registrar', 'inits', 'ioinits', 'parms',
-                 'prerefs', 'human', 'count', 'inode')
+                 'prerefs', 'human', 'count', 'inode', 'dispatch')
 
     def __init__(self, frame=None, context=None, act=None, actor=None,
                  registrar=None, inits=None, ioinits=None, parms=None,
@@ -57,6 +63,8 @@ class Act(object):
             .human = human friendly version of action declaration
             .count = line count in floscript of action declaration
             .inode = actor level inode for ioinits if any
+            .dispatch = callable with .parms prebound to resolved .actor
+                        None means not flattened so call .actor with .parms
 
         Share path resolution
             act.resolve aggregates ioinits from registry,  act.ioinits, and act.prerefs
@@ -79,6 +87,7 @@ class Act(object):
         self.human = human  # human readable version of FloScript declaration
         self.count = count  # line number or count of FloScript declaration
         self.inode = inode  # inode None means ignore
+        self.dispatch = None  # fast dispatch callable once resolved
 
     def clone(self):
         """ Return clone of self in support of framer cloning
@@ -106,12 +115,38 @@ class Act(object):
 
     def __call__(self): #make Act instance callable as function
         """ Define act as callable object """
+        if self.dispatch is not None:
+            return self.dispatch()
         return (self.actor(**self.parms))
 
+    def flatten(self):
+        """ Return callable without arguments with .parms prebound to resolved
+            .actor.action or None if .actor not resolved.
+            Actors whose class overrides __call__ are prebound via __call__
+            so the override still runs.
+        """
+        if not isinstance(self.actor, Actor):
+            return None
+        if type(self.actor).__call__ is Actor.__call__:
+            return partial(self.actor.action, **self.parms)
+        return partial(self.actor, **self.parms)
+
+    def compile(self):
+        """ Return callable without arguments equivalent to calling self
+            Uses the specialized check compiled by resolved .actor._compile
+            when it provides one and .actor does not override the action it
+            reimplements otherwise .dispatch if flattened else self
+        """
+        if isinstance(self.actor, Actor) and self.actor._compilable():
+            check = self.actor._compile(**self.parms)
+            if check is not None:
+                return check
+        return self.dispatch if self.dispatch is not None else self
+
     def expose(self):
         """ Show attributes"""
-        console.terse("Act Actor {0} Parms {1} in Frame {2} Context {3} SuperAct {4}\n".format(
-                    self.actor, self.parms, self.frame, self.context, self.act))
+        console.terse("Act Actor {0} Parms {1} in Frame {2} Context {3} SuperAct {4}\n",
+                    self.actor, self.parms, self.frame, self.context, self.act)
         if self.actor:
             self.actor._expose()
 
@@ -219,6 +254,8 @@ class Act(object):
             self.parms = parms
             self.parms.update(self.actor._resolve(**self.parms)) # resolve sub acts
             self.actor._prepare(**self.parms)
+            if self.Flatten:  # parms are final once resolved
+                self.dispatch = self.flatten()
 
     def resolvePath(self, ipath, ival=None, iown=None, warn=False):
         """
@@ -445,7 +482,7 @@ class Act(object):
                 ipath = self.frame.store.createNode(ipath.rstrip('.'))
                 if warn:
                     console.profuse( "     Warning: Non-existent node '{0}' "
-                                        "... creating anyway\n".format(ipath))
+                                        "... creating anyway\n", ipath)
             else: # Share
                 ipath = self.frame.store.create(ipath)
                 if ival is not None:
@@ -455,7 +492,7 @@ class Act(object):
                         ipath.create(ival)
                 if warn:
                     console.profuse( "     Warning: Non-existent node '{0}' "
-                                     "... creating anyway\n".format(ipath))
+                                     "... creating anyway\n", ipath)
 
         return ipath
 
@@ -493,12 +530,25 @@ class Nact(Act):
         """Define act as callable object
            Negate the output
         """
+        if self.dispatch is not None:
+            return not self.dispatch()
         return not (self.actor(**self.parms))
 
+    def compile(self):
+        """ Return callable without arguments equivalent to calling self
+            Negates the specialized check compiled by resolved .actor._compile
+            when it provides one otherwise self
+        """
+        if isinstance(self.actor, Actor) and self.actor._compilable():
+            check = self.actor._compile(**self.parms)
+            if check is not None:
+                return lambda: not check()
+        return self
+
     def expose(self):
         """ Show attributes """
-        console.terse("Nact Actor {0} Parms {1} in Frame {2} Context {3} SuperAct {4}\n".format(
-                    self.actor, self.parms, self.frame, self.context, self.act))
+        console.terse("Nact Actor {0} Parms {1} in Frame {2} Context {3} SuperAct {4}\n",
+                    self.actor, self.parms, self.frame, self.context, self.act)
         if self.actor:
             self.actor._expose()
 
@@ -522,8 +572,18 @@ class SideAct(Act):
 
     def __call__(self): #make Act instance callable as function
         """ Define call method named .action of .actor """
+        if self.dispatch is not None:
+            return self.dispatch()
         return (getattr(self.actor, self.action)(**self.parms))
 
+    def flatten(self):
+        """ Return callable without arguments with .parms prebound to
+            method named .action of resolved .actor or None if not resolved
+        """
+        if not isinstance(self.actor, Actor):
+            return None
+        return partial(getattr(self.actor, self.action), **self.parms)
+
     def resolve(self, **kwa):
         """ Assumes all has been resolved.
             Check for valid action
@@ -548,6 +608,9 @@ class SideAct(Act):
                                          self.human,
                                          self.count)
 
+        if self.Flatten:
+            self.dispatch = self.flatten()
+
 def actify(name, base=None, registry=None, inits=None, ioinits=None, parms=None,
              parametric=None):
     """ Parametrized decorator function that converts the decorated function
@@ -578,11 +641,8 @@ def actify(name, base=None, registry=None, inits=None, ioinits=None, parms=None,
     cls = type(name, (base, ), attrs )
 
     def implicit(func):
-        @wraps(func)
-        def inner(*pa, **kwa):
-            return func(*pa, **kwa)
-        cls.action = inner
-        return inner
+        cls.action = func  # no wrapper layer so flattened acts call func directly
+        return func
     return implicit
 
 actorify = actify  # alias for backwards compatibility
@@ -626,15 +686,15 @@ class Actor(object):
 
     def action(self, **kwa):
         """Action called by Actor. Should override in subclass."""
-        console.profuse("Actioning {0} in {1} of {2} with {3}\n".format(self.name,
+        console.profuse("Actioning {0} in {1} of {2} with {3}\n", self.name,
                                                                         self._act.frame.name,
                                                                         self._act.frame.framer.name,
-                                                                        str(kwa)))
+                                                                        kwa)
         pass
 
     def _expose(self):
         """Show Actor."""
-        console.terse("Actor {0}".format(self.name))
+        console.terse("Actor {0}", self.name)
 
     def _resolve(self, **kwa):
         """ Return updated parms
@@ -645,6 +705,27 @@ class Actor(object):
 
         return parms
 
+    def _compile(self, **kwa):
+        """ Return callable without arguments that gives same result as
+            .action(**kwa) for resolved parms kwa or None if not compilable
+            Override in subclass such as Need to specialize hot path evaluation
+        """
+        return None
+
+    def _compilable(self):
+        """ Return True if ._compile may stand in for .action of this actor
+            That is when the class of this actor does not override .action or
+            __call__ of the class that defines ._compile since the compiled
+            check reimplements that class's .action and would skip the override
+        """
+        cls = type(self)
+        for base in cls.__mro__:
+            if '_compile' in base.__dict__:
+                break
+        unbind = lambda method: getattr(method, '__func__', method)  # py2 unbound
+        return (unbind(cls.action) is unbind(base.action) and
+                unbind(cls.__call__) is unbind(base.__call__))
+
     def _initio(self, ioinits):
         """
         Compute initializations for ioflo shares from ioinits (odict or item list)
@@ -844,14 +925,14 @@ class Actor(object):
         for dstField, srcField in izip(dstFields, srcFields):
             if (dstField != srcField) and (srcField != 'value'):
                 console.profuse("     Warning: Field names mismatch. '{0}' in {1} "
-                                "from '{2}' ... creating anyway".format(
-                                  dstField, dst.name, srcField))
+                                "from '{2}' ... creating anyway",
+                                  dstField, dst.name, srcField)
 
         #create any non existent destination fields
         for field in dstFields: #use destination fields for destination data
             if field not in dst:
                 console.profuse("     Warning: Transfer into non-existent field '{0}' in "
-                       "share {1} ... creating anyway\n".format(field, dst.name))
+                       "share {1} ... creating anyway\n", field, dst.name)
                 dst[field] = None #create
 
         return dstFields
@@ -900,20 +981,20 @@ class Actor(object):
         for dstField, srcField in izip(dstFields, srcFields):
             if (dstField != srcField) and (srcField != 'value'):
                 console.profuse("     Warning: Field names mismatch. '{0}' in {1} "
-                                "from '{2}' in {3}  ... creating anyway".format(
-                                    dstField, dst.name, srcField, src.name))
+                                "from '{2}' in {3}  ... creating anyway",
+                                    dstField, dst.name, srcField, src.name)
 
         #create any non existent source or destination fields
         for field in srcFields: #use source fields for source data
             if field not in src:
                 console.profuse("     Warning: Transfer from non-existent field '{0}' "
-                        "in share {1} ... creating anyway".format(field, src.name))
+                        "in share {1} ... creating anyway", field, src.name)
                 src[field] = None #create
 
         for field in dstFields: #use destination fields for destination data
             if field not in dst:
                 console.profuse("     Warning: Transfer into non-existent field '{0}' "
-                        "in share {1} ... creating anyway\n".format(field, dst.name))
+                        "in share {1} ... creating anyway\n", field, dst.name)
                 dst[field] = None #create
 
         return (srcFields, dstFields)
@@ -980,10 +1061,13 @@ class Interrupter(Actor):
         Attributes:
             ._tracts = list of references to transition acts for this Actor
                 transit sub-context of precur context during segue
+            ._checks = list of compiled need checks for needs once resolved
+                None means call need acts directly
 
         """
         super(Interrupter,self).__init__(**kw)
         self._tracts = []
+        self._checks = None
 
 class Transiter(Interrupter):
     """Transiter Interrupter Class
@@ -1035,6 +1119,8 @@ class Transiter(Interrupter):
             self._tracts.extend(act.actor._tracts)
             del act.actor._tracts[:]
 
+        self._checks = [act.compile() for act in needs]
+
         return parms
 
 
@@ -1043,46 +1129,46 @@ class Transiter(Interrupter):
 
         framer = near.framer #to speed up
 
-        console.profuse("Attempt segue from {0} to {1}\n".format(near.name, far.name))
+        console.profuse("Attempt segue from {0} to {1}\n", near.name, far.name)
 
-        for act in needs:
-            if not act(): #return None if not all true
+        for check in (self._checks if self._checks is not None else needs):
+            if not check(): #return None if not all true
                 return None
 
-        console.profuse("     active outline: {0}\n".format([frame.name for frame in framer.actives]))
-        console.profuse("     far outline: {0}\n".format([frame.name for frame in far.outline]))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("     active outline: {0}\n", [frame.name for frame in framer.actives])
+            console.profuse("     far outline: {0}\n", [frame.name for frame in far.outline])
 
         #find uncommon entry and exit lists associated with transition
         #exits, enters = framing.Framer.Uncommon(framer.actives,far.outline)
         #find uncommon and common entry and exit lists associated with transition
-        exits, enters, reexens = framing.Framer.ExEn(framer.actives, far)
+        #precomputed at resolve time by framer.planTransits
+        plan = framer.plan(far)
+        exits, enters, reexens = plan.exits, plan.enters, plan.reexens
 
         #check enters, if successful, perform transition
         if not framer.checkEnter(enters, exits):
             return None
 
-        msg = "To: {0}<{1} at {2} Via: {3} ({4}) From: {5} after {6:0.3f}\n".format(
+        console.terse("To: {0}<{1} at {2} Via: {3} ({4}) From: {5} after {6:0.3f}\n",
             framer.name, far.human, round(framer.store.stamp, 6), near.name, human,
             framer.human, framer.elapsed)
-        console.terse(msg)
 
-        console.profuse("     exits: {0}\n".format([frame.name for frame in exits]))
-        console.profuse("     enters: {0}\n".format([frame.name for frame in enters]))
-        console.profuse("     reexens: {0}\n".format([frame.name for frame in reexens]))
+        if console._verbosity >= console.Wordage.profuse:
+            console.profuse("     exits: {0}\n", [frame.name for frame in exits])
+            console.profuse("     enters: {0}\n", [frame.name for frame in enters])
+            console.profuse("     reexens: {0}\n", [frame.name for frame in reexens])
 
         for act in self._tracts:  # transit sub-context of segue precur
             act()
 
-        framer.exit(exits) #exit uncommon frames in near outline reversed in place
-        framer.rexit(reexens[:]) #make copy since reversed in place
-        framer.renter(reexens)
-        framer.enter(enters)
+        framer.transit(plan) #exit rexit renter and enter in plan order
         framer.activate(active = far)
         return far
 
     def _expose(self):
         """      """
-        console.terse("Transiter {0}\n".format(self.name))
+        console.terse("Transiter {0}\n", self.name)
 
 
 class Suspender(Interrupter):
@@ -1128,6 +1214,8 @@ class Suspender(Interrupter):
             self._tracts.extend(act.actor._tracts)
             del act.actor._tracts[:]
 
+        self._checks = [act.compile() for act in needs]
+
         deActParms = odict(aux=aux)
         deAct = SideAct( actor=self,
                         parms=deActParms,
@@ -1135,8 +1223,8 @@ class Suspender(Interrupter):
                         human=self._act.human,
                         count=self._act.count)
         self._act.frame.addExact(deAct)
-        console.profuse("{0}Added exact {1} SideAct for {2} with {3} in {4}\n".format(
-                INDENT_ADD, 'deactivize', self.name, deAct.parms, self._act.frame.name))
+        console.profuse("{0}Added exact {1} SideAct for {2} with {3} in {4}\n",
+                INDENT_ADD, 'deactivize', self.name, deAct.parms, self._act.frame.name)
         deAct.resolve()
 
         return parms
@@ -1148,10 +1236,10 @@ class Suspender(Interrupter):
 
         if aux.done: #not active
 
-            console.profuse("Attempt segue from {0} to aux {1}\n".format(main.name, aux.name))
+            console.profuse("Attempt segue from {0} to aux {1}\n", main.name, aux.name)
 
-            for act in needs:
-                if not act(): #return None if not all true
+            for check in (self._checks if self._checks is not None else needs):
+                if not check(): #return None if not all true
                     return None
 
             #if aux.main: #see if aux still belongs to another frame
@@ -1161,7 +1249,7 @@ class Suspender(Interrupter):
             # we can't enter unless it is our act's frame
             if aux.main and (aux.main is not self._act.frame):
                 console.concise("    Invalid aux '{0}' in use by another frame"
-                        " '{1}'\n".format(aux.name, aux.main.name))
+                        " '{1}'\n", aux.name, aux.main.name)
                 return None
 
             if not aux.checkStart(): #performs entry checks
@@ -1202,17 +1290,17 @@ class Suspender(Interrupter):
 
     def _expose(self):
         """      """
-        console.terse("Suspender {0}\n".format(self.name))
+        console.terse("Suspender {0}\n", self.name)
 
     def deactivize(self, aux, **kwa):
         """ If not aux.done Then force deactivate. Used in exit action."""
         if not aux.done:
-            console.profuse("{0} deactivate {1}\n".format(self.name, aux.name))
+            console.profuse("{0} deactivate {1}\n", self.name, aux.name)
             self.deactivate(aux)
 
     def deactivate(self, aux):
         """Called by deactivator actor to cleanly exit      """
-        console.profuse("Deactivating {0}\n".format(aux.name))
+        console.profuse("Deactivating {0}\n", aux.name)
 
         aux.exitAll() # also sets .done = True
         if aux.original:
@@ -1230,11 +1318,11 @@ class Printer(Actor):
         """Action called by Actor
         """
         #console.terse("{0} printer {1}\n".format(self.name, message))
-        console.terse("*** {0} ***\n".format(message))
+        console.terse("*** {0} ***\n", message)
 
     def _expose(self):
         """   """
-        console.terse("Printer {0}\n".format(self.name))
+        console.terse("Printer {0}\n", self.name)
 
 class Marker(Actor):
     """ Base class that sets up mark in provided share reference"""
@@ -1259,8 +1347,8 @@ class MarkerUpdate(Marker):
 
             only one mark per marker per share is needed
         """
-        console.profuse("{0} mark {1} in {2} on {3}\n".format(
-            self.name, share.name, marker, 'update' ))
+        console.profuse("{0} mark {1} in {2} on {3}\n",
+            self.name, share.name, marker, 'update')
 
         mark = share.marks.get(marker)
         if mark:
@@ -1270,7 +1358,7 @@ class MarkerUpdate(Marker):
 
     def _expose(self):
         """   """
-        console.terse("MarkerUpdate {0}\n".format(self.name))
+        console.terse("MarkerUpdate {0}\n", self.name)
 
 class MarkerChange(Marker):
     """ MarkerChange Class
@@ -1287,20 +1375,23 @@ class MarkerChange(Marker):
         """ Update mark in share
             Where share is reference to share and marker is unique name key of mark in
                 share.marks odict
-            Updates mark.data
+            Updates mark.version when share is change tracked else mark.data
 
             only one mark per marker per share is needed
         """
-        console.profuse("{0} mark {1} in {2} on {3}\n".format(
-            self.name, share.name, marker, 'change' ))
+        console.profuse("{0} mark {1} in {2} on {3}\n",
+            self.name, share.name, marker, 'change')
 
         mark = share.marks.get(marker)
         if mark:
-            mark.data = storing.Data(share.items())  # set date when marker runs
+            if share.changes is not None:  # tracked so no need to copy data
+                mark.version = share.changes
+            else:
+                mark.data = storing.Data(share.items())  # set date when marker runs
 
     def _expose(self):
         """   """
-        console.terse("MarkerChange {0}\n".format(self.name))
+        console.terse("MarkerChange {0}\n", self.name)
 
 class Rearer(Actor):
     """
@@ -1393,42 +1484,25 @@ class Rearer(Actor):
 
         """
 
-        console.profuse("         Cloning '{0}' as '{1}' be '{2}'\n".format(
-                original.name, clone, ScheduleNames.get(schedule, schedule)))
+        console.profuse("         Cloning '{0}' as '{1}' be '{2}'\n",
+                original.name, clone, ScheduleNames.get(schedule, schedule))
 
         if schedule == AUX:
             if frame in self._act.frame.outline:
                 console.terse("         Error: Cannot rear clone in own"
-                              " '{0}' outline. {1} in line {2}\n".format(frame.name,
+                              " '{0}' outline. {1} in line {2}\n", frame.name,
                                                                          self._act.human,
-                                                                         self._act.count))
+                                                                         self._act.count)
                 return
 
-            tag = framer.newAuxTag(base=original.tag)
-            name = "_".join((framer.surname, tag))  # replace name with full name
-            console.terse("         Rearing original '{0}' as aux insular clone"
-                          " '{1}' in Frame '{2}' in Framer '{3}'"
-                          "\n".format(original.name,
-                                        name,
-                                        frame.name,
-                                        framer.name))
-            clone = original.clone(name=name, tag=tag, schedule=schedule)
-            clone.original = False  # main frame will be fixed
-            clone.insular = True  #  local to this framer
-            clone.razeable = True  # can be razed
-            framer.auxes[tag] = clone
-            frame.addAux(clone)
-            clone.main = frame
-            #self._act.frame.framer.assignFrameRegistry()  # setup for resolution
-            self.store.house.presolvables.append(clone)
-            self.store.house.presolvePresolvables()
-            self.store.house.resolveResolvables()
+            framer.rear(original, frame)  # reuses retired clone if any
 
 
 class Razer(Actor):
     """
     Razer Actor Class
     Razer is a special actor that destroys a  framer clone at runtime
+    or retires it into its framer's pool for reuse when Framer.Reuse
 
        Parameters
             who = auxiliary clones to be destroyed
@@ -1491,8 +1565,5 @@ class Razer(Actor):
                     break
 
         for aux in razeables:
-            console.concise("         Razing '{0}' in '{1}'\n".format(who, frame.name))
-            aux.prune()
-            frame.auxes.remove(aux)
-            if aux.tag in framer.auxes:
-                del framer.auxes[aux.tag]
+            console.concise("         Razing '{0}' in '{1}'\n", who, frame.name)
+            framer.raze(aux, frame)  # retires into framer.pool when reusable
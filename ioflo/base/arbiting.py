@@ -132,7 +132,7 @@ class Arbiter(doing.Doer):
         """action is to update arbiter
 
         """
-        console.profuse("Updating arbiter {0}\n".format(self.name))
+        console.profuse("Updating arbiter {0}\n", self.name)
         self.update()
 
 
@@ -333,7 +333,7 @@ class ArbiterWeighted(Arbiter):
             wgtcnf = wgtcnf / float(wgtimp)
 
         except TypeError:#one of the input values is not number
-            console.terse("     Warning, bad input value for Arbiter {0}\n".format(self.name))
+            console.terse("     Warning, bad input value for Arbiter {0}\n", self.name)
             #self.output.updateJointly(value = self.default.value,
             #                              truth = self.default.truth, stamp = stamp)
             self.output.value = self.default.value
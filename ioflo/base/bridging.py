@@ -0,0 +1,122 @@
+"""bridging.py exchange of bridged shares between houses
+
+"""
+from __future__ import division
+
+from ..aid.sixing import *
+from ..aid.odicting import odict
+
+from ..aid.consoling import getConsole
+console = getConsole()
+
+
+class Bridge(object):
+    """
+    Exchanges the bridged shares of a house with other houses at skedder
+    iteration boundaries.
+
+    Bridges are declared in FloScript with the bridge verb and held by the
+    house in .bridges as list of (source path, house name, destination path).
+    A bridged source share is collected after the iteration in which its
+    change count (Share.track) or stamp moved. Collected data is posted into
+    the inbox of the destination house bridge and delivered with update at the
+    start of the next iteration so destination share stamps are in the
+    destination house's time.
+
+    When .conn is a multiprocessing connection the bridge is the worker end of
+    a parallel skedder and items are exchanged with the parent skedder instead.
+
+    instance attributes:
+        .house = house whose bridged shares are exchanged
+        .conn = connection to parent skedder or None when serial
+        .lockstep = wait for parent each iteration IF True ELSE poll
+        .links = list of (share, house name, destination path, last) where
+                 last is (changes, stamp) of share when last collected
+        .inbox = list of (path, data) duples to be delivered
+    """
+
+    def __init__(self, house, conn=None, lockstep=True):
+        """
+        Initialize instance.
+        parameters:
+            house = house whose bridged shares are exchanged
+            conn = connection to parent skedder or None when serial
+            lockstep = wait for parent each iteration IF True ELSE poll
+        """
+        self.house = house
+        self.conn = conn
+        self.lockstep = True if lockstep else False
+        self.links = []
+        for source, name, path in house.bridges:
+            share = house.store.create(source).track()
+            self.links.append([share, name, path, None])
+        self.inbox = []
+
+    def collect(self):
+        """
+        Returns list of (house name, path, data) triples for bridged shares
+        that changed since last collected
+        """
+        items = []
+        for link in self.links:
+            share, name, path, last = link
+            mark = (share.changes, share.stamp)
+            if mark != last:
+                link[3] = mark
+                items.append((name, path, odict(share.items())))
+        return items
+
+    def post(self, items):
+        """
+        Append items list of (path, data) duples to .inbox
+        """
+        self.inbox.extend(items)
+
+    def deliver(self):
+        """
+        Update shares in .house store from .inbox and empty .inbox
+        """
+        store = self.house.store
+        for path, data in self.inbox:
+            store.create(path).update(data)
+            console.profuse("     Bridged '{0}' into House '{1}'\n",
+                            path, self.house.name)
+        del self.inbox[:]
+
+    def receive(self):
+        """
+        Post items received from parent skedder and deliver them.
+        When .lockstep waits for the parent otherwise only takes pending.
+        Returns False if parent asked to stop True otherwise
+        """
+        if self.conn is not None:
+            while self.lockstep or self.conn.poll():
+                kind, items = self.conn.recv()
+                if kind == 'stop':
+                    return False
+                self.post(items)
+                if self.lockstep:  # one tick per iteration
+                    break
+        self.deliver()
+        return True
+
+    def send(self, done=False):
+        """
+        Send collected items to parent skedder with done flag that tells parent
+        this is the last iteration.
+        When not .lockstep only sends if any items or done
+        """
+        items = self.collect()
+        if self.lockstep or items or done:
+            self.conn.send(('done' if done else 'tock', items))
+
+
+def exchange(bridges):
+    """
+    Post collected items of each bridge in bridges dict keyed by house name
+    into the inbox of the bridge of the destination house
+    """
+    for bridge in bridges.values():
+        for name, path, data in bridge.collect():
+            if name in bridges:
+                bridges[name].post([(path, data)])
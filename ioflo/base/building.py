@@ -5,10 +5,13 @@ from __future__ import division
 
 #print("module {0}".format(__name__))
 
+import sys
 import time
 import re
 import importlib
 import os
+import hashlib
+import pickle
 
 from collections import deque
 try:
@@ -42,12 +45,12 @@ from . import framing
 from . import logging
 from . import serving
 
-from .. import trim
-
 from ..aid.consoling import getConsole
 console = getConsole()
 
-from ..trim import exterior
+from ..__metadata__ import __version__
+
+BUILD_CACHE_DIR = os.path.join('~', '.ioflo', 'build')  # default build cache directory
 
 def Convert2Num(text):
     """converts text to python type in order
@@ -306,7 +309,7 @@ def StripQuotes(text):
 
     return text
 
-VerbList = ['load', 'house', 'init',
+VerbList = ['load', 'house', 'init', 'bridge',
                'server',
                'logger', 'log', 'loggee',
                'framer', 'first',
@@ -333,9 +336,12 @@ class Builder(object):
     """
 
     """
-    def __init__(self, fileName='', mode=None, metas=None, preloads=None, behaviors=None):
+    def __init__(self, fileName='', mode=None, metas=None, preloads=None,
+                 behaviors=None, cache=None):
         """
-
+        cache is directory path of build cache of parsed houses or
+           True for default BUILD_CACHE_DIR. Empty or None means no cache.
+           Cache files are pickles so cache directory must be trusted.
         """
         self.fileName = fileName #initial name of file to start building from
         self.mode = mode or []
@@ -344,6 +350,10 @@ class Builder(object):
         self.behaviors = behaviors or []
         self.files = [] #list of open file objects, appended to by load commands
         self.counts = [] #list of linectr s for open file objects
+        if cache is True:
+            cache = BUILD_CACHE_DIR
+        self.cache = os.path.abspath(os.path.expanduser(cache)) if cache else ''
+        self.loaded = [] #list of file path names read by build for cache validation
 
         self.houses = [] #list of houses
 
@@ -423,10 +433,19 @@ class Builder(object):
         housing.House.Clear() #clear house registry
         housing.ClearRegistries() #clear all the other registries
 
+        self.fileName = os.path.abspath(self.fileName)
+        if self.cache and self.loadCache():  # parsed houses from cache
+            try:
+                return self.resolveHouses()
+
+            except excepting.ResolveError as ex:
+                console.terse("{0}\n", ex)
+                return False
+
         try: #IOError
-            self.fileName = os.path.abspath(self.fileName)
             self.currentFile = open(self.fileName,"r")
             self.currentCount = 0
+            self.loaded = [self.fileName]
 
             try: #ResolveError
                 while self.currentFile:
@@ -470,15 +489,15 @@ class Builder(object):
 
                         try: #ParseError ParseWarning
                             if not self.dispatch(tokens):  # catches dispatches the return unexpectedly
-                                console.terse("Script Parsing stopped at line {0} in file {1}\n".format(
-                                    self.currentCount, self.currentFile.name))
+                                console.terse("Script Parsing stopped at line {0} in file {1}\n",
+                                    self.currentCount, self.currentFile.name)
                                 console.terse(self.currentHuman + '\n')
                                 return False
 
                         except excepting.ParseError as ex:
-                            console.terse("\n{0}\n\n".format(ex))
-                            console.terse("Script line {0} in file {1}\n".format(
-                                self.currentCount, self.currentFile.name))
+                            console.terse("\n{0}\n\n", ex)
+                            console.terse("Script line {0} in file {1}\n",
+                                self.currentCount, self.currentFile.name)
                             console.terse(self.currentHuman + '\n')
                             raise
 
@@ -491,34 +510,22 @@ class Builder(object):
                     if self.files:
                         self.currentFile = self.files.pop()
                         self.currentCount = self.counts.pop()
-                        console.terse("Resume loading from file {0}.\n".format(self.currentFile.name))
+                        console.terse("Resume loading from file {0}.\n", self.currentFile.name)
                     else:
                         self.currentFile = None
 
                 #building done so now resolve links and collect actives inactives
-                for house in self.houses:
-                    house.orderTaskables()
-                    house.resolve()
-
-                    if console._verbosity >= console.Wordage.concise:
-                        house.showAllTaskers()
-                        #show framework hierarchiy
-                        for framer in house.framers:
-                            framer.showHierarchy()
-
-                        #show hierarchy of each house's store
-                        console.concise( "\nData Store for {0}\n".format(house.name))
-                        house.store.expose(valued=(console._verbosity >= console.Wordage.terse))
-
-                return True
+                if self.cache:
+                    self.dumpCache()
+                return self.resolveHouses()
 
             except excepting.ResolveError as ex:
-                console.terse("{0}\n".format(ex))
+                console.terse("{0}\n", ex)
                 return False
 
 
         except IOError as ex:
-            console.terse("Error opening mission file  {0}\n".format(ex))
+            console.terse("Error opening mission file  {0}\n", ex)
             return False
 
         finally:
@@ -526,6 +533,127 @@ class Builder(object):
                 if not f.closed:
                     f.close()
 
+    def resolveHouses(self):
+        """
+        Resolve links of built .houses and collect actives inactives
+        Returns True
+        """
+        names = [house.name for house in self.houses]
+        for house in self.houses:
+            for source, name, path in house.bridges:
+                if name not in names or name == house.name:
+                    msg = "ResolveError: Bad bridge house link '{0}'".format(name)
+                    raise excepting.ResolveError(msg, name, source)
+
+        for house in self.houses:
+            house.orderTaskables()
+            house.resolve()
+
+            if console._verbosity >= console.Wordage.concise:
+                house.showAllTaskers()
+                #show framework hierarchiy
+                for framer in house.framers:
+                    framer.showHierarchy()
+
+                #show hierarchy of each house's store
+                console.concise( "\nData Store for {0}\n", house.name)
+                house.store.expose(valued=(console._verbosity >= console.Wordage.terse))
+
+        return True
+
+    def cachePath(self):
+        """
+        Returns file path in .cache of build cache for .fileName keyed by
+        hash of ioflo and python versions, mode, behaviors, metas and preloads
+        """
+        key = repr((__version__,
+                    tuple(sys.version_info[:3]),
+                    self.fileName,
+                    self.mode,
+                    self.behaviors,
+                    self.metas,
+                    self.preloads))
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        name = "{0}_{1}.pickle".format(os.path.splitext(os.path.basename(self.fileName))[0],
+                                       digest[:32])
+        return os.path.join(self.cache, name)
+
+    @staticmethod
+    def fileDigest(path):
+        """
+        Returns hex sha256 digest of contents of file at path
+        """
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def loadCache(self):
+        """
+        Load parsed .houses from build cache when every file read to build it
+        is unchanged. Reapplies .metas so credentials are not cached.
+        Returns True if loaded False otherwise
+        """
+        path = self.cachePath()
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, 'rb') as f:
+                cached = pickle.load(f)
+            for name, digest in cached['files']:
+                if self.fileDigest(name) != digest:
+                    console.terse("Build cache stale for file {0}\n", name)
+                    return False
+        except Exception as ex:  # unpickling may raise most anything
+            console.terse("Error loading build cache {0}\n{1}\n", path, ex)
+            return False
+
+        self.houses = cached['houses']
+        self.loaded = [name for name, digest in cached['files']]
+        for house in self.houses:
+            housing.House.Names[house.name] = house
+            house.assignRegistries()
+            self.currentStore = house.store
+            for name, share, data in self.metas:  # share is path of meta share
+                house.metas[name] = self.initPathToData(share, data)
+
+        console.terse("Loaded parsed houses from build cache {0}\n", path)
+        return True
+
+    def dumpCache(self):
+        """
+        Save parsed .houses with digests of files read to build them
+        into build cache. Credentials meta data is blanked in the cache.
+        Returns True if saved False otherwise
+        """
+        path = self.cachePath()
+        blanks = []  # (share, data) of blanked credentials to restore
+        for house in self.houses:
+            share = house.metas.get('credentials')
+            if share is not None:
+                blanks.append((share, share.copyDataDict()))
+                share.change([(key, '') for key in share.keys()])
+
+        try:
+            files = [(name, self.fileDigest(name)) for name in self.loaded]
+            if not os.path.exists(self.cache):
+                os.makedirs(self.cache)
+            temp = "{0}.{1}".format(path, os.getpid())
+            with open(temp, 'wb') as f:
+                pickle.dump(dict(version=__version__, files=files, houses=self.houses),
+                            f, pickle.HIGHEST_PROTOCOL)
+            if os.path.exists(path):  # rename does not replace on windows
+                os.remove(path)
+            os.rename(temp, path)
+        except Exception as ex:  # pickling may raise most anything
+            console.terse("Error saving build cache {0}\n{1}\n", path, ex)
+            return False
+        finally:
+            for share, data in blanks:
+                share.change(data)
+
+        console.terse("Saved parsed houses to build cache {0}\n", path)
+        return True
+
     def dispatch(self, tokens):
         """
         Converts declaration verb into build method name  and calls it
@@ -567,7 +695,8 @@ class Builder(object):
             os.chdir(cwd) #restore old cwd
             self.currentFile = open(name,"r")
             self.currentCount = 0
-            console.terse("Loading from file {0}.\n".format(self.currentFile.name))
+            self.loaded.append(name)
+            console.terse("Loading from file {0}.\n", self.currentFile.name)
 
         except IndexError:
             msg = "ParseError: Building verb '%s'. Not enough tokens." % (command,)
@@ -596,7 +725,7 @@ class Builder(object):
             self.currentStore = self.currentHouse.store
 
             console.terse("   Created House '{0}'. Assigning registries and "
-                          "creating instances ...\n".format(name))
+                          "creating instances ...\n", name)
 
             self.currentHouse.assignRegistries()
 
@@ -689,7 +818,7 @@ class Builder(object):
 
             if self.currentStore.fetchShare(destinationPath) is None:
                 console.terse("     Warning: Init of non-preexistent share {0} ..."
-                        " creating anyway\n".format(destinationPath))
+                        " creating anyway\n", destinationPath)
 
             destination = self.currentStore.create(destinationPath)
 
@@ -710,7 +839,7 @@ class Builder(object):
                 self.verifyShareFields(destination, data.keys(), tokens, index)
 
                 destination.update(data)
-                console.profuse("     Inited share {0} to data = {1}\n".format(destination.name, data))
+                console.profuse("     Inited share {0} to data = {1}\n", destination.name, data)
 
             elif connective in ('from', ):
                 sourceFields, index = self.parseFields(tokens, index)
@@ -754,6 +883,64 @@ class Builder(object):
 
         return True
 
+    def buildBridge(self, command, tokens, index):
+        """Bridge share in current house to share in other house
+
+           bridge source to house [as destination]
+
+           source:
+              absolute
+              path
+
+           destination:
+              absolute
+              path
+
+           destination defaults to source path
+        """
+        if not self.currentHouse:
+            msg = "ParseError: Building verb '%s'. No current house" % (command)
+            raise excepting.ParseError(msg, tokens, index)
+
+        try:
+            source, index = self.parsePath(tokens, index)
+
+            connective = tokens[index]
+            index += 1
+            if connective != 'to':
+                msg = "ParseError: Building verb '%s'. Unexpected connective '%s'" %\
+                    (command, connective)
+                raise excepting.ParseError(msg, tokens, index)
+
+            name = tokens[index]
+            index += 1
+
+            destination = source
+            while index < len(tokens):
+                connective = tokens[index]
+                index += 1
+                if connective == 'as':
+                    destination, index = self.parsePath(tokens, index)
+                else:
+                    msg = "ParseError: Building verb '%s'. Unexpected connective '%s'" %\
+                        (command, connective)
+                    raise excepting.ParseError(msg, tokens, index)
+
+        except IndexError:
+            msg = "ParseError: Building verb '%s'. Not enough tokens." % (command, )
+            raise excepting.ParseError(msg, tokens, index)
+
+        if index != len(tokens):
+            msg = "ParseError: Building verb '%s'. Unused tokens." % (command,)
+            raise excepting.ParseError(msg, tokens, index)
+
+        self.currentStore.create(source)
+        self.currentHouse.bridges.append((source, name, destination))
+        console.profuse("     Bridged share {0} to {1} in house {2}\n",
+                        source, destination, name)
+
+        return True
+
     def buildServer(self, command, tokens, index):
         """create server tasker in current house
            server has to have name so can  ask stop
@@ -778,6 +965,8 @@ class Builder(object):
 
            data:
               direct
+              drain max datagrams received per run, 0 one per run
+                 server telemetry rx :54321 per drain 64
 
            source:
               [(value, fields) in] indirect
@@ -858,7 +1047,7 @@ class Builder(object):
                     srcPath, index = self.parsePath(tokens, index)
                     if self.currentStore.fetchShare(srcPath) is None:
                         console.terse("     Warning: Init 'with' non-existent share {0}"
-                                      " ... creating anyway".format(srcPath))
+                                      " ... creating anyway", srcPath)
                     src = self.currentStore.create(srcPath)
                     #assumes src share inited before this line parsed
                     for field in srcFields:
@@ -923,6 +1112,7 @@ class Builder(object):
 
         logger logname [to prefix] [at period] [be scheduled]
                        [flush interval]  [keep copies] [cycle term] [size bytes]
+                       [reuse] [threaded]
         scheduled: (active, inactive, slave)
         period seconds
         interval seconds
@@ -957,6 +1147,7 @@ class Builder(object):
             term = 3600.0
             size = 1024 # default rotate size is 1024 bytes = 1KB
             reuse = False  # non-unique logger directory name if True
+            threaded = False  # write logs with writer thread if True
 
 
             while index < len(tokens): #options
@@ -1009,6 +1200,9 @@ class Builder(object):
                 elif connective == 'reuse':
                     reuse = True
 
+                elif connective == 'threaded':
+                    threaded = True
+
                 else:
                     msg = "Error building %s. Bad connective got %s." %\
                           (command, connective)
@@ -1027,7 +1221,8 @@ class Builder(object):
                                     keep=keep,
                                     cyclePeriod=term,
                                     fileSize=size,
-                                    reuse=reuse)
+                                    reuse=reuse,
+                                    threaded=threaded)
             logger.schedule = schedule
 
             self.currentHouse.taskers.append(logger)
@@ -1044,8 +1239,8 @@ class Builder(object):
 
             self.currentLogger = logger
 
-            console.profuse("     Created logger named {0} at period {1:0.4f} be {2}\n".format(
-                logger.name, logger.period,  ScheduleNames[logger.schedule]))
+            console.profuse("     Created logger named {0} at period {1:0.4f} be {2}\n",
+                logger.name, logger.period,  ScheduleNames[logger.schedule])
 
         except IndexError:
             msg = "Error building %s. Not enough tokens." % (command, )
@@ -1143,8 +1338,8 @@ class Builder(object):
             self.currentLogger.addLog(log)
             self.currentLog = log
 
-            console.profuse("     Created log named {0} kind {1} file {2} rule {3}\n".format(
-                name, kind, fileName, LogRuleNames[rule]))
+            console.profuse("     Created log named {0} kind {1} file {2} rule {3}\n",
+                name, kind, fileName, LogRuleNames[rule])
 
         except IndexError:
             msg = "Error building %s. Not enough tokens." % (command,)
@@ -1248,8 +1443,8 @@ class Builder(object):
 
                 self.currentLog.addLoggee(tag=tag, loggee=share, fields=fields)
 
-                console.profuse("     Added loggee {0} with tag {1} fields {2}\n".format(
-                    share.name, tag, fields))
+                console.profuse("     Added loggee {0} with tag {1} fields {2}\n",
+                    share.name, tag, fields)
 
         except IndexError:
             msg = "Error building %s. Not enough tokens." % (command,)
@@ -1367,11 +1562,11 @@ class Builder(object):
                 self.currentFramer.assignFrameRegistry()
                 self.currentFrame = None #changed current Framer so no current Frame
 
-                console.profuse("     Created Framer named '{0}' at period {1:0.4f} be {2} first {3}\n".format(
-                    framer.name, framer.period, ScheduleNames[framer.schedule], framer.first))
+                console.profuse("     Created Framer named '{0}' at period {1:0.4f} be {2} first {3}\n",
+                    framer.name, framer.period, ScheduleNames[framer.schedule], framer.first)
 
-                console.profuse("     Added Framer '{0}' to House '{1}', Assigned frame registry\n".format(
-                    framer.name, self.currentHouse.name))
+                console.profuse("     Added Framer '{0}' to House '{1}', Assigned frame registry\n",
+                    framer.name, self.currentHouse.name)
 
 
         except IndexError:
@@ -1401,8 +1596,8 @@ class Builder(object):
 
             self.currentFramer.first = name #need to resolve later
 
-            console.profuse("     Assigned first frame {0} for framework {1}\n".format(
-                name, self.currentFramer.name))
+            console.profuse("     Assigned first frame {0} for framework {1}\n",
+                name, self.currentFramer.name)
 
         except IndexError:
             msg = "Error building %s. Not enough tokens." % (command,)
@@ -1494,7 +1689,7 @@ class Builder(object):
             self.currentFrame = frame
             self.currentContext = NATIVE
 
-        console.profuse("     Created frame {0} with over {1}\n".format(frame.name, over))
+        console.profuse("     Created frame {0} with over {1}\n", frame.name, over)
 
         return True
 
@@ -1521,8 +1716,8 @@ class Builder(object):
 
         self.currentFrame.over = over #need to resolve and attach later
 
-        console.profuse("     Assigned over {0} to frame {1}\n".format(
-            over,self.currentFrame.name))
+        console.profuse("     Assigned over {0} to frame {1}\n",
+            over,self.currentFrame.name)
 
         return True
 
@@ -1564,8 +1759,8 @@ class Builder(object):
         else: #under == unders[0] already so do nothing
             pass
 
-        console.profuse("     Assigned primary under {0} for frame {1}\n".format(
-            under,self.currentFrame.name))
+        console.profuse("     Assigned primary under {0} for frame {1}\n",
+            under,self.currentFrame.name)
 
         return True
 
@@ -1602,8 +1797,8 @@ class Builder(object):
 
         self.currentFrame.next_ = next_
 
-        console.profuse("     Assigned next frame {0} for frame {1}\n".format(
-            next_, self.currentFrame.name))
+        console.profuse("     Assigned next frame {0} for frame {1}\n",
+            next_, self.currentFrame.name)
 
         return True
 
@@ -1729,13 +1924,13 @@ class Builder(object):
             self.currentFrame.addPreact(act)
 
             console.profuse("     Added suspender preact,  '{0}', with aux"
-                            " {1} needs:\n".format(command, aux))
+                            " {1} needs:\n", command, aux)
             for need in needs:
-                console.profuse("       {0} with parms = {1}\n".format(need.actor, need.parms))
+                console.profuse("       {0} with parms = {1}\n", need.actor, need.parms)
 
         else: # simple auxiliary  if aux is string then regular auz if aux is mapping then clone
             self.currentFrame.addAux(aux) #need to resolve later
-            console.profuse("     Added aux framer {0}\n".format(aux))
+            console.profuse("     Added aux framer {0}\n", aux)
 
         return True
 
@@ -1855,8 +2050,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -1937,8 +2132,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -2002,7 +2197,7 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Created done complete {0} with {1}\n".format(act.actor, act.parms))
+        console.profuse("     Created done complete {0} with {1}\n", act.actor, act.parms)
 
         return True
 
@@ -2050,10 +2245,10 @@ class Builder(object):
                          count=self.currentCount)
         self.currentFrame.addPreact(act) #add transact as preact
 
-        console.profuse("     Added timeout transition preact,  '{0}', with far {1} needs:\n".format(
-            command, far))
+        console.profuse("     Added timeout transition preact,  '{0}', with far {1} needs:\n",
+            command, far)
         for act in needs:
-            console.profuse("       {0} with parms = {1}\n".format(act.actor, act.parms))
+            console.profuse("       {0} with parms = {1}\n", act.actor, act.parms)
 
         return True
 
@@ -2104,10 +2299,10 @@ class Builder(object):
 
         self.currentFrame.addPreact(act) #add transact as preact
 
-        console.profuse("     Added repeat transition preact,  '{0}', with far {1} needs:\n".format(
-            command, far))
+        console.profuse("     Added repeat transition preact,  '{0}', with far {1} needs:\n",
+            command, far)
         for act in needs:
-            console.profuse("       {0} with parms = {1}\n".format(act.actor, act.parms))
+            console.profuse("       {0} with parms = {1}\n", act.actor, act.parms)
 
         return True
 
@@ -2118,8 +2313,8 @@ class Builder(object):
            native
         """
         self.currentContext = NATIVE
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     def buildBenter(self, command, tokens, index):
@@ -2128,8 +2323,8 @@ class Builder(object):
            benter
         """
         self.currentContext = BENTER
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     def buildEnter(self, command, tokens, index):
@@ -2138,8 +2333,8 @@ class Builder(object):
            enter
         """
         self.currentContext = ENTER
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     def buildRenter(self, command, tokens, index):
@@ -2148,8 +2343,8 @@ class Builder(object):
            renter
         """
         self.currentContext = RENTER
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     def buildPrecur(self, command, tokens, index):
@@ -2158,8 +2353,8 @@ class Builder(object):
            precur
         """
         self.currentContext = PRECUR
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     def buildRecur(self, command, tokens, index):
@@ -2168,8 +2363,8 @@ class Builder(object):
            recur
         """
         self.currentContext = RECUR
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     def buildExit(self, command, tokens, index):
@@ -2178,8 +2373,8 @@ class Builder(object):
            exit
         """
         self.currentContext = EXIT
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     def buildRexit(self, command, tokens, index):
@@ -2188,8 +2383,8 @@ class Builder(object):
            rexit
         """
         self.currentContext = REXIT
-        console.profuse("     Changed context to {0}\n".format(
-            ActionContextNames[self.currentContext]))
+        console.profuse("     Changed context to {0}\n",
+            ActionContextNames[self.currentContext])
         return True
 
     #Frame Action specific builders
@@ -2223,8 +2418,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -2290,8 +2485,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -2360,8 +2555,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -2421,7 +2616,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         context = self.currentContext
         if context == NATIVE:
@@ -2431,8 +2626,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -2508,8 +2703,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -2587,10 +2782,10 @@ class Builder(object):
 
         self.currentFrame.addPreact(act)
 
-        console.profuse("     Added transition preact,  '{0}', with far {1} needs:\n".format(
-            command, far))
+        console.profuse("     Added transition preact,  '{0}', with far {1} needs:\n",
+            command, far)
         for act in needs:
-            console.profuse("       {0} with parms = {1}\n".format(act.actor, act.parms))
+            console.profuse("       {0} with parms = {1}\n", act.actor, act.parms)
 
         return True
 
@@ -2658,9 +2853,9 @@ class Builder(object):
         for act in needs:
             self.currentFrame.addBeact(act)
 
-        console.profuse("     Added beact,  '{0}', with needs:\n".format(command))
+        console.profuse("     Added beact,  '{0}', with needs:\n", command)
         for act in needs:
-            console.profuse("       {0} with {1}\n".format(act.actor, act.parms))
+            console.profuse("       {0} with {1}\n", act.actor, act.parms)
 
         return True
 
@@ -2831,8 +3026,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -2934,8 +3129,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} want '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} want '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -3131,7 +3326,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         return act
 
@@ -3163,7 +3358,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         return act
 
@@ -3239,7 +3434,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         return act
 
@@ -3270,7 +3465,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         return act
 
@@ -3762,7 +3957,7 @@ class Builder(object):
 
            implied state is framer.currentframer.state.name value
         """
-        console.profuse("     Making implicit direct framer need {0}\n".format(name))
+        console.profuse("     Making implicit direct framer need {0}\n", name)
         #name is used as name of state relative to current framer
         # and if implicit goal the name of goal relative to current framer
         #create state relative to framer
@@ -3795,7 +3990,7 @@ class Builder(object):
            elapsed == goal +- 0.1
 
         """
-        console.profuse("     Making framer need {0}\n".format(name))
+        console.profuse("     Making framer need {0}\n", name)
         #name is used as name of state relative to current framer
         # and if implicit goal the name of goal relative to current framer
         #create state relative to framer
@@ -3852,7 +4047,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         return act
 
@@ -3881,7 +4076,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         return act
 
@@ -3913,7 +4108,7 @@ class Builder(object):
         msg = "     Created Actor {0} parms: ".format(actorName)
         for key, value in parms.items():
             msg += " {0} = {1}".format(key, value)
-        console.profuse("{0}\n".format(msg))
+        console.profuse("{0}\n", msg)
 
         act = acting.Act(   actor=actorName,
                             registrar=needing.Need,
@@ -3951,8 +4146,8 @@ class Builder(object):
             msg = "Error building %s. Bad context '%s'." % (command, context)
             raise excepting.ParseError(msg, tokens, index)
 
-        console.profuse("     Added {0} fiat '{1}' with parms '{2}'\n".format(
-            ActionContextNames[context], act.actor, act.parms))
+        console.profuse("     Added {0} fiat '{1}' with parms '{2}'\n",
+            ActionContextNames[context], act.actor, act.parms)
 
         return True
 
@@ -4721,20 +4916,20 @@ class Builder(object):
         for dstField, srcField in izip(dstFields, srcFields):
             if (dstField != srcField) and (srcField != 'value'):
                 console.profuse("     Warning: Field names mismatch. '{0}' in {1} "
-                                "from '{2}' in {3}  ... creating anyway".format(
-                                    dstField, dst.name, srcField, src.name))
+                                "from '{2}' in {3}  ... creating anyway",
+                                    dstField, dst.name, srcField, src.name)
 
         #create any non existent source or destination fields
         for field in srcFields: #use source fields for source data
             if field not in src:
                 console.profuse("     Warning: Transfer from non-existent field '{0}' "
-                        "in share {1} ... creating anyway".format(field, src.name))
+                        "in share {1} ... creating anyway", field, src.name)
                 src[field] = None #create
 
         for field in dstFields: #use destination fields for destination data
             if field not in dst:
                 console.profuse("     Warning: Transfer into non-existent field '{0}' "
-                        "in share {1} ... creating anyway\n".format(field, dst.name))
+                        "in share {1} ... creating anyway\n", field, dst.name)
                 dst[field] = None #create
 
         return (srcFields, dstFields)
@@ -4769,14 +4964,14 @@ class Builder(object):
         for dstField, dataField in izip(dstFields, dataFields):
             if (dstField != dataField) and (dataField != 'value'):
                 console.profuse("     Warning: Field names mismatch. '{0}' in {1} "
-                                "from '{2}' ... creating anyway".format(
-                                  dstField, dst.name, dataField))
+                                "from '{2}' ... creating anyway",
+                                  dstField, dst.name, dataField)
 
         #create any non existent destination fields
         for field in dstFields: #use destination fields for destination data
             if field not in dst:
                 console.profuse("     Warning: Transfer into non-existent field '{0}' in "
-                       "share {1} ... creating anyway\n".format(field, dst.name))
+                       "share {1} ... creating anyway\n", field, dst.name)
                 dst[field] = None #create
 
         return (dataFields, dstFields)
@@ -4868,8 +5063,8 @@ def DebugShareFields(store, name):
 
     share = store.fetch(name)
     if share is not None:
-        console.terse("++++++++ Debug share fields++++++++\n{0} = {1}\n".format(
-                share.name, share.items))
+        console.terse("++++++++ Debug share fields++++++++\n{0} = {1}\n",
+                share.name, share.items)
 
 
 def Test(fileName = None, verbose = False):
@@ -4945,8 +5140,8 @@ def Test(fileName = None, verbose = False):
                         control = RUN
 
                     status = framer.runner.send(control)
-                    console.terse("Framer {0} control {1} resulting status = {2}\n".format(
-                            framer.name, ControlNames[control], StatusNames[status]))
+                    console.terse("Framer {0} control {1} resulting status = {2}\n",
+                            framer.name, ControlNames[control], StatusNames[status])
                     if not (status == STOPPED or status == ABORTED):
                         actives.append(framer)
                         done = False
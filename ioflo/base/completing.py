@@ -62,6 +62,6 @@ class CompleteDone(Complete):
         """
         for tasker in taskers:
             tasker.done = True
-            console.profuse("    Done {0}\n".format(tasker.name))
+            console.profuse("    Done {0}\n", tasker.name)
 
         return None
@@ -4,7 +4,6 @@ doing.py doer module for do verb behaviors
 import time
 import struct
 from collections import deque, Mapping
-from functools import wraps
 import inspect
 import copy
 
@@ -23,26 +22,36 @@ console = getConsole()
 from ..aid.classing import nonStringIterable
 from ..aid.aiding import  just, nameToPath
 
+try:
+    from concurrent import futures
+except ImportError:  # python2 without futures backport
+    futures = None
+
 def doify(name,
           base=None,
           registry=None,
           parametric=None,
           inits=None,
           ioinits=None,
-          parms=None):
+          parms=None,
+          offload=False):
     """ Parametrized decorator function that converts the decorated function
         into an Actor sub class with .action method and with class name name
         and registers the new subclass in the registry under name.
         If base is provided then register as subclass of base.
-        Default base is Doer
+        Default base is Doer or DoerOffload when offload
 
         The parameters registry, parametric, inits, ioinits, and parms if provided,
         are used to create the class attributes for the new subclass
+        When offload the ioinits update the output and status Ioinits of base
     """
-    base = base or Doer
+    base = base or (DoerOffload if offload else Doer)
     if not issubclass(base, Doer):
         msg = "Base class '{0}' not subclass of Doer".format(base)
         raise excepting.RegisterError(msg)
+    if offload and not issubclass(base, DoerOffload):
+        msg = "Base class '{0}' not subclass of DoerOffload".format(base)
+        raise excepting.RegisterError(msg)
 
     attrs = odict()
     if registry:
@@ -53,16 +62,16 @@ def doify(name,
         attrs['Inits'] = odict(inits)
     if ioinits:
         attrs['Ioinits'] = odict(ioinits)
+        if offload:  # keep output and status iois unless given
+            attrs['Ioinits'] = odict(base.Ioinits)
+            attrs['Ioinits'].update(ioinits)
     if parms:
         attrs['Parms'] = odict(parms)
     cls = type(name, (base, ), attrs )
 
     def implicit(func):
-        @wraps(func)
-        def inner(*pa, **kwa):
-            return func(*pa, **kwa)
-        cls.action = inner
-        return inner
+        cls.action = func  # no wrapper layer so flattened acts call func directly
+        return func
     return implicit
 
 class Doer(acting.Actor):
@@ -100,7 +109,7 @@ class DoerSince(Doer):
 
     def action(self, **kw):
         """Should call this on superclass  as first step of subclass action method  """
-        console.profuse("Actioning DoerSince  {0}\n".format(self.name))
+        console.profuse("Actioning DoerSince  {0}\n", self.name)
         self.stamp = self.store.stamp
 
     def _expose(self):
@@ -133,7 +142,7 @@ class DoerLapse(Doer):
         Override in subclass
         This is called by restarter action in enter context
         """
-        console.profuse("Restarting DoerLapse  {0}\n".format(self.name))
+        console.profuse("Restarting DoerLapse  {0}\n", self.name)
 
     def updateLapse(self):
         """
@@ -155,7 +164,7 @@ class DoerLapse(Doer):
 
     def action(self, **kwa):
         """    """
-        console.profuse("Actioning DoerLapse  {0}\n".format(self.name))
+        console.profuse("Actioning DoerLapse  {0}\n", self.name)
         self.updateLapse()
 
     def _expose(self):
@@ -182,7 +191,147 @@ class DoerLapse(Doer):
         if not found:
             self._act.frame.addEnact(restartAct)
 
-        console.profuse("{0}Added enact {1} SideAct for {2} with {3} in {4}\n".format(
-                INDENT_ADD, 'restart', self.name, restartAct.parms, self._act.frame.name))
+        console.profuse("{0}Added enact {1} SideAct for {2} with {3} in {4}\n",
+                INDENT_ADD, 'restart', self.name, restartAct.parms, self._act.frame.name)
         restartAct.resolve()
         return parms
+
+
+class DoerOffload(Doer):
+    """
+    Doer whose action is run in a bounded pool of worker threads instead of
+    inline in the skedder iteration so a blocking deed does not delay every
+    framer.
+
+    Calling the doer submits .action to the pool unless its previous
+    submission is still pending, so there is at most one pending submission
+    per doer. The action runs in a worker thread so it must only read its
+    inputs and return its result. It must not write shares.
+    Input shares, whether parms or attributes, are snapshot at submit time so
+    the action reads detached copies that later iterations do not change.
+    When the submission is done the doer is queued in .Dones and the Skedder
+    commits it at the start of its next iteration via Commit so results are
+    only ever written between iterations.
+
+    Iois
+        output = share updated with the result if not None. A mapping result
+            updates fields otherwise the result is the output value
+        status = share with fields
+            pending = True while submission is pending
+            done = count of submissions done without exception
+            error = message of exception raised by last submission or empty
+
+    Class Attributes
+        .Workers = maximum worker threads of pool
+        .Pool = concurrent.futures.ThreadPoolExecutor shared by all instances
+            created on first use
+        .Dones = deque of doers whose submission is done awaiting Commit
+
+    Attributes
+        .future = future of pending submission or None
+    """
+    Ioinits = odict([('output', 'output'),
+                     ('status', odict(ipath='status',
+                                      ival=odict([('pending', False),
+                                                  ('done', 0),
+                                                  ('error', '')])))])
+    Workers = 4
+    Pool = None
+    Dones = deque()
+
+    def __init__(self, **kwa):
+        """Initialize Instance """
+        super(DoerOffload, self).__init__(**kwa)
+        self.future = None
+        self._output = None
+        self._status = None
+
+    def __call__(self, **kwa):
+        """ Submit .action to .Pool unless pending """
+        if self.future is not None:  # previous submission still pending
+            return None
+        kwa.pop('output', None)  # parametric iois are written only by commit
+        kwa.pop('status', None)
+        for key, val in kwa.items():
+            if isinstance(val, storing.Share):
+                kwa[key] = self._snapshot(val)
+        doer = self
+        for key, val in vars(self).items():
+            if (isinstance(val, storing.Share) and
+                    key not in ('output', 'status', '_output', '_status')):
+                if doer is self:
+                    doer = copy.copy(self)  # action reads snapshots not self
+                setattr(doer, key, self._snapshot(val))
+        self.future = DoerOffload.Offload().submit(doer.action, **kwa)
+        self._status.update(pending=True)
+        self.future.add_done_callback(self._done)
+        return None
+
+    @staticmethod
+    def _snapshot(share):
+        """ Return detached copy of share's fields, truth, and stamp """
+        return storing.Share(name=share.name,
+                             data=odict(share.items()),
+                             truth=share.truth,
+                             stamp=share.stamp)
+
+    def _done(self, future):
+        """ Queue self to be committed. Called in worker thread """
+        DoerOffload.Dones.append(self)
+
+    def _prepare(self, **kwa):
+        """ Find output and status shares from parms or attributes """
+        super(DoerOffload, self)._prepare(**kwa)
+        if futures is None:
+            msg = "ResolveError: Offload requires concurrent.futures"
+            raise excepting.ResolveError(msg, self.name, self._act,
+                                         self._act.human, self._act.count)
+        self._output = kwa['output'] if 'output' in kwa else self.output
+        self._status = kwa['status'] if 'status' in kwa else self.status
+
+    def commit(self):
+        """ Write result or exception of done .future into output and status """
+        future, self.future = self.future, None
+        try:
+            result = future.result()
+        except Exception as ex:
+            console.terse("Offloaded Doer '{0}' raised {1!r}\n", self.name, ex)
+            self._status.update(pending=False, error=str(ex) or repr(ex))
+            return
+
+        if result is not None:
+            if isinstance(result, Mapping):
+                self._output.update(result)
+            else:
+                self._output.update(value=result)
+        self._status.update(pending=False,
+                            done=self._status.fetch('done', 0) + 1,
+                            error='')
+
+    @staticmethod
+    def Offload():
+        """ Return .Pool creating it if needed """
+        if DoerOffload.Pool is None:
+            DoerOffload.Pool = futures.ThreadPoolExecutor(max_workers=DoerOffload.Workers)
+        return DoerOffload.Pool
+
+    @staticmethod
+    def Commit():
+        """
+        Commit each done doer in .Dones
+        Called by Skedder at start of each iteration
+        """
+        dones = DoerOffload.Dones
+        while dones:
+            dones.popleft().commit()
+
+    @staticmethod
+    def Shutdown():
+        """
+        Wait for pending submissions, shutdown .Pool and commit
+        Called by Skedder when run ends
+        """
+        if DoerOffload.Pool is not None:
+            DoerOffload.Pool.shutdown(wait=True)
+            DoerOffload.Pool = None
+        DoerOffload.Commit()
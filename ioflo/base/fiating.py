@@ -56,7 +56,7 @@ class FiatReady(Fiat):
     def action(self, tasker, **kw):
         """ready control for explicit slave tasker"""
 
-        console.profuse("Ready {0}\n".format(tasker.name))
+        console.profuse("Ready {0}\n", tasker.name)
         status = tasker.runner.send(READY)
         return (status == READIED)
 
@@ -71,7 +71,7 @@ class FiatStart(Fiat):
     def action(self, tasker, **kw):
         """start control for explicit slave tasker"""
 
-        console.profuse("Start {0}\n".format(tasker.name))
+        console.profuse("Start {0}\n", tasker.name)
         status = tasker.runner.send(START)
         return (status == STARTED)
 
@@ -86,7 +86,7 @@ class FiatStop(Fiat):
     def action(self, tasker, **kw):
         """stop control for explicit slave framer"""
 
-        console.profuse("Stope {0}\n".format(tasker.name))
+        console.profuse("Stope {0}\n", tasker.name)
         status = tasker.runner.send(STOP)
         return (status == STOPPED)
 
@@ -101,7 +101,7 @@ class FiatRun(Fiat):
     def action(self, tasker, **kw):
         """run control for explicit slave tasker"""
 
-        console.profuse("Run {0}\n".format(tasker.name))
+        console.profuse("Run {0}\n", tasker.name)
         status = tasker.runner.send(RUN)
         return (status == RUNNING)
 
@@ -116,6 +116,6 @@ class FiatAbort(Fiat):
     def action(self, tasker, **kw):
         """abort control for explicit slave tasker"""
 
-        console.profuse("Abort {0}\n".format(tasker.name))
+        console.profuse("Abort {0}\n", tasker.name)
         status = tasker.runner.send(ABORT)
         return (status == ABORTED)
@@ -6,7 +6,7 @@ import sys
 if sys.version > '3':
     xrange = range
 import copy
-from collections import deque, Mapping
+from collections import deque, Mapping, namedtuple
 import uuid
 
 from ..aid.sixing import *
@@ -20,6 +20,12 @@ from . import tasking
 from ..aid.consoling import getConsole
 console = getConsole()
 
+# Precomputed transition plan from active outline to far frame
+#   exits = uncommon near frames top down, enters = uncommon far frames top down
+#   reexens = common frames top down to reexit and reenter
+#   exitsUp, rexitsUp = exits and reexens bottom up in exit order
+Plan = namedtuple('Plan', 'exits enters reexens exitsUp rexitsUp')
+
 #Class definitions
 
 class Framer(tasking.Tasker):
@@ -69,9 +75,17 @@ class Framer(tasking.Tasker):
             .tag = main framer local unique clone tag when cloned or aux name if not
             .insularCount = number of insular clones used to create unique clone tag
             .auxes = odict of cloned auxes keyed by tag name of clone
+            .plans = dict of transition Plans keyed by (bottom active frame, far frame)
+            .origin = moot framer this clone was reared from at runtime else None
+            .pool = dict of lists of retired reared clones keyed by origin framer
+
+       class attributes
+            .Reuse = True means razed reared clones are retired into .pool of
+                     rearing framer for reuse by Rearer instead of pruned
     """
     #Counter = 0
     #Names = {}
+    Reuse = True
 
     def __init__(self, tag='', **kw):
         """
@@ -120,6 +134,9 @@ class Framer(tasking.Tasker):
 
         self.tag = tag if tag else self.name  # main framer local unique clone tag when cloned or .name if not
         self.auxes = odict()  # aux framers keyed by clone tag if clone or aux name if not
+        self.plans = dict()  # transition plans keyed by (bottom active frame, far frame)
+        self.origin = None  # moot framer when clone reared at runtime
+        self.pool = dict()  # retired reared clones keyed by origin framer
 
     @property
     def mains(self):
@@ -166,8 +183,8 @@ class Framer(tasking.Tasker):
                        period=period,
                        schedule=schedule,
                        tag=tag)
-        console.terse("         Cloning contents of Framer original '{0}' to clone '{1}'\n"
-                        "".format(self.name, clone.name))
+        console.terse("         Cloning contents of Framer original '{0}' to clone '{1}'\n",
+                        self.name, clone.name)
         clone.schedule = schedule
         clone.first = self.first # resolve later
         clone.moots = copy.deepcopy(self.moots)
@@ -186,7 +203,7 @@ class Framer(tasking.Tasker):
         Called by Razer Actor when razing insular auxes from frame
         """
         if not self.done:
-            console.profuse("Force exiting '{0}'\n".format(self.name))
+            console.profuse("Force exiting '{0}'\n", self.name)
             self.exitAll()
 
         for frame in self.frameNames.values():
@@ -200,11 +217,93 @@ class Framer(tasking.Tasker):
         if self.name in Framer.Names and Framer.Names[self.name] == self:
             del Framer.Names[self.name]
 
+    def retire(self):
+        """
+        Retire reared insular clone so it may be reused instead of pruned.
+        Force exit if not done
+        Razes its own reared clones into its .pool but keeps the insular clones
+        from its moots since those are part of its resolved contents.
+        Resolved frames, acts and share links are kept as is.
+        """
+        if not self.done:
+            console.profuse("Force exiting '{0}'\n", self.name)
+            self.exitAll()
+
+        for frame in self.frameNames.values():
+            razeables = [aux for aux in frame.auxes if aux.insular and aux.razeable]
+            for aux in razeables:
+                self.raze(aux, frame)
+
+        if self.name in Framer.Names and Framer.Names[self.name] == self:
+            del Framer.Names[self.name]
+
+    def raze(self, aux, frame):
+        """
+        Remove reared insular clone aux from frame of this framer.
+        When .Reuse and aux was reared from an origin moot framer retire aux
+        into .pool for reuse by .rear otherwise prune it
+        Called by Razer Actor
+        """
+        frame.auxes.remove(aux)
+        if aux.tag in self.auxes:
+            del self.auxes[aux.tag]
+
+        if self.Reuse and aux.origin is not None:
+            aux.retire()
+            self.pool.setdefault(aux.origin, []).append(aux)
+        else:
+            aux.prune()
+
+    def rear(self, original, frame):
+        """
+        Returns reared insular aux clone of moot framer original added to
+        frame of this framer.
+        Reuses a retired clone of original from .pool when available since it
+        is already resolved otherwise clones, presolves and resolves a new one.
+        Called by Rearer Actor
+        """
+        self.store.house.assignRegistries()  # ensure Framer.Names is houses registry
+        pool = self.pool.get(original)
+        while pool:
+            clone = pool.pop()
+            if clone.tag in self.auxes or clone.name in Framer.Names:  # tag taken
+                clone.prune()
+                continue
+            console.terse("         Reusing retired clone '{0}' of original '{1}'"
+                          " in Frame '{2}' in Framer '{3}'\n",
+                          clone.name, original.name, frame.name, self.name)
+            Framer.Names[clone.name] = clone
+            self.auxes[clone.tag] = clone
+            frame.addAux(clone)
+            clone.main = frame
+            return clone
+
+        tag = self.newAuxTag(base=original.tag)
+        name = "_".join((self.surname, tag))  # replace name with full name
+        console.terse("         Rearing original '{0}' as aux insular clone"
+                      " '{1}' in Frame '{2}' in Framer '{3}'"
+                      "\n", original.name,
+                                    name,
+                                    frame.name,
+                                    self.name)
+        clone = original.clone(name=name, tag=tag, schedule=AUX)
+        clone.original = False  # main frame will be fixed
+        clone.insular = True  #  local to this framer
+        clone.razeable = True  # can be razed
+        clone.origin = original
+        self.auxes[tag] = clone
+        frame.addAux(clone)
+        clone.main = frame
+        self.store.house.presolvables.append(clone)
+        self.store.house.presolvePresolvables()
+        self.store.house.resolveResolvables()
+        return clone
+
     def presolve(self):
         """
         Convert namestrings or data of moots into clones
         """
-        console.terse("     Presolving Framer {0}\n".format(self.name))
+        console.terse("     Presolving Framer {0}\n", self.name)
         self.resolveMoots()
 
         self.assignFrameRegistry()  # needed so Frame.Names valid
@@ -216,7 +315,7 @@ class Framer(tasking.Tasker):
             raise excepting.ResolveError("No first frame link", self.name, self.first)
 
 
-        console.terse("       Presolving frames for framer {0}\n".format(self.name))
+        console.terse("       Presolving frames for framer {0}\n", self.name)
         for frame in Frame.Names.values():  # all frames in this framer's name space
             frame.presolve()
 
@@ -230,15 +329,16 @@ class Framer(tasking.Tasker):
         if not self.presolved:
             raise excepting.ResolveError("Not presolved", self.name, self.main)
 
-        console.terse("     Resolving Framer {0}\n".format(self.name))
+        console.terse("     Resolving Framer {0}\n", self.name)
 
         self.assignFrameRegistry() #needed by act links below
 
-        console.terse("       Resolving frames for framer {0}\n".format(self.name))
+        console.terse("       Resolving frames for framer {0}\n", self.name)
         for frame in Frame.Names.values(): #all frames in this framer's name space
             frame.resolve()
 
         self.traceOutlines()
+        self.planTransits()
 
         self.resolved = True
 
@@ -272,10 +372,10 @@ class Framer(tasking.Tasker):
             count = data['count']
             inode = data['inode']
             insular = data['insular']
-            console.terse("         Cloning original '{0}' as {1} clone '{2}'\n"
-                            "".format(original,
+            console.terse("         Cloning original '{0}' as {1} clone '{2}'\n",
+                            original,
                                       "insular" if insular else "named",
-                                      name))
+                                      name)
             if name != tag:
                 raise excepting.ResolveError("Mismatch clone tag",
                                                              name=name,
@@ -361,7 +461,7 @@ class Framer(tasking.Tasker):
     def traceOutlines(self):
         """Trace and assign outlines for each frame in framer
         """
-        console.terse("       Tracing outlines for framer {0}\n".format(self.name))
+        console.terse("       Tracing outlines for framer {0}\n", self.name)
 
         self.assignFrameRegistry()
 
@@ -371,6 +471,37 @@ class Framer(tasking.Tasker):
             frame.traceHuman()
             frame.traceHeadHuman()
 
+    def planTransits(self):
+        """Precompute .plans for the transition acts in each frame's preacts
+           from every active outline that includes the transition's near frame
+           Outlines are static once traced so plans never go stale
+
+           called by .resolve after .traceOutlines
+        """
+        self.plans.clear()
+        frames = list(Frame.Names.values())
+        for near in frames:
+            for act in near.preacts:
+                far = act.parms.get('far') if act.parms else None
+                if not isinstance(far, Frame):  # not a transition
+                    continue
+                for bottom in frames:  # near active when in bottom's head
+                    if near in bottom.head:
+                        self.plans[(bottom, far)] = self.ExEnPlan(bottom.head, far)
+
+    def plan(self, far):
+        """Returns transition Plan from current .actives to far frame
+           Uses cached plan in .plans computing and caching it if missing
+
+           .actives is always the head of its bottom frame either as the
+           active outline or as a head truncated by a conditional aux
+        """
+        key = (self.actives[-1], far)
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = self.plans[key] = self.ExEnPlan(self.actives, far)
+        return plan
+
     def assignFrameRegistry(self):
         """Point Frame class name registry dict and counter to .frameNames
            and .frameCounter.
@@ -404,8 +535,8 @@ class Framer(tasking.Tasker):
         """update store value of the elapsed time of framer in  current outline
 
         """
-        console.profuse("     Updating {0} from {1:0.4f} to {2:0.4f}\n".format(
-            self.elapsedShr.name, self.elapsedShr.value, self.elapsed))
+        console.profuse("     Updating {0} from {1:0.4f} to {2:0.4f}\n",
+            self.elapsedShr.name, self.elapsedShr.value, self.elapsed)
         self.elapsedShr.update(value = self.elapsed)
 
     def restartCounter(self):
@@ -427,8 +558,8 @@ class Framer(tasking.Tasker):
         """update store value of the recurred count of framer in  current outline
 
         """
-        console.profuse("     Updating {0} from {1:d} to {2:d}\n".format(
-            self.recurredShr.name, self.recurredShr.value, self.recurred))
+        console.profuse("     Updating {0} from {1:d} to {2:d}\n",
+            self.recurredShr.name, self.recurredShr.value, self.recurred)
         self.recurredShr.update(value = self.recurred)
 
     def change(self, actives, human = ''):
@@ -478,10 +609,10 @@ class Framer(tasking.Tasker):
            exits list is used by frame.checkEnters to test for original auxiliaries
            that would be exited from thier main frame if transition where allowed
         """
-        console.profuse("{0}Check enters of {1} Framer {2}\n".format(
+        console.profuse("{0}Check enters of {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         if not enters:  #don't want to make transition if no change in outline
             console.profuse("    False, empty enters\n")
@@ -490,7 +621,7 @@ class Framer(tasking.Tasker):
         for frame in enters:
             if not frame.checkEnter(exits=exits):
                 return False
-        console.profuse("    True all {0}\n".format(self.name))
+        console.profuse("    True all {0}\n", self.name)
         return True
 
     def enterAll(self):
@@ -499,10 +630,10 @@ class Framer(tasking.Tasker):
            calls enterActions for frames in active outline
 
         """
-        console.profuse("{0}Enter All {1} Framer {2}\n".format(
+        console.profuse("{0}Enter All {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         self.done = False #reset done state
         self.activate(self.first)
@@ -533,10 +664,10 @@ class Framer(tasking.Tasker):
            assumes actives outline is in top down order
 
         """
-        console.profuse("{0}Recur {1} Framer {2}\n".format(
+        console.profuse("{0}Recur {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         for frame in self.actives:  #recur actions top to bottom so all actions get run before trans
             frame.recur()
@@ -549,10 +680,10 @@ class Framer(tasking.Tasker):
            Start performing transitions for frames in active outline top down until
              find successful transition or complete without finding
         """
-        console.profuse("{0}Segue {1} Framer {2}\n".format(
+        console.profuse("{0}Segue {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         self.updateTimer() #this also updates share
         self.updateCounter() #this also updates share
@@ -577,10 +708,10 @@ class Framer(tasking.Tasker):
            sets .done to True
            deactivates so restart required to run again
         """
-        console.profuse("{0}Exit All {1} Framer {2}\n".format(
+        console.profuse("{0}Exit All {1} Framer {2}\n",
             '    ' if self.schedule == AUX or self.schedule == SLAVE else '',
             ScheduleNames[self.schedule],
-            self.name))
+            self.name)
 
         exits = self.actives[:]  #make copy of self.actives so can reverse it
         self.exit(exits) #exits is reversed in place in exit()
@@ -606,23 +737,35 @@ class Framer(tasking.Tasker):
         for frame in rexits:
             frame.rexit()
 
+    def transit(self, plan):
+        """performs exits, rexits, renters, and enters of transition plan
+           in order using its precomputed bottom up exit lists so no copies
+           or reversals are needed
+        """
+        for frame in plan.exitsUp:
+            frame.exit()
+        for frame in plan.rexitsUp:
+            frame.rexit()
+        self.renter(plan.reexens)
+        self.enter(plan.enters)
+
     def showHierarchy(self):
         """Prints out Framework Hierachy for this framer
         """
-        console.terse("\nFramework Hierarchy for {0}:\n".format(self.name))
+        console.terse("\nFramework Hierarchy for {0}:\n", self.name)
         names = self.frameNames
 
         #top layer are nodes with no over but a unders
         tops = [ x for x in names.itervalues() if ((not x.over) and x.unders)]
-        console.terse("Tops: {0}\n".format(" ".join([x.name for x in tops])))
+        console.terse("Tops: {0}\n", " ".join([x.name for x in tops]))
 
         # bottom nodes with over but no unders
         bottoms = [x for x in names.itervalues() if ((x.over) and (not x.unders))]
-        console.terse("Bottoms: {0}\n".format(" ".join([x.name for x in bottoms])))
+        console.terse("Bottoms: {0}\n", " ".join([x.name for x in bottoms]))
 
         # loose node have no over and no unders
         loose = [x for x in names.itervalues() if ((not x.over) and (not x.unders))]
-        console.terse("Loose: {0}\n".format(" ".join([x.name for x in loose])))
+        console.terse("Loose: {0}\n", " ".join([x.name for x in loose]))
 
         console.terse("Hierarchy: \n")
         upper = tops
@@ -644,7 +787,7 @@ class Framer(tasking.Tasker):
                     lower.append(b)
             upper = lower
             count += 1
-            console.terse("Level {0}: {1}\n".format(count, " ".join(lframes)))
+            console.terse("Level {0}: {1}\n", count, " ".join(lframes))
 
         console.terse("\n")
 
@@ -656,7 +799,7 @@ class Framer(tasking.Tasker):
            yields next frame on a trans(ition)
         """
         #do any on creation initialization here
-        console.profuse("   Making Framer '{0}' runner\n".format(self.name))
+        console.profuse("   Making Framer '{0}' runner\n", self.name)
 
         self.status = STOPPED #operational status of framer
         self.desire = STOP
@@ -668,60 +811,60 @@ class Framer(tasking.Tasker):
 
                 status = self.status #for speed
 
-                console.profuse("\n   Iterate Framer '{0}' with control = {1} status = {2}\n".format(
+                console.profuse("\n   Iterate Framer '{0}' with control = {1} status = {2}\n",
                     self.name,
                     ControlNames.get(control, 'Unknown'),
-                    StatusNames.get(status, 'Unknown')))
+                    StatusNames.get(status, 'Unknown'))
 
                 if control == RUN:
                     if status == RUNNING or status == STARTED:
                         #self.desire = RUN
                         self.segue()
                         self.recur() #.desire may change here
-                        console.profuse("     Ran Framer '{0}'\n".format(self.name))
+                        console.profuse("     Ran Framer '{0}'\n", self.name)
                         self.status = RUNNING
 
                     elif status == STOPPED or status == READIED:
-                        console.profuse("   Need to Start Framer '{0}'\n".format(self.name))
+                        console.profuse("   Need to Start Framer '{0}'\n", self.name)
                         self.desire = START
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n",
                             self.name,
                             StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                            ControlNames.get(control, "Unknown"))
                         self.desire = ABORT
                         self.status = ABORTED
 
                 elif control == READY:
                     if status == STOPPED or status == READIED:
-                        console.profuse("   Attempting Ready Framer '{0}'\n".format(self.name))
+                        console.profuse("   Attempting Ready Framer '{0}'\n", self.name)
 
                         if self.checkStart(): #checks enters
-                            console.profuse("   Readied Framer '{0}' ...\n".format(self.name))
+                            console.profuse("   Readied Framer '{0}' ...\n", self.name)
                             self.status = READIED
                         else:  #checkStart failed
-                            console.profuse("   Failed Ready Framer '{0}'\n".format(self.name))
+                            console.profuse("   Failed Ready Framer '{0}'\n", self.name)
                             self.desire = STOP
                             self.status = STOPPED
 
                     elif status == RUNNING or status == STARTED:
-                        console.profuse("   Framer '{0}', aleady Started\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Started\n", self.name)
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n",
                             self.name,
                             StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                            ControlNames.get(control, "Unknown"))
                         self.desire = ABORT
                         self.status = ABORTED
 
                 elif control == START:
                     if status == STOPPED or status == READIED:
-                        console.profuse("   Attempting Start Framer '{0}'\n".format(self.name))
+                        console.profuse("   Attempting Start Framer '{0}'\n", self.name)
 
                         if self.checkStart(): #checks enters
-                            console.terse("   Starting Framer '{0}' ...\n".format(self.name))
+                            console.terse("   Starting Framer '{0}' ...\n", self.name)
                             msg = "To: {0}<{1} at {2}\n".format(self.name,
                                                                      self.first.human,
                                                                      round(self.store.stamp, 6))
@@ -731,19 +874,19 @@ class Framer(tasking.Tasker):
                             self.recur() #.desire may change here
                             self.status = STARTED
                         else:  #checkStart failed
-                            console.profuse("   Failed Start Framer {0}\n".format(self.name))
+                            console.profuse("   Failed Start Framer {0}\n", self.name)
                             self.desire = STOP
                             self.status = STOPPED
 
                     elif status == RUNNING or status == STARTED:
-                        console.profuse("   Framer '{0}', aleady Started\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Started\n", self.name)
                         self.desire = RUN
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n",
                             self.name,
                             StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                            ControlNames.get(control, "Unknown"))
                         self.desire = ABORT
                         self.status = ABORTED
 
@@ -755,24 +898,24 @@ class Framer(tasking.Tasker):
                         console.terse(msg)
                         #self.done = False set in exitAll(abort=True) when abort == True
                         self.exitAll(abort=True)  #self.desire may change,
-                        console.profuse("   Stopped Framer '{0}'\n".format(self.name))
+                        console.profuse("   Stopped Framer '{0}'\n", self.name)
                         self.status = STOPPED
 
                     elif status == STOPPED or status == READIED:
-                        console.profuse("   Framer '{0}', aleady Stopped\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Stopped\n", self.name)
                         #self.desire = STOP
 
                     else: # self.status == ABORTED or unknown:
-                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n".format(
+                        console.profuse("   Aborting Framer '{0}', bad status = {1} control = {2}\n",
                             self.name,
                             StatusNames.get(status, "Unknown"),
-                            ControlNames.get(control, "Unknown")))
+                            ControlNames.get(control, "Unknown"))
                         self.desire = ABORT
                         self.status = ABORTED
 
                 else: #control == ABORT or unknown
-                    console.profuse("   Framer '{0}' aborting with control = {1}\n".format(
-                        self.name, ControlNames.get(control, "Unknown")))
+                    console.profuse("   Framer '{0}' aborting with control = {1}\n",
+                        self.name, ControlNames.get(control, "Unknown"))
 
                     if status == RUNNING or status == STARTED:
                         msg = "   Aborting %s in %s at %0.3f\n" %\
@@ -784,13 +927,13 @@ class Framer(tasking.Tasker):
                             (self.name, self.store.stamp)
                         console.terse(msg)
                     elif status == ABORTED:
-                        console.profuse("   Framer '{0}', aleady Aborted\n".format(self.name))
+                        console.profuse("   Framer '{0}', aleady Aborted\n", self.name)
 
                     self.desire = ABORT
                     self.status = ABORTED
 
         finally: #in case uncaught exception
-            console.profuse("   Exception causing Abort Framer '{0}' ...\n".format(self.name))
+            console.profuse("   Exception causing Abort Framer '{0}' ...\n", self.name)
             self.desire = ABORT
             self.status = ABORTED
 
@@ -820,6 +963,15 @@ class Framer(tasking.Tasker):
         #(exits, enters, reexits, reenters)
         return ([], [], nears[:])
 
+    @staticmethod
+    def ExEnPlan(nears, far):
+        """Returns transition Plan from outline list nears to far frame
+           computed with .ExEn as tuples including bottom up exit orders
+        """
+        exits, enters, reexens = Framer.ExEn(nears, far)
+        return Plan(tuple(exits), tuple(enters), tuple(reexens),
+                    tuple(reversed(exits)), tuple(reversed(reexens)))
+
     @staticmethod
     def Uncommon(near,far):
         """Computes the relative differences (uncommon part) between
@@ -920,8 +1072,8 @@ class Frame(registering.StoriedRegistrar):
                       store=self.store,
                       framer=framer.name,  # only name so resolve framer later
                       inode=self.inode)
-        console.terse("           Cloning Frame '{0}' into Framer '{1}'\n".format(
-                               clone.name, framer.name))
+        console.terse("           Cloning Frame '{0}' into Framer '{1}'\n",
+                               clone.name, framer.name)
 
         for aux in self.auxes:
             clone.addAux(aux)
@@ -970,7 +1122,7 @@ class Frame(registering.StoriedRegistrar):
            need to be converted to object references using instance name registry
 
         """
-        console.concise("        Presolving Frame {0}\n".format(self.name))
+        console.concise("        Presolving Frame {0}\n", self.name)
 
         self.resolveFramerLink()
         self.resolveAuxLinks()
@@ -982,7 +1134,7 @@ class Frame(registering.StoriedRegistrar):
            need to be converted to object references using instance name registry
 
         """
-        console.concise("        Resolving Frame {0}\n".format(self.name))
+        console.concise("        Resolving Frame {0}\n", self.name)
 
         #self.resolveFramerLink()
         #self.resolveAuxLinks()
@@ -1316,7 +1468,7 @@ class Frame(registering.StoriedRegistrar):
            exits is list of exit frames to test if aux main frame would be exited
            if transition allowed
         """
-        console.profuse("    Check enter into {0}\n".format(self.name))
+        console.profuse("    Check enter into {0}\n", self.name)
 
         for need in self.beacts:  #could use generator expression and all()
             if not need(): #evaluate need Act if failed
@@ -1328,20 +1480,20 @@ class Frame(registering.StoriedRegistrar):
             # verify that aux does not belong to another frame
             if aux.main and (aux.main is not self) and (aux.main not in exits):
                 console.concise("    False. Invalid aux '{0}' in use by another frame"
-                        " '{1}'\n".format(aux.name, aux.main.name))
+                        " '{1}'\n", aux.name, aux.main.name)
                 return False
 
             if not aux.checkStart(): #performs entry checks beacts
                 return False
 
-        console.profuse("    True all {0}\n".format(self.name))
+        console.profuse("    True all {0}\n", self.name)
 
         return True #since no failues return True
 
     def enter(self):
         """calls enacts enter  acts for self and auxes
         """
-        console.profuse("    Enter {0}\n".format(self.name))
+        console.profuse("    Enter {0}\n", self.name)
 
         for act in self.enacts: #could use generator expression
             act() #call entryAction
@@ -1358,14 +1510,14 @@ class Frame(registering.StoriedRegistrar):
     def renter(self):
         """calls  renacts renter acts for self
         """
-        console.profuse("    Renter {0}\n".format(self.name))
+        console.profuse("    Renter {0}\n", self.name)
         for act in self.renacts: #could use generator expression
             act() #call renter actions
 
     def recur(self):
         """calls reacts recurring acts for self and runs auxes
         """
-        console.profuse("    Recur {0}\n".format(self.name))
+        console.profuse("    Recur {0}\n", self.name)
 
         for act in self.reacts:
             act()
@@ -1378,7 +1530,7 @@ class Frame(registering.StoriedRegistrar):
            called by self.framer.segue()
            segue Auxes is its own context
         """
-        console.profuse("    Seque auxes of {0}\n".format(self.name))
+        console.profuse("    Seque auxes of {0}\n", self.name)
 
         for aux in self.auxes:
             aux.segue()
@@ -1401,7 +1553,7 @@ class Frame(registering.StoriedRegistrar):
 
            called by self.framer.segue()
         """
-        console.profuse("    Precur {0}\n".format(self.name))
+        console.profuse("    Precur {0}\n", self.name)
 
         for act in self.preacts:
             if act():
@@ -1412,7 +1564,7 @@ class Frame(registering.StoriedRegistrar):
     def exit(self):
         """calls exacts exit acts for self
         """
-        console.profuse("    Exit {0}\n".format(self.name))
+        console.profuse("    Exit {0}\n", self.name)
 
         for aux in self.auxes: #since auxes entered last must be exited first
             aux.exitAll()
@@ -1425,7 +1577,7 @@ class Frame(registering.StoriedRegistrar):
     def rexit(self):
         """calls  rexacts rexit acts for self
         """
-        console.profuse("    Rexit {0}\n".format(self.name))
+        console.profuse("    Rexit {0}\n", self.name)
 
         for act in self.rexacts:
             act() #call rexit Action
@@ -1546,8 +1698,8 @@ def resolveAuxOfFramer(aux,
                                          who,
                                          human,
                                          count)
-        console.concise("         Resolved {0} Framer '{1}' with tag '{2}' in {3}\n"
-                      "".format(desc, aux.name, aux.tag, who))
+        console.concise("         Resolved {0} Framer '{1}' with tag '{2}' in {3}\n",
+                      desc, aux.name, aux.tag, who)
     return aux
 
 
@@ -1589,8 +1741,8 @@ def resolveFramer(framer, who='', desc='framer', contexts=None,
                                          who,
                                          human,
                                          count)
-        console.concise("         Resolved {0} Framer '{1}' in {2}\n"
-                      "".format(desc, framer.name, who))
+        console.concise("         Resolved {0} Framer '{1}' in {2}\n",
+                      desc, framer.name, who)
     return framer
 
 ResolveFramer = resolveFramer
@@ -1611,8 +1763,8 @@ def resolveFrame(frame, who='', desc='act', human='', count=None):
                                          human,
                                          count)
         frame = Frame.Names[frame] #replace frame name with frame
-        console.concise("         Resolved {0} Frame '{1}' in {2}\n"
-                              "".format(desc, frame.name, who))
+        console.concise("         Resolved {0} Frame '{1}' in {2}\n",
+                              desc, frame.name, who)
 
     return frame
 
@@ -1635,8 +1787,8 @@ def resolveFrameOfFramer(frame, framer, who='', desc='act', human='', count=None
                                          human,
                                          count)
         frame = framer.frameNames[frame] #replace frame name with frame
-        console.concise("         Resolved {0} Frame '{1}' in {2}\n"
-                              "".format(desc, frame.name, who))
+        console.concise("         Resolved {0} Frame '{1}' in {2}\n",
+                              desc, frame.name, who)
 
     return frame
 
@@ -66,7 +66,7 @@ class GoalDirect(Goal):
               destination = share of goal
               data = dict of data fields to assign to goal share
         """
-        console.profuse("Set {0} to {1}\n".format(destination.name, data))
+        console.profuse("Set {0} to {1}\n", destination.name, data)
         destination.update(data)
         return None
 
@@ -104,8 +104,8 @@ class GoalIndirect(Goal):
               source = share of source to get data from
               fields = fields to use to update goal
         """
-        console.profuse("Set {0} in {1} from {2} in {3}\n".format(
-                destination.name, destinationFields, source.name, sourceFields))
+        console.profuse("Set {0} in {1} from {2} in {3}\n",
+                destination.name, destinationFields, source.name, sourceFields)
         data = odict()
         for gf, sf in izip(destinationFields, sourceFields):
             data[gf] = source[sf]
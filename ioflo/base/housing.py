@@ -30,7 +30,6 @@ from . import doing  #needed for Registries
 from . import tasking  #needed for Registries
 from . import framing  #needed for Registries
 from . import logging  #needed for Registries
-from .. import trim  #needed for Registries
 
 from ..aid.consoling import getConsole
 console = getConsole()
@@ -80,6 +79,8 @@ class House(registering.StoriedRegistrar):
 
           .metas = dictionary of (name, share) items of meta data for access by skedder
                   name is how skedder accesses the associated share
+          .bridges = list of (source path, house name, destination path) triples
+                  of shares exchanged with other houses by skedder
     """
     Counter = 0
     Names = {}
@@ -107,6 +108,7 @@ class House(registering.StoriedRegistrar):
         self.counters = odict() #houses dict of registry Name Counters
 
         self.metas = odict() # dict of meta data items (name, share) for skedder to access
+        self.bridges = []  # list of (source, house, destination) bridged shares
 
         for key in Registries: #initialize names dicts for registry Names
             self.names[key] = odict()
@@ -120,7 +122,7 @@ class House(registering.StoriedRegistrar):
     def orderTaskables(self):
         """Place taskables in order
         """
-        console.terse("   Ordering taskable taskers for House '{0}' ...\n".format(self.name))
+        console.terse("   Ordering taskable taskers for House '{0}' ...\n", self.name)
         self.taskables = self.fronts + self.mids + self.backs
 
     def assignRegistries(self):
@@ -137,7 +139,7 @@ class House(registering.StoriedRegistrar):
             resolution looks up name string in appropriate registry and replaces
             name string with link to object
         """
-        console.terse("   Resolving House '{0}' ...\n".format(self.name))
+        console.terse("   Resolving House '{0}' ...\n", self.name)
         self.assignRegistries()
 
         for tasker in self.taskers:
@@ -174,17 +176,17 @@ class House(registering.StoriedRegistrar):
     def showAllTaskers(self):
         """Show all Taskers and Slaves and Auxes and Moots and Framers."""
 
-        console.terse("Taskables in House '{0}':\n     {1}\n".format(
-            self.name, ' '.join([tasker.name for tasker in self.taskables])))
+        console.terse("Taskables in House '{0}':\n     {1}\n",
+            self.name, ' '.join([tasker.name for tasker in self.taskables]))
 
-        console.terse("Slaves in House '{0}':\n     {1}\n".format(
-            self.name, ' '.join([tasker.name for tasker in self.slaves])))
+        console.terse("Slaves in House '{0}':\n     {1}\n",
+            self.name, ' '.join([tasker.name for tasker in self.slaves]))
 
-        console.terse("Auxes in House '{0}':\n     {1}\n".format(
-            self.name, ' '.join([tasker.name for tasker in self.auxes])))
+        console.terse("Auxes in House '{0}':\n     {1}\n",
+            self.name, ' '.join([tasker.name for tasker in self.auxes]))
 
-        console.terse("Moots in House '{0}':\n     {1}\n".format(
-                    self.name, ' '.join([tasker.name for tasker in self.moots])))
+        console.terse("Moots in House '{0}':\n     {1}\n",
+                    self.name, ' '.join([tasker.name for tasker in self.moots]))
 
-        console.terse("Framers in House '{0}':\n     {1}\n".format(
-            self.name, ' '.join([tasker.name for tasker in self.framers])))
+        console.terse("Framers in House '{0}':\n     {1}\n",
+            self.name, ' '.join([tasker.name for tasker in self.framers]))
@@ -0,0 +1,51 @@
+"""indexing.py generated index of lazily imported registry entries
+
+Generated by registering.writeIndex() do not edit
+"""
+
+Index = {
+    'ioflo.base.doing.Doer': {
+        'Deed': 'ioflo.base.deeding',
+        'DeedParam': 'ioflo.base.deeding',
+        'DeedSince': 'ioflo.base.deeding',
+        'DeedLapse': 'ioflo.base.deeding',
+        'Arbiter': 'ioflo.base.arbiting',
+        'ArbiterSwitch': 'ioflo.base.arbiting',
+        'ArbiterPriority': 'ioflo.base.arbiting',
+        'ArbiterTrusted': 'ioflo.base.arbiting',
+        'ArbiterWeighted': 'ioflo.base.arbiting',
+        'ControllerBase': 'ioflo.trim.interior.plain.controlling',
+        'ControllerPid': 'ioflo.trim.interior.plain.controlling',
+        'ControllerPidSpeed': 'ioflo.trim.interior.plain.controlling',
+        'ControllerPidHeading': 'ioflo.trim.interior.plain.controlling',
+        'ControllerPidDepth': 'ioflo.trim.interior.plain.controlling',
+        'ControllerPidPitch': 'ioflo.trim.interior.plain.controlling',
+        'DetectorBase': 'ioflo.trim.interior.plain.detecting',
+        'DetectorPositionBox': 'ioflo.trim.interior.plain.detecting',
+        'EstimatorPositionNfl': 'ioflo.trim.interior.plain.estimating',
+        'FilterBase': 'ioflo.trim.interior.plain.filtering',
+        'FilterSensorHeading': 'ioflo.trim.interior.plain.filtering',
+        'FilterWindowed': 'ioflo.trim.interior.plain.filtering',
+        'FilterSensorSalinity': 'ioflo.trim.interior.plain.filtering',
+        'FilterSensorSalinitysim': 'ioflo.trim.interior.plain.filtering',
+        'FilterSensorTemperature': 'ioflo.trim.interior.plain.filtering',
+        'FilterCtdMin': 'ioflo.trim.interior.plain.filtering',
+        'SimulatorBase': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorMotionUuv': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorMotionUsv': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSensorGps': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSensorDvl': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSensorCompass': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorFleetBase': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorMotionUuvFleet': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorMotionUsvFleet': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSensorGpsFleet': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSensorDvlFleet': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSensorCompassFleet': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSalinityLinear': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorSalinitySinusoid': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorGradient': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorGradientTemperature': 'ioflo.trim.interior.plain.simulating',
+        'SimulatorGradientSalinity': 'ioflo.trim.interior.plain.simulating',
+    },
+}
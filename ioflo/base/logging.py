@@ -9,9 +9,17 @@ import time
 import datetime
 import copy
 import io
+import numbers
+import struct
+import threading
 
 from collections import deque, MutableSequence, MutableMapping, Mapping
 
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
 from ..aid.sixing import *
 from .globaling import *
 from ..aid.odicting import odict
@@ -25,6 +33,14 @@ from . import tasking
 from ..aid.consoling import getConsole
 console = getConsole()
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Missing = object()  # sentinel for log row value of field not in loggee
+Scalars = (float, bool, int, long, str, bytes, unicode, type(None))  # immutable
+
 #Class definitions
 
 
@@ -36,6 +52,10 @@ class Logger(tasking.Tasker):
              logger.send(RUN) runs logs
              logger.send(STOP) closes log files needed to flush caches
 
+    When threaded, logs capture their rows in the skedder thread and submit
+    them onto a bounded queue. A writer thread formats and writes the rows and
+    performs the flushes and rotations. When the queue is full submissions are
+    dropped and counted so the skedder never blocks on file I/O.
     """
 
     def __init__(self,
@@ -45,6 +65,8 @@ class Logger(tasking.Tasker):
                  cyclePeriod=0.0,
                  fileSize=0,
                  reuse=False,
+                 threaded=False,
+                 queueSize=4096,
                  **kw):
         """
         Initialize instance.
@@ -66,6 +88,8 @@ class Logger(tasking.Tasker):
                        0 means always rotate
             reuse = Make unique time stamped log directory if True otherwise nonunique
                     useful when rotating
+            threaded = Write logs with writer thread if True otherwise in line
+            queueSize = max number of submissions queued for writer thread
 
 
         Inherited Class Attributes:
@@ -99,6 +123,15 @@ class Logger(tasking.Tasker):
             .path = full path name of log directory
             .logs = dict of logs
 
+            .threaded = Write logs with writer thread if True otherwise in line
+            .queue = bounded queue of submissions for writer thread
+            .writer = writer thread when started
+            .written = number of submissions performed by writer thread
+            .dropped = number of submissions dropped since queue full
+            .failed = number of submissions that raised in writer thread
+            .highwater = max sampled queue backlog
+            .writerShr = share of writer counters when threaded
+
 
         """
         super(Logger, self).__init__(**kw) #status = STOPPED  make runner advance so can send cmd
@@ -117,6 +150,20 @@ class Logger(tasking.Tasker):
         self.path = '' #log directory path created on .reopen()
         self.logs = [] #list of logs
 
+        self.threaded = True if threaded else False
+        self.queue = queue.Queue(maxsize=max(1, queueSize)) if self.threaded else None
+        self.writer = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.highwater = 0
+        self.writerShr = None
+        if self.threaded:
+            path = 'logger.' + self.name + '.writer'
+            self.writerShr = self.store.create(path)
+            self.writerShr.update(backlog=0, highwater=0, written=0,
+                                  dropped=0, failed=0)
+
     def log(self):
         """
         Perform one log action
@@ -126,9 +173,12 @@ class Logger(tasking.Tasker):
 
         try:
             if (self.store.stamp - self.flushStamp) >= self.flushPeriod:
-                console.profuse("Logger {0} Flushed at {1}, previous flush at {2}\n".format(
-                    self.name, self.store.stamp, self.flushStamp))
-                self.flush()
+                console.profuse("Logger {0} Flushed at {1}, previous flush at {2}\n",
+                    self.name, self.store.stamp, self.flushStamp)
+                if self.writer:
+                    self.submit(self.flush)
+                else:
+                    self.flush()
                 self.flushStamp = self.store.stamp
 
         except TypeError:  # stamps may be None so handle
@@ -137,14 +187,80 @@ class Logger(tasking.Tasker):
         if self.keep:
             try:
                 if (self.store.stamp - self.cycleStamp) >= self.cyclePeriod:
-                    console.profuse("Logger {0} Cycle rotation at {1}, previous cycle at {2}\n".format(
-                        self.name, self.store.stamp, self.cycleStamp))
-                    self.cycle()
+                    console.profuse("Logger {0} Cycle rotation at {1}, previous cycle at {2}\n",
+                        self.name, self.store.stamp, self.cycleStamp)
+                    if self.writer:
+                        self.submit(self.cycle)
+                    else:
+                        self.cycle()
                     self.cycleStamp = self.store.stamp
 
             except TypeError:  # stamps may be None so handle
                 self.cycleStamp = self.store.stamp  # force cycleStamp to be store.stamp
 
+        if self.writerShr:
+            backlog = self.queue.qsize()
+            self.highwater = max(self.highwater, backlog)
+            self.writerShr.update(backlog=backlog,
+                                  highwater=self.highwater,
+                                  written=self.written,
+                                  dropped=self.dropped,
+                                  failed=self.failed)
+
+    def submit(self, func, *args):
+        """
+        Returns True if func(*args) queued for writer thread
+        Otherwise returns False and counts drop since queue is full
+        """
+        try:
+            self.queue.put_nowait((func, args))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def startWriter(self):
+        """
+        Start writer thread if threaded and not already started
+        Logs then submit their writes to the writer thread
+        """
+        if self.threaded and not self.writer:
+            self.writer = threading.Thread(target=self.serviceWriter,
+                                           name="{0}Writer".format(self.name))
+            self.writer.daemon = True
+            for log in self.logs:
+                log.submit = self.submit
+            self.writer.start()
+
+    def stopWriter(self):
+        """
+        Drain queue and stop writer thread if started
+        Logs then write in line
+        """
+        if self.writer:
+            self.queue.put((None, ()))  # blocks until room for stop sentinel
+            self.writer.join()
+            self.writer = None
+            for log in self.logs:
+                log.submit = None
+
+    def serviceWriter(self):
+        """
+        Writer thread target. Performs queued submissions in order until
+        stop sentinel
+        """
+        while True:
+            func, args = self.queue.get()
+            if func is None:  # stop sentinel
+                break
+            try:
+                func(*args)
+            except Exception as ex:
+                self.failed += 1
+                console.terse("Error: Logger {0} writer '{1}'\n", self.name, ex)
+            else:
+                self.written += 1
+
     def reopen(self):
         """
         Reopen all log files
@@ -164,6 +280,7 @@ class Logger(tasking.Tasker):
         """
         Close all log files
         """
+        self.stopWriter()  # drain writes first
         for log in self.logs:
             log.close()
 
@@ -233,11 +350,11 @@ class Logger(tasking.Tasker):
                     i +=1
 
         except OSError as ex:
-            console.terse("Error: creating log directory '{0}'\n".format(ex))
+            console.terse("Error: creating log directory '{0}'\n", ex)
             return path
 
-        console.concise("     Created Logger {0} Directory at '{1}'\n".format(
-                self.name, self.path))
+        console.concise("     Created Logger {0} Directory at '{1}'\n",
+                self.name, self.path)
 
         return path
 
@@ -246,7 +363,7 @@ class Logger(tasking.Tasker):
         generator factory function to create generator to run this logger
         """
         #do any on creation initialization here
-        console.profuse("     Making Logger Task Runner {0}\n".format(self.name))
+        console.profuse("     Making Logger Task Runner {0}\n", self.name)
 
         self.status = STOPPED #operational status of tasker
         self.desire = STOP #default what to do next time, override below
@@ -254,28 +371,29 @@ class Logger(tasking.Tasker):
         try: #catch exceptions to close log files before exiting generator
             while (True):
                 control = (yield (self.status )) #accept control and yield status
-                console.profuse("\n     Iterate Logger {0} with control = {1} status = {2}\n".format(
+                console.profuse("\n     Iterate Logger {0} with control = {1} status = {2}\n",
                     self.name,
                     ControlNames.get(control, 'Unknown'),
-                    StatusNames.get(self.status, 'Unknown')))
+                    StatusNames.get(self.status, 'Unknown'))
 
                 if control == RUN:
-                    console.profuse("     Running Logger {0} ...\n".format(self.name))
+                    console.profuse("     Running Logger {0} ...\n", self.name)
                     self.log()
                     self.status = RUNNING
 
                 elif control == READY:
-                    console.profuse("     Attempting Ready Logger {0}\n".format(self.name))
+                    console.profuse("     Attempting Ready Logger {0}\n", self.name)
                     #doesn't do anything yet
-                    console.terse("     Readied Logger {0} ...\n".format(self.name))
+                    console.terse("     Readied Logger {0} ...\n", self.name)
                     self.status = READIED
 
                 elif control == START:
-                    console.profuse("     Attempting Start Logger {0}\n".format(self.name))
+                    console.profuse("     Attempting Start Logger {0}\n", self.name)
 
                     if self.reopen():
-                        console.terse("     Starting Logger {0} ...\n".format(self.name))
+                        console.terse("     Starting Logger {0} ...\n", self.name)
                         self.prepare()
+                        self.startWriter()
                         self.log()
                         self.desire = RUN
                         self.status = STARTED
@@ -285,8 +403,9 @@ class Logger(tasking.Tasker):
 
                 elif control == STOP:
                     if self.status != STOPPED:
-                        console.terse("     Stopping Logger {0} ...\n".format(self.name))
+                        console.terse("     Stopping Logger {0} ...\n", self.name)
                         self.log() #final log
+                        self.stopWriter()  # drain before in line cycle
                         if self.keep and self.reuse:  # recycle in case multiple restarts
                             self.cycle()  # cause log file to exceed size before cycle time
                         self.close()
@@ -294,7 +413,7 @@ class Logger(tasking.Tasker):
                         self.status = STOPPED
 
                 else:  #control == ABORT
-                    console.profuse("     Aborting Logger {0} ...\n".format(self.name))
+                    console.profuse("     Aborting Logger {0} ...\n", self.name)
                     self.close()
                     self.desire = ABORT
                     self.status = ABORTED
@@ -302,9 +421,9 @@ class Logger(tasking.Tasker):
                 self.stamp = self.store.stamp
 
         except Exception as ex:
-            console.terse("{0}\n".format(ex))
-            console.terse("     Exception in Logger {0} in {1}\n".format(
-                    self.name, self.store.house.name))
+            console.terse("{0}\n", ex)
+            console.terse("     Exception in Logger {0} in {1}\n",
+                    self.name, self.store.house.name)
             raise
 
         finally:
@@ -323,6 +442,7 @@ class Log(registering.StoriedRegistrar):
     Instance attributes:
        .stamp = time stamp last time logged used by once and update actions
        .kind = text or binary
+       .bufsize = max bytes of binary records buffered before write
        .fileName = file name only
        .path = full dir path name of file
        .file = file where log is written
@@ -335,9 +455,19 @@ class Log(registering.StoriedRegistrar):
                   each format string odict is are format strings keyed by data field
        .lasts = odict of loggee Data instances of last values keyed by tag
                   each Data instance attribute is data field
+       .versions = odict of loggee .changes counts when last checked keyed by tag
+                  so change rule skips field compares of unchanged loggees
+                  that opted in to change tracking with Share.track()
+       .columns = list of format strings of log row values after time stamp
+       .submit = threaded logger callable to submit writes to writer thread
+       .codes = list of struct type codes of binary record columns
+       .packer = struct.Struct of binary record with leading column valid mask
+       .mask = bytes of binary record mask with all columns valid
+       .buffer = bytearray of binary records not yet written
     """
     Counter = 0  # Logs have their own namespace
     Names = {}
+    Blanks = {'d': float('nan'), 'q': 0, '?': False}  # binary missing values
 
     def __init__(self,
                  kind='text',
@@ -345,11 +475,13 @@ class Log(registering.StoriedRegistrar):
                  rule=NEVER,
                  loggees=None,
                  fields=None,
+                 bufsize=65536,
                  **kw):
         """
         Initialize instance.
         Parameters:
             kind = text or binary
+            bufsize = max bytes of binary records buffered before write
             baseFilename = base for log file name, extension added later when path created
             rule = log rule conditions (NEVER, ONCE, ALWAYS, UPDATE, CHANGE)
             loggees = odict of shares to be logged keyed by tags
@@ -365,6 +497,7 @@ class Log(registering.StoriedRegistrar):
         self.first = True  # True means file created for the first time
 
         self.kind = kind
+        self.bufsize = max(0, bufsize)
         if baseFilename:
             self.baseFilename = baseFilename #file name only
         else:
@@ -385,6 +518,13 @@ class Log(registering.StoriedRegistrar):
         self.formats = odict()  # odict of format string odicts keyed by tag
                                 # each entry value is odict of format strings keyed by data field
         self.lasts = odict()  # odict of data instances of last values  keyed by tag
+        self.versions = odict()  # loggee change counts when last checked keyed by tag
+        self.columns = []  # format strings of log row values after time stamp
+        self.submit = None  # threaded logger callable to submit writes if any
+        self.codes = []  # struct type codes of binary record columns
+        self.packer = None  # struct.Struct of binary record
+        self.mask = b''  # binary record mask with all columns valid
+        self.buffer = bytearray()  # binary records not yet written
 
         if loggees:
             for tag, loggee in loggees.items():
@@ -396,7 +536,7 @@ class Log(registering.StoriedRegistrar):
         resolves links to loggees
 
         """
-        console.profuse("     Resolving links for Log {0}\n".format(self.name))
+        console.profuse("     Resolving links for Log {0}\n", self.name)
 
         for tag, loggee in self.loggees.items():
             if not isinstance(loggee, storing.Share):
@@ -410,7 +550,7 @@ class Log(registering.StoriedRegistrar):
         run .action
         """
         self.action(**kw)
-        console.profuse("     Log {0} at {1}\n".format(self.name, self.stamp))
+        console.profuse("     Log {0} at {1}\n", self.name, self.stamp)
 
     def createPath(self, prefix):
         """
@@ -445,14 +585,17 @@ class Log(registering.StoriedRegistrar):
         if os.path.exists(self.path):
             self.first = False
 
-        try:
-            self.file = ocfn(self.path, 'a+')  # append pick up where left off
+        try:  # append pick up where left off
+            if self.kind == 'binary':
+                self.file = ocfn(self.path, 'ab+', binary=True)
+            else:
+                self.file = ocfn(self.path, 'a+')
         except IOError as ex:
-            console.terse("Error: Creating/opening log file '{0}'\n".format(ex))
+            console.terse("Error: Creating/opening log file '{0}'\n", ex)
             self.file = None
             return False
 
-        console.concise("     Created/Opened Log file '{0}'\n".format(self.path))
+        console.concise("     Created/Opened Log file '{0}'\n", self.path)
 
         if keep > 0:
             self.paths = [self.path]
@@ -465,10 +608,10 @@ class Log(registering.StoriedRegistrar):
                 try:  # trial open file to make
                     file = ocfn(path, 'r')  # do not truncate in case reusing
                 except IOError as ex:
-                    console.terse("Error: Creating/opening log rotate file '{0}'\n".format(ex))
+                    console.terse("Error: Creating/opening log rotate file '{0}'\n", ex)
                     return False
                 file.close()
-                console.concise("     Created Log rotate file '{0}'\n".format(path))
+                console.concise("     Created Log rotate file '{0}'\n", path)
 
         return True
 
@@ -486,9 +629,21 @@ class Log(registering.StoriedRegistrar):
         flush self.file if open except stdout
         """
         if self.file and not self.file.closed:
+            self.writeBuffer()
             self.file.flush()
             os.fsync(self.file.fileno())
 
+    def writeBuffer(self):
+        """
+        Write buffered binary records to self.file and clear .buffer
+        """
+        if self.buffer:
+            try:
+                self.file.write(self.buffer)
+            except ValueError as ex: #if self.file already closed then ValueError
+                console.terse("{0}\n", ex)
+            del self.buffer[:]
+
     def cycle(self, size=0):
         """
         Returns True if cycle rotate successful, False otherwise
@@ -501,7 +656,7 @@ class Log(registering.StoriedRegistrar):
                 if size and os.path.getsize(self.path) < size:
                     return False
             except OSError as ex:
-                console.terse("Error: Reading file size '{0}'\n".format(ex))
+                console.terse("Error: Reading file size '{0}'\n", ex)
                 return False
 
             self.close()  # also flushes
@@ -512,7 +667,7 @@ class Log(registering.StoriedRegistrar):
                 try:
                     os.rename(old, new)
                 except OSError as ex:
-                    console.terse("Error: Moving log rotate file '{0}'\n".format(ex))
+                    console.terse("Error: Moving log rotate file '{0}'\n", ex)
                     cycled = False
                     break
 
@@ -521,9 +676,12 @@ class Log(registering.StoriedRegistrar):
                 return False
 
             try:  # truncate main file
-                self.file = ocfn(self.path, 'w+')  # truncate.file
+                if self.kind == 'binary':
+                    self.file = ocfn(self.path, 'wb+', binary=True)
+                else:
+                    self.file = ocfn(self.path, 'w+')  # truncate.file
             except IOError as ex:
-                console.terse("Error: Truncating log file '{0}'\n".format(ex))
+                console.terse("Error: Truncating log file '{0}'\n", ex)
                 self.file = None
                 return False
 
@@ -536,7 +694,6 @@ class Log(registering.StoriedRegistrar):
         """
         Assigns correct log action based on rule
         """
-        #should be different if binary kind
         if rule is not None:
             self.rule = rule
 
@@ -577,14 +734,20 @@ class Log(registering.StoriedRegistrar):
                 cf.write(u"\t{0}".format(tag))
 
         cf.write(u'\n')
-        self.header = cf.getvalue()
+        if self.kind == 'binary':  # third line header with record struct format
+            fmt = self.packer.format  # bytes before python 3.7
+            cf.write(fmt.decode('ascii') if isinstance(fmt, bytes) else ns2u(fmt))
+            cf.write(u'\n')
+            self.header = cf.getvalue().encode('utf-8')
+        else:
+            self.header = cf.getvalue()
         cf.close()
 
     def prepare(self):
         """
         Prepare log formats and values
         """
-        console.profuse("     Preparing formats for Log {0}\n".format(self.name))
+        console.profuse("     Preparing formats for Log {0}\n", self.name)
 
         if self.rule in (DECK, ):
             tag, loggee = self.loggees.items()[0]  # first loggee only
@@ -610,7 +773,6 @@ class Log(registering.StoriedRegistrar):
                 if tag not in self.fields or not self.fields[tag]:  # if fields not given use all fields in loggee
                     self.fields[tag] = [field for field in loggee]
 
-        #should be different if binary kind
         #build formats
         self.formats.clear()
         self.formats['_time'] = '%s'  # '%0.6f'
@@ -639,12 +801,41 @@ class Log(registering.StoriedRegistrar):
                     #self.formats[tag][field] = fmt
 
 
+        if self.rule in (STREAK, DECK):  # first loggee only
+            tag = self.loggees.keys()[0]
+            self.columns = list(self.formats[tag].values()) or ['\t%s']
+        else:
+            self.columns = [fmt for fmts in self.formats.values()[1:]
+                            for fmt in fmts.values()]
+
+        if self.kind == 'binary':  # build binary record schema
+            self.codes = ['d']  # _time
+            if self.rule in (STREAK, DECK):  # no way to know data so default
+                self.codes.extend(['d'] * len(self.columns))
+            else:
+                for tag, fields in self.fields.items():
+                    loggee = self.loggees[tag]
+                    for field in fields:
+                        code = self.code(loggee[field]) if field in loggee else 'd'
+                        if code is None:
+                            raise ValueError("Log {0}: Binary kind field '{1}.{2}'"
+                                             " is not a number.".format(
+                                                 self.name, tag, field))
+                        self.codes.append(code)
+            size = (len(self.codes) + 7) // 8  # one valid bit per column
+            self.packer = struct.Struct("<{0}s{1}".format(size, "".join(self.codes)))
+            self.mask = b'\xff' * size
+            del self.buffer[:]
+
         if self.rule in (CHANGE, ):  # build last copies for if changed
             self.lasts.clear()
             for tag, fields in self.fields.items():  # list of fields by tag
                 loggee = self.loggees[tag]
                 lasts = [(key, loggee[key]) for key in fields if key in loggee]
                 self.lasts[tag] = storing.Data(lasts)  # in both loggee and fields
+            self.versions.clear()
+            for tag, loggee in self.loggees.items():  # None unless opted in
+                self.versions[tag] = loggee.changes
 
         self.buildHeader()
 
@@ -664,43 +855,117 @@ class Log(registering.StoriedRegistrar):
         else:
             return '\t%s'
 
-    def log(self):
+    def code(self, value):
         """
-        log loggees
-        called by conditional actions
+        returns binary struct type code for value type
+        '?' for bool and 'd' for every other real number or None so that a
+        column that starts as int still packs later floats
+        returns None for values such as strings that do not pack
         """
-        self.stamp = self.store.stamp
+        if isinstance(value, bool):
+            return '?'
+        elif value is None or isinstance(value, numbers.Real):
+            return 'd'
+        else:
+            return None
+
+    def record(self, values):
+        """
+        Pack values list of binary record columns onto .buffer
+        Values that are Missing, None or do not pack with their column code
+        are blanked and their column valid bit cleared
+        Writes .buffer once it exceeds .bufsize
+        """
+        try:  # only bool columns pack None or Missing without error
+            if '?' in self.codes and (None in values or Missing in values):
+                raise TypeError("Missing value")
+            self.buffer.extend(self.packer.pack(self.mask, *values))
+        except (struct.error, TypeError, OverflowError):
+            mask = bytearray(len(self.mask))
+            packables = []
+            for i, (code, value) in enumerate(zip(self.codes, values)):
+                try:
+                    if value is None or value is Missing:
+                        raise TypeError("Missing value")
+                    struct.pack('<' + code, value)
+                except (struct.error, TypeError, OverflowError):
+                    value = self.Blanks[code]
+                else:
+                    mask[i >> 3] |= 1 << (i & 7)
+                packables.append(value)
+            self.buffer.extend(self.packer.pack(bytes(mask), *packables))
 
-        #should be different if binary kind
-        cf = io.StringIO() #use string io faster than concatenation
-        try:
-            text = self.formats['_time'] % self.stamp
-        except TypeError:
-            text = '%s' % self.stamp
-        cf.write(ns2u(text))
+        if len(self.buffer) >= self.bufsize:
+            self.writeBuffer()
 
-        for tag, loggee in self.loggees.items():
-            for field, fmt in self.formats[tag].items():
-                if field in loggee:
-                    value = loggee[field]
-                    try:
-                        text = fmt % value
-                    except TypeError:
-                        text = '\t%s' % value
-                    cf.write(ns2u(text))
+    def write(self, rows):
+        """
+        Format rows and write to .file
+        Each row is list of time stamp followed by values in .columns order
+        with Missing for missing values
+        """
+        if self.kind == 'binary':
+            for row in rows:
+                self.record(row)
+            return
+
+        cf = io.StringIO() #use string io faster than concatenation
+        for row in rows:
+            try:
+                text = self.formats['_time'] % (row[0], )
+            except TypeError:
+                text = '%s' % (row[0], )
+            cf.write(ns2u(text))
 
-                else:  # field no longer present in loggee so just tab
+            for fmt, value in zip(self.columns, row[1:]):
+                if value is Missing:  # field not present so just tab
                     cf.write(u'\t')
+                    continue
+                try:
+                    text = fmt % (value, )
+                except TypeError:
+                    text = '\t%s' % (value, )
+                cf.write(ns2u(text))
 
-        cf.write(u'\n')
+            cf.write(u'\n')
 
         try:
             self.file.write(cf.getvalue())
         except ValueError as ex: #if self.file already closed then ValueError
-            console.terse("{0}\n".format(ex))
+            console.terse("{0}\n", ex)
 
         cf.close()
 
+    def emit(self, rows):
+        """
+        Write rows now or when .submit is provided by threaded logger
+        submit them to its writer thread. Non scalar values are converted to
+        text first since they may be mutated before the writer gets to them.
+        """
+        if self.submit is None:
+            self.write(rows)
+            return
+
+        if self.kind != 'binary':
+            for row in rows:
+                for i, value in enumerate(row):
+                    if not (value is Missing or isinstance(value, Scalars)):
+                        row[i] = '%s' % (value, )
+        self.submit(self.write, rows)
+
+    def log(self):
+        """
+        log loggees
+        called by conditional actions
+        """
+        self.stamp = self.store.stamp
+
+        row = [self.stamp]
+        for tag, loggee in self.loggees.items():
+            data = loggee.data.__dict__
+            row.extend([data.get(field, Missing) for field in self.fields[tag]])
+        self.emit([row])
+
     def logStreak(self):
         """
         called by conditional actions
@@ -710,18 +975,13 @@ class Log(registering.StoriedRegistrar):
         """
         self.stamp = self.store.stamp
 
-        #should be different if binary kind
-        cf = io.StringIO() #use string io faster than concatenation
-
         if self.loggees:
             tag, loggee = self.loggees.items()[0] # only works for one loggee
             if loggee: # not empty has at least one field
                 if not self.fields[tag]:  # field was not prepared
                     field = loggee.keys()[0]  # first field
-                    fmt = "\t%s"  # default
                 else:
                     field = self.fields[tag][0]  # first prepared field
-                    fmt = self.formats[tag][field]
 
                 if field in loggee:
                     value = loggee[field]
@@ -737,27 +997,8 @@ class Log(registering.StoriedRegistrar):
                     else: #not mutable sequence or mapping so log normally
                         d.appendleft(value)
 
-                    while d: # not empty
-                        try:
-                            text = self.formats['_time'] % self.stamp
-                        except TypeError:
-                            text = '%s' % self.stamp
-                        cf.write(ns2u(text))
-
-                        element = d.popleft()
-                        try:
-                            text = fmt % (element, )
-                        except TypeError:
-                            text = '\t%s' % element
-                        cf.write(ns2u(text))
-                        cf.write(u'\n')
-
-                    try:
-                        self.file.write(cf.getvalue())
-                    except ValueError as ex: #if self.file already closed then ValueError
-                        console.terse("{0}\n".format(ex))
-
-        cf.close()
+                    if d:
+                        self.emit([[self.stamp, element] for element in d])
 
     def logDeck(self):
         """
@@ -771,42 +1012,20 @@ class Log(registering.StoriedRegistrar):
             fields = self.fields[tag]
 
             if loggee.deck:  # something to log
-                cf = io.StringIO() #use string io faster than concatenation
-
+                rows = []
                 while loggee.deck:  # while not empty deck
                     entry = loggee.pull()  # assumed a dict
                     if not isinstance(entry, Mapping):
                         console.concise("Log {0}: Deck entry of '{1}' = '{2}' not a "
-                                    "mapping.\n".format(self.name, loggee.name, entry))
+                                    "mapping.\n", self.name, loggee.name, entry)
                         continue
 
-                    try:
-                        text = self.formats['_time'] % self.stamp
-                    except TypeError:
-                        text = '%s' % self.stamp
-                    cf.write(ns2u(text))
-
-                    for field in fields:
-                        if field in entry:
-                            fmt = self.formats[tag][field]
-                            value = entry[field]
-                            try:
-                                text = fmt % value
-                            except TypeError:
-                                text = '\t%s' % value
-                            cf.write(ns2u(text))
-
-                        else:  # field not in element
-                            cf.write(u'\t')
+                    row = [self.stamp]
+                    row.extend([entry.get(field, Missing) for field in fields])
+                    rows.append(row)
 
-                    cf.write(u'\n')
-
-                try:
-                    self.file.write(cf.getvalue())
-                except ValueError as ex: #if self.file already closed then ValueError
-                    console.terse("{0}\n".format(ex))
-
-                cf.close()
+                if rows:
+                    self.emit(rows)
 
     def never(self):
         """
@@ -874,6 +1093,10 @@ class Log(registering.StoriedRegistrar):
         for tag, fields in self.fields.items():
             last = self.lasts[tag]  # get last Data object for each loggee
             loggee = self.loggees[tag]  # get loggee for tag
+            if loggee.changes is not None:  # opted in to tracking so skip if unchanged
+                if loggee.changes == self.versions.get(tag):
+                    continue
+                self.versions[tag] = loggee.changes
 
             try:
                 for field in fields:
@@ -889,13 +1112,13 @@ class Log(registering.StoriedRegistrar):
 
             except AttributeError as ex: #
                 console.terse("Warning: Log {0}, missing field"
-                              " '{1}' for last value of loggee {2}\n".format(
-                                  self.name, field, loggee.name))
+                              " '{1}' for last value of loggee {2}\n",
+                                  self.name, field, loggee.name)
 
             except KeyError as ex: #
                 console.terse("Warning: Log {0}, missing field"
-                              " '{1}' for loggee {2}\n".format(
-                                  self.name, field, loggee.name))
+                              " '{1}' for loggee {2}\n",
+                                  self.name, field, loggee.name)
 
         if change:
             self.log()
@@ -913,3 +1136,76 @@ class Log(registering.StoriedRegistrar):
             self.loggees[tag] = loggee
             self.fields[tag] = fields if fields else []  # need tag to preserve order
 
+
+
+def readBinaryLog(path):
+    """
+    Returns tuple (header, names, codes, records) read from binary kind log
+    file at path where
+        header is list of first two header lines, kind rule and file name line
+            and column names line
+        names is list of column names starting with _time
+        codes is list of struct type codes of columns
+        records is list of tuples of column values with None if missing
+    """
+    with open(path, 'rb') as f:
+        header = [f.readline().decode('utf-8'), f.readline().decode('utf-8')]
+        fmt = f.readline().decode('utf-8').strip()
+        body = f.read()
+
+    if header[0].split(u'\t')[0] != u'binary':
+        raise ValueError("Not a binary kind log file '{0}'".format(path))
+
+    packer = struct.Struct(str(fmt))
+    size, sep, codes = fmt.lstrip(u'<').partition(u's')
+    codes = list(codes)
+    names = header[1].rstrip(u'\n').split(u'\t')[:len(codes)]
+
+    records = []
+    for offset in range(0, len(body) - packer.size + 1, packer.size):
+        row = packer.unpack_from(body, offset)
+        mask = bytearray(row[0])
+        records.append(tuple(value if mask[i >> 3] & (1 << (i & 7)) else None
+                             for i, value in enumerate(row[1:])))
+    return (header, names, codes, records)
+
+def binaryLogToText(path, dest=''):
+    """
+    Returns dest path of text kind log file written from binary kind log
+    file at path. Default dest is path with .txt extension.
+    Text is the same as a text kind log with the same loggee values except
+    that numbers are written as floats
+    """
+    header, names, codes, records = readBinaryLog(path)
+    if not dest:
+        dest = "{0}.txt".format(os.path.splitext(path)[0])
+
+    with io.open(dest, 'w', encoding='utf-8') as f:
+        f.write(header[0].replace(u'binary', u'text', 1))
+        f.write(header[1])
+        for record in records:
+            cf = io.StringIO() #use string io faster than concatenation
+            cf.write(ns2u('%s' % (record[0], )))  # missing time was None
+            for value in record[1:]:
+                cf.write(u'\t' if value is None else ns2u('\t%s' % (value, )))
+            cf.write(u'\n')
+            f.write(cf.getvalue())
+            cf.close()
+    return dest
+
+def binaryLogToArray(path):
+    """
+    Returns numpy structured array of records in binary kind log file at path
+    with fields named by column name. Missing values are NaN for float columns
+    otherwise 0 or False.
+    Requires numpy
+    """
+    if numpy is None:
+        raise ImportError("Converting binary log to array requires numpy")
+
+    header, names, codes, records = readBinaryLog(path)
+    dtype = numpy.dtype([(str(name), '<' + code) for name, code in zip(names, codes)])
+    blanks = [Log.Blanks[code] for code in codes]
+    return numpy.array([tuple(blank if value is None else value
+                              for value, blank in zip(record, blanks))
+                        for record in records], dtype=dtype)
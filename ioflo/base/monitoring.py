@@ -24,7 +24,8 @@ class Monitor(tasking.Tasker):
     #Counter = 0
     #Names = {}
 
-    def __init__(self, host = '', port = 23456, dhost = '10.0.2.162', dport = 23456, **kw):
+    def __init__(self, host = '', port = 23456, dhost = '10.0.2.162', dport = 23456,
+                 drain=0, **kw):
         """Initialize instance.
 
            iherited instance attributes
@@ -45,6 +46,7 @@ class Monitor(tasking.Tasker):
            .ha = host port tuple
            .server = non blocking udp socket server object
            .dha = destination address (host, port)
+           .drain = max datagrams received per run, 0 means one receive per run
         """
         super(Monitor,self).__init__(**kw) #status = STOPPED  make runner advance so can send cmd
 
@@ -55,9 +57,10 @@ class Monitor(tasking.Tasker):
         self.host = host
         self.port = port
         self.ha = (self.host, self.port)
-        self.server = PeerUdp(host = self.host,port = self.port, path = '')
+        self.server = PeerUdp(host = self.host,port = self.port)
 
         self.dha = (dhost, dport) #set up destination address
+        self.drain = drain  # max datagrams received per run when nonzero
 
     def reopen(self):
         """Closes if open then opens    """
@@ -78,41 +81,53 @@ class Monitor(tasking.Tasker):
         """generator factory function to create generator to run this monitor
         """
         #do any on creation initialization here
-        console.profuse("     Making Monitor Task Runner {0}\n".format(self.name))
+        console.profuse("     Making Monitor Task Runner {0}\n", self.name)
 
         self.status = STOPPED #operational status of tasker
 
         try:
             while (True):
                 control = (yield (self.status )) #accept control and yield status
-                console.profuse("\n     Iterate Monitor {0} with control = {1} status = {2}\n".format(
+                console.profuse("\n     Iterate Monitor {0} with control = {1} status = {2}\n",
                     self.name,
                     ControlNames.get(control, 'Unknown'),
-                    StatusNames.get(self.status, 'Unknown')))
+                    StatusNames.get(self.status, 'Unknown'))
 
                 self.desire = RUN #default what to do next time, override in frame
 
                 if control == RUN:
                     if self.status == STARTED or self.status == RUNNING:
                         self.status = RUNNING
-                        console.profuse("     Running Monitor {0} ...\n".format(self.name))
-
-                        data, sa = self.server.receive() #result tuple (data, sourceaddress)
-
-                        # server.receive always returns a two element tuple.
-                        #if no data the tuple is ('',None)
-                        if sa:
-                            shost, sport = sa
-                            #self.console.put(shost + ': ' + data + '\n') #put on console
-
-                            self.console.put(shost + ': ' + data) #put on console
+                        console.profuse("     Running Monitor {0} ...\n", self.name)
+
+                        if self.drain:  # drain up to .drain datagrams this run
+                            count = self.drain
+                            while count > 0:
+                                rxes = self.server.receiveMany(count=count)
+                                if not rxes:
+                                    break
+                                for data, sa in rxes:  # data is memoryview
+                                    shost, sport = sa
+                                    self.console.put(shost + ': ' +
+                                            bytes(data).decode('utf-8', 'replace'))
+                                count -= len(rxes)
+                        else:
+                            data, sa = self.server.receive() #result tuple (data, sourceaddress)
+
+                            # server.receive always returns a two element tuple.
+                            #if no data the tuple is ('',None)
+                            if sa:
+                                shost, sport = sa
+                                #self.console.put(shost + ': ' + data + '\n') #put on console
+
+                                self.console.put(shost + ': ' + data) #put on console
 
                         line = self.console.getLine()
 
                         if line:
                             if line[0].lower() == 's':
                                 self.status = STOPPED
-                                console.profuse("     Stopping Monitor {0} ...\n".format(self.name))
+                                console.profuse("     Stopping Monitor {0} ...\n", self.name)
                                 self.close()
                                 self.done = True
                             else:
@@ -121,16 +136,16 @@ class Monitor(tasking.Tasker):
                                 self.console.put(str(result) + '\n')
 
                     else:
-                        console.profuse("     Need to Start Monitor {0}\n".format(self.name))
+                        console.profuse("     Need to Start Monitor {0}\n", self.name)
                         self.desire = START
 
                 elif control == READY:
                     self.status = READIED
-                    console.profuse("     Readying Monitor {0} ...\n".format(self.name))
+                    console.profuse("     Readying Monitor {0} ...\n", self.name)
 
                 elif control == START:
                     self.status = STARTED
-                    console.terse("     Starting Monitor {0} ...\n".format(self.name))
+                    console.terse("     Starting Monitor {0} ...\n", self.name)
 
                     self.reopen()
                     self.done = False
@@ -139,15 +154,15 @@ class Monitor(tasking.Tasker):
                     if self.status == RUNNING or self.status == STARTED:
                         self.status = STOPPED
                         self.desire = STOP
-                        console.terse("     Stopping Monitor {0} ...\n".format(self.name))
+                        console.terse("     Stopping Monitor {0} ...\n", self.name)
                         self.close()
                         self.done = True #only done if complete successfully
                     else:
-                        console.terse("     Monitor {0} not started or running.\n".format(self.name))
+                        console.terse("     Monitor {0} not started or running.\n", self.name)
 
                 elif control == ABORT:
                     self.status = ABORTED
-                    console.profuse("     Aborting Monitor {0} ...\n".format(self.name))
+                    console.profuse("     Aborting Monitor {0} ...\n", self.name)
 
                     self.close()
                     break #break out of while loop. this will cause stopIteration
@@ -155,8 +170,8 @@ class Monitor(tasking.Tasker):
                 else: #control == unknown error condition bad control
                     self.desire = ABORT
                     self.status = ABORTED
-                    console.profuse("     Aborting Monitor {0}, bad control = {1}\n".format(
-                        self.name,  CommandNames[control]))
+                    console.profuse("     Aborting Monitor {0}, bad control = {1}\n",
+                        self.name,  CommandNames[control])
 
                     self.close()
                     break #break out of while loop. this will cause stopIteration
@@ -164,7 +179,7 @@ class Monitor(tasking.Tasker):
                 self.stamp = self.store.stamp
 
         finally:
-            console.profuse("     Exception causing Abort Monitor {0} ...\n".format(self.name))
+            console.profuse("     Exception causing Abort Monitor {0} ...\n", self.name)
             self.desire = ABORT
             self.status = ABORTED
             self.close()
@@ -202,23 +217,23 @@ class MonitorOut(Monitor):
         """generator factory function to create generator to run this monitor
         """
         #do any on creation initialization here
-        console.profuse("     Making Monitor Task Runner {0}\n".format(self.name))
+        console.profuse("     Making Monitor Task Runner {0}\n", self.name)
 
         self.status = STOPPED #operational status of tasker
 
         while (True):
             control = (yield (self.status )) #accept control and yield status
-            console.profuse("Iterate Monitor {0} with control = {1} status = {2}\n".format(
+            console.profuse("Iterate Monitor {0} with control = {1} status = {2}\n",
                 self.name,
                 ControlNames.get(control, 'Unknown'),
-                StatusNames.get(self.status, 'Unknown')))
+                StatusNames.get(self.status, 'Unknown'))
 
             self.desire = RUN #default what to do next time, override in frame
             self.stamp = self.store.stamp
 
             if control == RUN:
                 self.status = RUNNING
-                console.profuse("Running Monitor {0} ...\n".format(self.name))
+                console.profuse("Running Monitor {0} ...\n", self.name)
 
                 #line = self.console.getLine().strip()
                 line = self.console.getLine()
@@ -226,7 +241,7 @@ class MonitorOut(Monitor):
                 if line:
                     if line[0].lower() == 's':
                         self.status = STOPPED
-                        console.profuse("Stopping Monitor {0} ...\n".format(self.name))
+                        console.profuse("Stopping Monitor {0} ...\n", self.name)
 
                         self.server.close()
                         self.console.close() #close file descriptor to console
@@ -238,11 +253,11 @@ class MonitorOut(Monitor):
 
             elif control == READY:
                 self.status = READIED
-                console.profuse("Readying Monitor {0} ...\n".format(self.name))
+                console.profuse("Readying Monitor {0} ...\n", self.name)
 
             elif control == START:
                 self.status = STARTED
-                console.profuse("Starting Monitor {0} ...\n".format(self.name))
+                console.profuse("Starting Monitor {0} ...\n", self.name)
 
                 self.console.open() #reopen file descriptor to console
                 self.server.open() #open socket server
@@ -250,7 +265,7 @@ class MonitorOut(Monitor):
 
             elif control == STOP:
                 self.status = STOPPED
-                console.profuse("Stopping Monitor {0} ...\n".format(self.name))
+                console.profuse("Stopping Monitor {0} ...\n", self.name)
 
                 self.server.close()
                 self.console.close() #close file descriptor to console
@@ -258,7 +273,7 @@ class MonitorOut(Monitor):
 
             elif control == ABORT:
                 self.status = ABORTED
-                console.profuse("Aborting Monitor {0} ...\n".format(self.name))
+                console.profuse("Aborting Monitor {0} ...\n", self.name)
 
                 self.server.close()
                 self.console.close() #close file descriptor to console
@@ -267,8 +282,8 @@ class MonitorOut(Monitor):
 
             else: #control == unknown error condition bad control
                 self.status = ABORTED
-                console.profuse("Aborting Monitor {0}, bad control = {1}\n".format(
-                    self.name,  CommandNames[control]))
+                console.profuse("Aborting Monitor {0}, bad control = {1}\n",
+                    self.name,  CommandNames[control])
 
                 self.server.close()
                 self.console.close() #close file descriptor to console
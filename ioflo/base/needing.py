@@ -5,6 +5,7 @@
 
 import time
 import struct
+import operator
 from collections import deque
 import inspect
 
@@ -25,8 +26,15 @@ console = getConsole()
 
 class Need(acting.Actor):
     """Need Class for conditions  such as entry or trans
+
+    Class Attributes:
+        .Operators = odict of operator functions keyed by ordering comparison
     """
     Registry = odict()
+    Operators = odict([('<', operator.lt),
+                       ('<=', operator.le),
+                       ('>=', operator.ge),
+                       ('>', operator.gt)])
 
     def __init__(self, **kwa):
         """
@@ -78,6 +86,40 @@ class Need(acting.Actor):
 
         return result
 
+    @staticmethod
+    def Compile(comparison, tolerance):
+        """Returns function compare(state, goal) that gives same result as
+           Check(state, comparison, goal, tolerance) but with comparison
+           dispatched once to an operator function and tolerance precomputed
+        """
+        if comparison in Need.Operators:
+            return Need.Operators[comparison]
+
+        if comparison not in ('==', '!='):
+            return lambda state, goal: False
+
+        try:
+            tolerance = abs(tolerance)
+        except TypeError:  # Check falls back to equality every time
+            if comparison == '==':
+                return lambda state, goal: (goal == state)
+            return lambda state, goal: (goal != state)
+
+        if comparison == '==':
+            def compare(state, goal):
+                try: #in case goal is string
+                    return ((goal - tolerance) <= state <= (goal + tolerance))
+                except TypeError:
+                    return (goal == state)
+        else:
+            def compare(state, goal):
+                try: #in case goal is string
+                    return not ((goal - tolerance) <= state <= (goal + tolerance))
+                except TypeError:
+                    return (goal != state)
+
+        return compare
+
     def addTract(self, act):
         """
         Add act to ._tracts list
@@ -92,9 +134,20 @@ class NeedAlways(Need):
     def action(self, **kw):
         """Always return true"""
         result = True
-        console.profuse("Need Always = {0}\n".format(result))
+        console.profuse("Need Always = {0}\n", result)
         return result
 
+    def _compile(self, **kw):
+        """Returns compiled check"""
+        action, profuse = self.action, console.Wordage.profuse
+
+        def check():
+            if console._verbosity >= profuse:
+                return action(**kw)
+            return True
+
+        return check
+
 class NeedDone(Need):
     """
     NeedDone Need Special Need
@@ -121,9 +174,20 @@ class NeedDone(Need):
             tasker
         """
         result = tasker.done
-        console.profuse("Need Tasker {0} done = {1}\n".format(tasker.name, result))
+        console.profuse("Need Tasker {0} done = {1}\n", tasker.name, result)
         return result
 
+    def _compile(self, tasker, **kw):
+        """Returns compiled check"""
+        action, profuse = self.action, console.Wordage.profuse
+
+        def check():
+            if console._verbosity >= profuse:
+                return action(tasker=tasker, **kw)
+            return tasker.done
+
+        return check
+
 class NeedDoneAux(Need):
     """
     NeedDoneAux Need Special Need
@@ -185,13 +249,13 @@ class NeedDoneAux(Need):
             else:
                 result = False
             name = tasker if tasker in ('any', 'all') else tasker.tag
-            console.profuse("Need Aux {0} done = {1} in {2}<{3}\n".format(name,
+            console.profuse("Need Aux {0} done = {1} in {2}<{3}\n", name,
                                                                           result,
                                                                           framer.name,
-                                                                          frame.name))
+                                                                          frame.name)
         else:
             result = tasker.done
-            console.profuse("Need Aux {0} done = {1}\n".format(tasker.name, result))
+            console.profuse("Need Aux {0} done = {1}\n", tasker.name, result)
 
         return result
 
@@ -224,11 +288,22 @@ class NeedStatus(Need):
         # maybe should add check for auxiliary since status never changes for auxiliary
 
         result = (tasker.status == status)
-        console.profuse("Need Tasker {0} status is {1} = {2}\n".format(
-            tasker.name, StatusNames[status], result))
+        console.profuse("Need Tasker {0} status is {1} = {2}\n",
+            tasker.name, StatusNames[status], result)
 
         return result
 
+    def _compile(self, tasker, status, **kw):
+        """Returns compiled check"""
+        action, profuse = self.action, console.Wordage.profuse
+
+        def check():
+            if console._verbosity >= profuse:
+                return action(tasker=tasker, status=status, **kw)
+            return (tasker.status == status)
+
+        return check
+
 
 class NeedState(Need):
     """
@@ -263,7 +338,7 @@ class NeedState(Need):
 
         if stateField not in state:
             console.profuse("     Warning: Non-existent field '{0}' in state {1}"
-                            " ... creating anyway".format(stateField, state.name))
+                            " ... creating anyway", stateField, state.name)
             state[stateField] = 0.0 #create
 
         parms['stateField'] = stateField
@@ -287,11 +362,23 @@ class NeedBoolean(NeedState):
             result = True
         else:
             result = False
-        console.profuse("Need Boolean, if {0}[{1}]: = {2}\n".format(
-            state.name, stateField, result))
+        console.profuse("Need Boolean, if {0}[{1}]: = {2}\n",
+            state.name, stateField, result)
 
         return result
 
+    def _compile(self, state, stateField, **kw):
+        """Returns compiled check"""
+        action, profuse = self.action, console.Wordage.profuse
+        getter = operator.attrgetter(stateField)  # reads Data attribute directly
+
+        def check():
+            if console._verbosity >= profuse:
+                return action(state=state, stateField=stateField, **kw)
+            return True if getter(state._data) else False
+
+        return check
+
 class NeedDirect(NeedState):
     """NeedDirect Need
 
@@ -309,11 +396,26 @@ class NeedDirect(NeedState):
 
         """
         result = self.Check(state[stateField], comparison, goal, tolerance)
-        console.profuse("Need Direct, if {0}[{1}] {2} {3} +- {4}: = {5}\n".format(
-            state.name, stateField, comparison, goal, tolerance, result))
+        console.profuse("Need Direct, if {0}[{1}] {2} {3} +- {4}: = {5}\n",
+            state.name, stateField, comparison, goal, tolerance, result)
 
         return result
 
+    def _compile(self, state, stateField, comparison, goal, tolerance, **kw):
+        """Returns compiled check"""
+        action, profuse = self.action, console.Wordage.profuse
+        getter = operator.attrgetter(stateField)  # reads Data attribute directly
+        compare = self.Compile(comparison, tolerance)
+
+        def check():
+            if console._verbosity >= profuse:
+                return action(state=state, stateField=stateField,
+                              comparison=comparison, goal=goal,
+                              tolerance=tolerance, **kw)
+            return compare(getter(state._data), goal)
+
+        return check
+
 class NeedIndirect(NeedState):
     """NeedIndirect Need
 
@@ -348,7 +450,7 @@ class NeedIndirect(NeedState):
 
         if goalField not in goal:
             console.profuse("     Warning: Non-existent field '{0}' in goal"
-                    " {1} ... creating anyway".format(goalField, goal.name))
+                    " {1} ... creating anyway", goalField, goal.name)
             goal[goalField] = 0.0 #create
 
         parms['goalField'] = goalField
@@ -368,11 +470,27 @@ class NeedIndirect(NeedState):
         """
 
         result = self.Check(state[stateField], comparison, goal[goalField], tolerance)
-        console.profuse("Need Indirect, if {0}[{1}] {2} {3}[{4}] +- %s: = {5}\n".format(
-            state.name, stateField, comparison, goal, goalField, tolerance, result))
+        console.profuse("Need Indirect, if {0}[{1}] {2} {3}[{4}] +- %s: = {5}\n",
+            state.name, stateField, comparison, goal, goalField, tolerance, result)
 
         return result
 
+    def _compile(self, state, stateField, comparison, goal, goalField, tolerance, **kwa):
+        """Returns compiled check"""
+        action, profuse = self.action, console.Wordage.profuse
+        getter = operator.attrgetter(stateField)  # reads Data attribute directly
+        goalGetter = operator.attrgetter(goalField)
+        compare = self.Compile(comparison, tolerance)
+
+        def check():
+            if console._verbosity >= profuse:
+                return action(state=state, stateField=stateField,
+                              comparison=comparison, goal=goal,
+                              goalField=goalField, tolerance=tolerance, **kwa)
+            return compare(getter(state._data), goalGetter(goal._data))
+
+        return check
+
 class NeedMarker(Need):
     """
     NeedMarker is base class for needs that insert markers on resolvelinks
@@ -444,13 +562,13 @@ class NeedMarker(Need):
 
         self.addTract(markerAct)  # sets act.context to 'transit'
         console.profuse("     Added {0} {1} with {2} at {3} in {4} of "
-                        "framer {5}\n".format(
+                        "framer {5}\n",
                                 'tract',
                                 markerAct,
                                 markerAct.parms['share'].name,
                                 markerAct.parms['marker'],
                                 self._act.frame.name,
-                                framer.name))
+                                framer.name)
         markerAct.resolve()
 
         if enacted:  # only add enact marker if original provided frame not empty
@@ -473,13 +591,13 @@ class NeedMarker(Need):
 
                 frame.insertEnact(markerAct)
                 console.profuse("     Added {0} {1} with {2} at {3} in {4} of "
-                                "framer {5}\n".format(
+                                "framer {5}\n",
                                         'enact',
                                         markerAct,
                                         markerAct.parms['share'].name,
                                         markerAct.parms['marker'],
                                         frame.name,
-                                        framer.name))
+                                        framer.name)
                 markerAct.resolve()  # resolves .actor given by actor kind name into actor class
 
         return parms #return items are updated in original ._act parms
@@ -510,19 +628,22 @@ class NeedUpdate(NeedMarker):
                       (share.stamp == mark.stamp and mark.used != mark.stamp))
 
         console.profuse("Marker update {0} for {1} of Share {2} {3} "
-                        " {4} mark {5} used {6} at {7}\n".format(result,
+                        " {4} mark {5} used {6} at {7}\n", result,
                                                      marker,
                                                      share.name,
                                                      share.stamp,
                                                      '>=',
                                                      mark.stamp,
                                                      mark.used,
-                                                     self.store.stamp))
+                                                     self.store.stamp)
 
         return result
 
 class NeedChange(NeedMarker):
-    """NeedChange Need Special Need"""
+    """NeedChange Need Special Need
+       Compares change counts instead of data fields when share opted in to
+       change tracking with Share.track()
+    """
     def action(self, share, marker, **kw):
         """
         Check if share data changed while denoted by marker key if any
@@ -535,7 +656,9 @@ class NeedChange(NeedMarker):
         result = False
         mark = share.marks.get(marker) #get mark from mark frame name key
         if mark:
-            if mark.data is None:
+            if share.changes is not None and mark.version is not None:
+                result = share.changes != mark.version  # tracked so compare counts
+            elif mark.data is None:
                 result = True  # always true first time if mark not yet set
             else:
                 for field, value in share.items():
@@ -550,7 +673,7 @@ class NeedChange(NeedMarker):
                         break
 
 
-        console.profuse("Marker change {0} for {1} of data {2} of share {3} at {4}\n".format(
-            result, marker, mark.data if mark else None, share.name, self.store.stamp))
+        console.profuse("Marker change {0} for {1} of data {2} of share {3} at {4}\n",
+            result, marker, mark.data if mark else None, share.name, self.store.stamp)
 
         return result
@@ -57,7 +57,7 @@ class PokeDirect(Poke):
               data = data to copy from
               destination = share to copy to
         """
-        console.profuse("Put {0} into {1}\n".format( data, destination.name))
+        console.profuse("Put {0} into {1}\n", data, destination.name)
 
         destination.update(data)
 
@@ -100,8 +100,8 @@ class PokeIndirect(Poke):
                 destinationFields = list of fields to copy to
 
         """
-        console.profuse("Copy {0} in {1} into {2} in {3}\n".format(
-            sourceFields, source.name, destinationFields, destination.name))
+        console.profuse("Copy {0} in {1} into {2} in {3}\n",
+            sourceFields, source.name, destinationFields, destination.name)
 
         data = odict()
 
@@ -110,8 +110,8 @@ class PokeIndirect(Poke):
 
         destination.update(data) #updates time stamp as well
 
-        console.profuse("Copied {0} into {1}\n".format(
-                    data, destination.name))
+        console.profuse("Copied {0} into {1}\n",
+                    data, destination.name)
         return None
 
 class IncDirect(Poke):
@@ -150,10 +150,10 @@ class IncDirect(Poke):
                 dstData[field] = destination[field] + data[field]
             destination.update(dstData) #update so time stamp updated, use dict
         except TypeError as ex: #in case value is not a number
-            console.terse("Error in Inc: {0}\n".format(ex))
+            console.terse("Error in Inc: {0}\n", ex)
         else:
-            console.profuse("Inc {0} in {1} by {2} to {3}\n".format(
-                data.keys(), destination.name, data.values(), dstData.values()))
+            console.profuse("Inc {0} in {1} by {2} to {3}\n",
+                data.keys(), destination.name, data.values(), dstData.values())
 
 
 class IncIndirect(Poke):
@@ -194,7 +194,7 @@ class IncIndirect(Poke):
                 data[dstField] = destination[dstField] + source[srcField]
             destination.update(data) #update so time stamp updated, use dict
         except TypeError as ex:
-            console.terse("Error in Inc: {0}\n".format(ex1))
+            console.terse("Error in Inc: {0}\n", ex1)
         else:
-            console.profuse("Inc {0} in {1} from {2} in {3} to {4}\n".format(
-                destinationFields, destination.name, sourceFields, source.name, data.values))
+            console.profuse("Inc {0} in {1} from {2} in {3} to {4}\n",
+                destinationFields, destination.name, sourceFields, source.name, data.values)
@@ -3,17 +3,65 @@
 """
 #print("module {0}".format(__name__))
 
+import os
+import sys
 import random
+import importlib
+import pkgutil
 
 from ..aid.sixing import *
 from ..aid.odicting import odict
 
 from . import excepting
+from . import indexing
 from ..aid.aiding import reverseCamel
 
 from ..aid.consoling import getConsole
 console = getConsole()
 
+# modules whose registered classes are looked up lazily through indexing.Index
+LazyModules = ['ioflo.base.deeding', 'ioflo.base.arbiting', 'ioflo.trim']
+
+
+class LazyRegistry(odict):
+    """ Registry of classes that imports the module of an indexed entry on
+        first lookup so the module's classes register themselves.
+
+        .index = dict of module path strings keyed by entry name
+    """
+    __slots__ = ['index']
+
+    def __init__(self, *pa, **kwa):
+        self.index = {}
+        super(LazyRegistry, self).__init__(*pa, **kwa)
+
+    def __contains__(self, name):
+        return (super(LazyRegistry, self).__contains__(name) or
+                self.load(name))
+
+    def __getitem__(self, name):
+        if not super(LazyRegistry, self).__contains__(name):
+            self.load(name)
+        return super(LazyRegistry, self).__getitem__(name)
+
+    def load(self, name):
+        """ Import the indexed module of entry name if any
+            Return True if name is now registered False otherwise
+        """
+        module = self.index.get(name)
+        if not module:
+            return False
+        console.profuse("Importing '{0}' for registry entry '{1}'\n",
+                        module, name)
+        importlib.import_module(module)  # registers classes as side effect
+        return super(LazyRegistry, self).__contains__(name)
+
+
+def registryKey(cls):
+    """ Return indexing key string for class cls that owns a Registry """
+    return "{0}.{1}".format(cls.__module__, cls.__name__)
+
+
 class RegisterType(type):
     """ Metaclass that registers all subclasses """
     def __init__(cls, name, bases, attrs):
@@ -21,6 +69,9 @@ class RegisterType(type):
         super(RegisterType, cls).__init__(name, bases, attrs)
         if not hasattr(cls, 'Registry'):
             cls.Registry = odict()
+        if 'Registry' in attrs and not isinstance(cls.Registry, LazyRegistry):
+            cls.Registry = LazyRegistry(cls.Registry)
+            cls.Registry.index = indexing.Index.get(registryKey(cls), {})
         cls.__register__(   name,
                             inits=getattr(cls, 'Inits', None),
                             ioinits=getattr(cls, 'Ioinits', None),
@@ -35,7 +86,7 @@ class RegisterType(type):
             msg = "Entry '{0}' already exists in registry of {1}".format(name, cls)
             raise excepting.RegisterError(msg)
         cls.Registry[name] = (cls, inits, ioinits, parms)
-        console.profuse("Registered: '{0}'\n".format(name))
+        console.profuse("Registered: '{0}'\n", name)
         return cls
 
     def __fetch__(cls, name):
@@ -52,6 +103,88 @@ class RegisterType(type):
                 odict(ioinits or odict()),
                 odict(parms or odict()))
 
+def generateIndex(modules=None):
+    """ Return index dict of registry entries of the lazily imported modules
+        as dict of dicts of module path strings keyed by entry name keyed by
+        the registryKey of the class that owns each registry.
+        modules is list of module or package path strings, default LazyModules.
+        Packages are walked for their modules other than tests.
+        Must be run before any of the modules are imported so requires
+        python3.7+ where ioflo packages do not import them eagerly.
+    """
+    from . import acting  # registry owning classes
+    from . import doing
+    from . import poking
+    from . import needing
+    from . import goaling
+    from . import traiting
+    from . import fiating
+    from . import wanting
+    from . import completing
+
+    def registries():
+        """ Generate (key, registry) for each registry owning class """
+        classes = [acting.Actor]
+        while classes:
+            cls = classes.pop(0)
+            if 'Registry' in cls.__dict__:
+                yield (registryKey(cls), cls.Registry)
+            classes.extend(cls.__subclasses__())
+
+    index = odict()
+    seen = dict((key, set(registry.keys())) for key, registry in registries())
+
+    def include(path):
+        """ Import module at path and index its new registry entries """
+        module = importlib.import_module(path)
+        for key, registry in registries():
+            names = seen.setdefault(key, set())
+            for name in registry.keys():
+                if name not in names:
+                    names.add(name)
+                    index.setdefault(key, odict())[name] = path
+        return module
+
+    for path in (modules if modules is not None else LazyModules):
+        if path in sys.modules:
+            msg = "Module '{0}' already imported so cannot be indexed".format(path)
+            raise excepting.RegisterError(msg)
+        package = include(path)
+        if hasattr(package, '__path__'):  # walk package for its modules
+            for loader, name, ispkg in pkgutil.walk_packages(package.__path__,
+                                                             path + '.'):
+                if '.test' not in name:
+                    include(name)
+    return index
+
+
+def writeIndex(path=None, modules=None):
+    """ Generate index of lazily imported registry entries and write it as
+        python module to path, default is indexing module of this package.
+        Should be run in fresh process, i.e.
+        python -c "from ioflo.base import registering; registering.writeIndex()"
+    """
+    index = generateIndex(modules=modules)
+    if path is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'indexing.py')
+    lines = ['"""indexing.py generated index of lazily imported registry entries',
+             '',
+             'Generated by registering.writeIndex() do not edit',
+             '"""',
+             '',
+             'Index = {']
+    for key, entries in index.items():
+        lines.append("    '{0}': {{".format(key))
+        for name, module in entries.items():
+            lines.append("        '{0}': '{1}',".format(name, module))
+        lines.append("    },")
+    lines.append('}')
+    with open(path, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+    return index
+
+
 class Registrar(object):
     """Class that ensures every instance has a unique name
        uses class variable Counter and  Names dictionary
@@ -32,7 +32,8 @@ class Server(tasking.Tasker):
     #Counter = 0
     #Names = {}
 
-    def __init__(self, sha=('', 54321), dha=('localhost', 54321), prefix='./', **kw):
+    def __init__(self, sha=('', 54321), dha=('localhost', 54321), prefix='./',
+                 drain=0, **kw):
         """Initialize instance.
 
            iherited instance attributes
@@ -54,6 +55,7 @@ class Server(tasking.Tasker):
            .path = log directory path
            .logPath = log file path
            .logFile = log file
+           .drain = max datagrams received per run, 0 means one receive per run
 
         """
         super(Server,self).__init__(**kw)
@@ -67,8 +69,9 @@ class Server(tasking.Tasker):
         self.path = '' #log directory path set up when runner calls createPaths
         self.logPath = '' # log file path set up when runner calls createPaths
         self.logFile = None # log file object set up when runner calls createPaths
+        self.drain = drain  # max datagrams received per run when nonzero
 
-    def reinit(self, sha=None, dha=None, prefix=None, **kw):
+    def reinit(self, sha=None, dha=None, prefix=None, drain=None, **kw):
         """Re initializes certain attributes for reuse
 
         """
@@ -86,6 +89,9 @@ class Server(tasking.Tasker):
         if prefix is not None:
             self.prefix = prefix #prefix to log directory for server
 
+        if drain is not None:
+            self.drain = int(drain)
+
     def createPaths(self, prefix = './'):
         """creates log directory path
            creates physical directories on disk
@@ -105,10 +111,10 @@ class Server(tasking.Tasker):
                 os.makedirs(self.path)
 
         except OSError as ex:
-            console.terse("Error: creating server log directory '{0}'\n".format(ex))
+            console.terse("Error: creating server log directory '{0}'\n", ex)
             return False
 
-        console.concise("     Created Server {0} Log Directory = '{1}'\n".format(self.name, self.path))
+        console.concise("     Created Server {0} Log Directory = '{1}'\n", self.name, self.path)
 
         self.logPath = os.path.join(self.path, "{0}.txt".format('log'))
         self.logPath = os.path.abspath(self.logPath) #convert to proper absolute path
@@ -142,11 +148,11 @@ class Server(tasking.Tasker):
             self.logFile = open(self.logPath, 'a+')
 
         except IOError as ex:
-            console.terse("Error: creating server log file '{0}\n".format(ex))
+            console.terse("Error: creating server log file '{0}\n", ex)
             self.logFile = None
             return False
 
-        console.concise("     Created Server Log file {0}\n".format(self.logPath))
+        console.concise("     Created Server Log file {0}\n", self.logPath)
 
         return True
 
@@ -170,16 +176,16 @@ class Server(tasking.Tasker):
         try:
             self.logFile.write("%0.4f\t%s\n" % (float(stamp), msg))
         except TypeError as ex: #if stamp is not a number then type error
-            console.terse("{0}\n".format(ex))
+            console.terse("{0}\n", ex)
         except ValueError as ex: #if self.logFile already closed then ValueError
-            console.terse("{0}\n".format(ex))
+            console.terse("{0}\n", ex)
 
 
     def makeRunner(self):
         """generator factory function to create generator to run this monitor
         """
         #do any on creation initialization here
-        console.profuse("     Making Server Task Runner {0}\n".format(self.name))
+        console.profuse("     Making Server Task Runner {0}\n", self.name)
 
         self.status = STOPPED #operational status of tasker
         self.desire = STOP #default what to do next time, override below
@@ -188,35 +194,45 @@ class Server(tasking.Tasker):
         try: #catch exceptions to close socket before exiting generator
             while (True):
                 control = (yield (self.status )) #accept control and yield status
-                console.profuse("\n     Iterate Server {0} with control = {1} status = {2}\n".format(
+                console.profuse("\n     Iterate Server {0} with control = {1} status = {2}\n",
                     self.name,
                     ControlNames.get(control, 'Unknown'),
-                    StatusNames.get(self.status, 'Unknown')))
+                    StatusNames.get(self.status, 'Unknown'))
 
                 if control == RUN:
                     if self.status == STARTED or self.status == RUNNING:
-                        console.profuse("     Running Server {0} ...\n".format(self.name))
-                        input, sa = self.server.receive() #if no data the tuple is ('',None)
-
-                        if sa:
-                            shost, sport = sa
+                        console.profuse("     Running Server {0} ...\n", self.name)
+                        if self.drain:  # drain up to .drain datagrams this run
+                            count = self.drain
+                            while count > 0:
+                                rxes = self.server.receiveMany(count=count)
+                                if not rxes:
+                                    break
+                                for input, sa in rxes:  # input is memoryview
+                                    shost, sport = sa
+                                count -= len(rxes)
+                        else:
+                            input, sa = self.server.receive() #if no data the tuple is ('',None)
+
+                            if sa:
+                                shost, sport = sa
 
                         output = b''
                         result = self.server.send(output, self.dha)
                         self.status = RUNNING
 
                     else:
-                        console.profuse("     Need to Start Server {0}\n".format(self.name))
+                        console.profuse("     Need to Start Server {0}\n", self.name)
                         self.desire = START
 
                 elif control == READY:
-                    console.profuse("     Readying Server {0} ...\n".format(self.name))
+                    console.profuse("     Readying Server {0} ...\n", self.name)
 
                     self.status = READIED
                     self.desire = START
 
                 elif control == START:
-                    console.terse("     Starting Server {0} ...\n".format(self.name))
+                    console.terse("     Starting Server {0} ...\n", self.name)
 
                     if self.reopen(): #open socket server
                         self.desire = RUN
@@ -229,16 +245,16 @@ class Server(tasking.Tasker):
 
                 elif control == STOP:
                     if self.status == RUNNING or self.status == STARTED:
-                        console.terse("     Stopping Server {0} ...\n".format(self.name))
+                        console.terse("     Stopping Server {0} ...\n", self.name)
                         self.close()
                         self.desire = STOP
                         self.status = STOPPED
                         self.done = True # only done if complete successfully
                     else:
-                        console.terse("     Server {0} not started or running.\n".format(self.name))
+                        console.terse("     Server {0} not started or running.\n", self.name)
 
                 elif control == ABORT:
-                    console.profuse("     Aborting Server {0} ...\n".format(self.name))
+                    console.profuse("     Aborting Server {0} ...\n", self.name)
                     self.close()
                     self.desire = ABORT
                     self.status = ABORTED
@@ -246,8 +262,8 @@ class Server(tasking.Tasker):
                 else: #control == unknown error condition bad control
                     self.desire = ABORT
                     self.status = ABORTED
-                    console.profuse("     Aborting Server {0}, bad control = {1}\n".format(
-                        self.name,  CommandNames[control]))
+                    console.profuse("     Aborting Server {0}, bad control = {1}\n",
+                        self.name,  CommandNames[control])
 
                     self.close()
                     break #break out of while loop. this will cause stopIteration
@@ -255,7 +271,7 @@ class Server(tasking.Tasker):
                 self.stamp = self.store.stamp
 
         finally:
-            console.profuse("     Exception causing Abort Server {0} ...\n".format(self.name))
+            console.profuse("     Exception causing Abort Server {0} ...\n", self.name)
             self.desire = ABORT
             self.status = ABORTED
             self.close()
@@ -9,7 +9,10 @@ if sys.version > '3':
     xrange = range
 import os
 import time
+import heapq
+import multiprocessing
 from collections import deque
+from operator import itemgetter
 
 from ..aid.consoling import getConsole
 console = getConsole()
@@ -24,6 +27,8 @@ from . import registering
 from . import storing
 from . import tasking
 from . import building
+from . import bridging
+from . import doing
 
 from ..__metadata__ import __version__
 
@@ -71,6 +76,20 @@ class Skedder(object):
           addStoppedTask(tasker) adds tasker to stopped list
           addReadyTask(tasker) adds tasker to ready list
 
+          When heaped is True the ready taskers are moved at run time into
+          buckets of taskers with the same retime and a min heap of the bucket
+          retimes so that each iteration only touches the taskers that are
+          due instead of rotating the whole ready deque.
+          Due taskers are run in their ready order so the run order is the
+          same as with the deque.
+
+          When parallel is True and there is more than one house each house is
+          run by its own skedder in a worker process that builds the same plan
+          and keeps only its house. In lockstep the parent skedder paces the
+          iterations of all the workers so they share stamps otherwise each
+          worker runs free at the same period. Bridged shares are exchanged
+          through the parent at iteration boundaries (see bridging.Bridge).
+
        Everytime a tasker runs it yields a status that the skedder uses to determine
        what to do with the tasker
 
@@ -79,6 +98,11 @@ class Skedder(object):
        .period = time seconds between iterations of skedder
        .stamp = current iteration time of skedder
        .real = real time IF True ELSE simulated time
+       .heaped = use retime heap of ready taskers IF True ELSE rotate ready deque
+       .clockLazy = house stores refresh .realtime .datetime on read IF True
+       .clockPeriod = minimum stamp change between house store clock refreshes
+       .parallel = run each house in own worker process IF True
+       .lockstep = parallel workers iterate in lockstep IF True ELSE free run
        .timer = timer to time loops in real time
        .elapsed = timer to time elapsed in mission
 
@@ -101,7 +125,13 @@ class Skedder(object):
                    mode=None,
                    houses=None,
                    metas=None,
-                   preloads=None, ):
+                   preloads=None,
+                   heaped=False,
+                   clockLazy=False,
+                   clockPeriod=0.0,
+                   cache=None,
+                   parallel=False,
+                   lockstep=True, ):
         """
         Initialize Skedder instance.
         parameters:
@@ -120,6 +150,16 @@ class Skedder(object):
                 name = name string of house attribute, path = path string, data = odict
             preloads = list of duples of (path, data) to preload Store where
                path = path string, data = odict
+            heaped = schedule ready taskers with min heap keyed on retime
+            clockLazy = house stores refresh .realtime and .datetime shares
+                only when read instead of every stamp
+            clockPeriod = minimum stamp change between refreshes of house store
+                .realtime and .datetime shares. 0.0 means every stamp
+            cache = directory path of build cache of parsed houses or True for
+                default directory. None or empty means build without cache
+            parallel = run each house in own worker process
+            lockstep = parallel workers iterate in lockstep with parent
+                otherwise each worker runs free
         """
         self.name = name
         self.period = float(abs(period))
@@ -127,6 +167,12 @@ class Skedder(object):
         self.stamp = float(abs(stamp))
         #real time or sim time mode
         self.real = True if real else False
+        self.heaped = True if heaped else False
+        self.clockLazy = True if clockLazy else False
+        self.clockPeriod = float(abs(clockPeriod))
+        self.parallel = True if parallel else False
+        self.lockstep = True if lockstep else False
+        self.retro = retro
         self.timer = timing.MonoTimer(duration = self.period, retro=retro)
         self.elapsed = timing.MonoTimer(retro=retro)
 
@@ -137,6 +183,7 @@ class Skedder(object):
         self.password = password
         self.mode = mode or []
         self.houses = houses or []
+        self.cache = cache
 
         #Meta data format is list of triples of form (name, path, value)
         self.metas = [
@@ -183,13 +230,13 @@ class Skedder(object):
         period = tasker.period
         trp = (tasker, retime, period)
         self.ready.append(trp)
-        console.profuse("     Add ready: {0} retime: {1} period: {2} desire {3}\n".format(
-            tasker.name, retime, period, ControlNames[tasker.desire]))
+        console.profuse("     Add ready: {0} retime: {1} period: {2} desire {3}\n",
+            tasker.name, retime, period, ControlNames[tasker.desire])
 
     def build(self, filepath='', mode=None, metas=None, preloads=None):
         """ Build houses from file given by filepath """
 
-        console.terse("Building Houses for Skedder '{0}' ...\n".format(self.name))
+        console.terse("Building Houses for Skedder '{0}' ...\n", self.name)
         self.built = False
         #use parameter otherwise use inited value
         if filepath:
@@ -205,7 +252,8 @@ class Skedder(object):
                              mode=self.mode,
                              metas = self.metas,
                              preloads =self.preloads,
-                             behaviors=self.behaviors)
+                             behaviors=self.behaviors,
+                             cache=self.cache)
 
         if not b.build():
             return False
@@ -214,12 +262,12 @@ class Skedder(object):
         self.houses = b.houses
 
         for house in self.houses:
-            console.profuse("Meta Data for House '{0}':\n{1}\n".format(
-                house.name, house.metas))
+            console.profuse("Meta Data for House '{0}':\n{1}\n",
+                house.name, house.metas)
 
         return True
 
-    def run(self, growable=False):
+    def run(self, growable=False, bridge=None):
         """runs all generator taskers in running list by calling next() method.
 
            Keyboard interrupt (cntl-c) to end forever loop
@@ -229,12 +277,21 @@ class Skedder(object):
            if growable is True then allow adding new taskers at runtime
               via  house metas['taskables']
 
+           if .parallel and more than one house then runs houses in worker
+              processes via runParallel
+
+           bridge is the Bridge to the parent skedder when run in a worker
+              process otherwise bridged shares are exchanged between .houses
+
         """
+        if self.parallel and bridge is None and len(self.houses) > 1:
+            return self.runParallel()
 
-        console.terse("Starting Skedder '{0}' ...\n".format(self.name))
+        console.terse("Starting Skedder '{0}' ...\n", self.name)
 
         stamp = self.stamp
         for house in self.houses:
+            house.store.reclock(lazy=self.clockLazy, period=self.clockPeriod)
             house.store.changeStamp(stamp)
             ("Initialized store {0}:  stamp = {1} with {2}\n".format(
                 house.store.name,  house.store.stamp, stamp))
@@ -242,11 +299,15 @@ class Skedder(object):
             for tasker in house.taskables:
                 self.addReadyTask(tasker)
 
-        console.profuse("Ready Taskers: {0}\n".format(
-            ', '.join([tasker.name for tasker,r,p in self.ready])))
-        console.profuse("Aborted Taskers: {0}\n".format(
-            ', '.join([tasker.name for tasker,r,p in self.aborted])))
+        console.profuse("Ready Taskers: {0}\n",
+            ', '.join([tasker.name for tasker,r,p in self.ready]))
+        console.profuse("Aborted Taskers: {0}\n",
+            ', '.join([tasker.name for tasker,r,p in self.aborted]))
 
+        bridges = odict()  # bridges between houses keyed by house name
+        if bridge is None and any(house.bridges for house in self.houses):
+            for house in self.houses:
+                bridges[house.name] = bridging.Bridge(house)
 
         self.timer.restart()
         self.elapsed.restart()
@@ -256,14 +317,41 @@ class Skedder(object):
         #stopped = self.stopped
         aborted = self.aborted
 
+        # heap is min heap of retimes of buckets. buckets entries are
+        # retime: list of (order, tasker, period, retime) where order is the
+        # position in ready so due taskers keep ready order
+        heap = []
+        buckets = {}
+        if self.heaped:
+            for order, (tasker, retime, period) in enumerate(ready):
+                if retime not in buckets:
+                    buckets[retime] = []
+                    heap.append(retime)
+                buckets[retime].append((order, tasker, period, retime))
+            ready.clear()
+            heapq.heapify(heap)
+
         try: #so always clean up resources if exception
             while True:
                 try: #CNTL-C generates keyboardInterrupt to break out of while loop
-                    console.profuse("\nRunning Skedder '{0}' at stamp = {1} real elapsed = {2:0.4f}\n".format(
-                        self.name, self.stamp,  self.elapsed.elapsed))
+                    console.profuse("\nRunning Skedder '{0}' at stamp = {1} real elapsed = {2:0.4f}\n",
+                        self.name, self.stamp,  self.elapsed.elapsed)
 
                     more = False #are any taskers RUNNING or STARTED
 
+                    if bridge is not None:  # deliver from parent skedder
+                        if not bridge.receive():
+                            console.terse("Parent stop forcing shutdown of Skedder ...\n")
+                            break
+                    else:
+                        for houseBridge in bridges.values():
+                            houseBridge.deliver()
+
+                    doing.DoerOffload.Commit()  # results of offloaded doers
+
+                    if self.heaped:
+                        more = self.runHeap(heap, buckets, stamp)
+
                     for i in xrange(len(ready)): #attempt to run each ready tasker
                         tasker, retime, period = ready.popleft() #pop it off
 
@@ -276,7 +364,7 @@ class Skedder(object):
                                 status = tasker.runner.send(tasker.desire)
                                 if status == ABORTED: #aborted so abort tasker
                                     aborted.append((tasker, stamp, period))
-                                    console.profuse("     Tasker Self Aborted: {0}\n".format(tasker.name))
+                                    console.profuse("     Tasker Self Aborted: {0}\n", tasker.name)
                                 else:
                                     ready.append((tasker,
                                                   retime + tasker.period,
@@ -284,7 +372,7 @@ class Skedder(object):
 
                             except StopIteration: #generator returned instead of yielded
                                 aborted.append((tasker, stamp, period))
-                                console.profuse("     Tasker Aborted due to StopIteration: {0}\n".format(tasker.name))
+                                console.profuse("     Tasker Aborted due to StopIteration: {0}\n", tasker.name)
 
                         if status == RUNNING or status == STARTED:
                             more = True
@@ -294,7 +382,12 @@ class Skedder(object):
                         # add to ready
                         pass
 
-                    if not ready: #no pending taskers so done
+                    if bridge is not None:  # send to parent skedder
+                        bridge.send(done=(not more or (not ready and not buckets)))
+                    elif bridges:
+                        bridging.exchange(bridges)
+
+                    if not ready and not buckets: #no pending taskers so done
                         console.terse("No ready taskers. Shutting down skedder ...\n")
                         break
 
@@ -304,7 +397,7 @@ class Skedder(object):
 
                     #update time stamps
                     if self.real:
-                        console.profuse("     Time remaining skedder = {0:0.4f}\n".format(self.timer.remaining))
+                        console.profuse("     Time remaining skedder = {0:0.4f}\n", self.timer.remaining)
                         while not self.timer.expired:
                             time.sleep(self.timer.remaining)
                         self.timer.repeat()
@@ -326,7 +419,7 @@ class Skedder(object):
                     console.terse("Surprise exception forcing shutdown of Skedder ...\n")
                     raise
 
-            console.terse("Total elapsed real time = {0:0.4f}\n".format(self.elapsed.elapsed))
+            console.terse("Total elapsed real time = {0:0.4f}\n", self.elapsed.elapsed)
 
         finally: #finally clause always runs regardless of exception or not
             #Abort any running taskers to reclaim resources
@@ -334,25 +427,256 @@ class Skedder(object):
             #if last run tasker exited due to exception then try finally clause in
             #its generator is responsible for releasing resources
 
+            if buckets:  # restore ready order so abort order same as deque
+                entries = sorted((entry for bucket in buckets.values()
+                                  for entry in bucket), key=itemgetter(0))
+                ready.extend((tasker, retime, period)
+                             for order, tasker, period, retime in entries)
+                buckets.clear()
+                del heap[:]
+
             console.terse("Aborting all ready Taskers ...\n")
             for i in xrange(len(ready)): #run each ready tasker once
                 tasker,retime,period = ready.popleft() #pop it off
 
                 try:
                     status = tasker.runner.send(ABORT)
-                    console.terse("Tasker '{0}' aborted\n".format(tasker.name))
+                    console.terse("Tasker '{0}' aborted\n", tasker.name)
                 except StopIteration: #generator returned instead of yielded
-                    console.terse("Tasker '{0}' generator already exited\n".format(tasker.name))
+                    console.terse("Tasker '{0}' generator already exited\n", tasker.name)
 
                 #tasker.runner.close() #kill generator
 
+            doing.DoerOffload.Shutdown()  # wait for offloaded doers
+
         if console._verbosity >= console.Wordage.concise:
             for house in self.houses:
                 #show store hierarchy
-                console.concise( "\nData Store for {0}\n".format(house.name))
+                console.concise( "\nData Store for {0}\n", house.name)
                 house.store.expose(valued=(console._verbosity >= console.Wordage.terse))
 
 
+    def runHeap(self, heap, buckets, stamp):
+        """
+        Run each due tasker in buckets once at time stamp and reschedule it.
+        Returns True if any tasker is RUNNING or STARTED
+
+        heap is min heap list of bucket retimes
+        buckets is dict of retime: list of (order, tasker, period, retime) tuples
+        Only buckets with retime <= stamp are run. Due taskers are run in
+        order so that they run in ready deque order.
+        Aborted taskers are appended to .aborted
+        """
+        aborted = self.aborted
+        more = False  # are any taskers RUNNING or STARTED
+
+        dues = []  # list of due buckets
+        while heap and heap[0] <= stamp:
+            dues.append(buckets.pop(heapq.heappop(heap)))
+
+        if len(dues) == 1:
+            due = dues[0]
+            due.sort(key=itemgetter(0))  # run in ready order
+        else:
+            due = sorted((entry for bucket in dues for entry in bucket),
+                         key=itemgetter(0))
+
+        for order, tasker, period, retime in due:
+            try:
+                status = tasker.runner.send(tasker.desire)
+                if status == ABORTED: #aborted so abort tasker
+                    aborted.append((tasker, stamp, period))
+                    console.profuse("     Tasker Self Aborted: {0}\n", tasker.name)
+                else:
+                    period = tasker.period  # allows for period change
+                    retime += period
+                    if retime not in buckets:
+                        buckets[retime] = []
+                        heapq.heappush(heap, retime)
+                    buckets[retime].append((order, tasker, period, retime))
+
+            except StopIteration: #generator returned instead of yielded
+                aborted.append((tasker, stamp, period))
+                console.profuse("     Tasker Aborted due to StopIteration: {0}\n", tasker.name)
+                status = tasker.status
+
+            if status == RUNNING or status == STARTED:
+                more = True
+
+        if not more:  # not due taskers may still be running
+            for bucket in buckets.values():
+                for order, tasker, period, retime in bucket:
+                    if tasker.status == RUNNING or tasker.status == STARTED:
+                        return True
+
+        return more
+
+    def config(self):
+        """
+        Returns dict of parameters for a worker process skedder to build and
+        run the same plan as this skedder
+        """
+        return dict(name=self.name,
+                    period=self.period,
+                    stamp=self.stamp,
+                    real=self.real,
+                    retro=self.retro,
+                    filepath=self.filepath,
+                    behaviors=self.behaviors,
+                    username=self.username,
+                    password=self.password,
+                    mode=self.mode,
+                    metas=self.metas,
+                    preloads=self.preloads,
+                    heaped=self.heaped,
+                    clockLazy=self.clockLazy,
+                    clockPeriod=self.clockPeriod,
+                    cache=self.cache,
+                    verbosity=console._verbosity)
+
+    def runParallel(self):
+        """
+        Runs each house of .houses in its own worker process and routes the
+        bridged shares between them until all workers are done.
+        In lockstep paces the workers one iteration per period otherwise
+        the workers run free and items are routed as they arrive.
+        Keyboard interrupt (cntl-c) or exception stops all workers
+        The houses of this skedder are not run so their stores are unchanged
+        """
+        console.terse("Starting Skedder '{0}' with {1} parallel {2} houses ...\n",
+                      self.name, len(self.houses),
+                      "lockstep" if self.lockstep else "free running")
+
+        config = self.config()
+        conns = odict()  # parent end of pipe to each worker keyed by house name
+        workers = []
+        for house in self.houses:
+            conn, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=runWorker,
+                                             name="{0}.{1}".format(self.name, house.name),
+                                             args=(child, config, house.name, self.lockstep))
+            worker.daemon = True
+            worker.start()
+            child.close()
+            conns[house.name] = conn
+            workers.append(worker)
+
+        inboxes = odict((name, []) for name in conns)  # items to deliver
+        live = odict(conns)  # connections of workers not yet done
+
+        def route(name, kind, items):
+            """ Route items from worker name into inboxes, drop if done """
+            for house, path, data in items:
+                if house in live:
+                    inboxes[house].append((path, data))
+            if kind == 'done' and name in live:
+                console.terse("Worker for House '{0}' done\n", name)
+                del live[name]
+
+        def deliver(name, conn):
+            """ Send inbox of worker name, drop if worker already exited """
+            try:
+                conn.send(('tick', inboxes[name]))
+            except (IOError, OSError):  # worker exited
+                route(name, 'done', [])
+            inboxes[name] = []
+
+        self.timer.restart()
+        self.elapsed.restart()
+
+        try:
+            while live:
+                try:
+                    if self.lockstep:
+                        for name, conn in list(live.items()):
+                            deliver(name, conn)
+                        for name, conn in list(live.items()):
+                            try:
+                                kind, items = conn.recv()
+                            except EOFError:  # worker exited
+                                kind, items = ('done', [])
+                            route(name, kind, items)
+                        if not live:  # all done so stamp is last iteration
+                            break
+
+                        if self.real:
+                            while not self.timer.expired:
+                                time.sleep(self.timer.remaining)
+                            self.timer.repeat()
+                        self.stamp += self.period
+
+                    else:
+                        for name, conn in list(live.items()):
+                            while name in live and conn.poll():
+                                try:
+                                    kind, items = conn.recv()
+                                except EOFError:  # worker exited
+                                    kind, items = ('done', [])
+                                route(name, kind, items)
+                        for name, conn in list(live.items()):
+                            if inboxes[name]:
+                                deliver(name, conn)
+                        time.sleep(self.period / 2.0)  # route at twice rate
+
+                except KeyboardInterrupt: #CNTL-C shutdown skedder
+                    console.terse("KeyboardInterrupt forcing shutdown of Skedder ...\n")
+                    break
+
+            console.terse("Total elapsed real time = {0:0.4f}\n", self.elapsed.elapsed)
+
+        finally:  # stop any live workers and wait for them to abort their taskers
+            console.terse("Stopping all worker processes ...\n")
+            for name, conn in live.items():
+                try:
+                    conn.send(('stop', []))
+                except (IOError, OSError):  # worker already exited
+                    pass
+            for worker in workers:
+                worker.join(timeout=max(1.0, 10 * self.period))
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+            for conn in conns.values():
+                conn.close()
+
+
+def runWorker(conn, config, name, lockstep=True):
+    """
+    Worker process target of Skedder.runParallel.
+    Builds the plan given by config dict of skedder parameters, keeps only the
+    house named name and runs it bridged to the parent skedder over pipe
+    connection conn. Always sends ('done', []) to parent when finished.
+    In lockstep the parent paces the iterations so the worker is not real time
+    """
+    try:
+        config = dict(config)
+        console.reinit(verbosity=config.pop('verbosity'))
+        metas = config.pop('metas')
+        preloads = config.pop('preloads')
+        mode = config.pop('mode')
+        if lockstep:
+            config['real'] = False  # paced by parent
+        skedder = Skedder(**config)
+        skedder.name = "{0}.{1}".format(skedder.name, name)
+        skedder.metas = list(metas)
+        skedder.preloads = list(preloads)
+        skedder.mode = list(mode)
+        if skedder.build():
+            skedder.houses = [house for house in skedder.houses if house.name == name]
+            if skedder.houses:
+                skedder.run(bridge=bridging.Bridge(skedder.houses[0],
+                                                   conn=conn,
+                                                   lockstep=lockstep))
+    except KeyboardInterrupt:  # parent is stopping too
+        pass
+    finally:
+        try:
+            conn.send(('done', []))
+        except (IOError, OSError):  # parent already closed
+            pass
+        conn.close()
+
+
 def Test(real = False, verbose = False):
     """Module Common self test
 
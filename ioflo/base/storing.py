@@ -8,6 +8,7 @@ import struct
 import re
 import copy
 from collections import deque
+from bisect import bisect_left
 import datetime
 
 from ..aid.sixing import *
@@ -65,15 +66,25 @@ class Store(registering.Registrar):
         .stamp = global time stamp for store
         .house = reference to house owning this store
         .shares = dictionary of shared data store items
+        .index = flat dictionary of nodes and shares in .shares keyed by
+            path name without leading or trailing '.'
+        .paths = sorted list of .index keys for prefix queries or None if stale
         .metaShr = share for meta data
         .realTimeShr = share whose value is realtime time when .stamp is updated
+        .dateTimeShr = share whose fields are realtime datetime when .stamp is updated
         .timeShr = share whose value is copy of stamp when .stamp is updated
+        .clockLazy = True means .realTimeShr and .dateTimeShr are refreshed
+            on first read after .stamp is updated instead of on every update
+        .clockPeriod = minimum change in .stamp between refreshes of
+            .realTimeShr and .dateTimeShr. 0.0 means every .stamp update
+        .clockStamp = .stamp at last refresh of .realTimeShr and .dateTimeShr
 
     """
     Counter = 0
     Names = {}
 
-    def __init__(self, stamp = None, house = None, **kwa):
+    def __init__(self, stamp = None, house = None, clockLazy=False,
+                 clockPeriod=0.0, **kwa):
         """Initialize instance
 
            *pa and **kwa allow multiple inheritance
@@ -89,51 +100,34 @@ class Store(registering.Registrar):
         self.stamp = stamp #must be None or number
         self.house = house
         self.shares = Node().byName('') #dictionary of data store shares indexed by name
+        self.index = dict()  # flat path to node or share of .shares
+        self.paths = None  # sorted .index keys built on demand by .iterPrefix
+        self.clockLazy = True if clockLazy else False
+        self.clockPeriod = float(abs(clockPeriod))
+        self.clockStamp = None
 
         #create node for meta data
         self.metaShr = self.createNode('.meta')
         #create share for stamp
         self.timeShr = self.create('.time').update(value = self.stamp or 0.0)
         #create share for realtime
-        rt = time.time()
-        self.realTimeShr = self.create('.realtime').update(value=rt)
+        self.realTimeShr = self.add(ClockShare(name='realtime'))
         #create share for realtime datetime ascii
-        dt = datetime.datetime.fromtimestamp(rt)
-        self.dateTimeShr = self.create('.datetime').update([("iso", dt.isoformat()),
-                                                            ("dt", dt),
-                                                            ("year", dt.year),
-                                                            ("month", dt.month),
-                                                            ("day", dt.day),
-                                                            ("hour", dt.hour),
-                                                            ("minute", dt.minute),
-                                                            ("second", dt.second),
-                                                            ("micro", dt.microsecond)
-                                                           ])
+        self.dateTimeShr = self.add(ClockShare(name='datetime'))
+        self.refreshClock()
 
     def changeStamp(self, stamp):
         """change time stamp for this store """
         try: #stamp must be a number or None
             self.stamp = float(stamp)
             self.timeShr.update(value=self.stamp)
-            rt = time.time()
-            self.realTimeShr.update(value=rt)
-            dt = datetime.datetime.fromtimestamp(rt)
-            self.dateTimeShr.update([("iso", dt.isoformat()),
-                                        ("dt", dt),
-                                        ("year", dt.year),
-                                        ("month", dt.month),
-                                        ("day", dt.day),
-                                        ("hour", dt.hour),
-                                        ("minute", dt.minute),
-                                        ("second", dt.second),
-                                        ("micro", dt.microsecond)
-                                       ])
-
+            if not self.clockLazy:
+                self.tickClock()
 
         except TypeError:
             self.stamp = None
-            console.verbose("Error: Store {0}, Invalid stamp '{1}'\n".format(
-                    self.name, self.stamp))
+            console.verbose("Error: Store {0}, Invalid stamp '{1}'\n",
+                    self.name, self.stamp)
             raise
 
     def advanceStamp(self, delta):
@@ -141,25 +135,55 @@ class Store(registering.Registrar):
         try:
             self.stamp += delta
             self.timeShr.update(value=self.stamp)
-            rt = time.time()
-            self.realTimeShr.update(value=rt)
-            dt = datetime.datetime.fromtimestamp(rt)
-            self.dateTimeShr.update([("iso", dt.isoformat()),
-                                        ("dt", dt),
-                                        ("year", dt.year),
-                                        ("month", dt.month),
-                                        ("day", dt.day),
-                                        ("hour", dt.hour),
-                                        ("minute", dt.minute),
-                                        ("second", dt.second),
-                                        ("micro", dt.microsecond)
-                                       ])
+            if not self.clockLazy:
+                self.tickClock()
 
         except TypeError:
             console.verbose("Error: Store {0}, Can't advance stamp={1}"
-                            " by delta={2}\n".format(self.name, self.stamp, delta))
+                            " by delta={2}\n", self.name, self.stamp, delta)
             raise
 
+    def reclock(self, lazy=None, period=None):
+        """ Selectively change clock refresh mode for non None arguments
+            lazy True means refresh .realTimeShr and .dateTimeShr on first read
+            period is minimum change in .stamp between refreshes
+        """
+        if lazy is not None:
+            self.clockLazy = True if lazy else False
+        if period is not None:
+            self.clockPeriod = float(abs(period))
+
+    def tickClock(self):
+        """Refresh .realTimeShr and .dateTimeShr if stale
+           Stale when .stamp has changed by at least .clockPeriod since
+           last refresh or has gone backwards.
+           When .clockLazy then refresh at most once per .stamp
+        """
+        stamp = self.stamp
+        clockStamp = self.clockStamp
+        if self.clockLazy and stamp == clockStamp:
+            return
+        if (clockStamp is None or stamp is None or stamp < clockStamp or
+                stamp - clockStamp >= self.clockPeriod):
+            self.refreshClock()
+
+    def refreshClock(self):
+        """Refresh .realTimeShr and .dateTimeShr from real time clock now"""
+        self.clockStamp = self.stamp  # first so lazy reads below do not recurse
+        rt = time.time()
+        self.realTimeShr.update(value=rt)
+        dt = datetime.datetime.fromtimestamp(rt)
+        self.dateTimeShr.update([("iso", dt.isoformat()),
+                                    ("dt", dt),
+                                    ("year", dt.year),
+                                    ("month", dt.month),
+                                    ("day", dt.day),
+                                    ("hour", dt.hour),
+                                    ("minute", dt.minute),
+                                    ("second", dt.second),
+                                    ("micro", dt.microsecond)
+                                   ])
+
     def fetch(self, name):
         """Retrieve from .shares a  node (or special case share)  by its name
            where name is path through hierarchy (may be partial)
@@ -169,9 +193,13 @@ class Store(registering.Registrar):
 
            isinstance(nos, Share)
 
-           since .shares is hierachical dictionary of dictionaries
-           need to traverse the hirearchy
+           looks up name in flat .index and only when not found
+           traverses the hierarchy of .shares
         """
+        nos = self.index.get(name.strip('.'))
+        if nos is not None:
+            return nos
+
         try:
             levels = name.strip('.').split('.')
             nos = self.shares #start at top where nos is node dict or share
@@ -188,18 +216,9 @@ class Store(registering.Registrar):
            return share or if not exist or if not a share (node by same name then
               return None
 
-           since .shares is hierachical dictionary of dictionaries
-           need to traverse the hirearchy
+           looks up name in flat .index
         """
-        try:
-            levels = name.strip('.').split(".")
-            nos = self.shares #start at top where nos =node dict or share
-            for level in levels:
-                nos = nos[level]
-
-        except KeyError:
-            return None
-
+        nos = self.index.get(name.strip('.'))
         if not isinstance(nos, Share):
             return None
 
@@ -210,23 +229,38 @@ class Store(registering.Registrar):
            return node or if not exist or if not a node (share by same name then
               return None
 
-           since .shares is hierachical dictionary of dictionaries
-           need to traverse the hirearchy
+           looks up name in flat .index
         """
-        try:
-            levels = name.strip('.').split(".")
-            nos = self.shares
-            for level in levels:
-                nos = nos[level]
-
-        except KeyError:
-            return None
-
-        if isinstance(nos, Share):
+        nos = self.index.get(name.strip('.'))
+        if nos is None or isinstance(nos, Share):
             return None
 
         return nos # this is a node
 
+    def iterPrefix(self, prefix=''):
+        """Generator of (path, nos) duples in path order of the node or share
+           at path prefix and of all nodes and shares below it in .shares
+           Empty prefix means all.
+           Builds sorted .paths from .index when stale
+
+           Assumes path levels are identifiers so that '.' sorts before any
+           level character
+        """
+        prefix = prefix.strip('.')
+        if self.paths is None:
+            self.paths = sorted(self.index)
+        paths = self.paths
+        if not prefix:
+            lo, hi = 0, len(paths)
+        else:
+            if prefix in self.index:
+                yield (prefix, self.index[prefix])
+            lo = bisect_left(paths, prefix + '.')
+            hi = bisect_left(paths, prefix + '/', lo)  # '/' sorts just after '.'
+        for i in range(lo, hi):
+            path = paths[i]
+            yield (path, self.index[path])
+
 
     def add(self, share):
         """Add share to store and change shares .store to self
@@ -246,14 +280,20 @@ class Store(registering.Registrar):
 
         levels = share.name.strip('.').split('.') #strip leading and following '.' and split
         node = self.shares
-        depth = 0
+        path = ''
         for level in levels[0:-1]: #all but last
             if not level:
                 raise ValueError("Empty level in '%s'" % share.name)
-            depth += 1
-            node = node.setdefault(level, Node().byName('.'.join(levels[:depth]))) #add node if not exist
-            if isinstance(node, Share):
-                raise ValueError("Level  '%s' in '%s' is preexisting share" % (level, share.name))
+            path = "{0}.{1}".format(path, level) if path else level
+            if level in node:
+                node = node[level]
+                if isinstance(node, Share):
+                    raise ValueError("Level  '%s' in '%s' is preexisting share" % (level, share.name))
+            else:  # add node
+                sub = Node().byName(path)
+                node[level] = sub
+                node = self.index[path] = sub
+                self.paths = None
 
         tail = levels[-1]
 
@@ -261,11 +301,13 @@ class Store(registering.Registrar):
             raise ValueError("Tail '%s' of '%s' is preexisting level" % (tail, share.name))
 
         node[tail] = share
+        self.index["{0}.{1}".format(path, tail) if path else tail] = share
+        self.paths = None
         share.changeStore(self)
 
-        console.profuse("{0}Added share {1} to store {2}\n".format(INDENT_ADD,
+        console.profuse("{0}Added share {1} to store {2}\n", INDENT_ADD,
                                                                    share.name,
-                                                                   self.name))
+                                                                   self.name)
 
         return share
 
@@ -281,18 +323,24 @@ class Store(registering.Registrar):
         """
         levels = name.strip('.').split('.') #strip leading and following '.' and split
         node = self.shares
-        depth = 0
+        path = ''
         for level in levels:
             if not level:
                 raise ValueError("Empty level in '%s'" % name)
-            depth += 1
-            node = node.setdefault(level, Node().byName('.'.join(levels[:depth]))) #add node if not exist
-            if isinstance(node, Share):
-                raise ValueError("Level  '%s' in '%s' is preexisting share" % (level, node.name))
-
-        console.profuse("{0}Added node {1} to {2}\n".format(INDENT_ADD,
+            path = "{0}.{1}".format(path, level) if path else level
+            if level in node:
+                node = node[level]
+                if isinstance(node, Share):
+                    raise ValueError("Level  '%s' in '%s' is preexisting share" % (level, node.name))
+            else:  # add node
+                sub = Node().byName(path)
+                node[level] = sub
+                node = self.index[path] = sub
+                self.paths = None
+
+        console.profuse("{0}Added node {1} to {2}\n", INDENT_ADD,
                                                             name,
-                                                            self.name))
+                                                            self.name)
 
         return node
 
@@ -323,6 +371,7 @@ class Store(registering.Registrar):
             raise ValueError("No share with name '%s'" % share.name)
 
         node[tail] = share
+        self.index['.'.join(levels)] = share
 
         share.changeStore(self)
 
@@ -353,7 +402,7 @@ class Store(registering.Registrar):
         """
         If valued then display values for leaf share items
         """
-        console.terse("Store name= {0}, stamp= {1}\n".format(self.name, self.stamp))
+        console.terse("Store name= {0}, stamp= {1}\n", self.name, self.stamp)
         console.terse("Nodes & Shares:\n")
         Store.ShowNode(self.shares, indent = 0, valued=valued)
 
@@ -371,7 +420,7 @@ class Store(registering.Registrar):
                 for i in range(indent):
                     msg += "  "
                 msg += ".{0} ".format(key)
-                console.terse("{0}\n".format(msg))
+                console.terse("{0}\n", msg)
                 Store.ShowNode(value, indent = indent + 1, valued=valued)
         else:  # share leaf
             msg = ""
@@ -384,13 +433,13 @@ class Store(registering.Registrar):
                     msg += "{0}={1} ".format(key, val)
                 if node.deck:
                     msg +=  "\n{0}deck={1}".format(offset, list(node.deck))
-                console.terse("{0}\n".format(msg))
+                console.terse("{0}\n", msg)
             else:
                 for key in node.keys():
                     msg += "{0} ".format(key)
                 if node.deck:
                     msg += "\n{0}deck".format(offset)
-                console.terse("{0}\n".format(msg))
+                console.terse("{0}\n", msg)
 
 
 
@@ -402,9 +451,10 @@ class Mark(object):
 
         stamp = last stamp of associated share
         data = copy of data of associated share
+        version = .changes count of associated share when tracked
 
     """
-    __slots__ = ('stamp', 'data', 'used')
+    __slots__ = ('stamp', 'data', 'used', 'version')
 
 
     def __init__(self, *pa, **kwa):
@@ -414,6 +464,7 @@ class Mark(object):
         self.stamp = None
         self.data = None
         self.used = None
+        self.version = None
 
 
 class Share(object):
@@ -440,6 +491,11 @@ class Share(object):
         .store = data store holding share
         .stamp = time stamp of this share
         .deck = Deck instance for this share
+        .changes = count of data changes when change tracked else None
+            tracking is opt in via .track() and counts writes through share
+            methods and properties that change a field value, add or remove
+            a field. Writes made directly to .data attributes are not counted
+            just as they do not update .stamp
 
         ._owner used by owner property
         ._data used by data property and also by private accessor methods
@@ -491,6 +547,7 @@ class Share(object):
 
         self.stamp = None
         self.deck = Deck()
+        self.changes = None  # data change count when tracked
 
         if not isinstance(name,str): #name must be string
             name = ''
@@ -513,7 +570,7 @@ class Share(object):
                 self.stamp = stamp
             except TypeError:
                 console.terse("Error: Share {0} bad initializer"
-                              " stamp= {1}\n".format(self.name, stamp))
+                              " stamp= {1}\n", self.name, stamp)
 
         if unit is not None:
             self.changUnit(**unit)
@@ -536,6 +593,8 @@ class Share(object):
             delattr(self._data, key)
         except AttributeError:
             raise KeyError("%s object has no key '%s'" % (self.__class__.__name__, key))
+        if self.changes is not None:
+            self.changes += 1
 
     def __getitem__(self, key):
         """    """
@@ -546,6 +605,8 @@ class Share(object):
 
     def __setitem__(self, key, value):
         """          """
+        if self.changes is not None:
+            self._track(((key, value), ))
         try:
             setattr(self._data, key, value)
         except AttributeError:
@@ -569,6 +630,8 @@ class Share(object):
 
     def clear(self):
         """   """
+        if self.changes is not None and self._data.__dict__:
+            self.changes += 1
         self._data.__dict__.clear()
 
     def copy(self):
@@ -590,6 +653,8 @@ class Share(object):
 
     def insert(self, index, key, item):
         """Insert key:item at index."""
+        if self.changes is not None:
+            self._track(((key, item), ))
         self._data.__dict__.insert(index, key, item)
         #don't update stamp here since used by change
 
@@ -622,6 +687,8 @@ class Share(object):
         Remove key and the associated item and return the associated value
         If key not found return default if given otherwise raise KeyError
         """
+        if self.changes is not None and key in self._data.__dict__:
+            self.changes += 1
         value = self._data.__dict__.pop(key, *default)
         return value
 
@@ -630,13 +697,18 @@ class Share(object):
         Remove and return last item (key, value) duple from ._data
         If ._data is empty raise KeyError
         """
-        return (self._data.__dict__.popitem())
+        item = self._data.__dict__.popitem()
+        if self.changes is not None:
+            self.changes += 1
+        return item
 
     def setdefault(self, key, default=None):
         """
         If key in ._data, return value at key
         Otherwise set value at key to default and return default
         """
+        if self.changes is not None and key not in self._data.__dict__:
+            self.changes += 1
         value = self._data.__dict__.setdefault(key, default)
         return value
 
@@ -659,17 +731,7 @@ class Share(object):
         if not isinstance(other, odict):
             raise ValueError('other must be an odict')
 
-        if other is self:
-            #raise ValueError('other cannot be the same odict')
-            pass #updating with self makes no changes
-
-        dict.update(self, other)
-        keys = self._keys
-
-        for key in other:
-            if key in keys:
-                keys.remove(key)
-            keys.append(key)
+        self._data.__dict__.reorder(other)
 
     def changeStore(self, store = None):  # store management
         """Replace .store """
@@ -736,6 +798,8 @@ class Share(object):
     @value.setter
     def value(self, value):  # value property
         """Set value property """
+        if self.changes is not None:
+            self._track((('value', value), ))
         setattr(self._data, 'value', value)
         try:
             self.stamp = self.store.stamp
@@ -753,6 +817,8 @@ class Share(object):
         if not isinstance(data, Data):
             raise ValueError("Not Data object %s" % data)
         self._data = data
+        if self.changes is not None:
+            self.changes += 1
         try:
             self.stamp = self.store.stamp
         except AttributeError as ex:
@@ -770,10 +836,49 @@ class Share(object):
             self.stamp = None
         return self.stamp
 
+    def track(self):
+        """Opt in to change tracking so .changes counts data changes
+           Returns self to enable method chaining
+        """
+        if self.changes is None:
+            self.changes = 0
+        return self
+
+    def _track(self, items):
+        """Increment .changes once if any (field, value) duple in items would
+           change value of or add field in data
+        """
+        fields = self._data.__dict__
+        for field, value in items:
+            if field not in fields:
+                self.changes += 1
+                return
+            unequal = fields[field] != value
+            try:
+                unequal = bool(unequal)
+            except ValueError:  # array values such as columnar share fields
+                unequal = unequal.any()
+            if unequal:
+                self.changes += 1
+                return
+
     def change(self, *pa, **kwa):
         """Change data fields without affecting stamp.
            Create if not already exist.
         """
+        if self.changes is not None:  # count change before fields are set
+            items = []
+            for a in pa:
+                if (isinstance(a, dict) or
+                        (hasattr(a, "get") and hasattr(a, "items"))):
+                    items.extend(a.items())
+                else:
+                    items.extend(a)
+            items.extend(kwa.items())
+            self._track(items)
+            pa = (items, )
+            kwa = {}
+
         for a in pa:
             if (isinstance(a, dict) or
                     (hasattr(a, "get") and hasattr(a, "items"))): #positional arg is dictionary
@@ -821,6 +926,8 @@ class Share(object):
                 update = True
 
         if update:
+            if self.changes is not None:
+                self.changes += 1
             try:
                 self.stamp = self.store.stamp
             except AttributeError as ex:
@@ -897,6 +1004,40 @@ class Share(object):
         result = ("{0}{1}\n".format(result, " ".join(entries)))
         return result
 
+class ClockShare(Share):
+    """
+    Share for the real time clock shares of a store such as .realtime and
+    .datetime. When the store's .clockLazy is True reading the share data or
+    stamp first refreshes the clock shares if they are stale.
+    So clock shares that are never read cost nothing per store stamp update.
+    """
+    @property
+    def _data(self):
+        """Get ._data refreshing store clock first if lazy"""
+        store = self.store
+        if store is not None and store.clockLazy:
+            store.tickClock()
+        return self._clockData
+
+    @_data.setter
+    def _data(self, data):
+        """Set ._data"""
+        self._clockData = data
+
+    @property
+    def stamp(self):
+        """Get stamp refreshing store clock first if lazy"""
+        store = self.store
+        if store is not None and store.clockLazy:
+            store.tickClock()
+        return self._stamp
+
+    @stamp.setter
+    def stamp(self, stamp):
+        """Set stamp"""
+        self._stamp = stamp
+
+
 class Data(object):
     """
     Data class
@@ -905,7 +1046,12 @@ class Data(object):
 
     Attempting to set an attribute that is not a python public identifier raises
     AttributeError
+
+    Class attribute ._Fields caches per Data class the field names already
+    validated as public identifiers that do not shadow class attributes so
+    that repeat writes to those fields skip the validation.
     """
+    _Fields = {}  # sets of validated field names keyed by class
 
     def __new__(cls, *pa, **kwa):
         """Set up at instance creation """
@@ -959,16 +1105,34 @@ class Data(object):
            definition since methods use descriptors and will already exist by
            virtue of the class definition when the instance of Data or subclass
            is created.
+
+           Public field names not in the class are validated once per class
+           and cached in ._Fields so later writes go straight to .__dict__
         """
-        try: #see if super class already has attribute so don't shadow
-            super(Data,self).__getattribute__(key)
-        except AttributeError: #super doesn't have it so put in dictionary
-            if (key in self.__dict__) or REO_IdentPub.match(key): #don't do check if already there
-                self.__dict__.__setitem__(key,value)
-            else:
-                raise AttributeError("Invalid attribute name '%s'" % key)
-        else: #pass on to superclass
-            super(Data,self).__setattr__(key,value)
+        try:
+            fields = Data._Fields[self.__class__]
+        except KeyError:
+            fields = Data._Fields.setdefault(self.__class__, set())
+
+        if key not in fields:
+            if not REO_IdentPub.match(key) or hasattr(self.__class__, key):
+                try: #see if super class already has attribute so don't shadow
+                    super(Data,self).__getattribute__(key)
+                except AttributeError: #super doesn't have it so put in dictionary
+                    if (key in self.__dict__) or REO_IdentPub.match(key): #don't do check if already there
+                        self.__dict__.__setitem__(key,value)
+                    else:
+                        raise AttributeError("Invalid attribute name '%s'" % key)
+                else: #pass on to superclass
+                    super(Data,self).__setattr__(key,value)
+                return
+            fields.add(key)
+
+        d = self.__dict__
+        if key in d:  # existing field so order unchanged
+            dict.__setitem__(d, key, value)
+        else:
+            d[key] = value
 
     def __repr__(self):
         """
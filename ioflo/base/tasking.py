@@ -70,6 +70,23 @@ class Tasker(registering.StoriedRegistrar):
         self.runner = None #reference to runner generator
         self.remake() #make generator assign to .runner and advance to yield
 
+    def __getstate__(self):
+        """Returns state for pickling as duple of (dict, slots) without
+           unpicklable .runner generator
+           slots holds .name and .store since Registrars keep them in __slots__
+        """
+        state = self.__dict__.copy()
+        state['runner'] = None
+        return (state, dict(name=self.name, store=self.store))
+
+    def __setstate__(self, state):
+        """Restores pickled state and remakes .runner generator"""
+        state, slots = state
+        self.__dict__.update(state)
+        for key, value in slots.items():
+            setattr(self, key, value)
+        self.remake()
+
     def reinit(self, period=None, schedule=None, **kw):
         if period is not None:
             self.period = period
@@ -138,7 +155,7 @@ class Tasker(registering.StoriedRegistrar):
            Should be overridden in sub class
         """
         #do any on creation initialization here
-        console.profuse("     Making Task Runner {0}\n".format(self.name))
+        console.profuse("     Making Task Runner {0}\n", self.name)
 
         self.status = STOPPED #operational status of tasker
         self.desire = STOP #default what to do next time, override below
@@ -149,41 +166,41 @@ class Tasker(registering.StoriedRegistrar):
         try:
             while (True):
                 control = (yield (self.status)) #accept control and yield status
-                console.profuse("\n     Iterate Tasker {0} with control = {1} status = {2}\n".format(
+                console.profuse("\n     Iterate Tasker {0} with control = {1} status = {2}\n",
                     self.name,
                     ControlNames.get(control, 'Unknown'),
-                    StatusNames.get(self.status, 'Unknown')))
+                    StatusNames.get(self.status, 'Unknown'))
 
                 if control == RUN:
                     if self.status == STARTED or self.status == RUNNING:
-                        console.profuse("     Running Tasker {0} ...\n".format(self.name))
+                        console.profuse("     Running Tasker {0} ...\n", self.name)
                         self.status = RUNNING
                     else:
-                        console.profuse("     Need to Start Tasker {0}\n".format(self.name))
+                        console.profuse("     Need to Start Tasker {0}\n", self.name)
                         self.desire = START
 
                 elif control == READY:
-                    console.profuse("     Readying Tasker {0} ...\n".format(self.name))
+                    console.profuse("     Readying Tasker {0} ...\n", self.name)
                     self.desire = START
                     self.status = READIED
 
                 elif control == START:
-                    console.terse("     Starting Tasker {0} ...\n".format(self.name))
+                    console.terse("     Starting Tasker {0} ...\n", self.name)
                     self.desire = RUN
                     self.status = STARTED
                     self.done = False
 
                 elif control == STOP:
                     if self.status == RUNNING or self.status == STARTED:
-                        console.terse("     Stopping Tasker {0} ...\n".format(self.name))
+                        console.terse("     Stopping Tasker {0} ...\n", self.name)
                         self.desire = STOP
                         self.status = STOPPED
                         self.done = True
                     else:
-                        console.terse("     Tasker {0} not started or running.\n".format(self.name))
+                        console.terse("     Tasker {0} not started or running.\n", self.name)
 
                 elif control == ABORT:
-                    console.profuse("     Aborting Tasker {0} ...\n".format(self.name))
+                    console.profuse("     Aborting Tasker {0} ...\n", self.name)
                     self.desire = ABORT
                     self.status = ABORTED
                     self.done = True #only done if complete successfully
@@ -191,14 +208,14 @@ class Tasker(registering.StoriedRegistrar):
                 else: #control == unknown error condition bad control
                     self.desire = ABORT
                     self.status = ABORTED
-                    console.profuse("     Aborting Tasker {0}, bad control = {1}\n".format(
-                        self.name,  CommandNames[control]))
+                    console.profuse("     Aborting Tasker {0}, bad control = {1}\n",
+                        self.name,  CommandNames[control])
                     break #break out of while loop. this will cause stopIteration
 
                 self.stamp = self.store.stamp
 
         finally: #in case uncaught exception
-            console.profuse("     Exception causing Abort Tasker {0} ...\n".format(self.name))
+            console.profuse("     Exception causing Abort Tasker {0} ...\n", self.name)
             self.desire = ABORT
             self.status = ABORTED
 
@@ -227,8 +244,8 @@ def resolveTasker(tasker, who='', desc='tasker', contexts=None, human='', count=
                                          who,
                                          human,
                                          count)
-        console.concise("         Resolved {0} Tasker '{1}' in '{2}'\n"
-                      "".format(desc, tasker.name, who))
+        console.concise("         Resolved {0} Tasker '{1}' in '{2}'\n",
+                      desc, tasker.name, who)
     return tasker
 
 ResolveTasker = resolveTasker
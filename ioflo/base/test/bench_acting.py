@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks Frame.recur of doify recur acts called through Act and Actor
+__call__ kwargs unpacking versus flattened fast dispatch of prebound parms.
+
+example:
+
+python -m ioflo.base.test.bench_acting -a 1000 -n 1000
+
+"""
+import sys
+import time
+import argparse
+
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import housing
+from ioflo.base import framing
+from ioflo.base import acting
+from ioflo.base import doing
+
+
+@doing.doify("BenchDoer")
+def benchDoer(self, x=1, y=2, **kwa):
+    """
+    Minimal deed with parms
+    """
+    return x + y
+
+
+def bench(acts, number, flatten=True):
+    """
+    Returns seconds to recur frame with acts recur acts number times
+    with Act.Flatten set to flatten
+    """
+    housing.House.Clear()
+    housing.ClearRegistries()
+    house = housing.House(name="bench")
+    house.assignRegistries()
+    framer = framing.Framer(name="bench", store=house.store)
+    framer.assignFrameRegistry()
+    frame = framing.Frame(name="bench", store=house.store, framer=framer)
+    framer.first = frame
+    house.taskers.append(framer)
+    house.framers.append(framer)
+    house.mids.append(framer)
+    house.orderTaskables()
+
+    for i in range(acts):
+        act = acting.Act(actor="BenchDoer",
+                         registrar=doing.Doer,
+                         parms=dict(x=i, y=2))
+        frame.addByContext(act, RECUR)
+
+    acting.Act.Flatten = flatten
+    try:
+        house.resolve()
+    finally:
+        acting.Act.Flatten = True
+
+    start = time.time()
+    for i in range(number):
+        frame.recur()
+    return time.time() - start
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark act dispatch.")
+    p.add_argument('-a', '--acts', type=int, default=1000,
+                   help="Number of recur acts.")
+    p.add_argument('-n', '--number', type=int, default=1000,
+                   help="Number of recurs.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.mute)
+
+    results = {}
+    for flatten in (False, True):
+        results[flatten] = elapsed = bench(args.acts, args.number, flatten=flatten)
+        print("{0:9s} acts={1} per act={2:0.3f}us"
+              "".format("flattened" if flatten else "unpacked", args.acts,
+                        1e6 * elapsed / (args.acts * args.number)))
+    print("speedup = {0:0.2f}x".format(results[False] / results[True]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks per tick console logging cost of a generated 500 frame FloScript
+at terse verbosity with lazy console messages versus eagerly formatted ones.
+
+The eager case replaces the console verbosity methods on the default console
+with versions that always format the message before checking the verbosity
+which is how console messages built with str.format behaved.
+
+example:
+
+python -m ioflo.base.test.bench_consoling -f 50 -n 10 -d 50.0
+
+"""
+import sys
+import os
+import time
+import tempfile
+import argparse
+
+from ioflo.aid.consoling import getConsole, Console
+console = getConsole()
+
+from ioflo.base import housing
+from ioflo.base import skedding
+
+
+def makeFlo(framers=50, frames=10, duration=50.0):
+    """
+    Returns FloScript string with framers times frames frames that cycle
+    through their frames and a stopper framer that stops after duration
+    """
+    lines = ["house bench", ""]
+    for i in range(framers):
+        lines.append("framer cycler{0} be active first f0".format(i))
+        for j in range(frames):
+            lines.append("   frame f{0}".format(j))
+            lines.append("      inc .cycler{0}.count with 1".format(i))
+            lines.append("      go f{0} if elapsed >= 0.25".format((j + 1) % frames))
+        lines.append("")
+    lines.append("framer stopper be active first wait")
+    lines.append("   frame wait")
+    lines.append("      go abort if elapsed >= {0}".format(duration))
+    lines.append("   frame abort")
+    lines.append("      bid stop all")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def eagerize(console):
+    """
+    Replace verbosity methods of console instance with eagerly formatting ones
+    """
+    def make(level):
+        def write(msg, *args, **kwa):
+            if args or kwa:
+                msg = msg.format(*args, **kwa)
+            console.write(msg, verbosity=level)
+        return write
+
+    for name in ('terse', 'concise', 'verbose', 'profuse'):
+        setattr(console, name, make(getattr(Console.Wordage, name)))
+
+
+def uneagerize(console):
+    """
+    Remove eagerly formatting verbosity methods from console instance
+    """
+    for name in ('terse', 'concise', 'verbose', 'profuse'):
+        console.__dict__.pop(name, None)
+
+
+def bench(filepath, period=0.125):
+    """
+    Returns tuple (elapsed, ticks) of running FloScript at filepath
+    """
+    housing.House.Clear()
+    housing.ClearRegistries()
+    skedder = skedding.Skedder(name="bench", period=period, filepath=filepath)
+    if not skedder.build():
+        raise ValueError("Failed building {0}".format(filepath))
+    start = time.time()
+    skedder.run()
+    elapsed = time.time() - start
+    ticks = int(round(skedder.stamp / period)) + 1
+    return (elapsed, ticks)
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark lazy console logging.")
+    p.add_argument('-f', '--framers', type=int, default=50,
+                   help="Number of framers.")
+    p.add_argument('-n', '--frames', type=int, default=10,
+                   help="Number of frames per framer.")
+    p.add_argument('-d', '--duration', type=float, default=50.0,
+                   help="Simulated run duration in seconds.")
+    args = p.parse_args()
+
+    fd, filepath = tempfile.mkstemp(suffix='.flo')
+    with os.fdopen(fd, 'w') as f:
+        f.write(makeFlo(args.framers, args.frames, args.duration))
+
+    devnull = open(os.devnull, 'w')
+    stdout = sys.stdout
+    console.reinit(verbosity=console.Wordage.terse)
+    results = {}
+    try:
+        for eager in (True, False):
+            sys.stdout = devnull  # terse console and prints go to devnull
+            console._file = devnull
+            if eager:
+                eagerize(console)
+            try:
+                results[eager] = bench(filepath)
+            finally:
+                uneagerize(console)
+                sys.stdout = stdout
+                console._file = stdout
+    finally:
+        os.remove(filepath)
+        devnull.close()
+
+    frames = args.framers * args.frames
+    for eager in (True, False):
+        elapsed, ticks = results[eager]
+        print("{0:5s} frames={1} ticks={2} elapsed={3:0.3f}s per tick={4:0.3f}ms"
+              "".format("eager" if eager else "lazy", frames, ticks, elapsed,
+                        1000.0 * elapsed / ticks))
+    saved = (results[True][0] / results[True][1] - results[False][0] / results[False][1])
+    print("savings per tick = {0:0.3f}ms".format(1000.0 * saved))
+
+
+if __name__ == "__main__":
+    main()
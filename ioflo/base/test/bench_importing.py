@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks import time of ioflo packages in fresh interpreters with behaviors
+imported lazily on first registry lookup versus eagerly importing every
+indexed behavior module as ioflo used to on import
+
+example:
+
+python -m ioflo.base.test.bench_importing -n 10
+
+"""
+import os
+import sys
+import subprocess
+import argparse
+
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+                                        os.path.abspath(__file__)))))
+
+TIMED = """
+import sys, time, importlib
+start = time.time()
+for name in {0!r}:
+    importlib.import_module(name)
+{1}
+print(time.time() - start)
+"""
+
+EAGER = """
+from ioflo.base import indexing
+for entries in indexing.Index.values():
+    for module in set(entries.values()):
+        importlib.import_module(module)
+"""
+
+CASES = [("ioflo.aid", ["ioflo.aid"], ""),
+         ("ioflo.aio", ["ioflo.aio"], ""),
+         ("ioflo.base", ["ioflo.base"], ""),
+         ("building", ["ioflo.base.building"], ""),
+         ("building eager", ["ioflo.base.building"], EAGER), ]
+
+
+def timeImport(names, extra, env):
+    """
+    Returns seconds to import module names and run extra in fresh interpreter
+    """
+    source = TIMED.format(names, extra)
+    output = subprocess.check_output([sys.executable, "-c", source], env=env)
+    return float(output.decode("utf-8").strip())
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark ioflo import time.")
+    p.add_argument('-n', '--number', type=int, default=10,
+                   help="Number of fresh interpreters per case.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.terse)
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ROOT, env.get('PYTHONPATH', '')])
+    for label, names, extra in CASES:
+        times = [timeImport(names, extra, env) for i in range(args.number)]
+        print("{0:15s} min={1:0.2f}ms mean={2:0.2f}ms"
+              "".format(label, 1e3 * min(times), 1e3 * sum(times) / len(times)))
+
+
+if __name__ == "__main__":
+    main()
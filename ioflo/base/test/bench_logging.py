@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks Log always rule logging of one loggee with many float fields
+with text kind versus buffered binary kind. Reports time per log call and
+resulting file size.
+
+example:
+
+python -m ioflo.base.test.bench_logging -f 200 -n 1000
+
+"""
+import sys
+import os
+import time
+import shutil
+import tempfile
+import argparse
+
+from ioflo.aid.odicting import odict
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import storing
+from ioflo.base import logging
+
+
+def bench(kind, fields, number, prefix):
+    """
+    Returns tuple (elapsed, size) of seconds to log number records with
+    fields float fields and resulting file size in bytes
+    """
+    logging.Log.Clear()
+    store = storing.Store(stamp=0.0)
+    share = store.create(".bench.telemetry").update(odict(("f{0}".format(i), i * 0.1)
+                                                          for i in range(fields)))
+    log = logging.Log(name=kind, store=store, kind=kind, rule=ALWAYS)
+    log.addLoggee(tag='telemetry', loggee=share)
+    log.reopen(prefix=prefix)
+    log.prepare()
+
+    elapsed = 0.0
+    for i in range(number):
+        store.advanceStamp(0.01)
+        share.update(f0=i * 0.01, f1=i * 0.02)
+        start = time.time()
+        log()
+        elapsed += time.time() - start
+    start = time.time()
+    log.close()  # flush buffered records
+    elapsed += time.time() - start
+
+    return (elapsed, os.path.getsize(log.path))
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark text versus binary logs.")
+    p.add_argument('-f', '--fields', type=int, default=200,
+                   help="Number of loggee fields.")
+    p.add_argument('-n', '--number', type=int, default=1000,
+                   help="Number of log records.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.terse)
+
+    prefix = tempfile.mkdtemp(prefix="ioflo_bench_logging")
+    try:
+        for kind in ('text', 'binary'):
+            elapsed, size = bench(kind, args.fields, args.number, prefix)
+            print("{0:6s} fields={1} per log={2:0.3f}us file={3}KB"
+                  "".format(kind, args.fields, 1e6 * elapsed / args.number,
+                            size // 1024))
+    finally:
+        shutil.rmtree(prefix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks precur transition evaluation with need acts called through
+Act and Actor versus compiled need checks.
+
+Builds a FloScript of many framers each with an active frame holding many
+transitions whose needs are never satisfied so every need is evaluated every
+tick. Mixes direct, tolerance, indirect, boolean, and negated needs.
+
+example:
+
+python -m ioflo.base.test.bench_needing -f 1000 -t 20 -n 100
+
+"""
+import sys
+import os
+import time
+import shutil
+import tempfile
+import argparse
+
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import building
+
+# transition need templates, none are satisfied by the initial share values
+NEEDS = ["go done if .bench.s{0} >= 1000.0",
+         "go done if .bench.s{0} == 7.0 +- 0.5",
+         "go done if .bench.s{0} < -1.0",
+         "go done if .bench.s{0} > .bench.g{0}",
+         "go done if .bench.f{0}",
+         "go done if not .bench.s{0} <= 1000.0", ]
+
+
+def flo(framers, transitions):
+    """
+    Returns FloScript text for framers each with transitions
+    """
+    lines = ["house bench", ""]
+    for i in range(framers):
+        lines.append("init .bench.s{0} to value 0.0".format(i))
+        lines.append("init .bench.g{0} to value 1.0".format(i))
+        lines.append("init .bench.f{0} to value False".format(i))
+    lines.append("")
+    for i in range(framers):
+        lines.append("framer f{0} be active first run".format(i))
+        lines.append("   frame run")
+        for j in range(transitions):
+            lines.append("      {0}".format(NEEDS[j % len(NEEDS)].format(i)))
+        lines.append("   frame done")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def bench(house, number, compiled=True):
+    """
+    Returns seconds to precur the first frame of every framer in house
+    number times with compiled need checks or with need acts
+    """
+    frames = []
+    for framer in house.framers:
+        for act in framer.first.preacts:
+            if compiled:
+                act.actor._checks = [need.compile() for need in act.parms['needs']]
+            else:
+                act.actor._checks = None
+        frames.append(framer.first)
+
+    start = time.time()
+    for i in range(number):
+        for frame in frames:
+            frame.precur()
+    return time.time() - start
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark transition need evaluation.")
+    p.add_argument('-f', '--framers', type=int, default=1000,
+                   help="Number of framers.")
+    p.add_argument('-t', '--transitions', type=int, default=20,
+                   help="Number of transitions per framer.")
+    p.add_argument('-n', '--number', type=int, default=100,
+                   help="Number of ticks.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.mute)
+
+    dirpath = tempfile.mkdtemp(prefix="ioflo_bench_needing")
+    try:
+        path = os.path.join(dirpath, "bench.flo")
+        with open(path, "w") as f:
+            f.write(flo(args.framers, args.transitions))
+        builder = building.Builder()
+        if not builder.build(fileName=path):
+            raise ValueError("Failed building {0}".format(path))
+        house = builder.houses[0]
+        house.store.changeStamp(0.0)
+
+        results = {}
+        for compiled in (False, True):
+            results[compiled] = elapsed = bench(house, args.number, compiled=compiled)
+            print("{0:8s} framers={1} transitions={2} per tick={3:0.3f}ms"
+                  "".format("compiled" if compiled else "acts", args.framers,
+                            args.transitions, 1000.0 * elapsed / args.number))
+        print("speedup = {0:0.2f}x".format(results[False] / results[True]))
+    finally:
+        shutil.rmtree(dirpath)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks Skedder.run with ready deque versus heaped ready taskers
+
+Runs 10k taskers of mixed periods in simulated time for an idle mix where
+most taskers are not due each tick and a busy mix where most taskers are due
+
+example:
+
+python -m ioflo.base.test.bench_skedding -t 10000 -d 30.0
+
+"""
+import sys
+import time
+import argparse
+
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import housing
+from ioflo.base import tasking
+from ioflo.base import skedding
+
+# mixes of tasker periods, busy has a third of taskers run every tick
+MIXES = dict(idle=[0.125, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 30.0, 30.0, 30.0],
+             busy=[0.125, 0.125, 0.25, 1.0, 5.0, 30.0])
+
+
+class Worker(tasking.Tasker):
+    """
+    Minimal tasker that runs until store stamp reaches .duration
+    """
+    def __init__(self, duration=30.0, **kw):
+        self.duration = duration
+        self.count = 0
+        super(Worker, self).__init__(**kw)
+
+    def makeRunner(self):
+        self.status = STOPPED
+        self.desire = STOP
+        while True:
+            control = (yield (self.status))
+            if control == ABORT:
+                self.status = ABORTED
+                continue
+            self.count += 1
+            if self.store.stamp >= self.duration:
+                self.status = STOPPED
+                self.desire = STOP
+            else:
+                self.status = RUNNING
+                self.desire = RUN
+
+
+def bench(taskers=10000, duration=30.0, period=0.125, heaped=False, mix='idle'):
+    """
+    Returns tuple (elapsed, runs, ticks) from skedder run of taskers
+    with periods from MIXES[mix]
+    """
+    periods = MIXES[mix]
+    housing.House.Clear()
+    housing.ClearRegistries()
+    house = housing.House(name="bench")
+    for i in range(taskers):
+        house.taskables.append(Worker(name="w{0}".format(i),
+                                      store=house.store,
+                                      period=periods[i % len(periods)],
+                                      duration=duration,
+                                      schedule=ACTIVE))
+
+    skedder = skedding.Skedder(period=period, houses=[house], heaped=heaped)
+    start = time.time()
+    skedder.run()
+    elapsed = time.time() - start
+    runs = sum(tasker.count for tasker in house.taskables)
+    ticks = int(round(skedder.stamp / period)) + 1
+    return (elapsed, runs, ticks)
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark Skedder scheduling.")
+    p.add_argument('-t', '--taskers', type=int, default=10000,
+                   help="Number of taskers.")
+    p.add_argument('-d', '--duration', type=float, default=30.0,
+                   help="Simulated run duration in seconds.")
+    p.add_argument('-m', '--mixes', nargs='*', default=['idle', 'busy'],
+                   choices=sorted(MIXES.keys()),
+                   help="Tasker period mixes.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.mute)
+
+    for mix in args.mixes:
+        results = {}
+        for heaped in (False, True):
+            elapsed, runs, ticks = bench(taskers=args.taskers,
+                                         duration=args.duration,
+                                         heaped=heaped,
+                                         mix=mix)
+            results[heaped] = elapsed
+            print("{0:4s} {1:6s} taskers={2} ticks={3} runs={4} elapsed={5:0.3f}s "
+                  "per tick={6:0.3f}ms".format(mix,
+                                              "heaped" if heaped else "deque",
+                                              args.taskers,
+                                              ticks,
+                                              runs,
+                                              elapsed,
+                                              1000.0 * elapsed / ticks))
+        print("{0:4s} speedup = {1:0.2f}x".format(mix, results[False] / results[True]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks Data field writes through PokeDirect, IncDirect and Share.update
+with the cached field name fast path versus the previous validate every write
+Data.__setattr__
+
+example:
+
+python -m ioflo.base.test.bench_storing -n 100000
+
+"""
+import sys
+import time
+import timeit
+import argparse
+
+from ioflo.aid.odicting import odict
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import REO_IdentPub
+from ioflo.base import storing
+from ioflo.base import poking
+
+
+def legacySetattr(self, key, value):
+    """
+    Data.__setattr__ that validates every write
+    """
+    try:
+        super(storing.Data, self).__getattribute__(key)
+    except AttributeError:
+        if (key in self.__dict__) or REO_IdentPub.match(key):
+            self.__dict__.__setitem__(key, value)
+        else:
+            raise AttributeError("Invalid attribute name '%s'" % key)
+    else:
+        super(storing.Data, self).__setattr__(key, value)
+
+
+def makeCases():
+    """
+    Returns list of (name, callable) benchmark cases
+    """
+    storing.Store.Clear()
+    store = storing.Store(stamp=0.0)
+    share = store.create(".bench.pose").update(odict([("north", 0.0),
+                                                       ("east", 0.0),
+                                                       ("down", 0.0),
+                                                       ("heading", 0.0)]))
+    value = store.create(".bench.value").update(value=0.0)
+    poke = poking.PokeDirect(name="poke", store=store)
+    inc = poking.IncDirect(name="inc", store=store)
+    data = odict([("north", 1.0), ("east", 2.0), ("down", 3.0), ("heading", 4.0)])
+    deltas = odict([("north", 0.5), ("east", 0.5)])
+
+    def pokeDirect():
+        poke.action(data=data, destination=share)
+
+    def incDirect():
+        inc.action(destination=share, data=deltas)
+
+    def shareUpdate():
+        share.update(north=1.0, east=2.0, down=3.0, heading=4.0)
+
+    def shareValue():
+        value.value = 1.0
+
+    return [("PokeDirect", pokeDirect),
+            ("IncDirect", incDirect),
+            ("Share.update", shareUpdate),
+            ("Share.value", shareValue)]
+
+
+def main():
+    """ Run benchmark """
+    p = argparse.ArgumentParser(description="Benchmark Data field writes.")
+    p.add_argument('-n', '--number', type=int, default=100000,
+                   help="Number of calls per case.")
+    args = p.parse_args()
+
+    console.reinit(verbosity=console.Wordage.terse)
+
+    cached = storing.Data.__setattr__
+    results = {}
+    for legacy in (True, False):
+        storing.Data.__setattr__ = legacySetattr if legacy else cached
+        try:
+            for name, case in makeCases():
+                elapsed = min(timeit.repeat(case, number=args.number, repeat=3))
+                results[(name, legacy)] = elapsed
+        finally:
+            storing.Data.__setattr__ = cached
+
+    for name, case in makeCases():
+        legacy = results[(name, True)]
+        fast = results[(name, False)]
+        print("{0:13s} legacy={1:0.3f}us cached={2:0.3f}us speedup={3:0.2f}x"
+              "".format(name,
+                        1e6 * legacy / args.number,
+                        1e6 * fast / args.number,
+                        legacy / fast))
+
+
+if __name__ == "__main__":
+    main()
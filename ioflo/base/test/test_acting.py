@@ -10,15 +10,18 @@ else:
     import unittest
 
 import os
+import threading
 
 from ioflo.test import testing
 from ioflo.aid.consoling import getConsole
 console = getConsole()
 
 
+from ioflo.base.globaling import *
 from ioflo.base import acting
 from ioflo.base import doing
 from ioflo.base import storing
+from ioflo.base import framing
 
 
 def setUpModule():
@@ -172,6 +175,208 @@ class BasicTestCase(testing.FrameIofloTestCase):
         self.assertIsInstance(share, storing.Share )
         self.assertEqual(share.value, "Felgercarb")
 
+    def testFrameDoerFlatten(self):
+        """
+        Test resolved acts dispatch directly to action with prebound parms
+        """
+        console.terse("{0}\n".format(self.testFrameDoerFlatten.__doc__))
+        @doing.doify("FlatDoer")
+        def action(self, a="Felgercarb", **kwa):
+            """
+            Doer action method
+            """
+            self.store.create(".test.a").update(value=a)
+            return a
+
+        class CallDoer(doing.Doer):
+            """
+            Doer that overrides __call__
+            """
+            def __call__(self, **kwa):
+                self.store.create(".test.c").update(value=kwa['c'])
+                return self.action(**kwa)
+
+        act = self.addDoer("FlatDoer", parms=dict(a="Hello"))
+        callAct = self.addDoer("CallDoer", parms=dict(c="World"))
+        self.assertIs(act.dispatch, None)
+
+        self.resolve()  # resolve House
+        self.assertIsNot(act.dispatch, None)
+        if sys.version > '3':
+            self.assertIs(act.dispatch.func.__func__, action)
+        self.assertEqual(act.dispatch.keywords, dict(a="Hello"))
+        self.assertIs(callAct.dispatch.func, callAct.actor)  # override kept
+        self.assertIs(act.compile(), act.dispatch)
+
+        self.assertEqual(act(), "Hello")
+        self.frame.recur()  # run reacts in frame
+        self.assertEqual(self.store.fetch(".test.a").value, "Hello")
+        self.assertEqual(self.store.fetch(".test.c").value, "World")
+
+        acting.Act.Flatten = False
+        try:
+            unflat = acting.Act(actor="FlatDoer",
+                                registrar=doing.Doer,
+                                parms=dict(a="Bye"))
+            self.frame.addByContext(unflat, RECUR)
+            unflat.resolve()
+            self.assertIs(unflat.dispatch, None)
+            self.assertEqual(unflat(), "Bye")
+        finally:
+            acting.Act.Flatten = True
+
+    @unittest.skipIf(doing.futures is None, "requires concurrent.futures")
+    def testDoerOffload(self):
+        """
+        Test offloaded Doer runs action in pool and commits results
+        """
+        console.terse("{0}\n".format(self.testDoerOffload.__doc__))
+        gate = threading.Event()
+        threads = []
+
+        @doing.doify("SlowDoer", offload=True, ioinits=dict(source=".test.source"))
+        def slow(self, **kwa):
+            """
+            Doer action method that blocks until gate is set
+            """
+            threads.append(threading.current_thread())
+            gate.wait(5.0)
+            if self.source.value is None:
+                raise ValueError("No source")
+            return dict(total=2 * self.source.value)
+
+        self.assertTrue(issubclass(doing.Doer.Registry["SlowDoer"][0],
+                                   doing.DoerOffload))
+        self.assertEqual(list(doing.Doer.Registry["SlowDoer"][0].Ioinits.keys()),
+                         ['output', 'status', 'source'])
+        self.store.create(".test.source").update(value=3)
+        act = self.addDoer("SlowDoer")
+        self.resolve()
+        doer = act.actor
+        output = doer._output
+        status = doer._status
+        self.assertEqual((status['pending'], status['done'], status['error']),
+                         (False, 0, ''))
+
+        try:
+            self.frame.recur()  # submits
+            future = doer.future
+            self.assertIsNot(future, None)
+            self.assertTrue(status['pending'])
+            self.frame.recur()  # still pending so not submitted again
+            self.assertIs(doer.future, future)
+            self.store.fetch(".test.source").update(value=10)  # after submit
+            queued = threading.Event()
+            future.add_done_callback(lambda f: queued.set())  # runs after ._done
+            gate.set()
+            self.assertTrue(queued.wait(5.0))
+            self.assertTrue(doer in doing.DoerOffload.Dones)
+            self.assertIsNot(threads[0], threading.current_thread())
+            self.assertEqual(len(threads), 1)
+            self.assertFalse('total' in output)  # not committed until boundary
+            doing.DoerOffload.Commit()
+            self.assertIs(doer.future, None)
+            self.assertEqual(output['total'], 6)  # source snapshot at submit
+            self.assertEqual(doer.source.value, 10)
+            self.assertFalse(status['pending'])
+            self.assertEqual(status['done'], 1)
+            self.assertEqual(status['error'], '')
+
+            self.store.fetch(".test.source").update(value=None)
+            self.frame.recur()
+            queued = threading.Event()
+            doer.future.add_done_callback(lambda f: queued.set())
+            self.assertTrue(queued.wait(5.0))
+            doing.DoerOffload.Commit()
+            self.assertEqual(status['error'], "No source")
+            self.assertEqual(status['done'], 1)
+            self.assertEqual(output['total'], 6)
+        finally:
+            gate.set()
+            doing.DoerOffload.Shutdown()
+        self.assertIs(doing.DoerOffload.Pool, None)
+
+    def testTransiterPlan(self):
+        """
+        Test Transiter uses transition plans precomputed at resolve
+        """
+        console.terse("{0}\n".format(self.testTransiterPlan.__doc__))
+
+        near = framing.Frame(name="NearTest", store=self.store, framer=self.framer)
+        far = framing.Frame(name="FarTest", store=self.store, framer=self.framer)
+        near.attach(self.frame)
+        far.attach(self.frame)
+        act = acting.Act(actor='Transiter',
+                         registrar=acting.Actor,
+                         parms=dict(needs=[], near='me', far="FarTest",
+                                    human="go FarTest"))
+        near.addPreact(act)
+        self.resolve()
+
+        plan = self.framer.plans[(near, far)]
+        self.assertEqual(plan.exits, (near, ))
+        self.assertEqual(plan.enters, (far, ))
+        self.assertEqual(plan.reexens, (self.frame, ))
+        self.assertEqual(plan.exitsUp, (near, ))
+        self.assertEqual(plan.rexitsUp, (self.frame, ))
+        self.assertEqual(plan, framing.Framer.ExEnPlan(near.outline, far))
+
+        self.store.changeStamp(0.0)
+        self.framer.enterAll()
+        self.assertEqual(self.framer.actives, [self.frame, near])
+        self.assertIs(self.framer.plan(far), plan)
+        self.assertTrue(self.framer.actives[-1].precur())
+        self.assertEqual(self.framer.actives, [self.frame, far])
+
+        self.assertNotIn((far, near), self.framer.plans)
+        plan = self.framer.plan(near)  # computed and cached on demand
+        self.assertEqual(plan.exits, (far, ))
+        self.assertEqual(plan.enters, (near, ))
+        self.assertIs(self.framer.plans[(far, near)], plan)
+
+    def testRearRazeReuse(self):
+        """
+        Test razed reared clones are retired into pool and reused when reared
+        """
+        console.terse("{0}\n".format(self.testRearRazeReuse.__doc__))
+
+        moot = framing.Framer(name="MootTest", store=self.store, schedule=MOOT)
+        moot.assignFrameRegistry()
+        framing.Frame(name="MootFrame", store=self.store, framer=moot.name)
+        moot.first = "MootFrame"
+        self.framer.assignFrameRegistry()
+        self.resolve()
+
+        clone = self.framer.rear(moot, self.frame)
+        self.assertIs(clone.origin, moot)
+        self.assertTrue(clone.resolved)
+        self.assertEqual(clone.name, "FramerTest_MootTest1")
+        self.assertIn(clone, self.frame.auxes)
+        self.assertIs(self.framer.auxes[clone.tag], clone)
+        self.assertIs(clone.main, self.frame)
+
+        self.framer.raze(clone, self.frame)
+        self.assertEqual(self.framer.pool[moot], [clone])
+        self.assertNotIn(clone, self.frame.auxes)
+        self.assertNotIn(clone.tag, self.framer.auxes)
+        self.assertNotIn(clone.name, framing.Framer.Names)
+
+        reused = self.framer.rear(moot, self.frame)
+        self.assertIs(reused, clone)
+        self.assertEqual(self.framer.pool[moot], [])
+        self.assertIn(clone, self.frame.auxes)
+        self.assertIs(framing.Framer.Names[clone.name], clone)
+
+        framing.Framer.Reuse = False
+        try:
+            self.framer.raze(clone, self.frame)
+            self.assertEqual(self.framer.pool[moot], [])
+            other = self.framer.rear(moot, self.frame)
+            self.assertIsNot(other, clone)
+            self.assertEqual(other.name, clone.name)
+        finally:
+            framing.Framer.Reuse = True
+
 
 def runOne(test):
     '''
@@ -186,7 +391,11 @@ def runSome():
     tests =  []
     names = ['testActify',
              'testDoify',
-             'testFrameDoer', ]
+             'testFrameDoer',
+             'testFrameDoerFlatten',
+             'testDoerOffload',
+             'testTransiterPlan',
+             'testRearRazeReuse', ]
     tests.extend(map(BasicTestCase, names))
     suite = unittest.TestSuite(tests)
     unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for building module
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import os
+import shutil
+import tempfile
+
+from ioflo.aid.sixing import *
+from ioflo.test import testing
+from ioflo.aid import getConsole, odict
+
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import housing
+from ioflo.base import framing
+from ioflo.base import building
+
+
+MAIN = """
+house cached
+
+  init counter to 0.0
+
+  framer mission be active first start
+    frame start
+      inc counter with 1.0
+      go next if counter >= 2.0
+
+    frame done
+      load {0}
+"""
+
+LOADED = """
+      bid stop all
+"""
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+class BasicTestCase(unittest.TestCase):
+    """
+    Test Case
+    """
+
+    def setUp(self):
+        """
+        Make temporary directory with FloScript files and cache directory
+        """
+        console.reinit(verbosity=console.Wordage.concise)
+        self.base = tempfile.mkdtemp(prefix="ioflo_build_")
+        self.cache = os.path.join(self.base, "cache")
+        self.loadPath = os.path.join(self.base, "loaded.flo")
+        with open(self.loadPath, "w") as f:
+            f.write(LOADED)
+        self.mainPath = os.path.join(self.base, "main.flo")
+        with open(self.mainPath, "w") as f:
+            f.write(MAIN.format("loaded.flo"))
+        self.metas = [("name", "meta.name", odict(value="Tester")),
+                      ("credentials", "meta.credentials",
+                       odict([('username', "Testee"), ('password', "Secret")])),]
+
+    def tearDown(self):
+        """
+        Remove temporary directory
+        """
+        shutil.rmtree(self.base, ignore_errors=True)
+        housing.House.Clear()
+        housing.ClearRegistries()
+        console.reinit(verbosity=console.Wordage.concise)
+
+    def build(self, cache=None):
+        """
+        Returns resolved Builder for .mainPath
+        """
+        builder = building.Builder(fileName=self.mainPath,
+                                   metas=list(self.metas),
+                                   cache=cache)
+        self.assertTrue(builder.build())
+        return builder
+
+    def testBuildCache(self):
+        """
+        Test build cache of parsed houses
+        """
+        console.terse("{0}\n".format(self.testBuildCache.__doc__))
+
+        builder = self.build()  # no cache
+        self.assertEqual(builder.cache, '')
+        self.assertFalse(os.path.exists(self.cache))
+
+        builder = self.build(cache=self.cache)  # parses and saves cache
+        self.assertEqual(builder.loaded, [self.mainPath, self.loadPath])
+        path = builder.cachePath()
+        self.assertTrue(os.path.exists(path))
+        with open(path, 'rb') as f:
+            self.assertNotIn(b"Secret", f.read())  # credentials not cached
+        house = builder.houses[0]
+        self.assertEqual(house.metas['credentials']['password'], "Secret")
+
+        self.assertTrue(builder.loadCache())  # cached is loadable
+        cached = builder.houses[0]
+        self.assertIsNot(cached, house)
+        self.assertFalse(cached.framers[0].resolved)
+        self.assertIsNot(cached.framers[0].runner, None)
+
+        builder = self.build(cache=self.cache)  # loads from cache
+        house = builder.houses[0]
+        self.assertIs(housing.House.Names[house.name], house)
+        self.assertEqual(house.metas['credentials']['password'], "Secret")
+        self.assertEqual(house.store.fetch('counter').value, 0.0)
+        framer = house.framers[0]
+        self.assertTrue(framer.resolved)
+        self.assertIsInstance(framer.first, framing.Frame)
+        self.assertEqual(framer.first.name, "start")
+
+        with open(self.loadPath, "a") as f:  # change loaded file so stale
+            f.write("\n")
+        builder = building.Builder(fileName=self.mainPath,
+                                   metas=list(self.metas),
+                                   cache=self.cache)
+        builder.fileName = os.path.abspath(builder.fileName)
+        self.assertFalse(builder.loadCache())
+
+        builder = building.Builder(fileName=self.mainPath,
+                                   metas=list(self.metas),
+                                   mode=["other"],
+                                   cache=self.cache)
+        builder.fileName = os.path.abspath(builder.fileName)
+        self.assertNotEqual(builder.cachePath(), path)  # mode is part of key
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = ['testBuildCache', ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testBuildCache')
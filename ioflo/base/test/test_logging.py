@@ -560,36 +560,50 @@ class LoggerTestCase(testing.LoggerIofloTestCase):
         self.assertEqual(log.rule, globaling.CHANGE)
         self.assertEqual(log.action, log.change)
 
-        heading = self.store.create('pose.heading').create(value = 0.0)
+        heading = self.store.create('pose.heading').create(value = 0.0).track()
+        course = self.store.create('pose.course').create(value = 0.0)
         log.addLoggee(tag = 'heading', loggee = 'pose.heading')
+        log.addLoggee(tag = 'course', loggee = 'pose.course')
         self.logger.addLog(log)
         self.logger.resolve()  # resolves logs as well
 
         self.house.store.changeStamp(0.0)
         self.assertIs(log.stamp, None)
         status = self.logger.runner.send(globaling.START)  # reopens prepares and logs once
-        self.assertEqual(log.formats, odict([('_time', '%s'), ('heading', odict([('value', '\t%s')]))]))
+        self.assertEqual(log.formats, odict([('_time', '%s'),
+                                             ('heading', odict([('value', '\t%s')])),
+                                             ('course', odict([('value', '\t%s')]))]))
         self.assertTrue('heading' in log.lasts)
+        self.assertEqual(heading.changes, 0)  # opted in
+        self.assertEqual(log.versions['heading'], 0)
+        self.assertIs(course.changes, None)  # prepare does not track
+        self.assertIs(log.versions['course'], None)
 
         self.store.advanceStamp(0.125)
         status = self.logger.runner.send(globaling.RUN)  # no log since not updated
         self.store.advanceStamp(0.125)
         self.assertEqual(self.store.stamp, 0.25)
         heading.value += 0.0  # updated but same value
+        self.assertEqual(heading.changes, 0)
         status = self.logger.runner.send(globaling.RUN)  # no log since updated but not changed
         self.store.advanceStamp(0.125)
-        status = self.logger.runner.send(globaling.RUN)  # no log since not updated
+        course.data.value = 3.0  # direct data write not counted
+        status = self.logger.runner.send(globaling.RUN)  # logs since fields compared
         self.store.advanceStamp(0.125)
         self.assertEqual(self.store.stamp, 0.5)
         heading.value += 5.0  # update with different value
+        self.assertEqual(heading.changes, 1)
         status = self.logger.runner.send(globaling.RUN)  # logs since changed
+        self.assertEqual(log.versions['heading'], 1)
         self.store.advanceStamp(0.125)
         status = self.logger.runner.send(globaling.STOP)  # not log since not updated
 
         log.reopen()
         log.file.seek(0)  # reopen appends so seek back to start
         lines = log.file.readlines()
-        self.assertEqual(lines, ['text\tChange\ttest\n', '_time\theading\n', '0.0\t0.0\n', '0.5\t5.0\n'])
+        self.assertEqual(lines, ['text\tChange\ttest\n', '_time\theading\tcourse\n',
+                                 '0.0\t0.0\t0.0\n', '0.375\t0.0\t3.0\n',
+                                 '0.5\t5.0\t3.0\n'])
         log.file.close()
 
         try:
@@ -926,6 +940,306 @@ class LoggerTestCase(testing.LoggerIofloTestCase):
         except OSError as ex:
             pass
 
+    def testLogBinary(self):
+        """
+        Test binary kind log converts to same text as text kind log
+        """
+        console.terse("{0}\n".format(self.testLogBinary.__doc__))
+
+        heading = self.store.create('pose.heading').create(value = 0.0)
+        position = self.store.create('pose.position').create([("north", 10.0),
+                                                              ("east", 5.0)])
+        status = self.store.create('pose.status').create([("count", 0),
+                                                          ("good", True)])
+
+        for rule in (globaling.ALWAYS, globaling.UPDATE, globaling.CHANGE):
+            heading.value = 0.0
+            position.update(north=10.0, east=5.0)
+            status.update(count=0, good=True)
+            logs = []
+            for kind in ('text', 'binary'):
+                log = logging.Log(name="{0}{1}".format(kind,
+                                                       globaling.LogRuleNames[rule]),
+                                  store=self.store,
+                                  kind=kind,
+                                  bufsize=64,
+                                  rule=rule)
+                log.addLoggee(tag = 'heading', loggee = 'pose.heading')
+                log.addLoggee(tag = 'pos', loggee = 'pose.position')
+                log.addLoggee(tag = 'status', loggee = 'pose.status')
+                self.logger.addLog(log)
+                logs.append(log)
+            text, binary = logs
+            self.logger.resolve()
+
+            self.store.changeStamp(0.0)
+            self.logger.runner.send(globaling.START)  # reopens prepares and logs once
+            self.assertTrue(binary.path.endswith('.log'))
+            self.assertEqual(binary.codes, ['d', 'd', 'd', 'd', 'd', '?'])
+            fmt = binary.packer.format  # bytes before python 3.7
+            self.assertEqual(fmt.decode('ascii') if isinstance(fmt, bytes) else fmt,
+                             '<1sddddd?')
+
+            for i in range(40):
+                self.store.advanceStamp(0.125)
+                if i % 4:
+                    heading.value = float(i)
+                    position.update(north=position.data.north + 2.0)
+                    status.update(count=i, good=not status.data.good)
+                if i == 10:
+                    del position['east']  # missing field
+                if i == 20:
+                    position.update(east="far")  # does not pack so missing
+                if i == 30:
+                    position.update(east=1.5)
+                self.logger.runner.send(globaling.RUN)
+            self.logger.runner.send(globaling.STOP)  # closes so flushes buffer
+
+            header, names, codes, records = logging.readBinaryLog(binary.path)
+            self.assertEqual(names, ['_time', 'heading', 'pos.north', 'pos.east',
+                                     'status.count', 'status.good'])
+            self.assertEqual(records[0], (0.0, 0.0, 10.0, 5.0, 0, True))
+
+            dest = logging.binaryLogToText(binary.path)
+            with open(text.path) as f:  # unpackable values are missing in binary
+                expected = f.read().replace(u'\tfar', u'\t').splitlines(True)
+            expected = [u'\t'.join(u'{0}'.format(float(value))  # ints as floats
+                                   if value.isdigit() else value
+                                   for value in line.split(u'\t'))
+                        for line in expected]
+            with open(dest) as f:
+                lines = f.readlines()
+            self.assertEqual(lines[0], u'text\t{0}\tbinary{0}\n'.format(
+                                                    globaling.LogRuleNames[rule]))
+            self.assertEqual(lines[1:], expected[1:])
+            self.assertEqual(len(records), len(expected) - 2)
+
+            self.logger.logs = []
+            for path in (text.path, binary.path, dest):
+                os.remove(path)
+
+    def testLogBinaryStreakDeck(self):
+        """
+        Test binary kind log with streak and deck rules
+        """
+        console.terse("{0}\n".format(self.testLogBinaryStreakDeck.__doc__))
+
+        heading = self.store.create('pose.heading').create(value = [])
+        ned = self.store.create('pose.ned')
+
+        streak = logging.Log(name='streak',
+                             store=self.store,
+                             kind='binary',
+                             rule=globaling.STREAK)
+        streak.addLoggee(tag = 'heading', loggee = 'pose.heading')
+        deck = logging.Log(name='deck',
+                           store=self.store,
+                           kind='binary',
+                           rule=globaling.DECK)
+        deck.addLoggee(tag = 'ned', loggee = 'pose.ned', fields=['north', 'east'])
+        self.logger.addLog(streak)
+        self.logger.addLog(deck)
+        self.logger.resolve()
+
+        self.store.changeStamp(0.0)
+        self.logger.runner.send(globaling.START)
+        self.assertEqual(streak.codes, ['d', 'd'])
+        self.assertEqual(deck.codes, ['d', 'd', 'd'])
+
+        self.store.advanceStamp(0.125)
+        heading.value.extend([1.0, 2, "three", 4.0])
+        ned.push(odict(north=5.0, east=4.0, down=3.0))
+        ned.push(odict(east=2.0, down=1.0))
+        ned.push(["hi", "there"])
+        ned.push(odict(north=8.0, east=5.0))
+        self.logger.runner.send(globaling.RUN)
+        self.logger.runner.send(globaling.STOP)
+
+        header, names, codes, records = logging.readBinaryLog(streak.path)
+        self.assertEqual(header, ['binary\tStreak\tstreak\n', '_time\theading\n'])
+        self.assertEqual(records, [(0.125, 1.0), (0.125, 2.0), (0.125, None),
+                                   (0.125, 4.0)])
+        header, names, codes, records = logging.readBinaryLog(deck.path)
+        self.assertEqual(names, ['_time', 'ned.north', 'ned.east'])
+        self.assertEqual(records, [(0.125, 5.0, 4.0), (0.125, None, 2.0),
+                                   (0.125, 8.0, 5.0)])
+
+        if logging.numpy is not None:
+            array = logging.binaryLogToArray(deck.path)
+            self.assertEqual(array.dtype.names, ('_time', 'ned.north', 'ned.east'))
+            self.assertEqual(list(array['ned.east']), [4.0, 2.0, 5.0])
+            self.assertTrue(logging.numpy.isnan(array['ned.north'][1]))
+        else:
+            with self.assertRaises(ImportError):
+                logging.binaryLogToArray(deck.path)
+
+        for log in (streak, deck):
+            os.remove(log.path)
+
+    def testLogBinaryNumbers(self):
+        """
+        Test binary kind log packs later floats of int columns and rejects
+        string columns
+        """
+        console.terse("{0}\n".format(self.testLogBinaryNumbers.__doc__))
+
+        counts = self.store.create('pose.counts').create([("first", 0.0),
+                                                          ("count", 0),
+                                                          ("last", 0.0)])
+        log = logging.Log(name='numbers',
+                          store=self.store,
+                          kind='binary',
+                          rule=globaling.ALWAYS)
+        log.addLoggee(tag = 'counts', loggee = 'pose.counts')
+        self.logger.addLog(log)
+        self.logger.resolve()
+
+        self.store.changeStamp(0.0)
+        self.logger.runner.send(globaling.START)
+        self.assertEqual(log.codes, ['d', 'd', 'd', 'd'])
+        self.store.advanceStamp(0.125)
+        counts.update(first=1.0, count=1.5, last=2.5)
+        self.logger.runner.send(globaling.RUN)
+        self.logger.runner.send(globaling.STOP)
+
+        header, names, codes, records = logging.readBinaryLog(log.path)
+        self.assertEqual(records[:2], [(0.0, 0.0, 0.0, 0.0),
+                                       (0.125, 1.0, 1.5, 2.5)])
+        os.remove(log.path)
+
+        self.store.create('pose.name').create(value="Alpha")
+        log = logging.Log(name='names',
+                          store=self.store,
+                          kind='binary',
+                          rule=globaling.ALWAYS)
+        log.addLoggee(tag = 'name', loggee = 'pose.name')
+        log.resolve()
+        with self.assertRaises(ValueError):
+            log.prepare()
+
+    def testLoggerThreaded(self):
+        """
+        Test threaded logger writes same logs as in line logger
+        """
+        console.terse("{0}\n".format(self.testLoggerThreaded.__doc__))
+
+        heading = self.store.create('pose.heading').create(value = 0.0)
+        position = self.store.create('pose.position').create([("north", 10.0),
+                                                              ("east", 5.0)])
+        history = self.store.create('pose.history').create(value = [])
+
+        threaded = logging.Logger(name="LoggerThreaded",
+                                  store=self.store,
+                                  prefix="/tmp/log/ioflo",
+                                  flushPeriod=1.0,
+                                  threaded=True,
+                                  queueSize=4096)  # large enough to never drop
+        self.assertIs(threaded.threaded, True)
+        self.assertIs(self.logger.threaded, False)
+        self.assertIs(self.logger.queue, None)
+        self.assertEqual(threaded.writerShr.name, 'logger.LoggerThreaded.writer')
+
+        logs = []
+        for logger in (self.logger, threaded):
+            for kind in ('text', 'binary'):
+                log = logging.Log(name="{0}{1}".format(logger.name, kind),
+                                  store=self.store,
+                                  kind=kind,
+                                  bufsize=128,
+                                  rule=globaling.ALWAYS)
+                log.addLoggee(tag = 'heading', loggee = 'pose.heading')
+                log.addLoggee(tag = 'pos', loggee = 'pose.position')
+                logger.addLog(log)
+                logs.append(log)
+            log = logging.Log(name="{0}streak".format(logger.name),
+                              store=self.store,
+                              rule=globaling.STREAK)
+            log.addLoggee(tag = 'history', loggee = 'pose.history')
+            logger.addLog(log)
+            logs.append(log)
+            logger.resolve()
+
+        self.store.changeStamp(0.0)
+        for logger in (self.logger, threaded):
+            logger.runner.send(globaling.START)
+        self.assertIs(self.logger.writer, None)
+        self.assertIsInstance(threaded.writer, logging.threading.Thread)
+        self.assertEqual(threaded.logs[0].submit, threaded.submit)
+
+        for i in range(40):
+            self.store.advanceStamp(0.125)
+            heading.value = float(i)
+            position.update(north=position.data.north + 2.0)
+            if i == 10:
+                del position['east']
+            for logger in (self.logger, threaded):
+                if i % 3 == 0:
+                    position.update(east=[i])  # mutable value
+                history.value.extend([i, i + 0.5])
+                logger.runner.send(globaling.RUN)
+                if i % 3 == 0:
+                    position.data.east.append(0)  # mutate after log
+
+        for logger in (self.logger, threaded):
+            logger.runner.send(globaling.STOP)  # drains
+        self.assertIs(threaded.writer, None)
+        self.assertEqual(threaded.logs[0].submit, None)
+        self.assertEqual(threaded.dropped, 0)
+        self.assertEqual(threaded.failed, 0)
+        self.assertTrue(threaded.written > 40 * 2)
+        self.assertTrue(threaded.writerShr.data.written <= threaded.written)  # as of last run
+        self.assertEqual(threaded.writerShr.data.dropped, 0)
+
+        inlines, threadeds = logs[:3], logs[3:]
+        for inline, other in zip(inlines, threadeds):
+            with open(inline.path, 'rb') as f:
+                expected = f.read().split(b'\n', 1)[1]  # name differs
+            with open(other.path, 'rb') as f:
+                self.assertEqual(f.read().split(b'\n', 1)[1], expected)
+
+        for log in logs:
+            os.remove(log.path)
+
+    def testLoggerThreadedBackpressure(self):
+        """
+        Test threaded logger drops and counts submissions when queue full
+        """
+        console.terse("{0}\n".format(self.testLoggerThreadedBackpressure.__doc__))
+
+        logger = logging.Logger(name="LoggerBackpressure",
+                                store=self.store,
+                                prefix="/tmp/log/ioflo",
+                                threaded=True,
+                                queueSize=2)
+        logger.startWriter()
+        blocker = logging.threading.Event()
+        started = logging.threading.Event()
+
+        def block():
+            started.set()
+            blocker.wait()
+
+        writes = []
+        self.assertIs(logger.submit(block), True)
+        started.wait()  # writer busy so queue fills
+        self.assertIs(logger.submit(writes.append, 1), True)
+        self.assertIs(logger.submit(writes.append, 2), True)
+        self.assertIs(logger.submit(writes.append, 3), False)
+        self.assertEqual(logger.dropped, 1)
+        self.assertIs(logger.submit(lambda: 1 / 0), False)
+        self.assertEqual(logger.dropped, 2)
+
+        logger.log()  # updates writer share
+        self.assertEqual(logger.writerShr.data.backlog, 2)
+        self.assertEqual(logger.writerShr.data.highwater, 2)
+        self.assertEqual(logger.writerShr.data.dropped, 2)
+
+        blocker.set()
+        logger.stopWriter()  # drains
+        self.assertEqual(writes, [1, 2])
+        self.assertEqual(logger.written, 3)
+        self.assertIs(logger.writer, None)
+
 
 class HouseTestCase(testing.HouseIofloTestCase):
     """
@@ -1495,6 +1809,11 @@ def runSome():
                 'testLogStreak',
                 'testLogStreakFields',
                 'testLogDeck',
+                'testLogBinary',
+                'testLogBinaryStreakDeck',
+                'testLogBinaryNumbers',
+                'testLoggerThreaded',
+                'testLoggerThreadedBackpressure',
             ]
     tests.extend(map(LoggerTestCase, names))
 
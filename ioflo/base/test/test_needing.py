@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for needing module
+"""
+
+import sys
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import os
+
+from ioflo.test import testing
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import acting
+from ioflo.base import needing
+from ioflo.base import framing
+
+
+class NeedDirectNever(needing.NeedDirect):
+    """Need that overrides action of compiled NeedDirect"""
+    def action(self, **kw):
+        """Never satisfied"""
+        return False
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    pass
+
+
+class BasicTestCase(testing.FrameIofloTestCase):
+    """
+    Test Case
+    """
+
+    def setUp(self):
+        """
+        Call super if override so House Framer and Frame are setup correctly
+        """
+        super(BasicTestCase, self).setUp()
+
+    def tearDown(self):
+        """
+        Call super if override so House Framer and Frame are torn down correctly
+        """
+        super(BasicTestCase, self).tearDown()
+
+    def addNeed(self, kind, parms, negate=False):
+        """
+        Create need act of kind with parms and add as entry check of .frame
+        """
+        act = (acting.Nact if negate else acting.Act)(actor=kind,
+                                                      registrar=needing.Need,
+                                                      parms=parms)
+        self.frame.addByContext(act, BENTER)
+        return act
+
+    def testCompile(self):
+        """
+        Test Need.Compile matches Need.Check
+        """
+        console.terse("{0}\n".format(self.testCompile.__doc__))
+
+        pairs = [(1.0, 1.0), (1.0, 1.2), (1.2, 1.0), (1.0, 2.0), (2.0, 1.0),
+                 (3, 3), (-1, 0), (True, False), (u"on", u"on"), (u"on", u"off")]
+        for comparison in ('==', '<', '<=', '>=', '>', '!=', '~'):
+            for tolerance in (0.0, 0.5, -0.5, None):
+                compare = needing.Need.Compile(comparison, tolerance)
+                for state, goal in pairs:
+                    self.assertEqual(compare(state, goal),
+                                     needing.Need.Check(state, comparison, goal, tolerance),
+                                     (comparison, tolerance, state, goal))
+
+        self.assertIs(needing.Need.Compile('<', 0.0), needing.Need.Operators['<'])
+
+    def testCompiledNeeds(self):
+        """
+        Test compiled need checks match need act calls
+        """
+        console.terse("{0}\n".format(self.testCompiledNeeds.__doc__))
+
+        state = self.store.create(".test.state").update(value=0.0, flag=False)
+        goal = self.store.create(".test.goal").update(value=1.0)
+        acts = [self.addNeed("NeedAlways", dict()),
+                self.addNeed("NeedBoolean", dict(state=".test.state",
+                                                 stateField="flag")),
+                self.addNeed("NeedDirect", dict(state=".test.state",
+                                                stateField="value",
+                                                comparison=">=",
+                                                goal=1.0,
+                                                tolerance=0.0)),
+                self.addNeed("NeedDirect", dict(state=".test.state",
+                                                stateField="value",
+                                                comparison="==",
+                                                goal=1.0,
+                                                tolerance=0.25)),
+                self.addNeed("NeedDirect", dict(state=".test.state",
+                                                stateField="value",
+                                                comparison="<",
+                                                goal=1.0,
+                                                tolerance=0.0), negate=True),
+                self.addNeed("NeedIndirect", dict(state=".test.state",
+                                                  stateField="value",
+                                                  comparison="!=",
+                                                  goal=".test.goal",
+                                                  goalField="value",
+                                                  tolerance=0.0)),
+               ]
+        self.resolve()
+
+        checks = [act.compile() for act in acts]
+        for act, check in zip(acts, checks):
+            self.assertIsNot(check, act)  # all compiled
+
+        for value, flag in ((0.0, False), (0.8, True), (1.0, False), (1.1, 1), (2.0, None)):
+            state.update(value=value, flag=flag)
+            for act, check in zip(acts, checks):
+                self.assertEqual(check(), act(), (act.actor.name, value, flag))
+
+        state.data = state.data.__class__(value=1.0, flag=True)  # replaced data
+        for act, check in zip(acts, checks):
+            self.assertEqual(check(), act(), act.actor.name)
+
+        console.reinit(verbosity=console.Wordage.profuse)  # falls back to action
+        try:
+            for act, check in zip(acts, checks):
+                self.assertEqual(check(), act(), act.actor.name)
+        finally:
+            console.reinit(verbosity=console.Wordage.concise)
+
+    def testCompiledOverride(self):
+        """
+        Test need subclass that overrides action is not compiled
+        """
+        console.terse("{0}\n".format(self.testCompiledOverride.__doc__))
+
+        self.store.create(".test.state").update(value=2.0)
+        parms = dict(state=".test.state", stateField="value", comparison=">=",
+                     goal=1.0, tolerance=0.0)
+        acts = [self.addNeed("NeedDirectNever", dict(parms)),
+                self.addNeed("NeedDirectNever", dict(parms), negate=True),
+                self.addNeed("NeedDirect", dict(parms))]
+        self.resolve()
+
+        never, negated, direct = acts
+        self.assertFalse(never.actor._compilable())
+        self.assertTrue(direct.actor._compilable())
+        self.assertIs(never.compile(), never.dispatch)
+        self.assertIs(negated.compile(), negated)
+        self.assertIsNot(direct.compile(), direct.dispatch)
+        self.assertEqual([act.compile()() for act in acts], [False, True, True])
+
+    def testTransiterChecks(self):
+        """
+        Test Transiter resolves compiled checks for its needs
+        """
+        console.terse("{0}\n".format(self.testTransiterChecks.__doc__))
+
+        far = framing.Frame(name="FarTest", store=self.store, framer=self.framer)
+        state = self.store.create(".test.state").update(value=0.0)
+        need = acting.Act(actor="NeedDirect",
+                          registrar=needing.Need,
+                          parms=dict(state=".test.state",
+                                     stateField="value",
+                                     comparison=">=",
+                                     goal=2.0,
+                                     tolerance=0))
+        act = acting.Act(actor='Transiter',
+                         registrar=acting.Actor,
+                         parms=dict(needs=[need], near='me', far="FarTest",
+                                    human="go FarTest if .test.state >= 2.0"))
+        self.frame.addPreact(act)
+        self.resolve()
+
+        self.assertEqual(len(act.actor._checks), 1)
+        self.assertIsNot(act.actor._checks[0], need)
+
+        self.store.changeStamp(0.0)
+        self.framer.enterAll()
+        self.assertEqual(self.framer.actives, [self.frame])
+        self.assertFalse(self.frame.precur())
+        state.update(value=2.0)
+        self.assertTrue(self.frame.precur())
+        self.assertEqual(self.framer.actives, [far])
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = ['testCompile',
+             'testCompiledNeeds',
+             'testCompiledOverride',
+             'testTransiterChecks', ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testCompiledNeeds')
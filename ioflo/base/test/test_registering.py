@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for registering module
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import os
+import json
+import subprocess
+
+from ioflo.aid.sixing import *
+from ioflo.aid import getConsole, odict
+
+console = getConsole()
+
+from ioflo.base import registering
+from ioflo.base import indexing
+from ioflo.base import doing
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+                                        os.path.abspath(__file__)))))
+
+def runFresh(source):
+    """
+    Returns json loaded output of python source run in a fresh interpreter
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ROOT, env.get('PYTHONPATH', '')])
+    output = subprocess.check_output([sys.executable, "-c", source], env=env)
+    return json.loads(output.decode("utf-8"))
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+class BasicTestCase(unittest.TestCase):
+    """
+    Test Case
+    """
+
+    def setUp(self):
+        console.reinit(verbosity=console.Wordage.concise)
+
+    def tearDown(self):
+        console.reinit(verbosity=console.Wordage.concise)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Eager imports before python3.7")
+    def testLazyRegistry(self):
+        """
+        Test registry imports indexed module on first lookup
+        """
+        console.terse("{0}\n".format(self.testLazyRegistry.__doc__))
+
+        self.assertIsInstance(doing.Doer.Registry, registering.LazyRegistry)
+        self.assertIs(doing.Doer.Registry.index,
+                      indexing.Index['ioflo.base.doing.Doer'])
+        self.assertEqual(doing.Doer.Registry.index['SimulatorMotionUuv'],
+                         'ioflo.trim.interior.plain.simulating')
+        self.assertNotIn("NoSuchDeed", doing.Doer.Registry)
+
+        result = runFresh(
+            "import sys, json\n"
+            "import ioflo.aid\n"
+            "aided = sorted(m for m in sys.modules if m.startswith('ioflo.'))\n"
+            "from ioflo.base import doing\n"
+            "based = 'ioflo.trim.interior.plain.simulating' in sys.modules\n"
+            "found = 'SimulatorMotionUuv' in doing.Doer.Registry\n"
+            "actor = doing.Doer.__fetch__('ControllerPid')[0].__name__\n"
+            "print(json.dumps(dict(aided=aided, based=based, found=found, actor=actor,\n"
+            "    loaded=sorted(m for m in sys.modules if m.startswith('ioflo.trim.')))))\n")
+        self.assertTrue(all(m.startswith("ioflo.aid") or m == "ioflo.__metadata__"
+                            for m in result['aided']))
+        self.assertFalse(result['based'])
+        self.assertTrue(result['found'])
+        self.assertEqual(result['actor'], 'ControllerPid')
+        self.assertIn('ioflo.trim.interior.plain.simulating', result['loaded'])
+        self.assertIn('ioflo.trim.interior.plain.controlling', result['loaded'])
+        self.assertNotIn('ioflo.trim.interior.plain.filtering', result['loaded'])
+
+    def testSubpackageAccess(self):
+        """
+        Test subpackage and module attribute access after import ioflo both
+        lazily and eagerly as on pythons without module __getattr__
+        """
+        console.terse("{0}\n".format(self.testSubpackageAccess.__doc__))
+
+        source = ("import sys, json\n"
+                  "{0}"
+                  "import ioflo\n"
+                  "eager = 'ioflo.base.building' in sys.modules\n"
+                  "names = [ioflo.base.storing.__name__,\n"
+                  "         ioflo.base.building.__name__,\n"
+                  "         ioflo.trim.interior.plain.simulating.__name__]\n"
+                  "print(json.dumps(dict(eager=eager, names=names)))\n")
+        names = ['ioflo.base.storing', 'ioflo.base.building',
+                 'ioflo.trim.interior.plain.simulating']
+        if sys.version_info >= (3, 7):
+            result = runFresh(source.format(""))
+            self.assertFalse(result['eager'])
+            self.assertEqual(result['names'], names)
+        result = runFresh(source.format("sys.version_info = (3, 6, 0, 'final', 0)\n"))
+        self.assertTrue(result['eager'])
+        self.assertEqual(result['names'], names)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Eager imports before python3.7")
+    def testIndexCurrent(self):
+        """
+        Test generated index matches registrations of lazily imported modules
+        """
+        console.terse("{0}\n".format(self.testIndexCurrent.__doc__))
+
+        index = runFresh(
+            "import json\n"
+            "from ioflo.base import registering\n"
+            "print(json.dumps(registering.generateIndex()))\n")
+        self.assertEqual(index, indexing.Index)  # else rerun registering.writeIndex()
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = ['testLazyRegistry',
+             'testSubpackageAccess',
+             'testIndexCurrent', ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testLazyRegistry')
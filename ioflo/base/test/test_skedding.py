@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Test Template
+"""
+
+import sys
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+import os
+import shutil
+import tempfile
+
+from ioflo.test import testing
+from ioflo.aid.consoling import getConsole
+console = getConsole()
+
+from ioflo.base.globaling import *
+from ioflo.base import tasking
+from ioflo.base import skedding
+from ioflo.base import housing
+
+
+BRIDGED = """
+house sensing
+
+  init counter with value 0.0
+  init ack with value 0.0
+  bridge .counter to control as .remote
+
+  framer counting be active first start
+    frame start
+      recur
+        inc .counter with 1.0
+      go done if .ack >= 1.0
+
+    frame done
+      bid stop all
+
+house control
+
+  init remote with value 0.0
+  init ack with value 0.0
+  bridge .ack to sensing
+
+  framer watching be active first start
+    frame start
+      go done if .remote >= 3.0
+
+    frame done
+      put 1.0 into .ack
+      bid stop all
+"""
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    pass
+
+
+class Recorder(tasking.Tasker):
+    """
+    Tasker that records each run in .runs and ends itself after .limit runs
+    either by yielding ABORTED or by StopIteration when .quit is True
+    """
+    def __init__(self, runs=None, limit=0, quit=False, **kw):
+        self.runs = runs if runs is not None else []
+        self.limit = limit
+        self.quit = quit
+        super(Recorder, self).__init__(**kw)
+
+    def makeRunner(self):
+        self.status = STOPPED
+        self.desire = STOP
+        count = 0
+        while True:
+            control = (yield (self.status))
+            if control == ABORT:
+                self.status = ABORTED
+                continue
+            self.runs.append((self.name, self.store.stamp))
+            self.status = RUNNING if count else STARTED
+            self.desire = RUN
+            count += 1
+            if self.limit and count >= self.limit:
+                if self.quit:
+                    return
+                self.status = ABORTED
+
+
+class BasicTestCase(testing.HouseIofloTestCase):
+    """
+    Skedder TestCase
+    """
+
+    def setUp(self):
+        super(BasicTestCase, self).setUp()
+
+    def tearDown(self):
+        super(BasicTestCase, self).tearDown()
+
+    def runSkedder(self, heaped, specs):
+        """
+        Returns list of (name, stamp) runs of set of mixed period taskers
+        specs is list of (name, period, limit) triples of taskers
+        """
+        runs = []
+        tasking.Tasker.Clear()
+        self.house.taskables = []
+        for name, period, limit in specs:
+            tasker = Recorder(name=name,
+                              store=self.store,
+                              period=period,
+                              schedule=ACTIVE,
+                              runs=runs,
+                              limit=limit,
+                              quit=(name == 'e'))
+            self.house.taskables.append(tasker)
+
+        self.store.changeStamp(0.0)
+        skedder = skedding.Skedder(period=0.125,
+                                   houses=[self.house],
+                                   heaped=heaped)
+        skedder.run()
+        self.assertEqual(len(skedder.ready), 0)
+        return (runs, [t.name for t, r, p in skedder.aborted])
+
+    def testHeapedOrder(self):
+        """
+        Test heaped Skedder runs taskers in same order as deque Skedder
+        """
+        console.terse("{0}\n".format(self.testHeapedOrder.__doc__))
+        specs = [('a', 0.0, 24), ('b', 0.5, 7), ('c', 0.25, 6),
+                 ('d', 0.125, 20), ('e', 0.5, 3), ('f', 0.0, 9)]
+        deqRuns, deqAborts = self.runSkedder(heaped=False, specs=specs)
+        heapRuns, heapAborts = self.runSkedder(heaped=True, specs=specs)
+        self.assertEqual(heapRuns, deqRuns)
+        self.assertEqual(heapAborts, deqAborts)
+        self.assertEqual(deqAborts, ['e', 'f', 'c', 'd', 'a', 'b'])
+        self.assertEqual(deqRuns[:6], [('a', 0.0), ('b', 0.0), ('c', 0.0),
+                                       ('d', 0.0), ('e', 0.0), ('f', 0.0)])
+        self.assertEqual(deqRuns[6:9], [('a', 0.125), ('d', 0.125), ('f', 0.125)])
+
+        # slow taskers ahead of fast ones share retimes with no asap taskers
+        specs = [('a', 1.0, 4), ('b', 0.5, 7), ('c', 0.25, 6),
+                 ('d', 0.125, 20), ('e', 0.5, 3)]
+        deqRuns, deqAborts = self.runSkedder(heaped=False, specs=specs)
+        heapRuns, heapAborts = self.runSkedder(heaped=True, specs=specs)
+        self.assertEqual(heapRuns, deqRuns)
+        self.assertEqual(heapAborts, deqAborts)
+        self.assertEqual([r for r in deqRuns if r[1] == 1.0],
+                         [('a', 1.0), ('b', 1.0), ('c', 1.0), ('d', 1.0), ('e', 1.0)])
+
+    def runBridged(self, parallel=False, lockstep=True):
+        """
+        Returns skedder after building and running plan with bridged houses
+        """
+        base = tempfile.mkdtemp(prefix="ioflo_sked_")
+        try:
+            path = os.path.join(base, "bridged.flo")
+            with open(path, "w") as f:
+                f.write(BRIDGED)
+            skedder = skedding.Skedder(period=0.125,
+                                       filepath=path,
+                                       parallel=parallel,
+                                       lockstep=lockstep)
+            self.assertTrue(skedder.build())
+            self.assertEqual(skedder.houses[0].bridges,
+                             [('.counter', 'control', '.remote')])
+            skedder.run()
+        finally:
+            shutil.rmtree(base, ignore_errors=True)
+        return skedder
+
+    def testBridgedHouses(self):
+        """
+        Test bridged shares between houses run serial and in parallel processes
+        """
+        console.terse("{0}\n".format(self.testBridgedHouses.__doc__))
+        serial = self.runBridged()
+        sensing, control = serial.houses
+        remote = control.store.fetch('.remote')
+        self.assertEqual(remote.value, 4.0)
+        self.assertEqual(remote.stamp, 0.5)  # delivered next iteration
+        ack = sensing.store.fetch('.ack')
+        self.assertEqual(ack.value, 1.0)
+        self.assertEqual(ack.stamp, 0.5)
+        self.assertEqual(sensing.store.fetch('.counter').value, 4.0)
+        self.assertEqual(serial.stamp, 0.625)
+        housing.House.Clear()
+        housing.ClearRegistries()
+
+        lockstep = self.runBridged(parallel=True)
+        self.assertEqual(lockstep.stamp, serial.stamp)  # same iterations
+        housing.House.Clear()
+        housing.ClearRegistries()
+
+        freerun = self.runBridged(parallel=True, lockstep=False)  # terminates
+        housing.House.Clear()
+        housing.ClearRegistries()
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = ['testHeapedOrder',
+             'testBridgedHouses', ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testHeapedOrder')
@@ -142,6 +142,45 @@ class BasicTestCase(unittest.TestCase):
         show = data._show()
         self.assertEqual(show, 'Data: error=None panSpeed=0 tiltSpeed=0\n')
 
+    def testDataFields(self):
+        """
+        Test Data validated field name cache
+        """
+        console.terse("{0}\n".format(self.testDataFields.__doc__))
+
+        data = storing.Data(x=1)
+        self.assertIn("x", storing.Data._Fields[storing.Data])
+        data.y = 2
+        data.x = 3  # cached field repeat write
+        self.assertEqual(data.__dict__.items(), [("x", 3), ("y", 2)])
+
+        other = storing.Data()
+        other.y = 5  # cached field new to this instance
+        other.x = 6
+        self.assertEqual(other.__dict__.items(), [("y", 5), ("x", 6)])
+        data.x = 4
+
+        for i in range(2):  # rejected each time
+            with self.assertRaises(AttributeError) as ex:
+                data._b = 4
+            with self.assertRaises(AttributeError) as ex:
+                data.__setattr__("1b", 4)
+        self.assertNotIn("_b", storing.Data._Fields[storing.Data])
+        self.assertEqual(data.__dict__.items(), [("x", 4), ("y", 2)])
+
+        class Point(storing.Data):
+            def norm(self):
+                return (self.x ** 2 + self.y ** 2) ** 0.5
+
+        point = Point(x=3, y=4)
+        self.assertEqual(point.norm(), 5.0)
+        point.norm = 10  # shadows method so not a field of class Point
+        self.assertNotIn("norm", storing.Data._Fields[Point])
+        self.assertEqual(point.norm, 10)
+        data.norm = 10  # but is a field of class Data
+        self.assertIn("norm", storing.Data._Fields[storing.Data])
+        self.assertEqual(data.__dict__.items(), [("x", 4), ("y", 2), ("norm", 10)])
+
     def testShare(self):
         """
         Test Share Class
@@ -198,6 +237,60 @@ class BasicTestCase(unittest.TestCase):
         self.assertEqual(show, 'Name  Value None\nerror = None panSpeed = 0 tiltSpeed = 0\n')
 
 
+    def testShareTrack(self):
+        """
+        Test Share change tracking counts
+        """
+        console.terse("{0}\n".format(self.testShareTrack.__doc__))
+
+        share = storing.Share(name='auto.heading', value=0.0)
+        self.assertIs(share.changes, None)
+        share.value = 5.0
+        self.assertIs(share.changes, None)  # not tracked
+        self.assertIs(share.track(), share)
+        self.assertEqual(share.changes, 0)
+        self.assertEqual(share.track().changes, 0)  # no reset
+
+        share.value = 5.0  # same value
+        self.assertEqual(share.changes, 0)
+        share.value = 6.0
+        self.assertEqual(share.changes, 1)
+        share.update(value=6.0)
+        self.assertEqual(share.changes, 1)
+        share.update([('value', 7.0)])
+        self.assertEqual(share.changes, 2)
+        share.change(odict(value=7.0))
+        self.assertEqual(share.changes, 2)
+
+        share = storing.Share(name='auto.pose').track()
+        share.create(north=0.0, east=0.0)  # new fields
+        self.assertEqual(share.changes, 1)
+        share.create(north=1.0)  # exists so no change
+        self.assertEqual(share.changes, 1)
+        share.update(north=0.0, east=1.0)  # one changed field counts once
+        self.assertEqual(share.changes, 2)
+        self.assertEqual(share['east'], 1.0)
+        share['north'] = 0.0
+        self.assertEqual(share.changes, 2)
+        share['north'] = 2.0
+        self.assertEqual(share.changes, 3)
+        share.setdefault('down', 0.0)
+        self.assertEqual(share.changes, 4)
+        share.setdefault('down', 1.0)
+        self.assertEqual(share.changes, 4)
+        share.pop('down')
+        self.assertEqual(share.changes, 5)
+        share.pop('down', None)
+        self.assertEqual(share.changes, 5)
+        del share['east']
+        self.assertEqual(share.changes, 6)
+        share.clear()
+        self.assertEqual(share.changes, 7)
+        share.clear()
+        self.assertEqual(share.changes, 7)
+        share.data.north = 3.0  # direct data writes are not counted
+        self.assertEqual(share.changes, 7)
+
     def testStore(self):
         """
         Test Store Class
@@ -258,6 +351,108 @@ class BasicTestCase(unittest.TestCase):
         store.expose(valued=True)
         storing.Store.Clear()
 
+    def testStoreIndex(self):
+        """
+        Test Store flat path index and prefix iteration
+        """
+        console.terse("{0}\n".format(self.testStoreIndex.__doc__))
+        storing.Store.Clear()  # clear registry of Store instance entries
+
+        store = storing.Store()
+        self.assertIs(store.index['meta'], store.metaShr)
+        self.assertIs(store.index['time'], store.timeShr)
+
+        depth = store.create('.auto.depth')
+        heading = store.create('auto.heading.')
+        node = store.createNode('auto.pid')
+        rate = store.create('auto.pid.rate')
+        store.create('autopilot.mode')
+        self.assertIs(store.index['auto'], store.fetchNode('auto'))
+        self.assertEqual(store.index['auto'].name, 'auto')
+        self.assertEqual(node.name, 'auto.pid')
+        self.assertIs(store.index['auto.depth'], depth)
+        self.assertIs(store.fetch('.auto.heading'), heading)
+        self.assertIs(store.fetchShare('auto.pid.rate.'), rate)
+        self.assertIs(store.fetchNode('auto.pid'), node)
+        self.assertIs(store.fetchShare('auto.pid'), None)
+        self.assertIs(store.fetchNode('auto.depth'), None)
+        self.assertIs(store.fetch('auto.speed'), None)
+        self.assertIs(store.fetchShare(''), None)
+        self.assertIs(store.fetch(''), None)
+
+        shareA = storing.Share(name='auto.depth')
+        store.change(shareA)
+        self.assertIs(store.fetch('auto.depth'), shareA)
+
+        paths = [path for path, nos in store.iterPrefix('auto')]
+        self.assertEqual(paths, ['auto', 'auto.depth', 'auto.heading',
+                                 'auto.pid', 'auto.pid.rate'])
+        self.assertEqual(list(store.iterPrefix('.auto.pid')),
+                         [('auto.pid', node), ('auto.pid.rate', rate)])
+        self.assertEqual(list(store.iterPrefix('auto.speed')), [])
+        store.create('auto.pid.gain')
+        paths = [path for path, nos in store.iterPrefix('auto.pid')]
+        self.assertEqual(paths, ['auto.pid', 'auto.pid.gain', 'auto.pid.rate'])
+        paths = [path for path, nos in store.iterPrefix()]
+        self.assertEqual(paths, sorted(store.index))
+        self.assertIn('autopilot.mode', paths)
+
+        storing.Store.Clear()
+
+    def testStoreClock(self):
+        """
+        Test Store realtime and datetime clock share refresh modes
+        """
+        console.terse("{0}\n".format(self.testStoreClock.__doc__))
+        storing.Store.Clear()  # clear registry of Store instance entries
+
+        store = storing.Store(stamp=0.0)
+        self.assertIs(store.clockLazy, False)
+        self.assertEqual(store.clockPeriod, 0.0)
+        self.assertEqual(store.clockStamp, 0.0)
+        self.assertIsInstance(store.realTimeShr, storing.ClockShare)
+        self.assertIsInstance(store.dateTimeShr, storing.ClockShare)
+        self.assertEqual(store.realTimeShr.stamp, 0.0)
+        rt = store.realTimeShr.value
+
+        store.changeStamp(0.125)  # eager refresh every stamp
+        self.assertEqual(store.clockStamp, 0.125)
+        self.assertEqual(store.realTimeShr._stamp, 0.125)
+        self.assertGreaterEqual(store.realTimeShr.value, rt)
+        self.assertEqual(store.timeShr.value, 0.125)
+
+        store.reclock(lazy=True)
+        self.assertIs(store.clockLazy, True)
+        store.changeStamp(0.25)
+        self.assertEqual(store.timeShr.value, 0.25)
+        self.assertEqual(store.clockStamp, 0.125)  # not refreshed until read
+        self.assertEqual(store.realTimeShr._stamp, 0.125)
+        rt = store.realTimeShr.value
+        self.assertEqual(store.clockStamp, 0.25)  # refreshed on read
+        self.assertEqual(store.realTimeShr.stamp, 0.25)
+        self.assertEqual(store.dateTimeShr.stamp, 0.25)
+        self.assertEqual(store.realTimeShr.value, rt)  # once per stamp
+        self.assertIn("iso", store.dateTimeShr)
+        store.advanceStamp(0.125)
+        self.assertEqual(store.clockStamp, 0.25)
+        self.assertEqual(store.dateTimeShr["year"], store.dateTimeShr.data.dt.year)
+        self.assertEqual(store.clockStamp, 0.375)
+
+        store.reclock(period=1.0)
+        store.changeStamp(1.0)
+        self.assertEqual(store.realTimeShr.stamp, 0.375)  # not yet period
+        store.changeStamp(1.375)
+        self.assertEqual(store.realTimeShr.stamp, 1.375)
+        store.changeStamp(0.0)  # retrograde
+        self.assertEqual(store.realTimeShr.stamp, 0.0)
+
+        store.reclock(lazy=False)  # eager with period
+        store.changeStamp(0.5)
+        self.assertEqual(store.clockStamp, 0.0)
+        store.changeStamp(1.0)
+        self.assertEqual(store.clockStamp, 1.0)
+        storing.Store.Clear()
+
     def testMark(self):
         """
         Test Mark Class
@@ -301,8 +496,12 @@ def runSome():
     tests =  []
     names = [
                 'testData',
+                'testDataFields',
                 'testShare',
+                'testShareTrack',
                 'testStore',
+                'testStoreIndex',
+                'testStoreClock',
                 'testMark',
                 'testDeck',
             ]
@@ -31,6 +31,6 @@ class TraitDepth(Trait):
     def action(self, value = 0.0, **kw):
         """Use depth """
 
-        console.profuse( "Use depth of {0:0.3f}\n".format(value))
+        console.profuse( "Use depth of {0:0.3f}\n", value)
 
         return None
@@ -67,7 +67,7 @@ class Want(acting.Actor):
 
             if sourceField not in source:
                 console.profuse("     Warning: Non-existent field '{0}' in source"
-                                " {1} ... creating anyway".format(sourceField, source.name))
+                                " {1} ... creating anyway", sourceField, source.name)
                 source[sourceField] = 0.0  # create
 
             parms['sourceField'] = sourceField
@@ -91,7 +91,7 @@ class WantStop(Want):
 
         for tasker in taskers:
             tasker.desire = STOP
-            console.profuse( "Bid stop {0}\n".format(tasker.name))
+            console.profuse( "Bid stop {0}\n", tasker.name)
 
         return None
 
@@ -109,7 +109,7 @@ class WantStart(Want):
             if period is not None:
                 tasker.period = max(0.0, period)
             tasker.desire = START
-            console.profuse( "Bid start {0} at {1}\n".format(tasker.name, tasker.period))
+            console.profuse( "Bid start {0} at {1}\n", tasker.name, tasker.period)
 
         return None
 
@@ -127,7 +127,7 @@ class WantRun(Want):
             if period is not None:
                 tasker.period = max(0.0, period)
             tasker.desire = RUN
-            console.profuse( "Bid run {0} at (1)\n".format(tasker.name, tasker.period))
+            console.profuse( "Bid run {0} at (1)\n", tasker.name, tasker.period)
 
         return None
 
@@ -141,7 +141,7 @@ class WantAbort(Want):
         """abort taskers """
         for tasker in taskers:
             tasker.desire = ABORT
-            console.profuse( "Bid abort {0}\n".format(tasker.name))
+            console.profuse( "Bid abort {0}\n", tasker.name)
 
         return None
 
@@ -159,6 +159,6 @@ class WantReady(Want):
             if period is not None:
                 tasker.period = max(0.0, period)
             tasker.desire = READY
-            console.profuse( "Bid ready {0} at {1}\n".format(tasker.name, tasker.period))
+            console.profuse( "Bid ready {0} at {1}\n", tasker.name, tasker.period)
 
         return None
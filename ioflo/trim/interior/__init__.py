@@ -2,10 +2,19 @@
 
 """
 #print("\nPackage at {0}".format( __path__[0]))
+import sys
 import importlib
 
+# modules are imported on first registry lookup of their behaviors
+# via ioflo.base.indexing not eagerly
 _modules = ['plain', 'fancy']
 
-for m in _modules:
-    importlib.import_module(".{0}".format(m), package='ioflo.trim.interior')
+if sys.version_info < (3, 7):  # no module __getattr__ so import eagerly
+    for m in _modules:
+        importlib.import_module(".{0}".format(m), package=__name__)
 
+def __getattr__(name):
+    """ Import module name on first attribute access (python3.7+) """
+    if name in _modules:
+        return importlib.import_module(".{0}".format(name), package=__name__)
+    raise AttributeError("module '{0}' has no attribute '{1}'".format(__name__, name))
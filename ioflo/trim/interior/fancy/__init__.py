@@ -2,10 +2,7 @@
 
 """
 #print("\nPackage at {0}".format( __path__[0]))
-import importlib
 
+# modules are imported on first registry lookup of their behaviors
+# via ioflo.base.indexing not eagerly
 _modules = []
-
-for m in _modules:
-    importlib.import_module(".{0}".format(m), package='ioflo.trim.interior.fancy')
-
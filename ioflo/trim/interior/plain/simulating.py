@@ -10,13 +10,17 @@ import struct
 from collections import deque
 import random
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from ....aid.sixing import *
 from ....base.globaling import *
 from ....aid.odicting import odict
 from ....aid import aiding, navigating
 from ....aid.navigating import DEGTORAD, RADTODEG
-from ....base import doing
+from ....base import doing, excepting
 
 from ....aid.consoling import getConsole
 console = getConsole()
@@ -985,6 +989,711 @@ class SimulatorSensorCompass(SimulatorBase):
               (self.output.value, self.parm.data.phase,
                self.parm.data.amp, self.parm.data.sigma))
 
+class SimulatorFleetBase(SimulatorBase):
+    """
+    Base class for fleet simulators that hold the states of .size vehicles
+    in numpy arrays and advance all of them in one vectorized step.
+
+    Fleet simulators publish into columnar shares whose fields are arrays
+    with one element per vehicle. Input share fields may be either arrays of
+    fleet size or scalars that apply to every vehicle.
+
+    Requires numpy
+    """
+    def _initio(self, ioinits):
+        """
+        Raise ResolveError when numpy is not available
+        """
+        if numpy is None:
+            msg = "ResolveError: Fleet simulator requires numpy"
+            raise excepting.ResolveError(msg, self.name, self)
+        return super(SimulatorFleetBase, self)._initio(ioinits)
+
+    def _column(self, value):
+        """
+        Returns float array of fleet size broadcast from value
+        """
+        return numpy.broadcast_to(numpy.asarray(value, dtype=float), (self.size, ))
+
+    def _zeros(self):
+        """
+        Returns float array of fleet size of zeros
+        """
+        return numpy.zeros(self.size)
+
+    def restart(self):
+        """Restart fleet simulator
+
+        """
+        self.stamp = self.store.stamp
+        self.lapse = 0.0
+
+
+class SimulatorMotionUuvFleet(SimulatorFleetBase):
+    """UUV fleet motion simulator class
+       Vectorized SimulatorMotionUuv for .size vehicles
+    """
+    Ioinits=odict(
+        group = 'simulator.motion.uuv.fleet',
+        state = 'fleet.state', goal = 'fleet.goal',
+        current = 'scenario.current', bottom = 'scenario.bottom',
+        onset = 'scenario.onset', origin = 'scenario.origin',
+        parms = dict(size = 1, rpmLimit = 1200.0, sternLimit = 20.0, rudderLimit = 20.0,
+                     gs = 0.0022, gpr = -0.4, gpp = 0.0, gdb = -0.1, ghr = -0.4))
+
+    def __init__(self, **kw):
+        """Initialize instance.
+        """
+        #call super class method
+        super(SimulatorMotionUuvFleet,self).__init__(**kw)
+
+    def _prepio(self, group, state, goal, current, bottom, onset, origin,
+                parms = None, **kw):
+        """ Override since legacy interface
+
+            group is path name of group in store, group has following subgroups or shares:
+              group.parm = share for data structure of fixed parameters or coefficients
+                 parm has the fields of SimulatorMotionUuv parm plus
+                    size = number of vehicles in fleet
+
+              group.elapsed = share copy of time lapse for logging
+
+           state = share path name output columnar state with array fields
+                speed, speedRate, depth, depthRate, pitch, pitchRate, altitude,
+                heading, headingRate, north, east, velocityNorth, velocityEast,
+                lat, lon
+
+           goal = share path name input columnar goal with fields rpm, stern, rudder
+           current = share path name input water current vector (north east) m/s
+           bottom = share path name input simulated bottom depth of ocean
+           onset = share path name input onset (start) positions (north east)
+           origin = share path name input origin (start) locations (lat lon)
+
+           parms = dictionary to initialize group.parm fields
+
+           instance attributes
+
+           .group = copy of group name
+           .parm = reference to input parameter share
+           .size = number of vehicles in fleet
+           .state = ref to columnar state share
+           .goal = ref to columnar goal share
+           .current = ref to current share
+           .bottom = ref to bottom share
+           .onset = ref to onset share
+           .origin = ref to origin share
+        """
+        self.group = group
+
+        self.parm = self.store.create(group + '.parm')#create if not exist
+        if not parms:
+            parms = dict(size = 1, rpmLimit = 1200.0, sternLimit = 20.0,rudderLimit = 20.0,
+                         gs = 0.0020, gpr = -0.4, gpp = 0.0, gdb = -0.1, ghr = -0.4)
+        self.parm.create(**parms)
+        self.size = max(1, int(self.parm.data.size))
+
+        self.elapsed = self.store.create(group + '.elapsed').create(value = 0.0)#create if not exist
+
+        #output create share if not exist but force update of columns
+        self.state = self.store.create(state)
+        self.state.update([(field, self._zeros()) for field in
+                           ('speed', 'speedRate', 'depth', 'depthRate',
+                            'pitch', 'pitchRate', 'altitude',
+                            'heading', 'headingRate', 'north', 'east',
+                            'velocityNorth', 'velocityEast', 'lat', 'lon')])
+
+        #inputs create share if not exists and create value if not exist
+        self.goal = self.store.create(goal)
+        self.goal.create(rpm = 0.0) #preserves field order
+        self.goal.create(stern = 0.0)
+        self.goal.create(rudder = 0.0)
+        self.current = self.store.create(current)
+        self.current.create(north = 0.0) #preserves field order
+        self.current.create(east = 0.0)
+        self.bottom = self.store.create(bottom).create(value = 50.0)
+        self.onset = self.store.create(onset)
+        self.onset.create(north = 0.0) #preserves order
+        self.onset.create(east = 0.0)
+        self.origin = self.store.create(origin)
+        self.origin.create(lat = 0.0) #preserves order
+        self.origin.create(lon = 0.0)
+
+    def restart(self):
+        """Restart fleet motion simulator
+
+        """
+        super(SimulatorMotionUuvFleet,self).restart()
+
+        #need to init positions here since onset may be changed at build time by init command
+        if self.state.stamp is None: #only on first run
+            self.state.update(north = self._column(self.onset.data.north).copy(),
+                              east = self._column(self.onset.data.east).copy(),
+                              lat = self._column(self.origin.data.lat).copy(),
+                              lon = self._column(self.origin.data.lon).copy())
+
+    def action(self, **kw):
+        """Updates simulated motion state of all vehicles in fleet
+        """
+        super(SimulatorMotionUuvFleet,self).action(**kw) #lapse updated here
+
+        self.elapsed.value = self.lapse #store lapse for logging
+
+        if self.lapse <= 0.0: #only evaluate if lapse positive so rate calc good
+            return
+
+        lapse = self.lapse
+        parm = self.parm.data
+        last = self.state.data
+
+        rpm = numpy.clip(self._column(self.goal.data.rpm), 0.0, abs(parm.rpmLimit))
+        rudderLimit = abs(parm.rudderLimit)
+        rudder = numpy.clip(self._column(self.goal.data.rudder), -rudderLimit, rudderLimit)
+        sternLimit = abs(parm.sternLimit)
+        stern = numpy.clip(self._column(self.goal.data.stern), -sternLimit, sternLimit)
+
+        speed = parm.gs * rpm
+        speedRate = (speed - last.speed) / lapse
+        slant = speed * lapse #slant distance traveled
+
+        pitchRate = parm.gpr * stern + parm.gpp * last.pitch
+        pitch = last.pitch + lapse * pitchRate
+
+        depth = last.depth - slant * numpy.sin(DEGTORAD * pitch) + parm.gdb * lapse
+        depthChange = depth - last.depth #virtual depth change
+        depth = numpy.maximum(0.0, depth) #can't have negative depth
+        depthRate = (depth - last.depth) / lapse #actual depth rate of change
+        altitude = self._column(self.bottom.value) - depth
+
+        headingRate = parm.ghr * rudder
+        heading = last.heading + lapse * headingRate
+        headAvg = (heading + last.heading) / 2.0 #must avg before wrap around
+        heading = numpy.mod(heading, 360.0)
+
+        #scale by horiz component of slant when changing depth
+        horizontal = numpy.sqrt(slant**2 + depthChange**2)
+
+        deltaNorth = horizontal * numpy.cos(DEGTORAD * headAvg) +\
+            self._column(self.current.data.north) * lapse
+        deltaEast = horizontal * numpy.sin(DEGTORAD * headAvg) +\
+            self._column(self.current.data.east) * lapse
+
+        lat, lon = navigating.SphereLLByDNDEToLLArray(last.lat, last.lon,
+                                                      deltaNorth, deltaEast)
+
+        self.state.update(speed = speed, speedRate = speedRate,
+                          depth = depth, depthRate = depthRate,
+                          pitch = pitch, pitchRate = pitchRate,
+                          altitude = altitude,
+                          heading = heading, headingRate = headingRate,
+                          north = last.north + deltaNorth,
+                          east = last.east + deltaEast,
+                          velocityNorth = deltaNorth / lapse,
+                          velocityEast = deltaEast / lapse,
+                          lat = lat, lon = lon)
+
+    def _expose(self):
+        """
+           prints out motion state
+
+        """
+        print("Simulator %s stamp = %s  lapse = %0.3f size = %s" %
+              (self.name, self.stamp, self.lapse, self.size))
+        print("speed = %s depth = %s heading = %s" %
+              (self.state.data.speed, self.state.data.depth, self.state.data.heading))
+        print("pos north = %s pos east = %s" %
+              (self.state.data.north, self.state.data.east))
+
+class SimulatorMotionUsvFleet(SimulatorFleetBase):
+    """USV fleet motion simulator class
+       Vectorized SimulatorMotionUsv for .size vehicles
+    """
+    Ioinits=odict(
+        group = 'simulator.motion.usv.fleet',
+        state = 'fleet.state', goal = 'fleet.goal',
+        current = 'scenario.current',
+        onset = 'scenario.onset',
+        parms = dict(size = 1, rpmLimit = 3000.0,  rudderLimit = 20.0,
+                     gs = 0.0025,  ghr = -0.25))
+
+    def __init__(self,  **kw):
+        """Initialize instance.
+        """
+        #call super class method
+        super(SimulatorMotionUsvFleet,self).__init__(**kw)
+
+    def _prepio(self, group, state, goal, current, onset, parms = None, **kw):
+        """ Override since legacy interface
+
+            group is path name of group in store, group has following subgroups or shares:
+              group.parm = share for data structure of fixed parameters or coefficients
+                 parm has the fields of SimulatorMotionUsv parm plus
+                    size = number of vehicles in fleet
+
+              group.elapsed = share copy of time lapse for logging
+
+           state = share path name output columnar state with array fields
+                speed, speedRate, heading, headingRate, north, east,
+                velocityNorth, velocityEast
+
+           goal = share path name input columnar goal with fields rpm, rudder
+           current = share path name input water current vector (north east) m/s
+           onset = share path name input onset (start) positions (north east)
+
+           parms = dictionary to initialize group.parm fields
+
+           instance attributes
+
+           .group = copy of group name
+           .parm = reference to input parameter share
+           .size = number of vehicles in fleet
+           .state = ref to columnar state share
+           .goal = ref to columnar goal share
+           .current = ref to current share
+           .onset = ref to onset share
+        """
+        self.group = group
+
+        self.parm = self.store.create(group + '.parm')#create if not exist
+        if not parms:
+            parms = dict(size = 1, rpmLimit = 3000.0, rudderLimit = 20.0,
+                         gs = 0.0025, ghr = -0.001)
+        self.parm.create(**parms)
+        self.size = max(1, int(self.parm.data.size))
+
+        self.elapsed = self.store.create(group + '.elapsed').create(value = 0.0)#create if not exist
+
+        #inputs create share if not exists and create value if not exist
+        self.goal = self.store.create(goal)
+        self.goal.create(rpm = 0.0) #preserves field order
+        self.goal.create(rudder = 0.0)
+        self.current = self.store.create(current)
+        self.current.create(north = 0.0) #preserves field order
+        self.current.create(east = 0.0)
+        self.onset = self.store.create(onset)
+        self.onset.create(north = 0.0) #preserves order
+        self.onset.create(east = 0.0)
+
+        #output create share if not exist but force update of columns
+        self.state = self.store.create(state)
+        self.state.update([(field, self._zeros()) for field in
+                           ('speed', 'speedRate', 'heading', 'headingRate',
+                            'north', 'east', 'velocityNorth', 'velocityEast')])
+        #init onset positions where vehicles start relative to 0,0 origin
+        self.state.update(north = self._column(self.onset.data.north).copy(),
+                          east = self._column(self.onset.data.east).copy())
+
+    def action(self, **kw):
+        """Updates simulated motion state of all vehicles in fleet
+        """
+        super(SimulatorMotionUsvFleet,self).action(**kw) #lapse updated here
+
+        self.elapsed.value = self.lapse #store lapse for logging
+
+        if self.lapse <= 0.0: #only evaluate if lapse positive so rate calc good
+            return
+
+        lapse = self.lapse
+        parm = self.parm.data
+        last = self.state.data
+
+        rpm = numpy.clip(self._column(self.goal.data.rpm), 0.0, abs(parm.rpmLimit))
+        rudderLimit = abs(parm.rudderLimit)
+        rudder = numpy.clip(self._column(self.goal.data.rudder), -rudderLimit, rudderLimit)
+
+        speed = parm.gs * rpm
+        speedRate = (speed - last.speed) / lapse
+
+        headingRate = parm.ghr * speed * rudder
+        heading = last.heading + lapse * headingRate
+        headAvg = (heading + last.heading) / 2.0 #must avg before wrap around
+        heading = numpy.mod(heading, 360.0)
+
+        horizontal = speed * lapse #distance traveled
+
+        deltaNorth = horizontal * numpy.cos(DEGTORAD * headAvg) +\
+            self._column(self.current.data.north) * lapse
+        deltaEast = horizontal * numpy.sin(DEGTORAD * headAvg) +\
+            self._column(self.current.data.east) * lapse
+
+        self.state.update(speed = speed, speedRate = speedRate,
+                          heading = heading, headingRate = headingRate,
+                          north = last.north + deltaNorth,
+                          east = last.east + deltaEast,
+                          velocityNorth = deltaNorth / lapse,
+                          velocityEast = deltaEast / lapse)
+
+    def _expose(self):
+        """
+           prints out motion state
+
+        """
+        print("Simulator %s stamp = %s  lapse = %0.3f size = %s" %
+              (self.name, self.stamp, self.lapse, self.size))
+        print("speed = %s heading = %s" %
+              (self.state.data.speed, self.state.data.heading))
+        print("pos north = %s pos east = %s" %
+              (self.state.data.north, self.state.data.east))
+
+class SimulatorSensorGpsFleet(SimulatorFleetBase):
+    """GPS fleet sensor simulator class
+       Vectorized SimulatorSensorGps for .size vehicles
+    """
+    Ioinits=odict(
+        group = 'simulator.sensor.gps.fleet',
+        output = 'fleet.gps', state = 'fleet.state',
+        scenario = 'scenario.gps',
+        parms = dict(size = 1, noiseBand = 5.0,  noiseJitter = 2.5,
+                     noiseVelocity = 0.1))
+
+    def __init__(self, **kw):
+        """Initialize instance.
+        """
+        #call super class method
+        super(SimulatorSensorGpsFleet,self).__init__(**kw)
+
+    def _prepio(self, group, output, state, scenario, parms = None, **kw):
+        """ Override since legacy interface
+
+            group is path name of group in store, group has following subgroups or shares:
+              group.parm = share for data structure of fixed parameters or coefficients
+                 parm has the fields of SimulatorSensorGps parm plus
+                    size = number of vehicles in fleet
+
+              group.elapsed = share copy of time lapse for logging
+
+           output = share path name output columnar gps with array fields
+                north, east, velocityNorth, velocityEast, errorNorth, errorEast
+
+           state = share path name input columnar state with array fields
+                north, east, velocityNorth, velocityEast
+           scenario = share path name input scenario (for dropouts etc)
+           parms = dictionary to initialize group.parm fields
+
+           instance attributes
+
+           .group = copy of group name
+           .parm = reference to input parameter share
+           .size = number of vehicles in fleet
+           .output = ref to columnar gps share
+           .state = ref to columnar state share
+           .scenario = ref to input scenario dropout
+        """
+        self.group = group
+
+        self.parm = self.store.create(group + '.parm')#create if not exist
+        if not parms:
+            parms = dict(size = 1, noiseBand = 5.0, noiseJitter = 2.5, noiseVelocity = 0.1)
+
+        self.parm.create(**parms)
+        self.parm.data.noiseBand = abs(self.parm.data.noiseBand)
+        self.parm.data.noiseJitter = abs(self.parm.data.noiseJitter)
+        self.parm.data.noiseVelocity = abs(self.parm.data.noiseVelocity)
+        self.size = max(1, int(self.parm.data.size))
+
+        self.elapsed = self.store.create(group + '.elapsed').create(value = 0.0)#create if not exist
+
+        #output create share if not exist but force update of columns
+        self.output = self.store.create(output)
+        self.output.update([(field, self._zeros()) for field in
+                            ('north', 'east', 'velocityNorth', 'velocityEast',
+                             'errorNorth', 'errorEast')])
+
+        #inputs create share if not exists and create value if not exist
+        self.state = self.store.create(state)
+        self.state.create(north = 0.0) #preserves order
+        self.state.create(east = 0.0)
+        self.state.create(velocityNorth = 0.0)
+        self.state.create(velocityEast = 0.0)
+
+        self.scenario = self.store.create(scenario).create(dropout = 0)
+
+    def action(self, **kw):
+        """Updates simulated gps sensor of all vehicles in fleet
+        """
+        super(SimulatorSensorGpsFleet,self).action(**kw) #lapse updated here
+
+        self.elapsed.value = self.lapse
+
+        if self.lapse <= 0.0: #only evaluate if lapse positive so rate calc good
+            return
+
+        dropout = self._column(self.scenario.data.dropout) != 0.0 #no gps
+        if dropout.all():
+            return
+
+        last = self.output.data
+        band = self.parm.data.noiseBand
+        jitter = self.parm.data.noiseJitter
+        vsigma = self.parm.data.noiseVelocity
+        vsigma3 = 3.0 * vsigma
+
+        en = numpy.clip(0.6 * last.errorNorth +
+                        0.4 * numpy.random.normal(0.0, jitter, self.size), -band, band)
+        ee = numpy.clip(0.6 * last.errorEast +
+                        0.4 * numpy.random.normal(0.0, jitter, self.size), -band, band)
+        evn = numpy.clip(numpy.random.normal(0.0, vsigma, self.size), -vsigma3, vsigma3)
+        eve = numpy.clip(numpy.random.normal(0.0, vsigma, self.size), -vsigma3, vsigma3)
+
+        columns = odict(north = self._column(self.state.data.north) + en,
+                        east = self._column(self.state.data.east) + ee,
+                        velocityNorth = self._column(self.state.data.velocityNorth) + evn,
+                        velocityEast = self._column(self.state.data.velocityEast) + eve,
+                        errorNorth = en, errorEast = ee)
+
+        if dropout.any(): #keep last output of vehicles in dropout
+            for field, value in columns.items():
+                columns[field] = numpy.where(dropout, self.output[field], value)
+
+        self.output.update(columns)
+
+    def _expose(self):
+        """
+           prints out sensor state
+
+        """
+        print("Simulator %s stamp = %s  lapse = %0.3f size = %s" %
+              (self.name, self.stamp, self.lapse, self.size))
+        print("north = %s east = %s" %
+              (self.output.data.north, self.output.data.east))
+
+class SimulatorSensorDvlFleet(SimulatorFleetBase):
+    """DVL fleet sensor simulator class
+       Vectorized SimulatorSensorDvl for .size vehicles
+    """
+    Ioinits=odict(
+        group = 'simulator.sensor.dvl.fleet',
+        output = 'fleet.dvl', state = 'fleet.state',
+        current = 'scenario.current',
+        bottom = 'scenario.bottom',
+        scenario = 'scenario.dvl',
+        parms = dict(size = 1, velSigma = 0.01, bias = 0.1, altSigma = 0.01))
+
+    def __init__(self, **kw):
+        """Initialize instance.
+        """
+        #call super class method
+        super(SimulatorSensorDvlFleet,self).__init__(**kw)
+
+    def _prepio(self, group, output, state, current, bottom, scenario,
+                parms = None, **kw):
+        """ Override since legacy interface
+
+            group is path name of group in store, group has following subgroups or shares:
+              group.parm = share for data structure of fixed parameters or coefficients
+                 parm has the fields of SimulatorSensorDvl parm plus
+                    size = number of vehicles in fleet
+
+              group.elapsed = share copy of time lapse for logging
+
+           output = share path name output columnar dvl with array fields
+                forward, starboard, currentForward, currentStarboard,
+                currentNorth, currentEast, altitude
+
+           state = share path name input columnar state with array fields
+                heading, speed
+           current = share path name input current vector (north, east) m/s
+           bottom = share path name input bottom depth m
+           scenario = share path name input scenario (for dropouts etc)
+           parms = dictionary to initialize group.parm fields
+
+           instance attributes
+
+           .group = copy of group name
+           .parm = reference to input parameter share
+           .size = number of vehicles in fleet
+           .output = ref to columnar dvl share
+           .state = ref to columnar state share
+           .current = ref to input current north east share
+           .bottom = ref to input bottom
+           .scenario = ref to input dvl scenario for dropout
+        """
+        self.group = group
+
+        self.parm = self.store.create(group + '.parm')#create if not exist
+        if not parms:
+            parms = dict(size = 1, velSigma = 0.01, bias = 0.001, altSigma = 0.01)
+
+        self.parm.create(**parms)
+        self.parm.data.velSigma = abs(self.parm.data.velSigma)
+        self.parm.data.altSigma = abs(self.parm.data.altSigma)
+        self.size = max(1, int(self.parm.data.size))
+
+        self.elapsed = self.store.create(group + '.elapsed').create(value = 0.0)#create if not exist
+
+        #output create share if not exist but force update of columns
+        self.output = self.store.create(output)
+        self.output.update([(field, self._zeros()) for field in
+                            ('forward', 'starboard',
+                             'currentForward', 'currentStarboard',
+                             'currentNorth', 'currentEast', 'altitude')])
+
+        #inputs create share if not exists and create value if not exist
+        self.state = self.store.create(state)
+        self.state.create(heading = 0.0)
+        self.state.create(speed = 0.0)
+        self.current = self.store.create(current)
+        self.current.create(north = 0.0)#preserves order
+        self.current.create(east = 0.0)
+        self.bottom = self.store.create(bottom).create(value = 0.0)
+        self.scenario = self.store.create(scenario).create(dropout = 0)
+
+    def action(self, **kw):
+        """Updates simulated dvl sensor of all vehicles in fleet
+        """
+        super(SimulatorSensorDvlFleet,self).action(**kw) #lapse updated here
+
+        self.elapsed.value = self.lapse
+
+        if self.lapse <= 0.0: #only evaluate if lapse positive so rate calc good
+            return
+
+        dropout = self._column(self.scenario.data.dropout) != 0.0 #no dvl
+        if dropout.all():
+            return
+
+        heading = self._column(self.state.data.heading)
+        speed = self._column(self.state.data.speed)
+
+        vsigma = self.parm.data.velSigma
+        bias = self.parm.data.bias
+        asigma = self.parm.data.altSigma
+        vsigma3 = vsigma * 3.0
+        asigma3 = asigma * 3.0
+
+        #transform to body forward starboard
+        cf, cs = navigating.RotateNEToFSArray(heading,
+                                              self._column(self.current.data.north),
+                                              self._column(self.current.data.east))
+
+        noise = numpy.clip(numpy.random.normal(0.0, vsigma, self.size), -vsigma3, vsigma3)
+        vf = speed + cf + noise + bias
+        vs = cs + noise + bias
+
+        noise = numpy.clip(numpy.random.normal(0.0, vsigma, self.size), -vsigma3, vsigma3)
+        cf = cf + noise
+        cs = cs + noise
+        cn, ce = navigating.RotateFSToNEArray(heading, cf, cs)
+
+        noise = numpy.clip(numpy.random.normal(0.0, asigma, self.size), -asigma3, asigma3)
+        alt = self._column(self.bottom.value) + noise
+
+        columns = odict(forward = vf, starboard = vs,
+                        currentForward = cf, currentStarboard = cs,
+                        currentNorth = cn, currentEast = ce, altitude = alt)
+
+        if dropout.any(): #keep last output of vehicles in dropout
+            for field, value in columns.items():
+                columns[field] = numpy.where(dropout, self.output[field], value)
+
+        self.output.update(columns)
+
+    def _expose(self):
+        """
+           prints out sensor state
+
+        """
+        print("Simulator %s stamp = %s  lapse = %0.3f size = %s" %
+              (self.name, self.stamp, self.lapse, self.size))
+        print("vel forward = %s vel starboard = %s altitude = %s" %
+              (self.output.data.forward, self.output.data.starboard,
+               self.output.data.altitude))
+
+class SimulatorSensorCompassFleet(SimulatorFleetBase):
+    """compass fleet sensor simulator class
+       Vectorized SimulatorSensorCompass for .size vehicles
+    """
+    Ioinits = odict(
+        group = 'simulator.sensor.compass.fleet',
+        output = 'fleet.compass', state = 'fleet.state',
+        scenario = 'scenario.magnetic',
+        parms = dict(size = 1, phase = 24.0, amp = 1.0, sigma = 0.1))
+
+    def __init__(self, **kw):
+        """Initialize instance.
+        """
+        #call super class method
+        super(SimulatorSensorCompassFleet,self).__init__(**kw)
+
+    def _prepio(self, group, output, state, scenario, parms = None, **kw):
+        """ Override since legacy interface
+
+            group is path name of group in store, group has following subgroups or shares:
+              group.parm = share for data structure of fixed parameters or coefficients
+                 parm has the fields of SimulatorSensorCompass parm plus
+                    size = number of vehicles in fleet
+
+              group.elapsed = share copy of time lapse for logging
+
+           output = share path name output columnar compass with array field
+                heading magnetic degrees
+
+           state = share path name input columnar state with array field
+                heading true deg north =0 positive clock wise
+           scenario = share path name input scenario (for scenario.declination)
+           parms = dictionary to initialize group.parm fields
+
+           instance attributes
+
+           .group = copy of group name
+           .parm = reference to input parameter share
+           .size = number of vehicles in fleet
+           .output = ref to columnar compass share
+           .state = ref to columnar state share
+           .scenario = ref to input scenario declination
+        """
+        self.group = group
+
+        self.parm = self.store.create(group + '.parm')#create if not exist
+        if not parms:
+            parms = dict(size = 1, phase = 45, amp = 1.0, sigma = 0.1)
+
+        self.parm.create(**parms)
+        #phase can be negative
+        self.parm.data.amp = abs(self.parm.data.amp)
+        self.parm.data.sigma = abs(self.parm.data.sigma)
+        self.size = max(1, int(self.parm.data.size))
+
+        self.elapsed = self.store.create(group + '.elapsed').create(value = 0.0)#create if not exist
+
+        #outputs
+        self.output = self.store.create(output).update(heading = self._zeros())
+        #inputs
+        self.state = self.store.create(state).create(heading = 0.0)
+        self.scenario = self.store.create(scenario).create(declination = 0.0)
+
+    def action(self, **kw):
+        """Updates simulated compass sensor of all vehicles in fleet
+        """
+        super(SimulatorSensorCompassFleet,self).action(**kw) #lapse updated here
+
+        self.elapsed.value = self.lapse
+
+        if self.lapse <= 0.0: #only evaluate if lapse positive so rate calc good
+            return
+
+        trueHeading = self._column(self.state.data.heading)
+        declination = self._column(self.scenario.data.declination)
+
+        phase = self.parm.data.phase
+        amp = self.parm.data.amp
+        sigma = self.parm.data.sigma
+        sigma3 = sigma * 3.0
+
+        noise = numpy.clip(numpy.random.normal(0.0, sigma, self.size), -sigma3, sigma3)
+        error = amp * numpy.cos(DEGTORAD * (trueHeading + phase)) + noise
+
+        heading = trueHeading - declination + error #magnetic heading with error
+        self.output.update(heading = numpy.mod(heading, 360.0))
+
+    def _expose(self):
+        """
+           prints out sensor state
+
+        """
+        print("Simulator %s stamp = %s  lapse = %0.3f size = %s" %
+              (self.name, self.stamp, self.lapse, self.size))
+        print("heading = %s" % (self.output.data.heading, ))
+
 class SimulatorSalinityLinear(SimulatorBase):
     """linear salinity simulator class
     """
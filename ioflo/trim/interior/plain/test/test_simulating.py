@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+"""
+Unittests for simulating module
+"""
+from __future__ import absolute_import, division, print_function
+
+import sys
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+from ioflo.aid.sixing import *
+from ioflo.aid import getConsole, odict
+from ioflo.aid import navigating
+
+console = getConsole()
+
+from ioflo.base import storing
+from ioflo.trim.interior.plain import simulating
+
+SIZE = 4
+LAPSE = 0.125
+STEPS = 40
+
+
+def setUpModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+def tearDownModule():
+    console.reinit(verbosity=console.Wordage.concise)
+
+
+@unittest.skipIf(simulating.numpy is None, "Fleet simulators require numpy")
+class BasicTestCase(unittest.TestCase):
+    """
+    Test Case
+    """
+
+    def setUp(self):
+        console.reinit(verbosity=console.Wordage.concise)
+        storing.Store.Clear()
+        self.numpy = simulating.numpy
+
+    def tearDown(self):
+        storing.Store.Clear()
+        console.reinit(verbosity=console.Wordage.concise)
+
+    def simulator(self, cls, name, store, **kwa):
+        """
+        Returns instance of simulator cls with ioinits from
+        cls.Ioinits updated with kwa
+        """
+        sim = cls(name=name, store=store)
+        ioinits = odict(cls.Ioinits)
+        ioinits.update(kwa)
+        sim._initio(ioinits)
+        return sim
+
+    def start(self, stores, sims):
+        """
+        Start stores at stamp zero and restart sims as when framer starts
+        """
+        for store in stores:
+            store.changeStamp(0.0)
+        for sim in sims:
+            sim.restart()
+
+    def step(self, stores, sims):
+        """
+        Advance stores by LAPSE and run action of sims
+        """
+        for store in stores:
+            store.advanceStamp(LAPSE)
+        for sim in sims:
+            sim.action()
+
+    def assertColumn(self, column, values):
+        """
+        Assert numpy array column matches scalar values within float tolerance
+        """
+        self.assertEqual(len(column), len(values))
+        self.assertTrue(self.numpy.allclose(column, values, rtol=1e-9, atol=1e-9),
+                        "{0} != {1}".format(list(column), values))
+
+    def testSphereLLByDNDEToLLArray(self):
+        """
+        Test vectorized SphereLLByDNDEToLL matches scalar version
+        """
+        console.terse("{0}\n".format(self.testSphereLLByDNDEToLLArray.__doc__))
+        lats = [0.0, 36.5, -45.25, 89.9]
+        lons = [0.0, -121.75, 170.0, 10.0]
+        dns = [100.0, -2500.0, 0.0, 12.5]
+        des = [-50.0, 3000.0, 40.0, 0.0]
+        lat, lon = navigating.SphereLLByDNDEToLLArray(lats, lons, dns, des)
+        expected = [navigating.SphereLLByDNDEToLL(*args)
+                    for args in zip(lats, lons, dns, des)]
+        self.assertColumn(lat, [e[0] for e in expected])
+        self.assertColumn(lon, [e[1] for e in expected])
+
+    def testMotionUuvFleet(self):
+        """
+        Test UUV fleet simulator matches scalar simulators
+        """
+        console.terse("{0}\n".format(self.testMotionUuvFleet.__doc__))
+        numpy = self.numpy
+        parms = dict(rpmLimit = 1500.0, sternLimit = 20.0, rudderLimit = 20.0,
+                     gs = 0.0025, gpr = -0.5, gpp = -0.1, gdb = -0.1, ghr = -0.5)
+        rpms = [500.0, 1600.0, -10.0, 900.0]
+        sterns = [0.0, 25.0, -5.0, 10.0]
+        rudders = [0.0, 5.0, -30.0, 12.0]
+        norths = [0.0, 10.0, -20.0, 100.0]
+        easts = [0.0, -5.0, 30.0, 0.0]
+        lats = [36.0, 36.1, -12.0, 0.0]
+        lons = [-121.0, -121.1, 45.0, 0.0]
+
+        store = storing.Store(name='Fleet')
+        store.create('fleet.goal').update(rpm=numpy.array(rpms),
+                                          stern=numpy.array(sterns),
+                                          rudder=numpy.array(rudders))
+        store.create('scenario.current').update(north=0.1, east=-0.2)
+        store.create('scenario.bottom').update(value=50.0)
+        store.create('scenario.onset').update(north=numpy.array(norths),
+                                              east=numpy.array(easts))
+        store.create('scenario.origin').update(lat=numpy.array(lats),
+                                               lon=numpy.array(lons))
+        fleet = self.simulator(simulating.SimulatorMotionUuvFleet,
+                               'simulatorMotionUuvFleet', store,
+                               parms=dict(parms, size=SIZE))
+        self.assertEqual(fleet.size, SIZE)
+
+        stores = []
+        sims = []
+        for i in range(SIZE):
+            single = storing.Store(name='Single{0}'.format(i))
+            single.create('goal.rpm').update(value=rpms[i])
+            single.create('goal.stern').update(value=sterns[i])
+            single.create('goal.rudder').update(value=rudders[i])
+            single.create('scenario.current').update(north=0.1, east=-0.2)
+            single.create('scenario.bottom').update(value=50.0)
+            single.create('scenario.onset').update(north=norths[i], east=easts[i])
+            single.create('scenario.origin').update(lat=lats[i], lon=lons[i])
+            sims.append(self.simulator(simulating.SimulatorMotionUuv,
+                                       'simulatorMotionUuv{0}'.format(i),
+                                       single, parms=dict(parms)))
+            stores.append(single)
+
+        self.start([store] + stores, [fleet] + sims)
+        self.assertColumn(fleet.state.data.north, norths)
+        for k in range(STEPS):
+            self.step([store] + stores, [fleet] + sims)
+
+        state = fleet.state.data
+        for field in ['speed', 'speedRate', 'depth', 'depthRate', 'pitch',
+                      'pitchRate', 'altitude', 'heading', 'headingRate']:
+            self.assertColumn(fleet.state[field],
+                              [getattr(sim, field).value for sim in sims])
+        self.assertColumn(state.north, [sim.position.data.north for sim in sims])
+        self.assertColumn(state.east, [sim.position.data.east for sim in sims])
+        self.assertColumn(state.velocityNorth, [sim.velocity.data.north for sim in sims])
+        self.assertColumn(state.velocityEast, [sim.velocity.data.east for sim in sims])
+        self.assertColumn(state.lat, [sim.location.data.lat for sim in sims])
+        self.assertColumn(state.lon, [sim.location.data.lon for sim in sims])
+        self.assertEqual(fleet.state.stamp, store.stamp)
+
+    def testMotionUsvFleet(self):
+        """
+        Test USV fleet simulator matches scalar simulators
+        """
+        console.terse("{0}\n".format(self.testMotionUsvFleet.__doc__))
+        numpy = self.numpy
+        parms = dict(rpmLimit = 3000.0, rudderLimit = 20.0, gs = 0.0025, ghr = -0.25)
+        rpms = [500.0, 3500.0, 0.0, 1200.0]
+        rudders = [0.0, 5.0, -30.0, 12.0]
+        norths = [0.0, 10.0, -20.0, 100.0]
+        easts = [0.0, -5.0, 30.0, 0.0]
+
+        store = storing.Store(name='Fleet')
+        store.create('fleet.goal').update(rpm=numpy.array(rpms),
+                                          rudder=numpy.array(rudders))
+        store.create('scenario.current').update(north=numpy.array([0.0, 0.1, 0.2, 0.3]),
+                                                east=-0.2)
+        store.create('scenario.onset').update(north=numpy.array(norths),
+                                              east=numpy.array(easts))
+        fleet = self.simulator(simulating.SimulatorMotionUsvFleet,
+                               'simulatorMotionUsvFleet', store,
+                               parms=dict(parms, size=SIZE))
+
+        stores = []
+        sims = []
+        for i in range(SIZE):
+            single = storing.Store(name='Single{0}'.format(i))
+            single.create('goal.rpm').update(value=rpms[i])
+            single.create('goal.rudder').update(value=rudders[i])
+            single.create('scenario.current').update(north=0.1 * i, east=-0.2)
+            single.create('scenario.onset').update(north=norths[i], east=easts[i])
+            sims.append(self.simulator(simulating.SimulatorMotionUsv,
+                                       'simulatorMotionUsv{0}'.format(i),
+                                       single, parms=dict(parms)))
+            stores.append(single)
+
+        self.start([store] + stores, [fleet] + sims)
+        self.assertColumn(fleet.state.data.north, norths)
+        for k in range(STEPS):
+            self.step([store] + stores, [fleet] + sims)
+
+        state = fleet.state.data
+        for field in ['speed', 'speedRate', 'heading', 'headingRate']:
+            self.assertColumn(fleet.state[field],
+                              [getattr(sim, field).value for sim in sims])
+        self.assertColumn(state.north, [sim.position.data.north for sim in sims])
+        self.assertColumn(state.east, [sim.position.data.east for sim in sims])
+        self.assertColumn(state.velocityNorth, [sim.velocity.data.north for sim in sims])
+        self.assertColumn(state.velocityEast, [sim.velocity.data.east for sim in sims])
+
+    def testSensorFleets(self):
+        """
+        Test noiseless sensor fleet simulators match scalar simulators
+        """
+        console.terse("{0}\n".format(self.testSensorFleets.__doc__))
+        numpy = self.numpy
+        norths = [0.0, 10.0, -20.0, 100.0]
+        easts = [0.0, -5.0, 30.0, 0.0]
+        vnorths = [1.0, 0.0, -0.5, 2.0]
+        veasts = [0.0, 1.5, 0.5, -2.0]
+        headings = [0.0, 45.0, 190.0, 359.0]
+        speeds = [1.0, 2.0, 0.0, 1.5]
+        drops = [0, 1, 0, 0]
+
+        store = storing.Store(name='Fleet')
+        store.create('fleet.state').update(north=numpy.array(norths),
+                                           east=numpy.array(easts),
+                                           velocityNorth=numpy.array(vnorths),
+                                           velocityEast=numpy.array(veasts),
+                                           heading=numpy.array(headings),
+                                           speed=numpy.array(speeds))
+        store.create('scenario.current').update(north=0.1, east=-0.2)
+        store.create('scenario.bottom').update(value=numpy.array([50.0, 40.0, 30.0, 20.0]))
+        store.create('scenario.gps').update(dropout=numpy.array(drops))
+        store.create('scenario.magnetic').update(declination=13.5)
+        gps = self.simulator(simulating.SimulatorSensorGpsFleet,
+                             'simulatorSensorGpsFleet', store,
+                             parms=dict(size=SIZE, noiseBand=5.0,
+                                        noiseJitter=0.0, noiseVelocity=0.0))
+        dvl = self.simulator(simulating.SimulatorSensorDvlFleet,
+                             'simulatorSensorDvlFleet', store,
+                             parms=dict(size=SIZE, velSigma=0.0,
+                                        bias=0.1, altSigma=0.0))
+        compass = self.simulator(simulating.SimulatorSensorCompassFleet,
+                                 'simulatorSensorCompassFleet', store,
+                                 parms=dict(size=SIZE, phase=24.0,
+                                            amp=1.0, sigma=0.0))
+
+        singles = []
+        for i in range(SIZE):
+            single = storing.Store(name='Single{0}'.format(i))
+            single.create('state.position').update(north=norths[i], east=easts[i])
+            single.create('state.velocity').update(north=vnorths[i], east=veasts[i])
+            single.create('heading.output').update(value=headings[i])
+            single.create('state.heading').update(value=headings[i])
+            single.create('state.speed').update(value=speeds[i])
+            single.create('scenario.current').update(north=0.1, east=-0.2)
+            single.create('scenario.bottom').update(value=50.0 - 10.0 * i)
+            single.create('scenario.gps').update(dropout=drops[i])
+            single.create('scenario.magnetic').update(declination=13.5)
+            sims = (self.simulator(simulating.SimulatorSensorGps,
+                                   'simulatorSensorGps{0}'.format(i), single,
+                                   parms=dict(noiseBand=5.0, noiseJitter=0.0,
+                                              noiseVelocity=0.0)),
+                    self.simulator(simulating.SimulatorSensorDvl,
+                                   'simulatorSensorDvl{0}'.format(i), single,
+                                   parms=dict(velSigma=0.0, bias=0.1, altSigma=0.0)),
+                    self.simulator(simulating.SimulatorSensorCompass,
+                                   'simulatorSensorCompass{0}'.format(i), single,
+                                   parms=dict(phase=24.0, amp=1.0, sigma=0.0)))
+            singles.append((single, sims))
+
+        stores = [store] + [single for single, sims in singles]
+        fleets = [gps, dvl, compass]
+        for single, sims in singles:
+            fleets.extend(sims)
+        self.start(stores, fleets)
+        self.step(stores, fleets)
+
+        out = gps.output.data
+        self.assertColumn(out.north, [sims[0].positionOut.data.north for s, sims in singles])
+        self.assertColumn(out.east, [sims[0].positionOut.data.east for s, sims in singles])
+        self.assertColumn(out.velocityNorth, [sims[0].velocityOut.data.north for s, sims in singles])
+        self.assertColumn(out.velocityEast, [sims[0].velocityOut.data.east for s, sims in singles])
+        self.assertEqual(out.north[1], 0.0)  # dropout keeps last output
+
+        out = dvl.output.data
+        self.assertColumn(out.forward, [sims[1].velocity.data.forward for s, sims in singles])
+        self.assertColumn(out.starboard, [sims[1].velocity.data.starboard for s, sims in singles])
+        self.assertColumn(out.currentForward, [sims[1].currentOut.data.forward for s, sims in singles])
+        self.assertColumn(out.currentStarboard, [sims[1].currentOut.data.starboard for s, sims in singles])
+        self.assertColumn(out.currentNorth, [sims[1].currentOut.data.north for s, sims in singles])
+        self.assertColumn(out.currentEast, [sims[1].currentOut.data.east for s, sims in singles])
+        self.assertColumn(out.altitude, [sims[1].altitude.value for s, sims in singles])
+
+        self.assertColumn(compass.output.data.heading,
+                          [sims[2].output.value for s, sims in singles])
+
+    def testColumnarTrack(self):
+        """
+        Test change tracking of columnar share with array fields
+        """
+        console.terse("{0}\n".format(self.testColumnarTrack.__doc__))
+        numpy = self.numpy
+        share = storing.Share(name='fleet.state').track()
+        share.update(north=numpy.zeros(SIZE))
+        self.assertEqual(share.changes, 1)
+        share.update(north=numpy.zeros(SIZE))
+        self.assertEqual(share.changes, 1)
+        share.update(north=numpy.ones(SIZE))
+        self.assertEqual(share.changes, 2)
+
+
+def runOne(test):
+    '''
+    Unittest Runner
+    '''
+    test = BasicTestCase(test)
+    suite = unittest.TestSuite([test])
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runSome():
+    """ Unittest runner """
+    tests =  []
+    names = ['testSphereLLByDNDEToLLArray',
+             'testMotionUuvFleet',
+             'testMotionUsvFleet',
+             'testSensorFleets',
+             'testColumnarTrack', ]
+    tests.extend(map(BasicTestCase, names))
+    suite = unittest.TestSuite(tests)
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+def runAll():
+    """ Unittest runner """
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.TestLoader().loadTestsFromTestCase(BasicTestCase))
+    unittest.TextTestRunner(verbosity=2).run(suite)
+
+if __name__ == '__main__' and __package__ is None:
+
+    #console.reinit(verbosity=console.Wordage.concise)
+
+    #runAll() #run all unittests
+
+    runSome()#only run some
+
+    #runOne('testMotionUuvFleet')